@@ -1,44 +1,119 @@
 import collections
+import jumptable
 import logging
 import queue
 import re
+import signatures
+import store
 import sys
-from   typing import Self, Optional
+import xref
+from   typing import Self, List, Optional
 import z80
 import z80.disasm.instruction
 import z80.z80dasm.instruction
 
 class Disasm:
-    def __init__(self: Self, filename: Optional[str]=None) -> None:
-        self.disasm = collections.defaultdict(lambda: collections.defaultdict(dict))
+    def __init__(self: Self,
+        filename: Optional[str]=None,
+        signature_library: Optional[List[signatures.Signature]]=None,
+        instruction_set: str='z80.disasm.instruction',
+    ) -> None:
+        self.disasm = store.DisasmStore()
         self.z80 = z80.Z80()
         self.z80.PC = 0x4000
         
+        ## Style and symbols belong to this object only, so that several 
+        ## analyses can run side by side (e.g. in a thread pool).
+        self.aux = z80.disasm.instruction.AUX()
+        self.z80.load_instruction_set(instruction_set, overwrite=True)
+        self.z80.style = z80.instruction.Instruction.styles[instruction_set]
+        self.z80.symbols = self.aux.routines
+        
+        self.jump_tables = jumptable.JumpTableRecovery(self)
+        self.signature_hits = {}
+        ## For every walked address the address of the instruction directly 
+        ## before it, if that one continues into it.
+        self._previous = {}
+        ## CALLs to dispatchers and indirect jumps, waiting for their jump table 
+        ## to be recovered.
+        self._pending_dispatches = []
+        
+        ## Addresses still to be walked. Filled by add_entry_point() and by the 
+        ## H.KEYI write hook, drained by _walk().
+        self._pc_queue = queue.Queue()
+        self._analysed = False
+        self.z80._ram.register_write_callback(self._hkeyi_hook, 0xFD9C)
+        
         if filename is not None:
             rom = open(filename, 'rb').read()
             for offset, value in enumerate(rom):
                 self.z80.ram[0x4000 + offset] = value
             
-            self.HL_plus_is_A = rom.find(b'\x85\x6F\xD0\x24\xC9')
-            if self.HL_plus_is_A == -1:
-                self.HL_plus_is_A = None
-            else:
-                self.HL_plus_is_A += 0x4000
-                self.add_routine(self.HL_plus_is_A, 'HL += A')
-                
-                self.PC_magic = rom.find(b'\x87\xe1\xcd' + self.HL_plus_is_A.to_bytes(2, 'little') + b'\x5e\x23\x56\xeb\xe9')
-                if self.PC_magic == -1:
-                    self.PC_magic = None
-                else:
-                    self.PC_magic += 0x4000
-                    self.add_routine(self.PC_magic, 'PC = PC[2 * A]')
-        self.z80.load_instruction_set('z80.disasm.instruction', overwrite=True)
-        #self.z80.load_instruction_set('z80.z80dasm.instruction', overwrite=True)
+            scanner = signatures.SignatureScanner(signatures.LIBRARY if signature_library is None else signature_library)
+            for address, signature in scanner.scan(rom, base=0x4000):
+                self.apply_signature(address, signature)
     
-    def add_routine(self: Self, address: int, routine_name: str) -> None:
-        z80.disasm.instruction.aux.add_routine(address, routine_name)
+    ## Puts data in memory at address for the analysis to read, but not to
+    ## walk, e.g. the BIOS, or only its RST vectors: an RST p whose vector
+    ## holds a JP to a dispatcher dispatches, see jumptable.
+    def load(self: Self, data: bytes, address: int) -> None:
+        for offset, value in enumerate(data):
+            self.z80.ram[address + offset] = value
+    
+    ## Mark address as code. Before the first run() the address is merely 
+    ## remembered as an extra starting point. Afterwards only the code newly 
+    ## reachable from address is walked and merged into the existing result.
+    ## 
+    ## Returns the start addresses of the blocks that were added or got new 
+    ## incoming references (empty before the first run).
+    def add_entry_point(self: Self, address: int) -> List[int]:
+        self._pc_queue.put(address)
+        if not self._analysed:
+            return []
+        return self._walk()
+    
+    def add_routine(self: Self, address: int, routine_name: str, is_code: bool=True) -> List[int]:
+        self.aux.add_routine(address, routine_name)
+        if not is_code:
+            return []
+        return self.add_entry_point(address)
     def get_routine(self: Self, address: int) -> str:
-        return z80.disasm.instruction.aux.get_routine(address)
+        return self.aux.get_routine(address)
+    
+    @property
+    def routines(self: Self) -> dict:
+        return self.aux.routines
+    
+    def apply_signature(self: Self, address: int, signature: signatures.Signature) -> None:
+        logging.debug(f"[{address:04X}] Signature '{signature.name}' ({signature.tag}).")
+        self.signature_hits[address] = signature
+        match signature.tag:
+            case 'routine' | 'add_hl_a':
+                self.add_routine(address, signature.name)
+            case 'dispatch':
+                self.add_routine(address, signature.name)
+                self.jump_tables.add_dispatcher(address)
+            case 'idiom':
+                ## Only remembered, it is not the start of a routine.
+                pass
+            case _:
+                raise ValueError(f"Unknown signature tag '{signature.tag}'")
+    
+    def is_code(self: Self, address: int) -> bool:
+        return self.disasm.kind[address] in (store.CODE, store.CODE_CONTINUATION)
+    
+    def previous_instruction(self: Self, address: int) -> Optional[int]:
+        return self._previous.get(address)
+    
+    ## Decode the instruction at address without executing it and without 
+    ## disturbing the program counter.
+    def decode(self: Self, address: int) -> z80.instruction.Instruction:
+        pc = self.z80.PC
+        self.z80.PC = address
+        self.z80.fetch_opcode()
+        instr = self.z80.decode_instruction()
+        self.z80.PC = pc
+        return instr
     
     def run(self: Self, style: Optional[str]=None):
         match style:
@@ -50,99 +125,186 @@ class Disasm:
                 raise ValueError(f"Unknown run style '{style}'")
     
     def run_branch_all(self: Self) -> dict:
-        pc_queue = queue.Queue()
-        pc_queue.put(self.z80.ram.get_word(0x4002))
+        if not self._analysed:
+            self._analysed = True
+            self._pc_queue.put(self.z80.ram.get_word(0x4002))
+        self._walk()
+        return self.disasm
+    
+    def _hkeyi_hook(self: Self, offset, new_value, old_value):
+        vdp_hook = self.z80.ram.get_word(0xFD9B)
+        logging.debug(f'vdp_hook=0x{vdp_hook:04X}')
+        self._pc_queue.put(vdp_hook)
+        self.disasm.kind[vdp_hook] = store.CODE
+        self.disasm.add_from(vdp_hook, 0xFD9B, 'VDP hook', xref.HOOK)
+    
+    ## Disassemble everything reachable from the queued addresses. Addresses 
+    ## which were disassembled before are not walked again, so calling this on 
+    ## an existing result only visits new code.
+    def _walk(self: Self) -> List[int]:
+        changed = set()
         
-        def hkeyi_hook(offset, new_value, old_value):
-            vdp_hook = self.z80.ram.get_word(0xFD9B)
-            logging.debug(f'vdp_hook=0x{vdp_hook:04X}')
-            pc_queue.put(vdp_hook)
-            self.disasm[vdp_hook]['type'] = 'code'
-            self.disasm[vdp_hook]['from'][0xFD9B] = 'VDP hook'
-        self.z80._ram.register_write_callback(hkeyi_hook, 0xFD9C)
+        def add_from(destination, source, how, kind):
+            if self.disasm.add_from(destination, source, how, kind):
+                changed.add(destination)
         
-        while not pc_queue.empty():
-            pc = pc_queue.get()
-            if pc in self.disasm and 'disasm' in self.disasm[pc]:
-                logging.debug(f'[{pc:04X}] Ignoring already disassembled/handled PC.')
-                continue
-            if pc < 0x4000:
-                ## Don't disassemble BIOS routines.
-                continue
-            self.disasm[pc]['type'] = 'code'
-            self.z80.PC = pc
+        ## The table entries become data, their targets code.
+        def add_table(table):
+            changed.add(table.address)
+            for i, target in enumerate(table.targets):
+                entry = table.address + 2 * i
+                self.disasm.kind[entry:entry + 2] = bytes([store.TABLE, store.TABLE])
+                self.disasm.set_text(entry, f'{entry:04X} DW 0x{target:04X}\t\t; Jump table entry {i}.')
+                add_from(target, table.dispatch, 'jump table', xref.JUMP_TABLE)
+                self._pc_queue.put(target)
+        
+        while True:
+            while not self._pc_queue.empty():
+                pc = self._pc_queue.get()
+                if self.disasm.has_text(pc):
+                    logging.debug(f'[{pc:04X}] Ignoring already disassembled/handled PC.')
+                    continue
+                if pc < 0x4000:
+                    ## Don't disassemble BIOS routines.
+                    continue
+                if self.z80.ram[pc] is None:
+                    ## Don't walk off the end of the ROM.
+                    continue
+                changed.add(pc)
+                self.z80.PC = pc
+                
+                try:
+                    self.z80.fetch_opcode()
+                    instr = self.z80.trace_opcode()
+                except NotImplementedError as e:
+                    logging.exception(f'Bailing out because of unknown opcode at pc {pc:04X}: 0x{e.args[0]:02X}')
+                    return self._changed_blocks(changed)
+                self.disasm.set_instruction(pc, instr, instr.size, self.z80.render(instr, pc))
+                self._add_data_references(pc, instr)
+                instr_name = type(instr).__name__
+                
+                match instr.name():
+                    case "CALL nn" | "CALL cc, nn":
+                        logging.debug(f"Adding CALL destination 0x{instr._nn:04X} also to queue.")
+                        self._pc_queue.put(instr._nn)
+                        add_from(instr._nn, pc, instr.name(), xref.CALL)
+                        
+                        if self.jump_tables.is_dispatcher(instr._nn):
+                            ## The jump table follows, not code.
+                            self._pending_dispatches.append((pc, instr))
+                        else:
+                            self._previous[self.z80.PC] = pc
+                            self._pc_queue.put(self.z80.PC)
+                            add_from(self.z80.PC, pc, instr.name(), xref.CALL)
+                    case "RST p":
+                        add_from(instr.t2p[instr._t], pc, instr.name(), xref.CALL)
+                        if self.jump_tables.is_dispatcher(instr.t2p[instr._t]):
+                            self._pending_dispatches.append((pc, instr))
+                        else:
+                            self._previous[self.z80.PC] = pc
+                            add_from(self.z80.PC, pc, 'fall through', xref.FALL_THROUGH)
+                            self._pc_queue.put(self.z80.PC)
+                    case "JP (HL)":
+                        logging.debug(f"{pc:04X}: 'JP (HL)' encountered. Looking for a jump table later on.")
+                        self._pending_dispatches.append((pc, instr))
+                    case "JP nn":
+                        logging.debug(f"{pc:04X}: 'JP nn' encountered. Only branching to 0x{instr._nn:04X}.")
+                        self._pc_queue.put(instr._nn)
+                        add_from(instr._nn, pc, instr.name(), xref.JUMP)
+                    case "JR e":
+                        jump_destination = instr.jump_destination(pc)
+                        logging.debug(f"{pc:04X}: '{instr.name()}' encountered. Only branching to 0x{jump_destination:04X}.")
+                        self._pc_queue.put(jump_destination)
+                        add_from(jump_destination, pc, instr.name(), xref.JUMP)
+                    case "DJNZ, e"  |\
+                         "JR C, e"  |\
+                         "JR NC, e" |\
+                         "JR Z, e"  |\
+                         "JR NZ, e":
+                        jump_destination = instr.jump_destination(pc)
+                        self._previous[self.z80.PC] = pc
+                        self._pc_queue.put(self.z80.PC)
+                        
+                        logging.debug(f"{pc:04X}: '{instr.name()}' encountered. Also branching to 0x{jump_destination:04X}.")
+                        
+                        self._pc_queue.put(jump_destination)
+                        add_from(jump_destination, pc, instr.name(), xref.JUMP)
+                    case "RET":
+                        logging.debug(f"{pc:04X}: 'RET' encountered. Discontinuing this branch.")
+                    case "JP (IX)" | "JP (IY)":
+                        logging.debug(f"{pc:04X}: '{instr.name()}' encountered. Discontinuing this branch.")
+                    case _:
+                        logging.debug(f"[{pc:04X}] Enqueueing PC={self.z80.PC:04X}. Handled {instr_name}.")
+                        self._previous[self.z80.PC] = pc
+                        add_from(self.z80.PC, pc, 'fall through', xref.FALL_THROUGH)
+                        self._pc_queue.put(self.z80.PC)
             
-            try:
-                self.z80.fetch_opcode()
-                instr = self.z80.execute_opcode()
-            except NotImplementedError as e:
-                logging.exception(f'Bailing out because of unknown opcode at pc {pc:04X}: 0x{e.args[0]:02X}')
+            ## Dispatches are resolved when there is nothing else left to walk, 
+            ## so that the instructions leading to them are known by then. An 
+            ## indirect jump without a recognizable table stays pending, new 
+            ## entry points may still lead to its table setup.
+            pending, self._pending_dispatches = self._pending_dispatches, []
+            for pc, instr in pending:
+                table = self.jump_tables.resolve(pc, instr)
+                if table is None:
+                    self._pending_dispatches.append((pc, instr))
+                else:
+                    add_table(table)
+            if self._pc_queue.empty():
                 break
-            self.disasm[pc]['disasm'] = str(instr)
-            instr_name = type(instr).__name__
-            
-            match instr.name():
-                case "CALL nn" | "CALL cc, nn":
-                    pc_queue.put(self.z80.PC)
-                    self.disasm[self.z80.PC]['from'][instr._PC] = instr.name()
-                    
-                    logging.debug(f"Adding CALL destination {instr.nn} also to queue.")
-                    pc_queue.put(instr._nn)
-                    self.disasm[instr._nn]['from'][instr._PC] = instr.name()
-                    
-                    if self.PC_magic is not None and instr._nn == self.PC_magic:
-                        offset = instr._PC + 3
-                        last_jump = None
-                        while True:
-                            jump = self.z80._ram.get_word(offset)
-                            if last_jump is None:
-                                last_jump = jump
-                            if abs(jump - last_jump) >= 0x400:
-                                break
-                            offset += 2
-                            logging.debug(f'[{offset:04X}] Part of a jump table. Jump to 0x{jump:04X}.')
-                            pc_queue.put(jump)
-                case "JP nn":
-                    logging.debug(f"{pc:04X}: 'JP nn' encountered. Only branching to {instr.nn}.")
-                    pc_queue.put(instr._nn)
-                    self.disasm[instr._nn]['from'][instr._PC] = instr.name()
-                case "JR e":
-                    logging.debug(f"{pc:04X}: '{instr.name()}' encountered. Only branching to {instr.jump_destination}.")
-                    pc_queue.put(instr._jump_destination)
-                    self.disasm[instr._jump_destination]['from'][instr._PC] = instr.name()
-                case "DJNZ, e"  |\
-                     "JR C, e"  |\
-                     "JR NC, e" |\
-                     "JR Z, e"  |\
-                     "JR NZ, e":
-                    pc_queue.put(self.z80.PC)
-                    
-                    logging.debug(f"{pc:04X}: '{instr.name()}' encountered. Also branching to {instr.jump_destination}.")
-                    
-                    pc_queue.put(instr._jump_destination)
-                    self.disasm[instr._jump_destination]['from'][instr._PC] = instr.name()
-                case "RET":
-                    logging.debug(f"{pc:04X}: 'RET' encountered. Discontinuing this branch.")
-                case _:
-                    logging.debug(f"[{pc:04X}] Enqueueing PC={self.z80.PC:04X}. Handled {instr_name}.")
-                    self.disasm[self.z80.PC]['from'][instr._PC] = 'fall through'
-                    pc_queue.put(self.z80.PC)
-            
-            logging.debug(f'DISASM: {type(instr).__name__} ' + str(instr))
         
-        return self.disasm
-
+        return self._changed_blocks(changed)
+    
+    ## Instructions reading or writing memory at a fixed address, with the 
+    ## kind of access and the number of bytes.
+    data_references =\
+    {
+        'LD A, (nn)':   (xref.READ, 1),
+        'LD HL, (nn)':  (xref.READ, 2),
+        'LD dd, (nn)':  (xref.READ, 2),
+        'LD IX, (nn)':  (xref.READ, 2),
+        'LD IY, (nn)':  (xref.READ, 2),
+        'LD (nn), A':   (xref.WRITE, 1),
+        'LD (nn), HL':  (xref.WRITE, 2),
+        'LD (nn), dd':  (xref.WRITE, 2),
+        'LD (nn), IX':  (xref.WRITE, 2),
+        'LD (nn), IY':  (xref.WRITE, 2),
+    }
+    
+    def _add_data_references(self: Self, pc: int, instr: z80.instruction.Instruction) -> None:
+        try:
+            kind, width = self.data_references[instr.name()]
+        except KeyError:
+            return
+        for offset in range(width):
+            self.disasm.xrefs.add(pc, (instr._nn + offset) & 0xFFFF, kind, instr.name())
+    
+    @property
+    def xrefs(self: Self) -> xref.XrefIndex:
+        return self.disasm.xrefs
+    
+    def _changed_blocks(self: Self, changed: set) -> List[int]:
+        ## A changed address starts a block unless it is only reached by falling 
+        ## through from another changed address.
+        blocks = []
+        for address in sorted(changed):
+            froms = list(self.disasm.froms(address))
+            if froms and all(how == 'fall through' and source in changed for source, how in froms):
+                continue
+            blocks.append(address)
+        return blocks
+    
     def run_linear(self: Self) -> dict:
         self.z80.PC = 0x4000
         
         while self.z80.PC < 0x8000:
+            pc = self.z80.PC
             try:
                 self.z80.fetch_opcode()
-                instr = self.z80.execute_opcode()
+                instr = self.z80.trace_opcode()
             except NotImplementedError as e:
                 logging.exception(f'Bailing out because of unknown opcode at pc {pc:04X}: 0x{e.args[0]:02X}')
                 break
-            self.disasm[self.z80.PC]['disasm'] = str(instr)
-            instr_name = type(instr).__name__
-
+            self.disasm.set_instruction(pc, instr, instr.size, self.z80.render(instr, pc))
+        
         return self.disasm
@@ -0,0 +1,179 @@
+import logging
+from   typing import Self, Dict, List, Optional
+
+
+
+## A recovered jump table: entry_count words starting at address, each one the
+## address of code. The dispatch is the address of the instruction that jumps
+## through the table.
+class JumpTable:
+    def __init__(self: Self, address: int, dispatch: int, kind: str, targets: List[int], bounded: bool) -> None:
+        self.address = address
+        self.dispatch = dispatch
+        self.kind = kind
+        self.targets = targets
+        ## True if the number of entries follows from a range check on the
+        ## index, False if it was guessed from the table contents.
+        self.bounded = bounded
+    
+    @property
+    def size(self: Self) -> int:
+        return 2 * len(self.targets)
+    
+    def __repr__(self: Self) -> str:
+        return f'JumpTable(0x{self.address:04X}, dispatch=0x{self.dispatch:04X}, kind={self.kind!r}, entries={len(self.targets)})'
+
+
+
+## Recognizes the dispatch idioms below and reads the tables they jump through.
+##
+##   inline : CALL dispatcher (or RST p, if p is a dispatcher) directly followed
+##            by the table. The dispatcher pops the return address to find the
+##            table, so the CALL never returns.
+##   JP (HL): LD HL, table; (index scaling); LD E, (HL); INC HL; LD D, (HL);
+##            EX DE, HL; JP (HL), with the table address in HL or DE.
+##
+## The number of entries is taken from an index range check (CP n, followed by
+## JR NC, JP NC or RET NC) in the instructions leading to the dispatch. Without
+## one, entries are read until one does not look like a code address anymore.
+##
+## Signatures are only looked for in the ROM, which is above the RST vectors.
+## A vector holding JP dispatcher is taken for a dispatcher, with whatever is
+## in memory there when the RST is walked: the vectors are only there once
+## they are put there with Disasm.load(). A dispatcher that is at a vector 
+## itself has to be registered with add_dispatcher().
+class JumpTableRecovery:
+    ## Number of instructions to look back for the table base and range check.
+    LOOKBACK = 16
+    ## Upper limit for tables without a range check.
+    MAX_GUESSED_ENTRIES = 128
+    
+    ## Condition code NC in the cc operand.
+    CC_NC = 0b010
+    ## The RST p vectors, and JP nn.
+    RST_VECTORS = range(0x00, 0x40, 0x08)
+    JP_NN = 0xC3
+    
+    def __init__(self: Self, disasm) -> None:
+        self._disasm = disasm
+        self.dispatchers: Dict[int, str] = {}
+        self.tables: Dict[int, JumpTable] = {}
+    
+    def add_dispatcher(self: Self, address: int, kind: str='inline') -> None:
+        self.dispatchers[address] = kind
+    
+    def is_dispatcher(self: Self, address: int) -> bool:
+        return self._kind(address) is not None
+    
+    ## The kind of the dispatcher at address, also for an RST vector jumping
+    ## to one. None if there is none.
+    def _kind(self: Self, address: int) -> Optional[str]:
+        kind = self.dispatchers.get(address)
+        if kind is None and address in self.RST_VECTORS:
+            ram = self._disasm.z80.ram
+            if ram[address] == self.JP_NN:
+                kind = self.dispatchers.get(ram.get_word(address + 1))
+        return kind
+    
+    ## The table used by the dispatching CALL, RST or JP (HL) at address pc, 
+    ## None if there is no table to be found (yet).
+    def resolve(self: Self, pc: int, instr) -> Optional[JumpTable]:
+        match instr.name():
+            case 'CALL nn' | 'CALL cc, nn':
+                return self.on_call(pc, instr, instr._nn)
+            case 'RST p':
+                return self.on_call(pc, instr, instr.t2p[instr._t])
+            case 'JP (HL)':
+                return self.on_jump_indirect(pc, instr)
+        raise ValueError(f"Instruction '{instr.name()}' does not dispatch.")
+    
+    ## The instructions leading to address, newest first, following the
+    ## sequential predecessors recorded by the walk.
+    def _history(self: Self, address: int) -> List:
+        history = []
+        while len(history) < self.LOOKBACK:
+            address = self._disasm.previous_instruction(address)
+            if address is None:
+                break
+            history.append(self._disasm.decode(address))
+        return history
+    
+    ## Number of table entries from a CP n guarding the index, None if no
+    ## range check precedes the dispatch.
+    def _bound(self: Self, history: List) -> Optional[int]:
+        guarded = False
+        for instr in history:
+            match instr.name():
+                case 'JR NC, e':
+                    guarded = True
+                case 'JP cc, nn' | 'RET cc' if instr._cc == self.CC_NC:
+                    guarded = True
+                case 'CP n' if guarded:
+                    return instr._n
+                case 'RET' | 'JP nn' | 'JR e':
+                    break
+        return None
+    
+    def _read(self: Self, address: int, dispatch: int, kind: str, entry_count: Optional[int]) -> JumpTable:
+        ram = self._disasm.z80.ram
+        targets = []
+        bounded = entry_count is not None
+        if not bounded:
+            entry_count = self.MAX_GUESSED_ENTRIES
+        for i in range(entry_count):
+            entry = address + 2 * i
+            target = ram.get_word(entry)
+            if not bounded:
+                ## Stop at the first word that can not be an entry: outside the
+                ## ROM, pointing into the table itself, far away from the other
+                ## entries, or overlapping code we already know about.
+                if target is None or target < 0x4000 or ram[target] is None:
+                    break
+                if address <= target < entry + 2:
+                    break
+                if targets and abs(target - targets[0]) >= 0x400:
+                    break
+                if i > 0 and (self._disasm.is_code(entry) or entry in self.tables):
+                    break
+            targets.append(target)
+        
+        table = JumpTable(address, dispatch, kind, targets, bounded)
+        logging.debug(f'[{dispatch:04X}] Recovered {table}.')
+        self.tables[address] = table
+        return table
+    
+    ## CALL nn or RST p. Returns the table if the destination is a dispatcher.
+    def on_call(self: Self, pc: int, instr, destination: int) -> Optional[JumpTable]:
+        kind = self._kind(destination)
+        if kind is None:
+            return None
+        entry_count = self._bound(self._history(pc))
+        return self._read(pc + instr.size, pc, kind, entry_count)
+    
+    ## JP (HL). Returns the table if the instructions before it index a table.
+    def on_jump_indirect(self: Self, pc: int, instr) -> Optional[JumpTable]:
+        history = self._history(pc)
+        names = [i.name() for i in history]
+        
+        ## Loading the entry: LD r, (HL); INC HL; LD r, (HL), read backwards.
+        for i in range(len(names) - 2):
+            if names[i] == 'LD r, (HL)' and names[i + 1] == 'INC ss' and names[i + 2] == 'LD r, (HL)':
+                break
+        else:
+            return None
+        
+        ## The table base: LD HL, nn or LD DE, nn (added to HL), before the load.
+        ## CALLs are looked through, since the index is usually added by a 
+        ## 'HL += A' routine.
+        base = None
+        for older in history[i + 3:]:
+            match older.name():
+                case 'LD dd, nn' if older.dd2name[older._dd] in ('HL', 'DE'):
+                    base = older._nn
+                    break
+                case 'RET' | 'JP nn' | 'JR e' | 'POP qq':
+                    break
+        if base is None:
+            return None
+        
+        return self._read(base, pc, 'JP (HL)', self._bound(history))
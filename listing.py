@@ -0,0 +1,56 @@
+from   typing import Self, Dict, Iterator, TextIO
+import store
+import xref
+
+
+
+## Writes the disassembly listing in address order.
+##
+## Routine starts are found by walking a sorted list of routine addresses along
+## with the listing (a merge join), instead of looking up every address. Lines
+## are collected and written in chunks, not printed one by one.
+class ListingWriter:
+    def __init__(self: Self, output: TextIO, show_callees: bool=True, show_routines: bool=True, chunk_lines: int=4096) -> None:
+        self.output = output
+        self.show_callees = show_callees
+        self.show_routines = show_routines
+        self.chunk_lines = chunk_lines
+    
+    def lines(self: Self, disasm: store.DisasmStore, routines: Dict[int, str]) -> Iterator[str]:
+        symbols = sorted(routines.items())
+        symbol = 0
+        text = disasm.text
+        
+        for address in range(disasm.size):
+            if not text[address]:
+                continue
+            
+            while symbol < len(symbols) and symbols[symbol][0] < address:
+                symbol += 1
+            if self.show_routines and symbol < len(symbols) and symbols[symbol][0] == address:
+                yield f'; Start of routine {symbols[symbol][1]}.'
+            
+            if self.show_callees and disasm.xrefs.count_to(address):
+                froms = disasm.xrefs.code_to(address)
+                if len(froms) > 1 or (len(froms) == 1 and froms[0][1] != xref.FALL_THROUGH):
+                    yield ';'
+                    yield ';'
+                    yield ';'
+                    yield '; We can get here from:'
+                    for source, kind, how in froms:
+                        yield f';   0x{source:04X} {how}'
+            
+            yield disasm.get_text(address)
+    
+    def write(self: Self, disasm: store.DisasmStore, routines: Dict[int, str]) -> None:
+        chunk = []
+        for line in self.lines(disasm, routines):
+            chunk.append(line)
+            if len(chunk) >= self.chunk_lines:
+                chunk.append('')
+                self.output.write('\n'.join(chunk))
+                chunk = []
+        if chunk:
+            chunk.append('')
+            self.output.write('\n'.join(chunk))
+        self.output.flush()
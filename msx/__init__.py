@@ -0,0 +1 @@
+from   msx.msx import MSX
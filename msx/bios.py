@@ -0,0 +1,319 @@
+from   typing import Self, Callable, Dict, Iterable, List, Optional, Tuple
+import z80
+import z80.disasm.instruction
+import z80.registers
+import msx.cassette
+import msx.input
+import msx.vdp
+
+
+
+## System variables of the BIOS in RAM that the routines below keep up to
+## date.
+RG0SAV = 0xF3DF	## Copies of the VDP registers, to RG7SAV
+FORCLR = 0xF3E9	## Foreground, background and border color
+BAKCLR = 0xF3EA
+BDRCLR = 0xF3EB
+SCRMOD = 0xFCAF	## Screen mode
+
+## VDP registers 0 to 6 of the screen modes 0 to 3 as the BIOS sets them,
+## with the tables where it puts them. Register 1 gets the sprite size and
+## magnification of RG1SAV on top.
+MODES: List[bytes] = [
+    bytes([ 0x00, 0xF0, 0x00, 0x00, 0x01, 0x00, 0x00 ]),	## Text 40: names 0x0000, patterns 0x0800
+    bytes([ 0x00, 0xE0, 0x06, 0x80, 0x00, 0x36, 0x07 ]),	## Graphics 1: names 0x1800, colors 0x2000, patterns 0x0000
+    bytes([ 0x02, 0xE0, 0x06, 0xFF, 0x03, 0x36, 0x07 ]),	## Graphics 2: names 0x1800, colors 0x2000, patterns 0x0000
+    bytes([ 0x00, 0xE8, 0x02, 0x00, 0x00, 0x36, 0x07 ]),	## Multicolor: names 0x0800, patterns 0x0000
+]
+
+## The stick directions of GTSTCK by up, down, left and right (bits 0-3,
+## set if pressed): 1 is up, then clockwise to 8, up and left.
+DIRECTIONS = bytes([ 0, 1, 5, 0, 7, 8, 6, 7, 3, 2, 4, 3, 0, 1, 5, 0 ])
+
+## Approximate T-states of the routines in the BIOS: (routine, per byte).
+TIMING: Dict[str, Tuple[int, int]] = {
+    'WRTVDP': (60, 0),
+    'RDVRM':  (90, 0),
+    'WRTVRM': (90, 0),
+    'SETRD':  (70, 0),
+    'SETWRT': (70, 0),
+    'FILVRM': (120, 27),
+    'LDIRMV': (120, 50),
+    'LDIRVM': (120, 50),
+    'CHGMOD': (400, 27),
+    'CHGCLR': (150, 0),
+    'DISSCR': (80, 0),
+    'ENASCR': (80, 0),
+    'CLRSPR': (200, 27),
+    'WRTPSG': (50, 0),
+    'RDPSG':  (50, 0),
+    'GTSTCK': (200, 0),
+    'GTTRIG': (150, 0),
+    'RDVDP':  (30, 0),
+    'RSLREG': (20, 0),
+    'WSLREG': (20, 0),
+    'SNSMAT': (80, 0),
+    'TAPION': (2000, 0),
+    'TAPIN':  (300, 0),
+    'TAPIOF': (20, 0),
+}
+
+
+
+## High level emulation of the BIOS: routines of its jump table (the ones in
+## z80.disasm.instruction.AUX.ROUTINES) done in Python on the devices, as
+## traps (see Z80.trap()), so e.g. LDIRVM copies to VRAM in one go instead
+## of a loop of OUTs. There is no BIOS ROM behind them.
+##
+## A routine takes its arguments and gives its results in the registers the
+## BIOS documents, and keeps the system variables above. Other registers it
+## changes in the BIOS are left as they are, and its time is approximated,
+## see TIMING. What the BIOS does with its ROM, loading the font into the
+## pattern table, is not done.
+class BIOS:
+    def __init__(self: Self, machine: 'msx.MSX') -> None:
+        self.machine = machine
+        self.cpu = machine.cpu
+        self.vdp = machine.vdp
+        ## The routines by name, see install().
+        self.routines: Dict[str, Callable[[z80.Z80], int]] = {
+            'WRTVDP': self.wrtvdp, 'RDVRM': self.rdvrm, 'WRTVRM': self.wrtvrm, 'SETRD': self.setrd, 'SETWRT': self.setwrt,
+            'FILVRM': self.filvrm, 'LDIRMV': self.ldirmv, 'LDIRVM': self.ldirvm, 'CHGMOD': self.chgmod, 'CHGCLR': self.chgclr,
+            'DISSCR': self.disscr, 'ENASCR': self.enascr, 'CLRSPR': self.clrspr, 'WRTPSG': self.wrtpsg, 'RDPSG': self.rdpsg,
+            'GTSTCK': self.gtstck, 'GTTRIG': self.gttrig, 'RDVDP': self.rdvdp, 'RSLREG': self.rslreg, 'WSLREG': self.wslreg,
+            'SNSMAT': self.snsmat, 'TAPION': self.tapion, 'TAPIN': self.tapin, 'TAPIOF': self.tapiof,
+        }
+        ## The tape the tape routines read, see MSX.insert_cassette().
+        self.cassette: Optional[msx.cassette.Cassette] = None
+    
+    ## Traps the entry points of the routines, or of those in names.
+    def install(self: Self, names: Optional[Iterable[str]]=None) -> None:
+        names = self.routines if names is None else set(names)
+        for address, name in z80.disasm.instruction.AUX.ROUTINES.items():
+            if not name.startswith('bios.'):
+                continue
+            name = name[len('bios.'):].split('(')[0]
+            if name in self.routines and name in names:
+                self.cpu.trap(address, self.routines[name])
+    
+    ## The time of a routine for count bytes.
+    def _cycles(self: Self, name: str, count: int=0) -> int:
+        cycles, per_byte = TIMING[name]
+        return cycles + per_byte * count
+    
+    def _set_carry(self: Self, carry: bool) -> None:
+        registers = self.cpu.registers
+        registers.F = registers.F & ~z80.registers.FLAG_C | carry
+    
+    def _write_register(self: Self, register: int, value: int) -> None:
+        register &= 0x07
+        self.vdp.write_register(register, value)
+        self.cpu.ram[RG0SAV + register] = value
+    
+    
+    
+    ## VDP
+    def wrtvdp(self: Self, cpu: z80.Z80) -> int:
+        registers = cpu.registers
+        self._write_register(registers.C, registers.B)
+        return self._cycles('WRTVDP')
+    
+    def rdvrm(self: Self, cpu: z80.Z80) -> int:
+        cpu.registers.A = self.vdp.read_vram(cpu.registers.HL, 1)[0]
+        return self._cycles('RDVRM')
+    
+    def wrtvrm(self: Self, cpu: z80.Z80) -> int:
+        self.vdp.write_vram(cpu.registers.HL, bytes([ cpu.registers.A ]))
+        return self._cycles('WRTVRM')
+    
+    def setrd(self: Self, cpu: z80.Z80) -> int:
+        self.vdp.read_vram(cpu.registers.HL, 0)
+        return self._cycles('SETRD')
+    
+    def setwrt(self: Self, cpu: z80.Z80) -> int:
+        self.vdp.write_vram(cpu.registers.HL, b'')
+        return self._cycles('SETWRT')
+    
+    ## Fills BC bytes of VRAM from HL on with A.
+    def filvrm(self: Self, cpu: z80.Z80) -> int:
+        registers = cpu.registers
+        count = registers.BC or 0x10000
+        self.vdp.fill_vram(registers.HL, registers.A, count)
+        registers.BC = 0x0000
+        return self._cycles('FILVRM', count)
+    
+    ## Copies BC bytes from VRAM at HL to memory at DE.
+    def ldirmv(self: Self, cpu: z80.Z80) -> int:
+        registers = cpu.registers
+        count = registers.BC or 0x10000
+        values = self.vdp.read_vram(registers.HL, count)
+        ram = cpu.ram
+        DE = registers.DE
+        for offset, value in enumerate(values):
+            ram[(DE + offset) & 0xFFFF] = value
+        registers.BC = 0x0000
+        return self._cycles('LDIRMV', count)
+    
+    ## Copies BC bytes from memory at HL to VRAM at DE.
+    def ldirvm(self: Self, cpu: z80.Z80) -> int:
+        registers = cpu.registers
+        count = registers.BC or 0x10000
+        ram = cpu.ram
+        HL = registers.HL
+        values = bytes(ram[(HL + offset) & 0xFFFF] for offset in range(count))
+        self.vdp.write_vram(registers.DE, values)
+        registers.BC = 0x0000
+        return self._cycles('LDIRVM', count)
+    
+    ## Screen mode A (0 to 3): the registers and tables of the mode, the
+    ## colors, an empty screen and no sprites.
+    def chgmod(self: Self, cpu: z80.Z80) -> int:
+        mode = cpu.registers.A & 0x03
+        ram = cpu.ram
+        self.disscr(cpu)
+        for register, value in enumerate(MODES[mode]):
+            if register == 1:
+                value |= ram[RG0SAV + 1] & 0x03
+            self._write_register(register, value)
+        ram[SCRMOD] = mode
+        self.chgclr(cpu)
+        
+        vdp = self.vdp
+        colors = (ram[FORCLR] & 0x0F) << 4 | ram[BAKCLR] & 0x0F
+        match mode:
+            case 0:
+                vdp.fill_vram(0x0000, 0x20, 960)
+                count = 960
+            case 1:
+                vdp.fill_vram(0x1800, 0x20, 0x300)
+                vdp.fill_vram(0x2000, colors, 0x20)
+                count = 0x320
+            case 2:
+                vdp.write_vram(0x1800, bytes(range(0x100)) * 3)
+                vdp.fill_vram(0x0000, 0x00, 0x1800)
+                vdp.fill_vram(0x2000, colors, 0x1800)
+                count = 0x3300
+            case 3:
+                vdp.write_vram(0x0800, bytes(row // 4 * 32 + column for row in range(24) for column in range(32)))
+                vdp.fill_vram(0x0000, colors & 0x0F | (colors & 0x0F) << 4, 0x600)
+                count = 0x900
+        if mode:
+            count += 0x800
+            self.clrspr(cpu)
+        self.enascr(cpu)
+        return self._cycles('CHGMOD', count)
+    
+    ## Colors from FORCLR, BAKCLR and BDRCLR.
+    def chgclr(self: Self, cpu: z80.Z80) -> int:
+        ram = cpu.ram
+        backdrop = ram[BAKCLR] if ram[SCRMOD] == 0 else ram[BDRCLR]
+        self._write_register(7, (ram[FORCLR] & 0x0F) << 4 | backdrop & 0x0F)
+        return self._cycles('CHGCLR')
+    
+    def disscr(self: Self, cpu: z80.Z80) -> int:
+        self._write_register(1, self.vdp.registers[1] & ~0x40)
+        return self._cycles('DISSCR')
+    
+    def enascr(self: Self, cpu: z80.Z80) -> int:
+        self._write_register(1, self.vdp.registers[1] | 0x40)
+        return self._cycles('ENASCR')
+    
+    ## Empty sprite patterns, and the 32 sprites below the screen, with the
+    ## foreground color.
+    def clrspr(self: Self, cpu: z80.Z80) -> int:
+        vdp = self.vdp
+        attributes = (vdp.registers[5] & 0x7F) << 7
+        vdp.fill_vram((vdp.registers[6] & 0x07) << 11, 0x00, 0x800)
+        sprite = 4 if vdp.registers[1] & 0x02 else 1
+        vdp.write_vram(attributes, b''.join(bytes([ 209, 0, number * sprite, cpu.ram[FORCLR] & 0x0F ]) for number in range(32)))
+        return self._cycles('CLRSPR', 0x880)
+    
+    def rdvdp(self: Self, cpu: z80.Z80) -> int:
+        cpu.registers.A = self.vdp.read_status(0x99)
+        return self._cycles('RDVDP')
+    
+    
+    
+    ## PSG
+    def wrtpsg(self: Self, cpu: z80.Z80) -> int:
+        psg = self.machine.psg
+        psg.write_address(0xA0, cpu.registers.A)
+        psg.write_data(0xA1, cpu.registers.E)
+        return self._cycles('WRTPSG')
+    
+    def rdpsg(self: Self, cpu: z80.Z80) -> int:
+        psg = self.machine.psg
+        psg.write_address(0xA0, cpu.registers.A)
+        cpu.registers.A = psg.read_data(0xA2)
+        return self._cycles('RDPSG')
+    
+    
+    
+    ## Input, see msx.input
+    
+    ## The direction (see DIRECTIONS) of the cursor keys (A 0), or joystick
+    ## A.
+    def gtstck(self: Self, cpu: z80.Z80) -> int:
+        stick = cpu.registers.A
+        if stick == 0:
+            row = ~self.machine.ppi.matrix[8]
+            pressed = (row >> 5 & 1) | (row >> 6 & 1) << 1 | (row >> 4 & 1) << 2 | (row >> 7 & 1) << 3
+        elif stick <= 2:
+            pressed = ~self.machine.psg.joysticks[stick - 1] & 0x0F
+        else:
+            pressed = 0
+        cpu.registers.A = DIRECTIONS[pressed]
+        return self._cycles('GTSTCK')
+    
+    ## 0xFF if the space bar (A 0), or trigger A of joystick 1 (A 1) or 2 (A
+    ## 2), or trigger B of joystick 1 (A 3) or 2 (A 4) is pressed, else 0.
+    def gttrig(self: Self, cpu: z80.Z80) -> int:
+        trigger = cpu.registers.A
+        if trigger == 0:
+            row, bit = msx.input.KEYS['SPACE']
+            bits = self.machine.ppi.matrix[row]
+        elif trigger <= 4:
+            bit = 4 if trigger <= 2 else 5
+            bits = self.machine.psg.joysticks[(trigger - 1) & 1]
+        else:
+            bit, bits = 0, 0xFF
+        cpu.registers.A = 0x00 if bits & (1 << bit) else 0xFF
+        return self._cycles('GTTRIG')
+    
+    def snsmat(self: Self, cpu: z80.Z80) -> int:
+        row = cpu.registers.A
+        matrix = self.machine.ppi.matrix
+        cpu.registers.A = matrix[row] if row < len(matrix) else 0xFF
+        return self._cycles('SNSMAT')
+    
+    
+    
+    ## Slots
+    def rslreg(self: Self, cpu: z80.Z80) -> int:
+        cpu.registers.A = self.machine.ppi.primary_slot
+        return self._cycles('RSLREG')
+    
+    def wslreg(self: Self, cpu: z80.Z80) -> int:
+        self.machine.ppi.primary_slot = cpu.registers.A
+        return self._cycles('WSLREG')
+    
+    
+    
+    ## Cassette, see msx.cassette. Carry is set for an error, e.g. without
+    ## a tape. Like the BIOS, TAPION disables interrupts and TAPIOF enables
+    ## them again.
+    def tapion(self: Self, cpu: z80.Z80) -> int:
+        cpu.registers.IFF1 = cpu.registers.IFF2 = 0
+        self._set_carry(self.cassette is None or self.cassette.tapion(cpu))
+        return self._cycles('TAPION')
+    
+    def tapin(self: Self, cpu: z80.Z80) -> int:
+        self._set_carry(self.cassette is None or self.cassette.tapin(cpu))
+        return self._cycles('TAPIN')
+    
+    def tapiof(self: Self, cpu: z80.Z80) -> int:
+        if self.cassette is not None:
+            self.cassette.tapiof(cpu)
+        cpu.registers.IFF1 = cpu.registers.IFF2 = 1
+        self._set_carry(False)
+        return self._cycles('TAPIOF')
@@ -0,0 +1,78 @@
+from   typing import Self, Dict, List, Optional, Type
+import msx.scc
+
+
+
+## Cartridges are in memory from 0x4000 to 0xC000. The ROM is read as plain
+## memory; writes go to the cartridge (see RAM.map()), which ignores them
+## unless they hit one of its registers.
+START = 0x4000
+END   = 0xC000
+
+
+
+## A ROM of up to 32K, without a mapper.
+class Cartridge:
+    def __init__(self: Self, machine: 'msx.MSX', rom: bytes) -> None:
+        self.machine = machine
+        self.rom = rom
+        ram = machine.cpu.ram
+        size = min(len(rom), END - START)
+        ram._ram[START:START + size] = rom[:size]
+        if ram.code is not None:
+            ram.invalidate(slice(START, END))
+        ram.map(START, END, write=self.write)
+    
+    def write(self: Self, address: int, value: int) -> None:
+        pass
+
+
+
+## The Konami mapper with the SCC: four banks of 8K, at 0x4000, 0x6000,
+## 0x8000 and 0xA000, selected by writing the bank number to 0x5000, 0x7000,
+## 0x9000 and 0xB000 (up to 0x7FF higher). Selecting 0x3F in the third
+## bank register puts the SCC at 0x9800-0x9FFF, see msx.scc.
+##
+## A bank switch copies the bank into memory, so reading the ROM stays
+## plain, and drops the decoded instructions there.
+class KonamiSCC(Cartridge):
+    BANK_SIZE = 0x2000
+    SCC_BANK  = 0x3F
+    
+    def __init__(self: Self, machine: 'msx.MSX', rom: bytes) -> None:
+        self.machine = machine
+        ## The ROM, padded to whole banks, and the bank in every window.
+        self.rom = rom + bytes(-len(rom) % self.BANK_SIZE)
+        self.bank_count = len(self.rom) // self.BANK_SIZE
+        self.banks: List[int] = [ 0, 1, 2, 3 ]
+        self.scc = machine.add_scc()
+        self.scc_enabled = False
+        machine.cpu.ram.map(START, END, write=self.write)
+        for window in range(4):
+            self.select(window, window)
+    
+    def write(self: Self, address: int, value: int) -> None:
+        if address & 0x1800 == 0x1000:
+            self.select((address - START) >> 13, value)
+        elif self.scc_enabled and address >= msx.scc.BASE and address < 0xA000:
+            self.scc.write(address, value)
+    
+    def select(self: Self, window: int, bank: int) -> None:
+        self.banks[window] = bank
+        bank %= self.bank_count
+        ram = self.machine.cpu.ram
+        start = START + window * self.BANK_SIZE
+        ram._ram[start:start + self.BANK_SIZE] = self.rom[bank * self.BANK_SIZE:(bank + 1) * self.BANK_SIZE]
+        if ram.code is not None:
+            ram.invalidate(slice(start, start + self.BANK_SIZE))
+        if window == 2:
+            self.scc_enabled = self.banks[2] & 0x3F == self.SCC_BANK
+            ram.map(msx.scc.BASE, 0xA000, read=self.scc.read if self.scc_enabled else None, write=self.write)
+
+
+
+## The cartridge classes by mapper name, see MSX.insert_cartridge().
+MAPPERS: Dict[Optional[str], Type[Cartridge]] = {
+    None: Cartridge,
+    'konami_scc': KonamiSCC,
+}
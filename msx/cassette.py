@@ -0,0 +1,75 @@
+from   typing import Self, Optional, Union
+import mmap
+import z80
+
+
+
+## Every block of a .CAS image starts with this header, at a multiple of 8
+## bytes into the file. On tape, it stands for the sync tone before a block.
+HEADER = bytes([ 0x1F, 0xA6, 0xDE, 0xBA, 0xCC, 0x13, 0x7D, 0x74 ])
+
+
+
+## A tape as a .CAS image: the bytes of the blocks, without the bit stream
+## around them. The image is memory mapped, and the BIOS routines that read
+## the tape (see msx.bios) are served from it:
+##
+##   TAPION  skips to after the next block header, carry set if there is none
+##   TAPIN   the next byte in A, carry set at the end of the tape
+##   TAPIOF  stops the tape
+##
+## so loading a program takes no emulated time to speak of.
+class Cassette:
+    def __init__(self: Self, filename: str) -> None:
+        self.filename = filename
+        self._file = open(filename, 'rb')
+        self.data: Union[mmap.mmap, bytes] = b''
+        if self._file.seek(0, 2):
+            self.data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        ## Where the tape is, and whether it was started by TAPION.
+        self.position = 0
+        self.motor = False
+    
+    def rewind(self: Self) -> None:
+        self.position = 0
+        self.motor = False
+    
+    def close(self: Self) -> None:
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.data = b''
+        self._file.close()
+    
+    ## The position after the next block header, None at the end of the tape.
+    def next_block(self: Self) -> Optional[int]:
+        position = self.position
+        while True:
+            found = self.data.find(HEADER, position)
+            if found < 0:
+                return None
+            if found % 8 == 0:
+                return found + len(HEADER)
+            position = found + 1
+    
+    
+    
+    ## BIOS routines, see msx.bios. They return the carry flag.
+    def tapion(self: Self, cpu: z80.Z80) -> bool:
+        block = self.next_block()
+        if block is None:
+            self.position = len(self.data)
+            return True
+        self.position = block
+        self.motor = True
+        return False
+    
+    def tapin(self: Self, cpu: z80.Z80) -> bool:
+        if self.position >= len(self.data):
+            return True
+        cpu.registers.A = self.data[self.position]
+        self.position += 1
+        return False
+    
+    def tapiof(self: Self, cpu: z80.Z80) -> bool:
+        self.motor = False
+        return False
@@ -0,0 +1,81 @@
+from   typing import Self, Dict, Iterable, List, Tuple
+
+
+
+## Input as the machine reads it: the rows of the keyboard matrix (see 
+## msx.ppi.PPI), 0 to 10, and the two joysticks (on I/O port A of the PSG,
+## see msx.psg.PSG), as rows JOYSTICK_1 and JOYSTICK_2. In all of them the
+## bits of what is pressed are 0.
+JOYSTICK_1 = 0x10
+JOYSTICK_2 = 0x11
+
+## The keys (of the international keyboard) and joystick directions and
+## buttons, as their row and bit.
+KEYS: Dict[str, Tuple[int, int]] = {}
+
+_LAYOUT = [
+    [ '0', '1', '2', '3', '4', '5', '6', '7' ],
+    [ '8', '9', '-', '=', '\\', '[', ']', ';' ],
+    [ "'", '`', ',', '.', '/', 'DEAD', 'A', 'B' ],
+    [ 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J' ],
+    [ 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R' ],
+    [ 'S', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z' ],
+    [ 'SHIFT', 'CTRL', 'GRAPH', 'CAPS', 'CODE', 'F1', 'F2', 'F3' ],
+    [ 'F4', 'F5', 'ESC', 'TAB', 'STOP', 'BS', 'SELECT', 'RETURN' ],
+    [ 'SPACE', 'HOME', 'INS', 'DEL', 'LEFT', 'UP', 'DOWN', 'RIGHT' ],
+    [ 'NUM*', 'NUM+', 'NUM/', 'NUM0', 'NUM1', 'NUM2', 'NUM3', 'NUM4' ],
+    [ 'NUM5', 'NUM6', 'NUM7', 'NUM8', 'NUM9', 'NUM-', 'NUM,', 'NUM.' ],
+]
+for row, names in enumerate(_LAYOUT):
+    for bit, name in enumerate(names):
+        KEYS[name] = (row, bit)
+for number, row in ((1, JOYSTICK_1), (2, JOYSTICK_2)):
+    for bit, name in enumerate([ 'UP', 'DOWN', 'LEFT', 'RIGHT', 'A', 'B' ]):
+        KEYS['JOY%d_%s' % (number, name)] = (row, bit)
+
+
+
+## A script of input: (frame, row, bits) entries, setting the row to bits
+## at the start of the frame (the vertical blank that ends the frame before,
+## see msx.vdp.VDP), frames counted from when the machine was made. 
+##
+## The entries are sorted by frame once, and MSX.play() applies them from
+## events at those frames, so nothing polls for input and the same script
+## gives the same run every time.
+class InputTimeline:
+    def __init__(self: Self, entries: Iterable[Tuple[int, int, int]]) -> None:
+        self.entries: List[Tuple[int, int, int]] = sorted(entries, key=lambda entry: entry[0])
+    
+    def __len__(self: Self) -> int:
+        return len(self.entries)
+    
+    ## The timeline of key presses: (frame, frames, key) is key (see KEYS)
+    ## held down from frame on for frames frames.
+    @classmethod
+    def from_presses(cls, presses: Iterable[Tuple[int, int, str]]) -> 'InputTimeline':
+        ## Changes of the number of presses holding every key, by frame.
+        changes: Dict[int, Dict[Tuple[int, int], int]] = {}
+        for frame, frames, key in presses:
+            if frames <= 0:
+                continue
+            position = KEYS[key]
+            for at, change in ((frame, 1), (frame + frames, -1)):
+                keys = changes.setdefault(at, {})
+                keys[position] = keys.get(position, 0) + change
+        
+        held: Dict[Tuple[int, int], int] = {}
+        rows: Dict[int, int] = {}
+        entries: List[Tuple[int, int, int]] = []
+        for frame in sorted(changes):
+            for position, change in changes[frame].items():
+                held[position] = held.get(position, 0) + change
+            changed: Dict[int, int] = {}
+            for (row, bit), count in held.items():
+                changed.setdefault(row, 0xFF)
+                if count > 0:
+                    changed[row] &= ~(1 << bit)
+            for row, bits in sorted(changed.items()):
+                if rows.get(row, 0xFF) != bits:
+                    rows[row] = bits
+                    entries.append((frame, row, bits))
+        return cls(entries)
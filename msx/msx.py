@@ -0,0 +1,191 @@
+from   typing import Self, List, Optional, Tuple
+import functools
+import numpy as np
+import z80
+import msx.bios
+import msx.cartridge
+import msx.cassette
+import msx.input
+import msx.ppi
+import msx.psg
+import msx.scc
+import msx.sound
+import msx.vdp
+
+
+
+## An MSX1: a Z80 (made with the options, see z80.Z80) with 64K of RAM, the
+## video chip and the sound chip. With scc, the SCC sound chip of Konami 
+## cartridges is at 0x9800-0x98FF (without a cartridge to switch it, see
+## insert_cartridge()). With expanded_slot, 0xFFFF is the secondary slot
+## register. With hle_bios, calls to the BIOS run natively, see msx.bios.
+##
+## run_frames() is the main loop, one frame (up to the vertical blank) at a
+## time. With render or audio off (fast forward), the devices keep their 
+## state exact, but leave composing the picture (and, for the sound chips,
+## the samples of the last second, see msx.sound.SoundChip) until they are
+## asked for them.
+##
+## Input (keyboard and joysticks) comes from an input timeline, see play()
+## and msx.input.
+class MSX:
+    def __init__(self: Self, scc: bool=False, expanded_slot: bool=False, hle_bios: bool=False, **options) -> None:
+        self.cpu = z80.Z80(**options)
+        self.cpu.ram._ram[:] = bytes(len(self.cpu.ram._ram))
+        
+        self.render = True
+        self.audio = False
+        
+        ## The devices put themselves on the I/O ports of the CPU, see
+        ## z80.io.IOBus.
+        self.vdp = msx.vdp.VDP(self.cpu)
+        self.psg = msx.psg.PSG(self.cpu)
+        self.ppi = msx.ppi.PPI(self.cpu)
+        self.sound_chips: List[msx.sound.SoundChip] = [ self.psg ]
+        self.scc: Optional[msx.scc.SCC] = None
+        if scc:
+            self.add_scc()
+            self.cpu.ram.map(msx.scc.BASE, msx.scc.BASE + msx.scc.SIZE, read=self.scc.read, write=self.scc.write)
+        self.sound = msx.sound.SoundOutput()
+        
+        self.cartridge: Optional[msx.cartridge.Cartridge] = None
+        
+        ## The secondary slot register at 0xFFFF, with expanded_slot.
+        self.secondary_slot = 0x00
+        if expanded_slot:
+            self.cpu.ram.map(0xFF00, 0x10000, read=self._read_slot, write=self._write_slot)
+        
+        self.bios = msx.bios.BIOS(self)
+        if hle_bios:
+            self.bios.install()
+        
+        ## The input timeline being played, the next entry of it, and which
+        ## play() it is, for the events of an earlier one.
+        self._timeline: List[Tuple[int, int, int]] = []
+        self._timeline_position = 0
+        self._timeline_generation = 0
+    
+    ## Puts data (a ROM image) in memory at address.
+    def load(self: Self, data: bytes, address: int) -> None:
+        ram = self.cpu.ram
+        ram._ram[address:address + len(data)] = data
+        if ram.code is not None:
+            ram.invalidate(slice(address, address + len(data)))
+    
+    ## Runs n frames. Composes the picture of every frame with render, and
+    ## synthesizes the sound of every frame into sound with audio.
+    def run_frames(self: Self, n: int, render: bool=False, audio: bool=False) -> None:
+        self.render = self.vdp.render = render
+        self.audio = audio
+        for chip in self.sound_chips:
+            chip.audio = audio
+        for _ in range(n):
+            self.cpu.run_cycles(self.vdp.next_vblank - self.cpu.cycles)
+            if audio:
+                self._synthesize()
+            else:
+                for chip in self.sound_chips:
+                    chip.skip(self.cpu.cycles)
+    
+    ## Synthesizes the sound up to now into sound, including what was left
+    ## by running without audio. A chip may have less of it, e.g. an SCC 
+    ## added since: the samples of the chips end together.
+    def _synthesize(self: Self) -> None:
+        cycles = self.cpu.cycles
+        chips = [ chip.synthesize(cycles) for chip in self.sound_chips ]
+        samples = max(chips, key=len)
+        for chip in chips:
+            if chip is not samples and len(chip):
+                samples[-len(chip):] += chip
+        self.sound.write(samples)
+    
+    ## Plays the input in timeline from now on, instead of any timeline
+    ## played before. Entries of frames already begun are applied at once.
+    def play(self: Self, timeline: msx.input.InputTimeline) -> None:
+        self._timeline = timeline.entries
+        self._timeline_position = 0
+        self._timeline_generation += 1
+        self._schedule_input()
+    
+    ## Sets row (see msx.input) to bits.
+    def input(self: Self, row: int, bits: int) -> None:
+        if row < msx.input.JOYSTICK_1:
+            self.ppi.matrix[row] = bits
+        else:
+            self.psg.joysticks[row - msx.input.JOYSTICK_1] = bits & 0x3F
+    
+    ## One event for every frame with entries: at the vertical blank that
+    ## starts it.
+    def _schedule_input(self: Self) -> None:
+        if self._timeline_position >= len(self._timeline):
+            return
+        frame = self._timeline[self._timeline_position][0]
+        at = self.vdp.next_vblank + (frame - self.vdp.frames - 1) * msx.vdp.FRAME
+        self.cpu.schedule(max(at, self.cpu.cycles), functools.partial(self._play_input, self._timeline_generation, frame))
+    
+    def _play_input(self: Self, generation: int, frame: int) -> None:
+        if generation != self._timeline_generation:
+            return
+        timeline = self._timeline
+        while self._timeline_position < len(timeline) and timeline[self._timeline_position][0] <= frame:
+            _, row, bits = timeline[self._timeline_position]
+            self.input(row, bits)
+            self._timeline_position += 1
+        self._schedule_input()
+    
+    ## The picture of the last frame as palette indices, see msx.vdp.PALETTE.
+    def frame(self: Self) -> bytearray:
+        return self.vdp.frame()
+    
+    ## Takes up to count samples of the sound out of the buffer, see 
+    ## msx.sound.SoundOutput, after synthesizing what is left to.
+    def samples(self: Self, count: Optional[int]=None) -> np.ndarray:
+        self._synthesize()
+        return self.sound.read(count)
+    
+    ## Streams the sound to a WAV file, while running with audio.
+    def record(self: Self, filename: str) -> None:
+        self.sound.record(filename)
+    
+    
+    
+    ## The SCC, if there is none yet. Where it is in memory is up to the 
+    ## cartridge.
+    def add_scc(self: Self) -> msx.scc.SCC:
+        if self.scc is None:
+            self.scc = msx.scc.SCC(self.cpu)
+            self.scc.audio = self.audio
+            self.sound_chips.append(self.scc)
+        return self.scc
+    
+    ## Puts a cartridge ROM in slot 1, at 0x4000, see msx.cartridge.
+    def insert_cartridge(self: Self, rom: bytes, mapper: Optional[str]=None) -> msx.cartridge.Cartridge:
+        self.cartridge = msx.cartridge.MAPPERS[mapper](self, rom)
+        return self.cartridge
+    
+    ## Puts the .CAS image in filename in the cassette player, see
+    ## msx.cassette. Its BIOS routines are trapped, with hle_bios or not.
+    def insert_cassette(self: Self, filename: str) -> msx.cassette.Cassette:
+        self.eject_cassette()
+        self.bios.cassette = msx.cassette.Cassette(filename)
+        self.bios.install([ 'TAPION', 'TAPIN', 'TAPIOF' ])
+        return self.bios.cassette
+    
+    def eject_cassette(self: Self) -> None:
+        if self.bios.cassette is not None:
+            self.bios.cassette.close()
+            self.bios.cassette = None
+    
+    ## The page of 0xFFFF, the secondary slot register. It reads back 
+    ## inverted.
+    def _read_slot(self: Self, address: int) -> int:
+        if address == 0xFFFF:
+            return ~self.secondary_slot & 0xFF
+        return self.cpu.ram._ram[address]
+    
+    def _write_slot(self: Self, address: int, value: int) -> None:
+        if address == 0xFFFF:
+            self.secondary_slot = value
+        else:
+            self.cpu.ram.store(address, value)
+
@@ -0,0 +1,63 @@
+from   typing import Self
+import z80
+
+
+
+## Rows of the keyboard matrix (see msx.input.KEYS). Reading a row past
+## these gives 0xFF.
+ROWS = 11
+
+
+
+## The 8255 PPI, on ports 0xA8 to 0xAB, or from port on:
+##
+##   0xA8  port A: the primary slot register, the slot of every 16K page
+##   0xA9  port B: the row of the keyboard matrix selected in port C, with
+##         the bits of the keys that are pressed 0
+##   0xAA  port C: the keyboard row (bits 0-3), cassette motor off (4), 
+##         cassette output (5), CAPS lamp off (6) and key click (7)
+##   0xAB  control: the mode with bit 7 set, else sets (bit 0 set) or
+##         resets (bit 0 clear) the bit of port C numbered by bits 1-3
+##
+## Only mode 0, with ports A and C output and B input as the BIOS sets it,
+## is there. The primary slot register is kept but switches nothing: memory
+## is as the machine maps it (see MSX).
+class PPI:
+    def __init__(self: Self, cpu: z80.Z80, port: int=0xA8) -> None:
+        cpu.io.register(port, read=self.read_slot, write=self.write_slot)
+        cpu.io.register(port + 1, read=self.read_keyboard)
+        cpu.io.register(port + 2, read=self.read_c, write=self.write_c)
+        cpu.io.register(port + 3, write=self.write_control)
+        self.primary_slot = 0x00
+        self.port_c = 0x50
+        self.mode = 0x82
+        ## The keyboard matrix, see msx.input.
+        self.matrix = bytearray(b'\xFF' * ROWS)
+    
+    def read_slot(self: Self, port: int) -> int:
+        return self.primary_slot
+    
+    def write_slot(self: Self, port: int, value: int) -> None:
+        self.primary_slot = value
+    
+    def read_keyboard(self: Self, port: int) -> int:
+        row = self.port_c & 0x0F
+        if row < ROWS:
+            return self.matrix[row]
+        return 0xFF
+    
+    def read_c(self: Self, port: int) -> int:
+        return self.port_c
+    
+    def write_c(self: Self, port: int, value: int) -> None:
+        self.port_c = value
+    
+    def write_control(self: Self, port: int, value: int) -> None:
+        if value & 0x80:
+            self.mode = value
+            return
+        bit = 1 << ((value >> 1) & 0x07)
+        if value & 0x01:
+            self.port_c |= bit
+        else:
+            self.port_c &= ~bit
@@ -0,0 +1,137 @@
+from   typing import Self
+import numpy as np
+import z80
+import msx.sound
+
+
+
+## The PSG runs at half the CPU clock. In PSG clock ticks, the tone outputs
+## toggle every 8 * period, the noise shift register and the envelope step
+## every 16 * period.
+CLOCK = msx.sound.CPU_CLOCK / 2
+TICKS_PER_SAMPLE = CLOCK / msx.sound.RATE
+
+## Bits of the registers that exist.
+REGISTER_MASKS = bytes([ 0xFF, 0x0F, 0xFF, 0x0F, 0xFF, 0x0F, 0x1F, 0xFF, 0x1F, 0x1F, 0x1F, 0xFF, 0xFF, 0x0F, 0xFF, 0xFF ])
+
+## Amplitude of the 16 volume levels, 3 dB apart, and of the whole chip in
+## the output (see msx.sound.SoundOutput).
+LEVELS = np.array([ 0.0 ] + [ 2 ** ((level - 15) / 2) for level in range(1, 16) ], dtype=np.float32)
+VOLUME = 0.5
+
+## The output of the noise generator: bit 0 of a 17 bit shift register with
+## feedback from bits 0 and 3, over a whole period.
+def _noise() -> np.ndarray:
+    bits = bytearray(2 ** 17 - 1)
+    state = 1
+    for i in range(len(bits)):
+        bits[i] = state & 1
+        state = (state >> 1) | ((state ^ (state >> 3)) & 1) << 16
+    return np.frombuffer(bytes(bits), dtype=np.uint8)
+
+NOISE = _noise()
+
+
+
+## The AY-3-8910 sound chip, on ports 0xA0 (register number), 0xA1 (write)
+## and 0xA2 (read), or from port on. See msx.sound.SoundChip for how the 
+## sound is made. The joysticks are on its I/O port A.
+class PSG(msx.sound.SoundChip):
+    def __init__(self: Self, cpu: z80.Z80, port: int=0xA0, resolution: int=16 * 228) -> None:
+        super().__init__(cpu, resolution)
+        cpu.io.register(port, write=self.write_address)
+        cpu.io.register(port + 1, write=self.write_data)
+        cpu.io.register(port + 2, read=self.read_data)
+        self.registers = bytearray(16)
+        self.address = 0
+        ## I/O port A (register 14): the joystick that bit 6 of register 15
+        ## selects in bits 0-5 (see msx.input), the bits of port_a above.
+        self.joysticks = [ 0x3F, 0x3F ]
+        self.port_a = 0xC0
+        
+        ## The synthesis: the registers as of the last sample synthesized,
+        ## and the state of the generators (in PSG clock ticks into their
+        ## period).
+        self._registers = bytearray(16)
+        self._tone = [ 0.0, 0.0, 0.0 ]
+        self._noise = 0.0
+        self._noise_position = 0
+        self._envelope = 0.0
+        self._envelope_step = 0
+    
+    
+    
+    ## Ports
+    def write_address(self: Self, port: int, value: int) -> None:
+        self.address = value & 0x0F
+    
+    def write_data(self: Self, port: int, value: int) -> None:
+        register = self.address
+        value &= REGISTER_MASKS[register]
+        self.registers[register] = value
+        self.log(register, value)
+    
+    def read_data(self: Self, port: int) -> int:
+        if self.address == 14:
+            return self.port_a | self.joysticks[self.registers[15] >> 6 & 1] & 0x3F
+        return self.registers[self.address]
+    
+    
+    
+    ## Synthesis
+    def _apply(self: Self, register: int, value: int) -> None:
+        self._registers[register] = value
+        if register == 13:
+            self._envelope = 0.0
+            self._envelope_step = 0
+    
+    ## Adds the output of the chip to samples, with the registers as they are
+    ## in _registers.
+    def _block(self: Self, samples: np.ndarray) -> None:
+        count = len(samples)
+        if count == 0:
+            return
+        registers = self._registers
+        ticks = np.arange(count, dtype=np.float64) * TICKS_PER_SAMPLE
+        elapsed = count * TICKS_PER_SAMPLE
+        mixer = registers[7]
+        
+        ## Noise, as the position in NOISE of every sample.
+        period = 16 * (registers[6] or 1)
+        steps = ((self._noise + ticks) // period).astype(np.int64)
+        noise = NOISE[(self._noise_position + steps) % len(NOISE)]
+        done = int((self._noise + elapsed) // period)
+        self._noise_position = (self._noise_position + done) % len(NOISE)
+        self._noise = self._noise + elapsed - done * period
+        
+        ## Envelope, as the step since the shape was written: a ramp of 16
+        ## steps, up with attack, then (with continue) held, or repeated,
+        ## turning around every time with alternate.
+        shape = registers[13]
+        period = 16 * ((registers[12] << 8 | registers[11]) or 1)
+        steps = self._envelope_step + ((self._envelope + ticks) // period).astype(np.int64)
+        done = int((self._envelope + elapsed) // period)
+        self._envelope_step = min(self._envelope_step + done, 32) if shape & 0x01 or not shape & 0x08 else (self._envelope_step + done) % 32
+        self._envelope = self._envelope + elapsed - done * period
+        attack = bool(shape & 0x04)
+        position = steps & 0x0F
+        first = np.where(attack, position, 15 - position)
+        if not shape & 0x08:
+            envelope = np.where(steps < 16, first, 0)
+        elif shape & 0x01:
+            envelope = np.where(steps < 16, first, 15 if attack ^ bool(shape & 0x02) else 0)
+        else:
+            up = attack ^ (bool(shape & 0x02) & ((steps >> 4) & 1).astype(bool))
+            envelope = np.where(up, position, 15 - position)
+        envelope = LEVELS[envelope]
+        
+        for channel in range(3):
+            period = 8 * ((registers[2 * channel + 1] << 8 | registers[2 * channel]) or 1)
+            tone = ((self._tone[channel] + ticks) // period).astype(np.int64) & 1
+            self._tone[channel] = (self._tone[channel] + elapsed) % (2 * period)
+            output = (tone | (mixer >> channel & 1)) & (noise | (mixer >> (channel + 3) & 1))
+            if not output.any():
+                continue
+            volume = registers[8 + channel]
+            amplitude = envelope if volume & 0x10 else LEVELS[volume & 0x0F]
+            samples += output * amplitude * (VOLUME / 3)
@@ -0,0 +1,95 @@
+from   typing import Self
+import numpy as np
+import z80
+import msx.sound
+
+
+
+## The SCC runs at the CPU clock. A channel steps to the next of the 32
+## samples of its waveform every period + 1 ticks.
+TICKS_PER_SAMPLE = msx.sound.CPU_CLOCK / msx.sound.RATE
+
+## Where the SCC is, in bank 3 of a Konami SCC cartridge (see 
+## msx.cartridge.KonamiSCC), mirrored up to 0xA000.
+BASE = 0x9800
+SIZE = 0x100
+
+## Shortest period that makes a sound. Below that the channel is muted.
+MIN_PERIOD = 9
+
+## Amplitude of the whole chip in the output (see msx.sound.SoundOutput).
+VOLUME = 0.5
+
+
+
+## The Konami SCC sound chip: five channels, each playing a waveform of 32
+## signed bytes. The fourth and fifth channel share a waveform. Offsets in
+## its window (BASE):
+##
+##   0x00-0x7F  waveforms of channels 1 to 4
+##   0x80-0x89  periods of the channels, 12 bits, low byte first
+##   0x8A-0x8E  volumes of the channels, 4 bits
+##   0x8F       channel enable bits
+##   0x90-0x9F  the same registers again
+##
+## Only the waveforms can be read back, the rest reads 0xFF. See
+## msx.sound.SoundChip for how the sound is made; the registers it logs
+## are the offsets.
+class SCC(msx.sound.SoundChip):
+    def __init__(self: Self, cpu: z80.Z80, resolution: int=16 * 228) -> None:
+        super().__init__(cpu, resolution)
+        self.waves = bytearray(0x80)
+        self.registers = bytearray(0x10)
+        
+        ## The synthesis: the waveforms and registers as of the last sample
+        ## synthesized, and how far (in ticks) every channel is into its
+        ## waveform.
+        self._waves = np.zeros((4, 32), dtype=np.float32)
+        self._registers = bytearray(0x10)
+        self._phase = [ 0.0 ] * 5
+    
+    ## Memory handlers (see RAM.map()), for the window and its mirrors.
+    def read(self: Self, address: int) -> int:
+        offset = address & 0xFF
+        if offset < 0x80:
+            return self.waves[offset]
+        return 0xFF
+    
+    def write(self: Self, address: int, value: int) -> None:
+        offset = address & 0xFF
+        if offset < 0x80:
+            self.waves[offset] = value
+        elif offset < 0xA0:
+            offset = 0x80 | (offset & 0x0F)
+            self.registers[offset & 0x0F] = value
+        else:
+            return
+        self.log(offset, value)
+    
+    
+    
+    ## Synthesis
+    def _apply(self: Self, offset: int, value: int) -> None:
+        if offset < 0x80:
+            self._waves[offset >> 5, offset & 0x1F] = value - 0x100 if value & 0x80 else value
+        else:
+            self._registers[offset & 0x0F] = value
+    
+    def _block(self: Self, samples: np.ndarray) -> None:
+        count = len(samples)
+        if count == 0:
+            return
+        registers = self._registers
+        ticks = np.arange(count, dtype=np.float64) * TICKS_PER_SAMPLE
+        elapsed = count * TICKS_PER_SAMPLE
+        for channel in range(5):
+            period = ((registers[2 * channel + 1] & 0x0F) << 8 | registers[2 * channel]) + 1
+            phase = self._phase[channel]
+            self._phase[channel] = (phase + elapsed) % (32 * period)
+            volume = registers[0x0A + channel] & 0x0F
+            if not registers[0x0F] & (1 << channel) or not volume or period <= MIN_PERIOD:
+                continue
+            ## The sample of the waveform at every sample of the output.
+            positions = ((phase + ticks) // period).astype(np.int64) & 0x1F
+            wave = self._waves[min(channel, 3)]
+            samples += wave[positions] * (volume * VOLUME / (128 * 15 * 5))
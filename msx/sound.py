@@ -0,0 +1,165 @@
+from   typing import Self, List, Optional, Tuple
+import abc
+import wave
+import numpy as np
+import z80
+
+
+
+## The CPU clock, which the sound chips count time in, and the sample rate
+## of the output.
+CPU_CLOCK = 3579545
+RATE      = 44100
+
+## Number of the sample at time cycles (in T-states). The sound chips
+## synthesize the samples between two of these, so their blocks line up.
+def sample_index(cycles: int) -> int:
+    return cycles * RATE // CPU_CLOCK
+
+
+
+## The part of a sound chip that turns register writes into samples.
+##
+## Register writes take effect at once, so the state of the chip is exact.
+## For the sound they are logged with their time, and synthesize() later
+## works out the samples up to a time in blocks between the writes, with
+## NumPy operations on whole blocks instead of a loop over the samples.
+## Without audio, skip() leaves the samples to the next synthesize(), which
+## works them out in one go. Only the last keep seconds of them are kept: 
+## the writes before those are applied without synthesizing anything.
+##
+## The time of a write is the CPU cycles at the start of the slice run up
+## to the next event (see Z80.run_cycles()). With audio, the chip schedules
+## an event every resolution T-states to keep these short.
+##
+## A chip implements _apply(), to put a logged write into the registers the
+## blocks are synthesized with, and _block().
+class SoundChip(abc.ABC):
+    def __init__(self: Self, cpu: z80.Z80, resolution: int=16 * 228, keep: float=1.0) -> None:
+        self.cpu = cpu
+        self.resolution = resolution
+        self.keep = int(keep * RATE)
+        self._audio = False
+        self._ticking = False
+        ## (cycles, register, value) of the writes not synthesized yet, and
+        ## the next sample.
+        self._log: List[Tuple[int, int, int]] = []
+        self._sample = sample_index(cpu.cycles)
+    
+    def log(self: Self, register: int, value: int) -> None:
+        self._log.append((self.cpu.cycles, register, value))
+    
+    ## With audio, writes are logged for synthesize() (at the resolution).
+    @property
+    def audio(self: Self) -> bool:
+        return self._audio
+    
+    @audio.setter
+    def audio(self: Self, audio: bool) -> None:
+        if audio and not self._audio:
+            if not self._ticking:
+                self._ticking = True
+                self.cpu.schedule(self.cpu.cycles + self.resolution, self._tick)
+        self._audio = audio
+    
+    def _tick(self: Self) -> None:
+        self._ticking = self._audio
+        if self._audio:
+            self.cpu.schedule(self.cpu.cycles + self.resolution, self._tick)
+    
+    ## Leaves the samples up to time cycles to the next synthesize(), but 
+    ## for the last keep seconds of them.
+    def skip(self: Self, cycles: int) -> None:
+        sample = sample_index(cycles) - self.keep
+        if sample <= self._sample:
+            return
+        log = self._log
+        applied = 0
+        while applied < len(log) and sample_index(log[applied][0]) < sample:
+            self._apply(log[applied][1], log[applied][2])
+            applied += 1
+        del log[:applied]
+        self._sample = sample
+    
+    ## The samples up to time cycles, as floats.
+    def synthesize(self: Self, cycles: int) -> np.ndarray:
+        end = sample_index(cycles)
+        samples = np.zeros(max(end - self._sample, 0), dtype=np.float32)
+        done = 0
+        for at, register, value in self._log:
+            block = min(max(sample_index(at) - self._sample, done), len(samples))
+            self._block(samples[done:block])
+            done = block
+            self._apply(register, value)
+        self._block(samples[done:])
+        self._log.clear()
+        self._sample = max(end, self._sample)
+        return samples
+    
+    @abc.abstractmethod
+    def _apply(self: Self, register: int, value: int) -> None: pass
+    
+    ## Adds the output of the chip to samples.
+    @abc.abstractmethod
+    def _block(self: Self, samples: np.ndarray) -> None: pass
+
+
+
+## Where the sound of the machine goes: a ring buffer of 16 bit samples
+## (mono, RATE per second) for whoever plays it, and optionally a WAV file
+## that every sample is streamed to.
+##
+## Samples come in as floats in [-1, 1], the sum of the sound chips. When
+## the buffer is full, the oldest samples are dropped.
+class SoundOutput:
+    def __init__(self: Self, seconds: float=1.0) -> None:
+        self.buffer = np.zeros(int(seconds * RATE), dtype=np.int16)
+        ## Position of the oldest sample, and the number of samples.
+        self._start = 0
+        self._count = 0
+        self.wav: Optional[wave.Wave_write] = None
+    
+    def __len__(self: Self) -> int:
+        return self._count
+    
+    def write(self: Self, samples: np.ndarray) -> None:
+        samples = (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+        if self.wav is not None:
+            self.wav.writeframes(samples.astype('<i2').tobytes())
+        
+        size = len(self.buffer)
+        if len(samples) >= size:
+            self.buffer[:] = samples[-size:]
+            self._start, self._count = 0, size
+            return
+        end = (self._start + self._count) % size
+        first = min(len(samples), size - end)
+        self.buffer[end:end + first] = samples[:first]
+        self.buffer[:len(samples) - first] = samples[first:]
+        self._count += len(samples)
+        if self._count > size:
+            self._start = (self._start + self._count - size) % size
+            self._count = size
+    
+    ## Takes up to count of the oldest samples out of the buffer, all of
+    ## them without a count.
+    def read(self: Self, count: Optional[int]=None) -> np.ndarray:
+        count = self._count if count is None else min(count, self._count)
+        indices = (self._start + np.arange(count)) % len(self.buffer)
+        samples = self.buffer[indices]
+        self._start = (self._start + count) % len(self.buffer)
+        self._count -= count
+        return samples
+    
+    ## Streams the samples to a WAV file from now on.
+    def record(self: Self, filename: str) -> None:
+        self.stop_recording()
+        self.wav = wave.open(filename, 'wb')
+        self.wav.setnchannels(1)
+        self.wav.setsampwidth(2)
+        self.wav.setframerate(RATE)
+    
+    def stop_recording(self: Self) -> None:
+        if self.wav is not None:
+            self.wav.close()
+            self.wav = None
@@ -0,0 +1,365 @@
+from   typing import Self, Dict, List, Optional, Tuple
+import z80
+
+
+
+## Timing, in CPU T-states: 262 lines (NTSC) of 228 T-states.
+LINE   = 228
+LINES  = 262
+FRAME  = LINE * LINES
+
+WIDTH  = 256
+HEIGHT = 192
+
+## Bits of the status register.
+STATUS_F  = 0x80	## Frame (vertical blank) interrupt
+STATUS_5S = 0x40	## Fifth sprite on a line
+STATUS_C  = 0x20	## Sprite collision
+
+## Sprite attribute Y that ends the sprite list.
+SPRITE_END = 208
+
+## The TMS9918 colors as RGB, color 0 (transparent) shows the backdrop.
+PALETTE: List[Tuple[int, int, int]] = [
+    (0x00, 0x00, 0x00), (0x00, 0x00, 0x00), (0x21, 0xC8, 0x42), (0x5E, 0xDC, 0x78),
+    (0x54, 0x55, 0xED), (0x7D, 0x76, 0xFC), (0xD4, 0x52, 0x4D), (0x42, 0xEB, 0xF5),
+    (0xFC, 0x55, 0x54), (0xFF, 0x79, 0x78), (0xD4, 0xC1, 0x54), (0xE6, 0xCE, 0x80),
+    (0x21, 0xB0, 0x3B), (0xC9, 0x5B, 0xBA), (0xCC, 0xCC, 0xCC), (0xFF, 0xFF, 0xFF),
+]
+
+## Bits of the registers that exist.
+REGISTER_MASKS = bytes([ 0x03, 0xFB, 0x0F, 0xFF, 0x07, 0x7F, 0x07, 0xFF ])
+
+## Doubles every bit of a row of size bits.
+def _magnify(row: int, size: int) -> int:
+    magnified = 0
+    for bit in range(size):
+        if row & (1 << bit):
+            magnified |= 0b11 << (2 * bit)
+    return magnified
+
+
+
+## The TMS9918A video chip of the MSX1, on ports 0x98 (VRAM data) and 0x99
+## (status and control), or port and port + 1.
+##
+## The machine state (VRAM, registers, status) is exact whether frames are
+## composed or not: the frame interrupt flag and the sprite status (fifth
+## sprite and collision) are worked out at every vertical blank. Composing
+## the picture into screen is the expensive part; it is done at the vertical
+## blank if render is set, and else only when frame() asks for it.
+##
+## The sprite status is that of the whole frame, set at the vertical blank,
+## not on the line where the fifth sprite or the collision is.
+class VDP:
+    def __init__(self: Self, cpu: z80.Z80, port: int=0x98) -> None:
+        self.cpu = cpu
+        cpu.io.register(port, read=self.read_data, write=self.write_data)
+        cpu.io.register(port + 1, read=self.read_status, write=self.write_control)
+        self.vram = bytearray(0x4000)
+        self.registers = bytearray(8)
+        self.status = 0x00
+        
+        ## VRAM address and the byte read ahead from it, and the first byte
+        ## written to the control port, if a second one is expected.
+        self.address = 0x0000
+        self.read_ahead = 0x00
+        self._latch: Optional[int] = None
+        
+        ## Frames (vertical blanks) so far, and the time of the next one.
+        self.frames = 0
+        self.next_vblank = cpu.cycles + FRAME
+        cpu.schedule(self.next_vblank, self.vblank)
+        
+        ## The picture, as palette indices, and the frame it is of.
+        self.render = True
+        self.screen = bytearray(WIDTH * HEIGHT)
+        self._composed = -1
+        ## Pixel rows of 8 pattern bits in two colors, see _row().
+        self._rows: Dict[int, bytes] = {}
+    
+    
+    
+    ## Ports
+    def read_data(self: Self, port: int) -> int:
+        self._latch = None
+        value = self.read_ahead
+        self.read_ahead = self.vram[self.address]
+        self.address = (self.address + 1) & 0x3FFF
+        return value
+    
+    def write_data(self: Self, port: int, value: int) -> None:
+        self._latch = None
+        self.vram[self.address] = value
+        self.read_ahead = value
+        self.address = (self.address + 1) & 0x3FFF
+    
+    ## Block access for the BIOS (see msx.bios), leaving the address and the
+    ## read ahead as count reads, resp. writes through the data port from 
+    ## address on would.
+    
+    ## count bytes of VRAM from address on, as read after setting the read
+    ## address to address.
+    def read_vram(self: Self, address: int, count: int) -> bytes:
+        self._latch = None
+        address &= 0x3FFF
+        values = self._vram_slice(address, count)
+        address = (address + count) & 0x3FFF
+        self.read_ahead = self.vram[address]
+        self.address = (address + 1) & 0x3FFF
+        return values
+    
+    def write_vram(self: Self, address: int, values: bytes) -> None:
+        self._latch = None
+        address &= 0x3FFF
+        if len(values) > 0x4000:
+            address = (address + len(values) - 0x4000) & 0x3FFF
+            values = values[-0x4000:]
+        first = min(len(values), 0x4000 - address)
+        self.vram[address:address + first] = values[:first]
+        self.vram[:len(values) - first] = values[first:]
+        if values:
+            self.read_ahead = values[-1]
+        self.address = (address + len(values)) & 0x3FFF
+    
+    def fill_vram(self: Self, address: int, value: int, count: int) -> None:
+        self._latch = None
+        address &= 0x3FFF
+        end = address + count
+        if count >= 0x4000:
+            self.vram[:] = bytes([ value ]) * 0x4000
+        else:
+            self.vram[address:min(end, 0x4000)] = bytes([ value ]) * (min(end, 0x4000) - address)
+            self.vram[:max(end - 0x4000, 0)] = bytes([ value ]) * max(end - 0x4000, 0)
+        if count:
+            self.read_ahead = value
+        self.address = end & 0x3FFF
+    
+    ## count bytes of VRAM from address on, wrapping around at the end.
+    def _vram_slice(self: Self, address: int, count: int) -> bytes:
+        if address + count <= 0x4000:
+            return bytes(self.vram[address:address + count])
+        vram = self.vram[address:] + self.vram[:address]
+        return bytes((vram * (count // 0x4000 + 1))[:count])
+    
+    ## Reading the status clears the flags, and with them the interrupt.
+    def read_status(self: Self, port: int) -> int:
+        self._latch = None
+        value = self.status
+        self.status &= 0x1F
+        self.cpu.clear_interrupt()
+        return value
+    
+    ## Two bytes: the low byte of the VRAM address, or the value for a
+    ## register, then the high byte of the address (bit 6 set to write), or
+    ## the register number with bit 7 set.
+    def write_control(self: Self, port: int, value: int) -> None:
+        if self._latch is None:
+            self._latch = value
+            self.address = (self.address & 0x3F00) | value
+            return
+        low, self._latch = self._latch, None
+        if value & 0x80:
+            self.write_register(value & 0x07, low)
+        else:
+            self.address = (value & 0x3F) << 8 | low
+            if not value & 0x40:
+                self.read_ahead = self.vram[self.address]
+                self.address = (self.address + 1) & 0x3FFF
+    
+    def write_register(self: Self, register: int, value: int) -> None:
+        self.registers[register] = value & REGISTER_MASKS[register]
+        if register == 1:
+            self._update_interrupt()
+    
+    def _update_interrupt(self: Self) -> None:
+        if self.status & STATUS_F and self.registers[1] & 0x20:
+            self.cpu.interrupt()
+        else:
+            self.cpu.clear_interrupt()
+    
+    
+    
+    ## The event at the end of the active display.
+    def vblank(self: Self) -> None:
+        self.frames += 1
+        self.next_vblank += FRAME
+        self.cpu.schedule(self.next_vblank, self.vblank)
+        
+        self._sprite_status()
+        if self.render:
+            self.compose()
+        self.status |= STATUS_F
+        self._update_interrupt()
+    
+    ## The picture of the last frame, composed now if it was not at the
+    ## vertical blank (from VRAM as it is now).
+    def frame(self: Self) -> bytearray:
+        if self._composed != self.frames:
+            self.compose()
+        return self.screen
+    
+    ## The picture as RGB bytes, 3 per pixel.
+    def rgb(self: Self) -> bytes:
+        colors = [ bytes(color) for color in PALETTE ]
+        colors[0] = colors[self.registers[7] & 0x0F]
+        return b''.join(colors[pixel] for pixel in self.frame())
+    
+    
+    
+    ## Sprites
+    
+    ## The sprites shown on every line, the first four that are on it, as
+    ## (number, x, pixels, width, color), pixels with the leftmost pixel as
+    ## the highest of width bits. Sets the fifth sprite status on the way.
+    ## None if the mode shows no sprites.
+    def _sprites(self: Self) -> Optional[List[List[Tuple[int, int, int, int, int]]]]:
+        registers = self.registers
+        if not registers[1] & 0x40 or registers[1] & 0x10:
+            return None
+        vram = self.vram
+        size = 16 if registers[1] & 0x02 else 8
+        magnify = registers[1] & 0x01
+        width = size << magnify
+        attributes = registers[5] << 7
+        patterns = registers[6] << 11
+        
+        lines: List[List[Tuple[int, int, int, int, int]]] = [ [] for _ in range(HEIGHT) ]
+        fifth = None
+        last = 31
+        for number in range(32):
+            y, x, name, color = vram[attributes + 4 * number:attributes + 4 * number + 4]
+            if y == SPRITE_END:
+                last = number
+                break
+            top = y + 1 if y < SPRITE_END else y - 255
+            if color & 0x80:
+                x -= 32
+            if size == 16:
+                pattern = patterns + ((name & 0xFC) << 3)
+                rows = [ vram[pattern + row] << 8 | vram[pattern + 16 + row] for row in range(16) ]
+            else:
+                pattern = patterns + (name << 3)
+                rows = list(vram[pattern:pattern + 8])
+            if magnify:
+                rows = [ _magnify(row, size) for row in rows ]
+            for line in range(max(top, 0), min(top + width, HEIGHT)):
+                shown = lines[line]
+                if len(shown) == 4:
+                    if fifth is None:
+                        fifth = number
+                    continue
+                shown.append((number, x, rows[(line - top) >> magnify], width, color & 0x0F))
+        
+        if not self.status & STATUS_5S:
+            if fifth is not None:
+                self.status = (self.status & 0xE0) | STATUS_5S | fifth
+            else:
+                self.status = (self.status & 0xE0) | last
+        return lines
+    
+    ## Works out the fifth sprite and collision flags of the frame. Sprites
+    ## collide where pixels of their patterns meet on the screen, whatever
+    ## their color.
+    def _sprite_status(self: Self) -> None:
+        lines = self._sprites()
+        if lines is None or self.status & STATUS_C:
+            return
+        for shown in lines:
+            if len(shown) < 2:
+                continue
+            covered = 0
+            for number, x, pixels, width, color in shown:
+                ## Bit 255 - x for pixel x, off the screen is cut off.
+                pixels = ((pixels << 288) >> (x + width + 32)) & ((1 << WIDTH) - 1)
+                if covered & pixels:
+                    self.status |= STATUS_C
+                    return
+                covered |= pixels
+    
+    
+    
+    ## Composing the picture
+    
+    ## 8 pixels of a pattern byte, in color one and color zero.
+    def _row(self: Self, pattern: int, one: int, zero: int) -> bytes:
+        key = pattern << 8 | one << 4 | zero
+        try:
+            return self._rows[key]
+        except KeyError:
+            row = self._rows[key] = bytes(one if pattern & (0x80 >> bit) else zero for bit in range(8))
+            return row
+    
+    def compose(self: Self) -> None:
+        registers = self.registers
+        vram = self.vram
+        screen = self.screen
+        backdrop = registers[7] & 0x0F
+        self._composed = self.frames
+        
+        if not registers[1] & 0x40:
+            screen[:] = bytes([backdrop]) * len(screen)
+            return
+        
+        names = (registers[2] & 0x0F) << 10
+        if registers[1] & 0x10:
+            ## Text: 40 columns of 6 pixels, within 8 pixel borders.
+            patterns = (registers[4] & 0x07) << 11
+            one, zero = registers[7] >> 4 or backdrop, backdrop
+            border = bytes([backdrop]) * 8
+            for y in range(HEIGHT):
+                row = names + (y >> 3) * 40
+                line = b''.join(self._row(vram[patterns + (vram[row + column] << 3) + (y & 7)], one, zero)[:6] for column in range(40))
+                screen[y * WIDTH:(y + 1) * WIDTH] = border + line + border
+            return
+        
+        if registers[1] & 0x08:
+            ## Multicolor: a color for every 4x4 block.
+            patterns = (registers[4] & 0x07) << 11
+            for y in range(HEIGHT):
+                row = names + (y >> 3) * 32
+                colors = bytearray()
+                for column in range(32):
+                    block = vram[patterns + (vram[row + column] << 3) + ((y >> 3) & 3) * 2 + ((y >> 2) & 1)]
+                    colors += bytes([block >> 4 or backdrop]) * 4 + bytes([block & 0x0F or backdrop]) * 4
+                screen[y * WIDTH:(y + 1) * WIDTH] = colors
+        else:
+            if registers[0] & 0x02:
+                ## Graphics II: a pattern and color byte for every row of
+                ## every character, in three banks for the thirds of the
+                ## screen.
+                patterns = (registers[4] & 0x04) << 11
+                pattern_mask = (registers[4] & 0x03) << 8 | 0xFF
+                colors = (registers[3] & 0x80) << 6
+                color_mask = (registers[3] & 0x7F) << 3 | 0x07
+            else:
+                ## Graphics I: a color byte for every 8 characters.
+                patterns = (registers[4] & 0x07) << 11
+                colors = registers[3] << 6
+            for y in range(HEIGHT):
+                row = names + (y >> 3) * 32
+                line = []
+                for column in range(32):
+                    name = vram[row + column]
+                    if registers[0] & 0x02:
+                        name |= (y >> 6) << 8
+                        pattern = vram[patterns + ((name & pattern_mask) << 3) + (y & 7)]
+                        color = vram[colors + ((name & color_mask) << 3) + (y & 7)]
+                    else:
+                        pattern = vram[patterns + (name << 3) + (y & 7)]
+                        color = vram[colors + (name >> 3)]
+                    line.append(self._row(pattern, color >> 4 or backdrop, color & 0x0F or backdrop))
+                screen[y * WIDTH:(y + 1) * WIDTH] = b''.join(line)
+        
+        ## Sprites, the lowest numbers in front. The status is left alone.
+        status = self.status
+        lines = self._sprites()
+        self.status = status
+        for y, shown in enumerate(lines):
+            for number, x, pixels, width, color in reversed(shown):
+                if not color:
+                    continue
+                for bit in range(width):
+                    if pixels & (1 << (width - 1 - bit)) and 0 <= x + bit < WIDTH:
+                        screen[y * WIDTH + x + bit] = color
+
@@ -0,0 +1,140 @@
+import collections
+import logging
+from   typing import Self, Dict, Iterable, List, Optional, Tuple
+
+
+
+## A byte pattern with wildcards that identifies a well known routine or idiom.
+##
+## The pattern is written as hex bytes, '??' is a wildcard:
+##
+##     Signature('PC = PC[2 * A]', '87 E1 CD ?? ?? 5E 23 56 EB E9', tag='dispatch')
+##
+## The tag tells the analysis what to do with a hit besides naming it, see
+## Disasm.apply_signature(). The offset is added to the match address to get
+## the address of the routine (for patterns with some leading context).
+class Signature:
+    def __init__(self: Self, name: str, pattern: str, tag: str='routine', offset: int=0) -> None:
+        self.name = name
+        self.tag = tag
+        self.offset = offset
+        self.pattern: List[Optional[int]] = [
+            None if byte == '??' else int(byte, 16) for byte in pattern.split()
+        ]
+        if all(byte is None for byte in self.pattern):
+            raise ValueError(f"Signature '{name}' has no fixed bytes.")
+    
+    def __repr__(self: Self) -> str:
+        return f"Signature({self.name!r}, tag={self.tag!r})"
+    
+    ## The longest run of fixed bytes, and its position in the pattern. This is
+    ## the part that goes into the automaton; the other bytes are verified on a
+    ## hit only.
+    def anchor(self: Self) -> Tuple[int, bytes]:
+        best_start, best_length = 0, 0
+        start = None
+        for i, byte in enumerate(self.pattern + [None]):
+            if byte is not None:
+                if start is None:
+                    start = i
+                continue
+            if start is not None and i - start > best_length:
+                best_start, best_length = start, i - start
+            start = None
+        return best_start, bytes(self.pattern[best_start:best_start + best_length])
+    
+    def matches(self: Self, data: bytes, start: int) -> bool:
+        if start < 0 or start + len(self.pattern) > len(data):
+            return False
+        for i, byte in enumerate(self.pattern):
+            if byte is not None and data[start + i] != byte:
+                return False
+        return True
+
+
+
+## Aho-Corasick automaton over the anchors of a set of signatures, so that any
+## number of signatures is matched in a single pass over the ROM.
+class SignatureScanner:
+    def __init__(self: Self, signatures: Iterable[Signature]) -> None:
+        self.signatures = list(signatures)
+        
+        ## State 0 is the root. _goto[state] maps a byte to the next state,
+        ## _output[state] lists (signature, anchor start, anchor length) of the
+        ## anchors ending in that state, including those reached through fail
+        ## links.
+        self._goto: List[Dict[int, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[Signature, int, int]]] = [[]]
+        
+        for signature in self.signatures:
+            anchor_start, anchor = signature.anchor()
+            state = 0
+            for byte in anchor:
+                if byte not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][byte] = len(self._goto) - 1
+                state = self._goto[state][byte]
+            self._output[state].append((signature, anchor_start, len(anchor)))
+        
+        ## Breadth first, so the fail state of a node is always done before the
+        ## node itself.
+        todo = collections.deque(self._goto[0].values())
+        while todo:
+            state = todo.popleft()
+            for byte, next_state in self._goto[state].items():
+                todo.append(next_state)
+                fail = self._fail[state]
+                while fail and byte not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(byte, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+    
+    ## Returns a list of (address, signature), sorted by address. The address
+    ## is the match position plus base plus the signature offset.
+    def scan(self: Self, data: bytes, base: int=0) -> List[Tuple[int, Signature]]:
+        goto, fail, output = self._goto, self._fail, self._output
+        hits = []
+        state = 0
+        for position, byte in enumerate(data):
+            while state and byte not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(byte, 0)
+            for signature, anchor_start, anchor_length in output[state]:
+                start = position + 1 - anchor_length - anchor_start
+                if signature.matches(data, start):
+                    hits.append((base + start + signature.offset, signature))
+        hits.sort(key=lambda hit: hit[0])
+        logging.debug(f'Found {len(hits)} signature hits.')
+        return hits
+
+
+
+## Routines and idioms commonly found in MSX cartridges.
+LIBRARY =\
+[
+    ## ADD A, L; LD L, A; RET NC; INC H; RET
+    Signature('HL += A', '85 6F D0 24 C9', tag='add_hl_a'),
+    ## ADD A, L; LD L, A; JR NC, +1; INC H; RET
+    Signature('HL += A', '85 6F 30 01 24 C9', tag='add_hl_a'),
+    ## ADD A, E; LD E, A; RET NC; INC D; RET
+    Signature('DE += A', '83 5F D0 14 C9'),
+    ## ADD A, E; LD E, A; JR NC, +1; INC D; RET
+    Signature('DE += A', '83 5F 30 01 14 C9'),
+    
+    ## ADD A, A; POP HL; CALL HL_plus_is_A; LD E, (HL); INC HL; LD D, (HL);
+    ## EX DE, HL; JP (HL)
+    ##
+    ## Called with the jump table directly behind the CALL instruction.
+    Signature('PC = PC[2 * A]', '87 E1 CD ?? ?? 5E 23 56 EB E9', tag='dispatch'),
+    ## ADD A, A; POP HL; ADD A, L; LD L, A; JR NC, +1; INC H; LD E, (HL);
+    ## INC HL; LD D, (HL); EX DE, HL; JP (HL)
+    Signature('PC = PC[2 * A]', '87 E1 85 6F 30 01 24 5E 23 56 EB E9', tag='dispatch'),
+    
+    ## LD BC, length; LD DE, vram; LD HL, ram; CALL LDIRVM
+    Signature('copy to VRAM', '01 ?? ?? 11 ?? ?? 21 ?? ?? CD 5C 00', tag='idiom'),
+    ## LD BC, length; LD HL, vram; XOR A; CALL FILVRM
+    Signature('clear VRAM', '01 ?? ?? 21 ?? ?? AF CD 56 00', tag='idiom'),
+]
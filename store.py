@@ -0,0 +1,230 @@
+import array
+from   typing import Self, Dict, Iterator, List, Optional, Set, Tuple
+import xref
+
+
+
+## Byte classes, one per address.
+UNKNOWN           = 0
+CODE              = 1	## First byte of an instruction
+CODE_CONTINUATION = 2	## Operand bytes (and prefixes) of an instruction
+DATA              = 3
+TABLE             = 4	## Jump table entry
+KIND2NAME = [ 'unknown', 'code', 'code continuation', 'data', 'table' ]
+NAME2KIND = { name: kind for kind, name in enumerate(KIND2NAME) }
+
+
+
+## Strings stored once, referred to by number. Number 0 is reserved for "no
+## string".
+class StringPool:
+    def __init__(self: Self) -> None:
+        self._strings: List[Optional[str]] = [None]
+        self._ids: Dict[str, int] = {}
+    
+    def intern(self: Self, string: str) -> int:
+        try:
+            return self._ids[string]
+        except KeyError:
+            self._strings.append(string)
+            self._ids[string] = len(self._strings) - 1
+            return self._ids[string]
+    
+    def __getitem__(self: Self, string_id: int) -> Optional[str]:
+        return self._strings[string_id]
+    
+    def __len__(self: Self) -> int:
+        return len(self._strings) - 1
+
+
+
+## Result of a disassembly run, stored in flat arrays indexed by address instead
+## of a dict per address:
+##
+##   kind       : the byte class of every address (see above)
+##   instruction: number of the instruction class decoded at the address
+##   text       : number of the rendered text in the string pool
+##
+## References between addresses are kept in an xref.XrefIndex.
+##
+## For compatibility with the old defaultdict result, store[address] returns a
+## view that supports store[address]['type'], ['disasm'] and ['from'].
+class DisasmStore:
+    ## The rendered text of the 'disasm' style starts with the address, which
+    ## would make every string unique. It is stored without it, the lowest bit
+    ## of the text number tells whether to put it back.
+    ADDRESS_PREFIX = 1
+    
+    def __init__(self: Self, size: int=0x10000) -> None:
+        self.size = size
+        self.kind = bytearray(size)
+        self.instruction = array.array('H', bytes(2 * size))
+        self.text = array.array('I', bytes(4 * size))
+        self.strings = StringPool()
+        ## The addresses with a text, for keys() and len().
+        self._addresses: Set[int] = set()
+        self._instruction_classes: List[type] = [type(None)]
+        self._instruction_ids: Dict[type, int] = {}
+        
+        self.xrefs = xref.XrefIndex(size)
+    
+    
+    
+    ## Direct access, used by the disassembler itself.
+    def set_instruction(self: Self, address: int, instr, size: int, text: str) -> None:
+        self.kind[address] = CODE
+        for offset in range(1, min(size, self.size - address)):
+            if self.kind[address + offset] == UNKNOWN:
+                self.kind[address + offset] = CODE_CONTINUATION
+        try:
+            instruction_id = self._instruction_ids[type(instr)]
+        except KeyError:
+            self._instruction_classes.append(type(instr))
+            instruction_id = self._instruction_ids[type(instr)] = len(self._instruction_classes) - 1
+        self.instruction[address] = instruction_id
+        self.set_text(address, text)
+    
+    def instruction_class(self: Self, address: int) -> Optional[type]:
+        instruction_id = self.instruction[address]
+        if instruction_id == 0:
+            return None
+        return self._instruction_classes[instruction_id]
+    
+    def set_text(self: Self, address: int, text: str) -> None:
+        self._addresses.add(address)
+        prefix = f'{address:04X} '
+        if text.startswith(prefix):
+            self.text[address] = (self.strings.intern(text[len(prefix):]) << 1) | self.ADDRESS_PREFIX
+        else:
+            self.text[address] = self.strings.intern(text) << 1
+    
+    def get_text(self: Self, address: int) -> Optional[str]:
+        text_id = self.text[address]
+        if text_id == 0:
+            return None
+        text = self.strings[text_id >> 1]
+        if text_id & self.ADDRESS_PREFIX:
+            return f'{address:04X} {text}'
+        return text
+    
+    def has_text(self: Self, address: int) -> bool:
+        return self.text[address] != 0
+    
+    ## Code references to destination, as (source, how).
+    def froms(self: Self, destination: int) -> List[Tuple[int, str]]:
+        return [ (source, how) for source, kind, how in self.xrefs.code_to(destination) ]
+    
+    ## Returns True if the reference is new. Without a kind, it is derived from 
+    ## the description.
+    def add_from(self: Self, destination: int, source: int, how: str, kind: Optional[int]=None) -> bool:
+        if kind is None:
+            if how == 'fall through':
+                kind = xref.FALL_THROUGH
+            elif how == 'jump table':
+                kind = xref.JUMP_TABLE
+            elif how.startswith('CALL'):
+                kind = xref.CALL
+            else:
+                kind = xref.JUMP
+        return self.xrefs.add(source, destination, kind, how)
+    
+    
+    
+    ## Mapping style access, like the old defaultdict(lambda: defaultdict(dict)).
+    def __getitem__(self: Self, address: int) -> 'Entry':
+        return Entry(self, address)
+    
+    def __contains__(self: Self, address: int) -> bool:
+        return self.has_text(address)
+    
+    def keys(self: Self) -> List[int]:
+        return sorted(self._addresses)
+    
+    def __iter__(self: Self) -> Iterator[int]:
+        return iter(self.keys())
+    
+    def __len__(self: Self) -> int:
+        return len(self._addresses)
+
+
+
+## View on one address of a DisasmStore.
+class Entry:
+    __slots__ = ('_store', '_address')
+    
+    def __init__(self: Self, store: DisasmStore, address: int) -> None:
+        self._store = store
+        self._address = address
+    
+    def __getitem__(self: Self, key: str):
+        match key:
+            case 'type':
+                kind = self._store.kind[self._address]
+                if kind == UNKNOWN:
+                    raise KeyError(key)
+                return KIND2NAME[kind]
+            case 'disasm':
+                text = self._store.get_text(self._address)
+                if text is None:
+                    raise KeyError(key)
+                return text
+            case 'from':
+                return Froms(self._store, self._address)
+        raise KeyError(key)
+    
+    def __setitem__(self: Self, key: str, value) -> None:
+        match key:
+            case 'type':
+                self._store.kind[self._address] = NAME2KIND[value]
+            case 'disasm':
+                self._store.set_text(self._address, value)
+            case _:
+                raise KeyError(key)
+    
+    def __contains__(self: Self, key: str) -> bool:
+        try:
+            self[key]
+            return True
+        except KeyError:
+            return False
+    
+    def get(self: Self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+
+## View on the incoming references of one address, like a dict from source
+## address to how we got here.
+class Froms:
+    __slots__ = ('_store', '_address')
+    
+    def __init__(self: Self, store: DisasmStore, address: int) -> None:
+        self._store = store
+        self._address = address
+    
+    def __getitem__(self: Self, source: int) -> str:
+        for other, how in self._store.froms(self._address):
+            if other == source:
+                return how
+        raise KeyError(source)
+    
+    def __setitem__(self: Self, source: int, how: str) -> None:
+        self._store.add_from(self._address, source, how)
+    
+    def __contains__(self: Self, source: int) -> bool:
+        return any(other == source for other, how in self._store.froms(self._address))
+    
+    def __iter__(self: Self) -> Iterator[int]:
+        return (source for source, how in self._store.froms(self._address))
+    
+    def __len__(self: Self) -> int:
+        return len(self._store.froms(self._address))
+    
+    def keys(self: Self) -> List[int]:
+        return list(self)
+    
+    def items(self: Self) -> List[Tuple[int, str]]:
+        return self._store.froms(self._address)
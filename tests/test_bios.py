@@ -0,0 +1,103 @@
+import pytest
+import msx
+import msx.bios
+import msx.cassette
+import msx.scc
+
+
+
+OPTIONS = [ {}, { 'lazy_flags': True }, { 'fuse': True, 'skip_idle': True } ]
+
+def machine(code: str, **options) -> msx.MSX:
+    m = msx.MSX(hle_bios=True, **options)
+    m.load(bytes.fromhex(code), 0x4000)
+    m.cpu.PC = 0x4000
+    return m
+
+
+
+## VDP
+
+## FILVRM, LDIRVM and LDIRMV move their bytes in one go, and leave BC 0.
+@pytest.mark.parametrize('options', OPTIONS)
+def test_vram_routines(options: dict) -> None:
+    m = machine(
+        '3100F0'
+        '3EAA 210038 010001 CD5600'      ## FILVRM 100h bytes at 3800h with AAh
+        '210080 110000 010008 CD5C00'    ## LDIRVM 800h bytes from 8000h to 0000h
+        '211000 1100A0 012000 CD5900'    ## LDIRMV 20h bytes from 0010h to A000h
+        'ED4300C0'                       ## LD (C000h), BC
+        '21F0FF 110010 012000 CD5C00'    ## LDIRVM 20h bytes from FFF0h, around the top
+        '76 18FD', **options)
+    m.load(bytes(range(256)) * 8, 0x8000)
+    m.load(bytes(range(0x10)), 0xFFF0)
+    m.load(bytes(range(0x10, 0x20)), 0x0000)
+    m.run_frames(2)
+    vram = m.vdp.vram
+    assert bytes(vram[0x37FF:0x3901]) == b'\x00' + b'\xAA' * 0x100 + b'\x00'
+    assert bytes(vram[0x0000:0x0800]) == bytes(range(256)) * 8
+    assert bytes(m.cpu.ram._ram[0xA000:0xA020]) == bytes(range(0x10, 0x30))
+    assert m.cpu.ram._ram[0xC000:0xC002] == [ 0, 0 ]
+    assert bytes(vram[0x1000:0x1020]) == bytes(range(0x20))
+
+## LDIRVM reads memory as the CPU does, through the handlers of mapped
+## pages, here the waveforms of the SCC.
+def test_ldirvm_reads_mapped_pages() -> None:
+    m = msx.MSX(scc=True, hle_bios=True)
+    m.load(bytes.fromhex('3100F0 210098 110020 012000 CD5C00 76'), 0x4000)
+    m.cpu.PC = 0x4000
+    for offset in range(0x20):
+        m.cpu.ram[msx.scc.BASE + offset] = 0x80 + offset
+    m.run_frames(1)
+    assert bytes(m.vdp.vram[0x2000:0x2020]) == bytes(range(0x80, 0xA0))
+    assert m.cpu.ram._ram[msx.scc.BASE] == 0
+
+## CHGMOD sets the registers of the mode and keeps their copies in RAM.
+def test_chgmod() -> None:
+    m = machine('3100F0 3E02 CD5F00 76 18FD')
+    m.run_frames(2)
+    assert bytes(m.vdp.registers) == bytes.fromhex('02e006ff03360700')
+    assert bytes(m.cpu.ram._ram[msx.bios.RG0SAV:msx.bios.RG0SAV + 8]) == bytes(m.vdp.registers)
+    assert m.cpu.ram._ram[msx.bios.SCRMOD] == 2
+    assert bytes(m.vdp.vram[0x1800:0x1B00]) == bytes(range(256)) * 3
+
+
+
+## Cassette
+
+## Reads the tape: TAPION, 16 bytes of TAPIN to 0xC000, TAPION, TAPIN to
+## 0xC010 until the carry (at most 12 bytes), the count left at 0xC0F1,
+## TAPION at the end of the tape, TAPIOF. The flags of the TAPIONs go to
+## 0xC0F0 and 0xC0F2.
+TAPE = (
+    '3100F0 FB'
+    'CDE100 F5 E1 7D 32F0C0'
+    '2100C0 0610 CDE400 77 23 10F9'
+    'CDE100'
+    '2110C0 060C CDE400 3804 77 23 10F7'
+    '78 32F1C0'
+    'CDE100 F5 E1 7D 32F2C0'
+    'CDE700 76 18FD')
+
+## The blocks of a .CAS file start at its headers, but only the ones at a
+## multiple of 8 bytes; the tape routines are trapped with or without
+## hle_bios.
+@pytest.mark.parametrize('options', [ {}, { 'hle_bios': True, 'lazy_flags': True }, { 'fuse': True, 'skip_idle': True } ])
+def test_cassette(tmp_path, options: dict) -> None:
+    header = msx.cassette.HEADER
+    data = header + b'\xD0' * 10 + b'GAME  '
+    data += bytes(-len(data) % 8) + header + b'\x01' + header + b'\x02\x03\x04\x05'
+    filename = tmp_path / 'tape.cas'
+    filename.write_bytes(data)
+    m = msx.MSX(**options)
+    cassette = m.insert_cassette(str(filename))
+    m.load(bytes.fromhex(TAPE), 0x4000)
+    m.cpu.PC = 0x4000
+    m.run_frames(3)
+    ram = m.cpu.ram._ram
+    assert bytes(ram[0xC000:0xC010]) == b'\xD0' * 10 + b'GAME  '
+    assert bytes(ram[0xC010:0xC01C]) == b'\x01' + header + b'\x02\x03\x04'
+    assert (ram[0xC0F0] & 0x01, ram[0xC0F1], ram[0xC0F2] & 0x01) == (0, 0, 1)
+    assert (cassette.position, cassette.motor, m.cpu.registers.IFF1) == (len(data), False, 1)
+    m.eject_cassette()
+    assert m.bios.cassette is None
@@ -0,0 +1,49 @@
+import re
+import disasm
+import store
+import z80.instruction
+import z80.instructions
+
+
+
+## Every load from or store to a fixed address is a data reference.
+def test_data_references_cover_fixed_address_loads() -> None:
+    names = { cls.name() for cls in vars(z80.instructions).values()
+        if isinstance(cls, type) and issubclass(cls, z80.instruction.Instruction) and cls is not z80.instruction.Instruction }
+    loads = { name for name in names if re.fullmatch(r'LD (\(nn\), \w+|\w+, \(nn\))', name) }
+    assert loads
+    assert loads <= set(disasm.Disasm.data_references)
+
+## A linear run keeps every instruction at its own address, as code, and the
+## store counts what it holds.
+def test_run_linear(tmp_path) -> None:
+    rom = bytes.fromhex('41421040' + '00' * 12 + '3E01 210080 C9') + bytes(0x4000 - 22)
+    filename = tmp_path / 'linear.rom'
+    filename.write_bytes(rom)
+    d = disasm.Disasm(str(filename))
+    result = d.run('linear')
+    assert d.is_code(0x4010) and d.is_code(0x4012) and d.is_code(0x4015)
+    assert (d.disasm.kind[0x4010], d.disasm.kind[0x4011]) == (store.CODE, store.CODE_CONTINUATION)
+    assert 'LD A' in result[0x4010]['disasm'] and 'LD HL' in result[0x4012]['disasm'] and 'RET' in result[0x4015]['disasm']
+    assert 0x4011 not in result
+    assert result.keys() == [ address for address in range(0x10000) if result.has_text(address) ]
+    assert len(result) == 0x4000 - 4
+
+## RST 28h to a vector that jumps to a dispatcher dispatches through the
+## table after it; every RST is a call of its vector.
+def test_rst_dispatch(tmp_path) -> None:
+    rom = bytearray(0x200)
+    rom[0:4] = b'AB\x10\x40'
+    rom[0x10:0x17] = bytes.fromhex('3E01 EF 2040 3040')	## LD A, 1; RST 28h; DW 4020h, 4030h
+    rom[0x20] = rom[0x30] = 0xC9
+    rom[0x100:0x10C] = bytes.fromhex('87 E1 85 6F 3001 24 5E 23 56 EB E9')
+    filename = tmp_path / 'rst.rom'
+    filename.write_bytes(rom)
+    d = disasm.Disasm(str(filename))
+    d.jump_tables.add_dispatcher(0x4100)
+    d.load(bytes.fromhex('C30041'), 0x28)
+    d.add_entry_point(0x4010)
+    d.run()
+    assert [ (table.address, table.targets) for table in d.jump_tables.tables.values() ] == [ (0x4013, [ 0x4020, 0x4030 ]) ]
+    assert d.is_code(0x4020) and d.is_code(0x4030)
+    assert d.disasm.xrefs.callers(0x28) == [ 0x4012 ]
@@ -0,0 +1,50 @@
+import random
+import pytest
+import z80
+from   z80.flags import FLAGS
+
+
+
+def state(cpu: z80.Z80) -> tuple:
+    regs = cpu.registers
+    r_prime = list(regs.r_prime)
+    r_prime[z80.registers.F] = FLAGS[r_prime[z80.registers.F]]
+    return (regs.B, regs.C, regs.D, regs.E, regs.H, regs.L, regs.F, regs.A, tuple(r_prime),
+        regs.SP, regs.PC, regs.IX, regs.IY, regs.I, regs.R, regs.IFF1, regs.IFF2, regs.IM, regs.halted)
+
+## Runs the same random code on two CPUs, one with lazy flags, and compares
+## the registers after every instruction and the memory at the end.
+@pytest.mark.parametrize('seed', range(10))
+def test_lazy_flags_match_the_tables(seed: int) -> None:
+    eager, lazy = z80.Z80(), z80.Z80(lazy_flags=True)
+    rnd = random.Random(seed)
+    image = rnd.randbytes(0x10000)
+    r = list(rnd.randbytes(8))
+    r_prime = list(rnd.randbytes(8))
+    PC = rnd.randrange(0x10000)
+    for cpu in (eager, lazy):
+        cpu.ram._ram[:] = image * 2
+        cpu.registers.r[:] = r
+        cpu.registers.r_prime[:] = r_prime
+        cpu.registers.SP = 0xF000
+        cpu.registers.PC = PC
+    
+    for step in range(1000):
+        for cpu in (eager, lazy):
+            try:
+                cpu.run(1)
+            except NotImplementedError:
+                cpu.registers.PC = (cpu.registers.PC + 1) & 0xFFFF
+            if cpu.registers.halted:
+                cpu.registers.halted = False
+                cpu.registers.PC = (cpu.registers.PC + 1) & 0xFFFF
+        assert state(eager) == state(lazy), f'instruction {step}'
+    assert eager.ram._ram == lazy.ram._ram
+
+## The pairs other than AF are plain, AF reads F through FLAGS.
+def test_register_pairs() -> None:
+    regs = z80.registers.Registers()
+    regs.r[:] = [ 0x12, 0x34, 0x56, 0x78, 0x9A, 0xBC, 0x00, 0xDE ]
+    regs.r[z80.registers.F] = z80.flags.LAZY_SZP | 0x00
+    assert (regs.BC, regs.DE, regs.HL) == (0x1234, 0x5678, 0x9ABC)
+    assert regs.AF == 0xDE00 | FLAGS[z80.flags.LAZY_SZP]
@@ -0,0 +1,190 @@
+import pytest
+import z80
+import msx
+import msx.input
+
+
+
+OPTIONS = [ {}, { 'threaded': True }, { 'fuse': True, 'lazy_flags': True } ]
+
+def out(port: int, value: int) -> bytes:
+    return bytes([ 0x3E, value, 0xD3, port ])
+
+def store(address: int, value: int) -> bytes:
+    return bytes([ 0x3E, value, 0x32, address & 0xFF, address >> 8 ])
+
+def machine(code: bytes, address: int=0x100, **options) -> msx.MSX:
+    m = msx.MSX(**options)
+    m.load(code, address)
+    m.cpu.PC = address
+    m.cpu.registers.SP = 0xF000
+    return m
+
+
+
+## Frame loop
+
+## Graphics 1 with sprites, and an interrupt handler that reads the VDP
+## status and counts the frames at 0xC000.
+HANDLER = bytes.fromhex('F5 E5 DB99 2A00C0 23 2200C0 E1 F1 FB C9')
+
+def _graphics() -> bytes:
+    def register(number: int, value: int) -> bytes:
+        return out(0x99, value) + out(0x99, 0x80 | number)
+    def address(at: int) -> bytes:
+        return out(0x99, at & 0xFF) + out(0x99, 0x40 | at >> 8)
+    code = b''.join(register(number, value) for number, value in enumerate([ 0x00, 0x62, 0x06, 0x80, 0x00, 0x36, 0x07, 0xF4 ]))
+    code += address(0x1B00)
+    for sprite in [ (50, 60, 0, 15), (52, 64, 0, 8), (100, 10, 0, 2), (100, 30, 0, 3), (100, 50, 0, 4), (100, 70, 0, 5), (100, 90, 0, 6), (208, 0, 0, 0) ]:
+        code += b''.join(out(0x98, value) for value in sprite)
+    code += address(0x3800) + bytes.fromhex('0620 3EFF D398 10FC')
+    code += address(0x1800) + bytes.fromhex('0600 78 D398 10FB')
+    return code + bytes.fromhex('ED56 FB 76 18FD')
+
+def _state(m: msx.MSX) -> tuple:
+    regs = m.cpu.registers
+    return (m.cpu.cycles, tuple(regs.r), regs.PC, regs.SP, regs.IFF1, regs.R, bytes(m.vdp.vram), bytes(m.vdp.registers), m.vdp.status,
+        bytes(m.cpu.ram._ram))
+
+## Fast forward keeps the state exact: it only leaves out the picture, which
+## is composed when asked for.
+@pytest.mark.parametrize('options', OPTIONS + [ { 'skip_idle': True } ])
+def test_fast_forward_matches_rendering(options: dict) -> None:
+    rendered, fast = machine(_graphics(), **options), machine(_graphics(), **options)
+    for m in (rendered, fast):
+        m.load(HANDLER, 0x38)
+    rendered.run_frames(60, render=True)
+    fast.run_frames(60)
+    assert _state(rendered) == _state(fast)
+    assert rendered.frame() == fast.frame()
+    assert rendered.cpu.ram[0xC000] == 59
+
+
+
+## Memory
+
+## Reads and writes of a mapped page go to its handlers, whatever the
+## instruction, other pages stay plain memory.
+@pytest.mark.parametrize('options', OPTIONS)
+def test_mapped_page(options: dict) -> None:
+    cpu = z80.Z80(**options)
+    cpu.ram._ram[:] = bytes(len(cpu.ram._ram))
+    writes = []
+    cpu.ram.map(0x8000, 0x8100, read=lambda address: address & 0xFF ^ 0x5A, write=lambda address, value: writes.append((address, value)))
+    code = bytes.fromhex(
+        '3A1080 3200C0'     ## LD A, (8010h); LD (C000h), A
+        '3E77 322080'       ## LD A, 77h; LD (8020h), A
+        '210080 1101C0 010400 EDB0'  ## LDIR 4 bytes from 8000h to C001h
+        '3EAA 328080'       ## LD A, AAh; LD (8080h), A
+        '3A0081 3205C0'     ## LD A, (8100h); LD (C005h), A
+        '76')
+    cpu.ram._ram[0x100:0x100 + len(code)] = code
+    cpu.ram._ram[0x8100] = 0x42
+    cpu.PC = 0x100
+    cpu.registers.SP = 0xF000
+    while not cpu.registers.halted:
+        cpu.run(1)
+    assert bytes(cpu.ram._ram[0xC000:0xC006]) == bytes([ 0x10 ^ 0x5A, 0x5A, 0x5B, 0x58, 0x59, 0x42 ])
+    assert writes == [ (0x8020, 0x77), (0x8080, 0xAA) ]
+    assert cpu.ram._ram[0x8020] == 0x00
+    
+    cpu.ram.map(0x8000, 0x8100)
+    cpu.ram[0x8020] = 0x33
+    assert (cpu.ram[0x8020], cpu.ram[0x8010]) == (0x33, 0x00)
+    with pytest.raises(ValueError):
+        cpu.ram.map(0x8000, 0x8080)
+
+## A Konami SCC cartridge: writes to the bank registers switch 8K banks,
+## bank 0x3F in the third window shows the SCC, and 0xFFFF is the
+## secondary slot register.
+@pytest.mark.parametrize('options', OPTIONS)
+def test_konami_scc_mapper(options: dict) -> None:
+    rom = b''.join(bytes([ bank ]) * 0x2000 for bank in range(16))
+    code = store(0x7000, 5) + store(0xB000, 7) + store(0x9000, 0x3F) + store(0x9800, 0x55) + store(0x9988, 9) + store(0x4000, 0xAA)
+    code += bytes.fromhex('3A0060 3200C0 3A00A0 3201C0 3A0098 3202C0 3A8098 3203C0 3A0080 3204C0')
+    code += store(0x9000, 2) + bytes.fromhex('3A0098 3205C0')
+    code += store(0xFFFF, 0x5A) + bytes.fromhex('3AFFFF 3206C0') + store(0xFFFE, 0x11)
+    code += bytes.fromhex('76 18FD')
+    rom = rom[:0x10] + code + rom[0x10 + len(code):]
+    m = msx.MSX(expanded_slot=True, **options)
+    m.insert_cartridge(rom, 'konami_scc')
+    m.cpu.PC = 0x4010
+    m.cpu.registers.SP = 0xF000
+    m.run_frames(2)
+    assert bytes(m.cpu.ram._ram[0xC000:0xC007]) == bytes([ 5, 7, 0x55, 0xFF, 15, 2, 0xA5 ])
+    assert m.cartridge.banks == [ 0, 5, 2, 7 ]
+    assert (m.scc.waves[0], m.scc.registers[8]) == (0x55, 9)
+    assert (m.cpu.ram[0x4000], m.cpu.ram._ram[0xFFFE], m.secondary_slot) == (0x00, 0x11, 0x5A)
+
+
+
+## I/O
+
+## IN and OUT, single and block, reach the handlers of their port; ports
+## without one read 0xFF.
+@pytest.mark.parametrize('options', OPTIONS)
+def test_io_dispatch(options: dict) -> None:
+    cpu = z80.Z80(**options)
+    cpu.ram._ram[:] = bytes(len(cpu.ram._ram))
+    written = []
+    cpu.io.register(0x10, read=lambda port: 0x21, write=lambda port, value: written.append((port, value)))
+    cpu.io.register(0x11, read=lambda port: 0x43)
+    code = bytes.fromhex(
+        'DB10 3200C0'       ## IN A, (10h); LD (C000h), A
+        '0E11 ED78 3201C0'  ## LD C, 11h; IN A, (C); LD (C001h), A
+        '3E12 D311'         ## LD A, 12h; OUT (11h), A: no handler, lost
+        'DB12 3202C0'       ## IN A, (12h): open bus
+        '3E34 D310'         ## LD A, 34h; OUT (10h), A
+        '0E10 1656 ED51'    ## LD C, 10h; LD D, 56h; OUT (C), D
+        '210080 0603 EDB3'  ## OTIR 3 bytes from 8000h
+        '2103C0 0602 EDB2'  ## INIR 2 bytes to C003h
+        '76')
+    cpu.ram._ram[0x100:0x100 + len(code)] = code
+    cpu.ram._ram[0x8000:0x8003] = b'\x01\x02\x03'
+    cpu.PC = 0x100
+    cpu.registers.SP = 0xF000
+    while not cpu.registers.halted:
+        cpu.run(1)
+    assert bytes(cpu.ram._ram[0xC000:0xC005]) == bytes([ 0x21, 0x43, 0xFF, 0x21, 0x21 ])
+    assert written == [ (0x10, 0x34), (0x10, 0x56), (0x10, 0x01), (0x10, 0x02), (0x10, 0x03) ]
+    
+    cpu.io.register(0x10)
+    assert cpu.io.readers[0x10](0x10) == 0xFF
+
+
+
+## Input
+
+## The interrupt handler of the keyboard test, and the main loop: after
+## every interrupt it stores row 8 of the keyboard matrix (selected in port
+## C of the PPI) and joysticks 2 and 1 (I/O port A of the PSG) from
+## 0xC000 on.
+KEYBOARD = bytes.fromhex(
+    '3100F0 2100C0 ED56' + '3E20D399 3E81D399'
+    + 'FB 76'
+    + 'DBAA E6F0 F608 D3AA DBA9 77 23'
+    + '3E0FD3A0 3E40D3A1 3E0ED3A0 DBA2 77 23'
+    + '3E0FD3A0 3E00D3A1 3E0ED3A0 DBA2 77 23'
+    + '18D0')
+
+## Key presses reach the programs through the matrix of the PPI and the
+## joystick port of the PSG, at the frames of the timeline.
+@pytest.mark.parametrize('options', OPTIONS + [ { 'skip_idle': True } ])
+def test_keyboard_matrix(options: dict) -> None:
+    timeline = msx.input.InputTimeline.from_presses([ (3, 2, 'SPACE'), (4, 3, 'LEFT'), (5, 1, 'JOY1_A'), (4, 1, 'SPACE'), (6, 2, 'JOY2_UP') ])
+    assert timeline.entries == [ (3, 8, 0xFE), (4, 8, 0xEE), (5, 8, 0xEF), (5, msx.input.JOYSTICK_1, 0xEF), (6, msx.input.JOYSTICK_1, 0xFF),
+        (6, msx.input.JOYSTICK_2, 0xFE), (7, 8, 0xFF), (8, msx.input.JOYSTICK_2, 0xFF) ]
+    m = machine(KEYBOARD, 0x4000, **options)
+    m.load(bytes.fromhex('F5 DB99 F1 FB C9'), 0x38)
+    m.play(timeline)
+    m.run_frames(10)
+    
+    ## The interrupt at the end of frame n reads the input of frame n + 1.
+    rows = { 8: 0xFF, msx.input.JOYSTICK_1: 0xFF, msx.input.JOYSTICK_2: 0xFF }
+    expected = b''
+    for frame in range(1, 10):
+        for at, row, bits in timeline.entries:
+            if at == frame:
+                rows[row] = bits
+        expected += bytes([ rows[8], 0xC0 | rows[msx.input.JOYSTICK_2], 0xC0 | rows[msx.input.JOYSTICK_1] ])
+    assert bytes(m.cpu.ram._ram[0xC000:0xC000 + len(expected)]) == expected
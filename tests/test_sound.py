@@ -0,0 +1,170 @@
+import random
+import numpy as np
+import pytest
+import z80
+import msx
+import msx.psg
+import msx.scc
+import msx.sound
+
+
+
+## Writes (cycles, register, value) to a chip at their time, and gives the
+## samples up to cycles.
+def play(chip: msx.sound.SoundChip, write, writes: list, cycles: int) -> np.ndarray:
+    for at, register, value in writes:
+        chip.cpu.cycles = at
+        write(register, value)
+    return chip.synthesize(cycles)
+
+## The fraction of samples that are off the reference: an edge of a square
+## wave may land on either side of a sample.
+def mismatch(samples: np.ndarray, reference: np.ndarray) -> float:
+    assert len(samples) == len(reference)
+    return float(np.mean(np.abs(samples - reference) > 1e-6))
+
+
+
+## PSG
+
+def _psg() -> msx.psg.PSG:
+    return msx.psg.PSG(z80.Z80())
+
+def _write_psg(psg: msx.psg.PSG):
+    def write(register: int, value: int) -> None:
+        psg.write_address(0xA0, register)
+        psg.write_data(0xA1, value)
+    return write
+
+## Three tones, with their volumes changed along the way, against a square
+## wave per sample: high for 8 * period PSG clock ticks, low for as many.
+def test_psg_tones() -> None:
+    periods = [ 254, 100, 0x3A7 ]
+    volumes = [ (0, 15), (12000, 9), (40000, 0), (61000, 13) ]
+    writes = [ (0, 7, 0x38) ]
+    for channel, period in enumerate(periods):
+        writes += [ (0, 2 * channel, period & 0xFF), (0, 2 * channel + 1, period >> 8) ]
+    for channel in range(3):
+        writes += [ (at + 700 * channel, 8 + channel, volume) for at, volume in volumes ]
+    writes.sort(key=lambda write: write[0])
+    cycles = msx.sound.CPU_CLOCK // 10
+    psg = _psg()
+    samples = play(psg, _write_psg(psg), writes, cycles)
+    
+    reference = np.zeros(msx.sound.sample_index(cycles))
+    for sample in range(len(reference)):
+        ticks = sample * msx.psg.TICKS_PER_SAMPLE
+        for channel, period in enumerate(periods):
+            volume = 0
+            for at, register, value in writes:
+                if register == 8 + channel and msx.sound.sample_index(at) <= sample:
+                    volume = value
+            if int(ticks // (8 * period)) % 2:
+                reference[sample] += msx.psg.LEVELS[volume] * msx.psg.VOLUME / 3
+    assert mismatch(samples, reference) < 0.002
+
+## The envelope shapes of the data sheet, as the level at every step.
+ENVELOPES = {
+    0x08: lambda step: 15 - step % 16,
+    0x09: lambda step: 15 - step if step < 16 else 0,
+    0x0A: lambda step: 15 - step % 16 if step // 16 % 2 == 0 else step % 16,
+    0x0B: lambda step: 15 - step if step < 16 else 15,
+    0x0C: lambda step: step % 16,
+    0x0D: lambda step: step if step < 16 else 15,
+    0x0E: lambda step: step % 16 if step // 16 % 2 == 0 else 15 - step % 16,
+    0x0F: lambda step: step if step < 16 else 0,
+}
+for shape in range(8):
+    ENVELOPES[shape] = ENVELOPES[0x09 if shape < 4 else 0x0F]
+
+## A channel with the envelope for its volume and nothing else against the
+## level of the shape at every step of 16 * period ticks.
+@pytest.mark.parametrize('shape', range(16))
+def test_psg_envelopes(shape: int) -> None:
+    period = 10
+    writes = [ (0, 7, 0x3F), (0, 8, 0x10), (0, 11, period), (0, 12, 0), (0, 13, shape) ]
+    cycles = msx.sound.CPU_CLOCK // 100
+    psg = _psg()
+    samples = play(psg, _write_psg(psg), writes, cycles)
+    
+    reference = np.array([ msx.psg.LEVELS[ENVELOPES[shape](int(sample * msx.psg.TICKS_PER_SAMPLE // (16 * period)))]
+        for sample in range(len(samples)) ]) * msx.psg.VOLUME / 3
+    assert mismatch(samples, reference) < 0.01
+
+## The tone of a program through the whole machine, with audio and after
+## fast forward.
+@pytest.mark.parametrize('audio', [ True, False ])
+def test_psg_frequency(audio: bool) -> None:
+    write = lambda register, value: bytes([ 0x3E, register, 0xD3, 0xA0, 0x3E, value, 0xD3, 0xA1 ])
+    code = write(0, 0xFE) + write(1, 0) + write(7, 0xBE) + write(8, 15) + bytes.fromhex('76 18FD')
+    m = msx.MSX()
+    m.load(code, 0x100)
+    m.cpu.PC = 0x100
+    m.run_frames(60, audio=audio)
+    samples = m.samples().astype(np.float64)
+    spectrum = np.abs(np.fft.rfft(samples - samples.mean()))
+    frequency = np.argmax(spectrum) * msx.sound.RATE / len(samples)
+    assert abs(frequency - msx.psg.CLOCK / 16 / 0xFE) < 2
+    assert bytes(m.psg.registers[:9]) == bytes([ 0xFE, 0, 0, 0, 0, 0, 0, 0xBE, 15 ])
+
+
+
+## SCC
+
+def _wave(seed: int) -> bytes:
+    return random.Random(seed).randbytes(32)
+
+## The first, fourth and fifth channel (which shares the waveform of the
+## fourth), and the third below the shortest period, against the waveforms
+## stepped every period + 1 CPU cycles; the waveform of the first is 
+## rewritten along the way.
+def test_scc_waves() -> None:
+    scc = msx.scc.SCC(z80.Z80())
+    write = lambda offset, value: scc.write(msx.scc.BASE + offset, value)
+    periods = { 0: 100, 2: msx.scc.MIN_PERIOD - 1, 3: 37, 4: 555 }
+    volumes = { 0: 15, 2: 15, 3: 7, 4: 12 }
+    writes = [ (0, channel * 32 + offset, value) for channel in (0, 2, 3) for offset, value in enumerate(_wave(channel)) ]
+    for channel, period in periods.items():
+        writes += [ (0, 0x80 + 2 * channel, period & 0xFF), (0, 0x81 + 2 * channel, period >> 8), (0, 0x8A + channel, volumes[channel]) ]
+    writes.append((0, 0x9F, 0x1D))
+    change = 50000
+    writes += [ (change, offset, value) for offset, value in enumerate(_wave(5)) ]
+    cycles = msx.sound.CPU_CLOCK // 20
+    samples = play(scc, write, writes, cycles)
+    
+    def signed(wave: bytes) -> list:
+        return [ value - 0x100 if value & 0x80 else value for value in wave ]
+    reference = np.zeros(msx.sound.sample_index(cycles))
+    for sample in range(len(reference)):
+        ticks = sample * msx.scc.TICKS_PER_SAMPLE
+        for channel, period in periods.items():
+            if period < msx.scc.MIN_PERIOD:
+                continue
+            wave = 5 if channel == 0 and sample >= msx.sound.sample_index(change) else min(channel, 3)
+            position = int(ticks // (period + 1)) % 32
+            reference[sample] += signed(_wave(wave))[position] * volumes[channel] * msx.scc.VOLUME / (128 * 15 * 5)
+    assert mismatch(samples, reference) < 0.002
+    assert (scc.registers[0x0F], scc.read(msx.scc.BASE + 0x60), scc.read(msx.scc.BASE + 0x80)) == (0x1D, _wave(3)[0], 0xFF)
+
+## A waveform written by a program through the whole machine.
+def test_scc_frequency() -> None:
+    code = bytes.fromhex('210098 0610 367F 23 10FB 0610 3680 23 10FB')
+    for offset, value in ((0x80, 253), (0x81, 0), (0x8A, 15), (0x8F, 0x01)):
+        code += bytes([ 0x3E, value, 0x32, offset, msx.scc.BASE >> 8 ])
+    code += bytes.fromhex('76 18FD')
+    m = msx.MSX(scc=True)
+    m.load(code, 0x100)
+    m.cpu.PC = 0x100
+    m.run_frames(60, audio=True)
+    samples = m.samples().astype(np.float64)
+    spectrum = np.abs(np.fft.rfft(samples - samples.mean()))
+    frequency = np.argmax(spectrum) * msx.sound.RATE / len(samples)
+    assert abs(frequency - msx.sound.CPU_CLOCK / 32 / 254) < 2
+
+## A chip without the synthesis cannot be made.
+def test_sound_chip_is_abstract() -> None:
+    class Silent(msx.sound.SoundChip):
+        def _apply(self, register: int, value: int) -> None:
+            pass
+    with pytest.raises(TypeError):
+        Silent(z80.Z80())
@@ -0,0 +1,155 @@
+import array
+import itertools
+from   typing import Self, Dict, Iterable, List, Optional, Tuple
+
+
+
+## Kinds of references.
+JUMP         = 0	## JP, JR, DJNZ
+CALL         = 1	## CALL, the return address is a CALL reference as well
+FALL_THROUGH = 2
+JUMP_TABLE   = 3
+HOOK         = 4	## Code installed in a hook, e.g. H.KEYI
+READ         = 5	## LD A, (nn) and friends
+WRITE        = 6	## LD (nn), A and friends
+KIND2NAME = [ 'jump', 'call', 'fall through', 'jump table', 'hook', 'read', 'write' ]
+CODE_KINDS = frozenset([ JUMP, CALL, FALL_THROUGH, JUMP_TABLE, HOOK ])
+DATA_KINDS = frozenset([ READ, WRITE ])
+
+
+
+## Cross references between addresses, both code (how can we get here) and data
+## (who reads or writes here).
+##
+## References are appended to flat arrays. These are sorted twice, by 
+## destination and by source, and an offset array per direction gives the 
+## slice belonging to an address (CSR, like a sparse matrix). References added
+## since are kept per address on the side, and queries add those to the 
+## slice. Once they are more than a quarter of the sorted ones, the arrays are
+## sorted again, so that adding and querying in turn stays O(E log E) overall.
+class XrefIndex:
+    ## Number of references kept on the side at least, before sorting again.
+    DELTA = 1024
+    
+    def __init__(self: Self, size: int=0x10000) -> None:
+        self.size = size
+        
+        ## Unsorted, in order of addition.
+        self._source = array.array('I')
+        self._destination = array.array('I')
+        self._kind = array.array('B')
+        self._how = array.array('H')
+        ## Edge number per (source, destination, kind), to find duplicates.
+        self._edges: Dict[int, int] = {}
+        
+        ## Free text per reference, e.g. the instruction name "JR NC, e".
+        self._hows: List[str] = []
+        self._how_ids: Dict[str, int] = {}
+        
+        ## The references from _built on are not sorted in yet, their edge 
+        ## numbers are by destination and by source here.
+        self._built = 0
+        self._delta_to: Dict[int, List[int]] = {}
+        self._delta_from: Dict[int, List[int]] = {}
+        self._to_offsets = array.array('I', bytes(4 * (size + 1)))
+        self._to_source = array.array('I')
+        self._to_edge = array.array('I')
+        self._from_offsets = array.array('I', bytes(4 * (size + 1)))
+        self._from_destination = array.array('I')
+        self._from_edge = array.array('I')
+    
+    def __len__(self: Self) -> int:
+        return len(self._source)
+    
+    ## Returns True if the reference is new. Adding an existing reference again
+    ## only updates its description.
+    def add(self: Self, source: int, destination: int, kind: int, how: Optional[str]=None) -> bool:
+        if how is None:
+            how = KIND2NAME[kind]
+        try:
+            how_id = self._how_ids[how]
+        except KeyError:
+            self._hows.append(how)
+            how_id = self._how_ids[how] = len(self._hows) - 1
+        
+        key = (((source * self.size) + destination) << 3) | kind
+        if key in self._edges:
+            self._how[self._edges[key]] = how_id
+            return False
+        edge = self._edges[key] = len(self._source)
+        self._source.append(source)
+        self._destination.append(destination)
+        self._kind.append(kind)
+        self._how.append(how_id)
+        self._delta_to.setdefault(destination, []).append(edge)
+        self._delta_from.setdefault(source, []).append(edge)
+        return True
+    
+    ## Sort the references by destination resp. by source (and by the other 
+    ## address within one address), the offsets are the running count of 
+    ## references per address.
+    def _build(self: Self) -> None:
+        for offsets, key, other, sorted_other, sorted_edge in (
+            (self._to_offsets, self._destination, self._source, '_to_source', '_to_edge'),
+            (self._from_offsets, self._source, self._destination, '_from_destination', '_from_edge'),
+        ):
+            order = sorted(range(len(key)), key=lambda edge: (key[edge], other[edge]))
+            counts = [0] * (self.size + 1)
+            for address in key:
+                counts[address + 1] += 1
+            offsets[:] = array.array('I', itertools.accumulate(counts))
+            setattr(self, sorted_edge, array.array('I', order))
+            setattr(self, sorted_other, array.array('I', (other[edge] for edge in order)))
+        self._built = len(self._source)
+        self._delta_to.clear()
+        self._delta_from.clear()
+    
+    def _update(self: Self) -> None:
+        if len(self._source) - self._built > max(self.DELTA, self._built // 4):
+            self._build()
+    
+    ## The (address, edge) pairs of the slice, with the references not sorted
+    ## in yet (delta, with the addresses in other) merged in.
+    def _merge(self: Self, addresses: Iterable[int], edges: Iterable[int], delta: Optional[List[int]], other: array.array) -> Iterable[Tuple[int, int]]:
+        if not delta:
+            return zip(addresses, edges)
+        return sorted(itertools.chain(zip(addresses, edges), ((other[edge], edge) for edge in delta)))
+    
+    def _select(self: Self, pairs: Iterable[Tuple[int, int]], kinds: Optional[Iterable[int]]) -> List[Tuple[int, int, str]]:
+        if kinds is None:
+            return [ (address, self._kind[edge], self._hows[self._how[edge]]) for address, edge in pairs ]
+        return [ (address, self._kind[edge], self._hows[self._how[edge]]) for address, edge in pairs if self._kind[edge] in kinds ]
+    
+    ## All references to address, as (source, kind, how), sorted by source.
+    def to(self: Self, address: int, kinds: Optional[Iterable[int]]=None) -> List[Tuple[int, int, str]]:
+        self._update()
+        start, end = self._to_offsets[address], self._to_offsets[address + 1]
+        pairs = self._merge(self._to_source[start:end], self._to_edge[start:end], self._delta_to.get(address), self._source)
+        return self._select(pairs, kinds)
+    
+    ## All references from address, as (destination, kind, how), sorted by
+    ## destination.
+    def from_(self: Self, address: int, kinds: Optional[Iterable[int]]=None) -> List[Tuple[int, int, str]]:
+        self._update()
+        start, end = self._from_offsets[address], self._from_offsets[address + 1]
+        pairs = self._merge(self._from_destination[start:end], self._from_edge[start:end], self._delta_from.get(address), self._destination)
+        return self._select(pairs, kinds)
+    
+    def count_to(self: Self, address: int) -> int:
+        self._update()
+        return self._to_offsets[address + 1] - self._to_offsets[address] + len(self._delta_to.get(address, ()))
+    
+    
+    
+    ## Convenience
+    def code_to(self: Self, address: int) -> List[Tuple[int, int, str]]:
+        return self.to(address, CODE_KINDS)
+    
+    def callers(self: Self, address: int) -> List[int]:
+        return [ source for source, kind, how in self.to(address, (CALL,)) ]
+    
+    def readers(self: Self, address: int) -> List[int]:
+        return [ source for source, kind, how in self.to(address, (READ,)) ]
+    
+    def writers(self: Self, address: int) -> List[int]:
+        return [ source for source, kind, how in self.to(address, (WRITE,)) ]
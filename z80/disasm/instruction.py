@@ -1,64 +1,31 @@
-import logging
-from   typing import Self, List
+from   typing import Self, Dict, List
 import z80.instruction
 import z80.instructions
 
-class cc(z80.instruction.cc):
-    def __str__(self: Self) -> str: return self.upper()
-z80.instruction.FormattingType.set('cc', cc)
-
-class d(z80.instruction.d):
-    def __str__(self: Self) -> str: return f'0x{int(self):02X}'
-z80.instruction.FormattingType.set('d', d)
-
-class dd(z80.instruction.dd):
-    def __str__(self: Self) -> str: return self.upper()
-z80.instruction.FormattingType.set('dd', dd)
-
-class jp(z80.instruction.dd):
-    def __str__(self: Self) -> str: return f'0x{int(self):04X}'
-z80.instruction.FormattingType.set('jp', jp)
-
-class n(z80.instruction.nn):
-    def __str__(self: Self) -> str: return f'0x{int(self):02X}'
-z80.instruction.FormattingType.set('n', n)
-
-class nn(z80.instruction.nn):
-    def __str__(self: Self) -> str: return f'0x{int(self):04X}'
-z80.instruction.FormattingType.set('nn', nn)
-
-class PC(z80.instruction.PC):
-    def __str__(self: Self) -> str: return f'{int(self):04X}'
-z80.instruction.FormattingType.set('PC', PC)
-
-class p(z80.instruction.pp):
-    def __str__(self: Self) -> str: return f'0x{int(self):02X}'
-z80.instruction.FormattingType.set('p', p)
-
-class pp(z80.instruction.pp):
-    def __str__(self: Self) -> str: return self.upper()
-z80.instruction.FormattingType.set('pp', pp)
-
-class qq(z80.instruction.qq):
-    def __str__(self: Self) -> str: return self.upper()
-z80.instruction.FormattingType.set('qq', qq)
-
-class r(z80.instruction.pp):
-    def __str__(self: Self) -> str: return self.upper()
-z80.instruction.FormattingType.set('r', r)
-
-class rr(z80.instruction.qq):
-    def __str__(self: Self) -> str: return self.upper()
-z80.instruction.FormattingType.set('rr', rr)
-
-class ss(z80.instruction.qq):
-    def __str__(self: Self) -> str: return self.upper()
-z80.instruction.FormattingType.set('ss', ss)
-
-
-
+## Upper case names and 0x prefixed hex numbers.
+STYLE = z80.instruction.Style(
+    b  = str,
+    cc = str.upper,
+    dd = str.upper,
+    p  = lambda p: f'0x{p:02X}',
+    pp = str.upper,
+    qq = str.upper,
+    r  = str.upper,
+    rr = str.upper,
+    ss = str.upper,
+    d  = '0x{:02X}',
+    jump_destination = '0x{:04X}',
+    n  = '0x{:02X}',
+    nn = '0x{:04X}',
+    PC = '{:04X}',
+)
+
+
+
+## The symbol table of one analysis. It starts out with the routines every
+## cartridge can call.
 class AUX:
-    routines =\
+    ROUTINES =\
     {
         ## Source: http://map.grauw.nl/resources/msxbios.php
         0x0000: "bios.CHKRAM",
@@ -192,841 +159,876 @@ class AUX:
         0x72F6: "72F6_A=0xE0C0[C - 1]",
     }
     
+    def __init__(self: Self) -> None:
+        self.routines: Dict[int, str] = dict(self.ROUTINES)
+    
     def add_routine(self: Self, address: int, routine_name: str) -> None:
         self.routines[address] = routine_name
     def get_routine(self: Self, address: int) -> str:
         return self.routines[address]
-## Singleton
-aux = AUX()
 
 
 
 class ADC_A_deref_HL(z80.instructions.ADC_A_deref_HL):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} ADC A, (HL)\t\t; A += *(HL) + CY'
+    __slots__ = ()
+    template = '{PC} ADC A, (HL)\t\t; A += *(HL) + CY'
 
 class ADC_A_deref_IX_plus_d(z80.instructions.ADC_A_deref_IX_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} ADC A, (IX+{self.d})\t\t; A += IX[{self.d}] + CY'
+    __slots__ = ()
+    template = '{PC} ADC A, (IX+{d})\t\t; A += IX[{d}] + CY'
 
 class ADC_A_deref_IY_plus_d(z80.instructions.ADC_A_deref_IY_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} ADC A, (IY+{self.d})\t\t; A += IY[{self.d}] + CY'
+    __slots__ = ()
+    template = '{PC} ADC A, (IY+{d})\t\t; A += IY[{d}] + CY'
 
 class ADC_A_n(z80.instructions.ADC_A_n):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} ADC A, {self.n}\t\t; A += {self.n} + CY'
+    __slots__ = ()
+    template = '{PC} ADC A, {n}\t\t; A += {n} + CY'
 
 class ADC_A_r(z80.instructions.ADC_A_r):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} ADC A, {self.r}\t\t; A += {self.r} + CY'
+    __slots__ = ()
+    template = '{PC} ADC A, {r}\t\t; A += {r} + CY'
 
 class ADC_HL_ss(z80.instructions.ADC_HL_ss):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} ADC HL, {self.ss}\t\t; HL += {self.ss} + CY'
+    __slots__ = ()
+    template = '{PC} ADC HL, {ss}\t\t; HL += {ss} + CY'
 
 
 
 class ADD_A_deref_HL(z80.instructions.ADD_A_deref_HL):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} ADD A, (HL)\t; A += *(HL)'
+    __slots__ = ()
+    template = '{PC} ADD A, (HL)\t; A += *(HL)'
 
 class ADD_A_deref_IX_plus_d(z80.instructions.ADD_A_deref_IX_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} ADD A, (IX+{self.d})\t; A += IX[{self.d}]'
+    __slots__ = ()
+    template = '{PC} ADD A, (IX+{d})\t; A += IX[{d}]'
 
 class ADD_A_deref_IY_plus_d(z80.instructions.ADD_A_deref_IY_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} ADD A, (IY+{self.d})\t\t; A += IY[{self.d}]'
+    __slots__ = ()
+    template = '{PC} ADD A, (IY+{d})\t\t; A += IY[{d}]'
 
 class ADD_A_n(z80.instructions.ADD_A_n):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} ADD A, {self.n}\t; A += {self.n}'
+    __slots__ = ()
+    template = '{PC} ADD A, {n}\t; A += {n}'
 
 class ADD_A_r(z80.instructions.ADD_A_r):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} ADD A, {self.r}\t\t; A += {self.r}'
+    __slots__ = ()
+    template = '{PC} ADD A, {r}\t\t; A += {r}'
 
 class ADD_HL_ss(z80.instructions.ADD_HL_ss):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} ADD HL, {self.ss}\t\t; HL += {self.ss}'
+    __slots__ = ()
+    template = '{PC} ADD HL, {ss}\t\t; HL += {ss}'
 
 class ADD_IX_pp(z80.instructions.ADD_IX_pp):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} ADD IX, {self.pp}\t\t; IX += {self.pp}'
+    __slots__ = ()
+    template = '{PC} ADD IX, {pp}\t\t; IX += {pp}'
 
 class ADD_IY_rr(z80.instructions.ADD_IY_rr):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} ADD IY, {self.rr}\t\t; IX += {self.rr}'
+    __slots__ = ()
+    template = '{PC} ADD IY, {rr}\t\t; IX += {rr}'
 
 
 
 class AND_deref_HL(z80.instructions.AND_deref_HL):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} AND (HL)\t\t; A &= *(HL)'
+    __slots__ = ()
+    template = '{PC} AND (HL)\t\t; A &= *(HL)'
 
 class AND_deref_IX_plus_d(z80.instructions.AND_deref_IX_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} AND (IX+{self.d})\t; A &= IX[{self.d}]'
+    __slots__ = ()
+    template = '{PC} AND (IX+{d})\t; A &= IX[{d}]'
 
 class AND_deref_IY_plus_d(z80.instructions.AND_deref_IY_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} AND (IY+{self.d})\t; A &= IY[{self.d}]'
+    __slots__ = ()
+    template = '{PC} AND (IY+{d})\t; A &= IY[{d}]'
 
 class AND_n(z80.instructions.AND_n):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} AND {self.n}\t\t; A &= {self._n:09_b}'
+    __slots__ = ()
+    template = '{PC} AND {n}\t\t; A &= {n:09_b}'
 
 class AND_r(z80.instructions.AND_r):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} AND {self.r}\t\t; A &= {self.r}'
+    __slots__ = ()
+    template = '{PC} AND {r}\t\t; A &= {r}'
 
 
 
 class BIT_b_deref_HL(z80.instructions.BIT_b_deref_HL):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} BIT {self.b}, (HL)\t; Compute *(HL) & 0x{1 << self._b:02X}, and set Z flag accordingly.'
+    __slots__ = ()
+    template = '{PC} BIT {b}, (HL)\t; Compute *(HL) & 0x{bmask:02X}, and set Z flag accordingly.'
 
 class BIT_b_deref_IX_plus_d(z80.instructions.BIT_b_deref_IX_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} BIT {self.b}, (IX+{self.d})\t; Compute IX[{self.d}] & 0x{1 << self._b:02X}, and set Z flag accordingly.'
+    __slots__ = ()
+    template = '{PC} BIT {b}, (IX+{d})\t; Compute IX[{d}] & 0x{bmask:02X}, and set Z flag accordingly.'
 
 class BIT_b_deref_IY_plus_d(z80.instructions.BIT_b_deref_IY_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} BIT {self.b}, (IY+{self.d})\t; Compute IY[{self.d}] & 0x{1 << self._b:02X}, and set Z flag accordingly.'
+    __slots__ = ()
+    template = '{PC} BIT {b}, (IY+{d})\t; Compute IY[{d}] & 0x{bmask:02X}, and set Z flag accordingly.'
 
 class BIT_b_r(z80.instructions.BIT_b_r):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} BIT {self.b}, {self.r}\t\t; Compute {self.r} & 0x{1 << self._b:02X}, and set Z flag accordingly.'
+    __slots__ = ()
+    template = '{PC} BIT {b}, {r}\t\t; Compute {r} & 0x{bmask:02X}, and set Z flag accordingly.'
 
 
 
 class CALL_cc_nn(z80.instructions.CALL_cc_nn):
-    def __str__(self: Self) -> str:
-        try:
-            post = f'{aux.routines[self._nn]}'
-        except KeyError:
-            logging.debug(f"Found unnamed call destination {self.nn}.")
-            post = ''
-        
-        return f'{self.PC} CALL {self.cc}, {self.nn}\t; {post}'
+    __slots__ = ()
+    template = '{PC} CALL {cc}, {nn}\t; {nn.symbol}'
 
 class CALL_nn(z80.instructions.CALL_nn):
-    def __str__(self: Self) -> str:
-        try:
-            post = f'{aux.routines[self._nn]}'
-        except KeyError:
-            logging.debug(f"Found unnamed call destination {self.nn}.")
-            post = ''
-        
-        return f'{self.PC} CALL {self.nn}\t; {post}'
+    __slots__ = ()
+    template = '{PC} CALL {nn}\t; {nn.symbol}'
 
 
 
 class CCF(z80.instructions.CCF):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} CCF\t\t;'
+    __slots__ = ()
+    template = '{PC} CCF\t\t;'
 
 class CPD(z80.instructions.CPD):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} CPD\t\t;'
+    __slots__ = ()
+    template = '{PC} CPD\t\t;'
 
 class CPDR(z80.instructions.CPDR):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} CPDR\t\t;'
+    __slots__ = ()
+    template = '{PC} CPDR\t\t;'
 
 class CPI(z80.instructions.CPI):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} CPI\t\t;'
+    __slots__ = ()
+    template = '{PC} CPI\t\t;'
 
 class CPIR(z80.instructions.CPIR):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} CPIR\t\t;'
+    __slots__ = ()
+    template = '{PC} CPIR\t\t;'
 
 class CPL(z80.instructions.CPL):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} CPL\t\t;'
+    __slots__ = ()
+    template = '{PC} CPL\t\t;'
 
 
 
 class CP_deref_HL(z80.instructions.CP_deref_HL):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} CP (HL)\t\t;'
+    __slots__ = ()
+    template = '{PC} CP (HL)\t\t;'
 
 class CP_deref_IX_plus_d(z80.instructions.CP_deref_IX_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} CP (IX+{self.d})\t\t;'
+    __slots__ = ()
+    template = '{PC} CP (IX+{d})\t\t;'
 
 class CP_deref_IY_plus_d(z80.instructions.CP_deref_IY_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} CP (IY+{self.d})\t\t;'
+    __slots__ = ()
+    template = '{PC} CP (IY+{d})\t\t;'
 
 class CP_n(z80.instructions.CP_n):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} CP {self.n}\t\t;'
+    __slots__ = ()
+    template = '{PC} CP {n}\t\t;'
 
 class CP_r(z80.instructions.CP_r):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} CP {self.r}\t\t;'
+    __slots__ = ()
+    template = '{PC} CP {r}\t\t;'
 
 
 
 class DAA(z80.instructions.DAA):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} DAA\t\t;'
+    __slots__ = ()
+    template = '{PC} DAA\t\t;'
 
 
 
 class DEC_deref_HL(z80.instructions.DEC_deref_HL):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} DEC (HL)\t\t; --*(HL)'
+    __slots__ = ()
+    template = '{PC} DEC (HL)\t\t; --*(HL)'
 
 class DEC_deref_IX_plus_d(z80.instructions.DEC_deref_IX_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} DEC (IX+{self.d})\t; --IX[{self.d}]'
+    __slots__ = ()
+    template = '{PC} DEC (IX+{d})\t; --IX[{d}]'
 
 class DEC_deref_IY_plus_d(z80.instructions.DEC_deref_IY_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} DEC (IY+{self.d})\t; --IY[{self.d}]'
+    __slots__ = ()
+    template = '{PC} DEC (IY+{d})\t; --IY[{d}]'
 
 class DEC_IX(z80.instructions.DEC_IX):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} DEC IX\t\t; --IX'
+    __slots__ = ()
+    template = '{PC} DEC IX\t\t; --IX'
 
 class DEC_IY(z80.instructions.DEC_IY):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} DEC IX\t\t; --IY'
+    __slots__ = ()
+    template = '{PC} DEC IX\t\t; --IY'
 
 class DEC_r(z80.instructions.DEC_r):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} DEC {self.r}\t\t; --{self.r}'
+    __slots__ = ()
+    template = '{PC} DEC {r}\t\t; --{r}'
 
 class DEC_ss(z80.instructions.DEC_ss):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} DEC {self.ss}\t\t; --{self.ss}'
+    __slots__ = ()
+    template = '{PC} DEC {ss}\t\t; --{ss}'
 
 class DI(z80.instructions.DI):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} DI\t\t\t; Disable interrupts.'
+    __slots__ = ()
+    template = '{PC} DI\t\t\t; Disable interrupts.'
 
 class DJNZ_e(z80.instructions.DJNZ_e):
-    def __str__(self: Self) -> str:
-        try:
-            post = f'{aux.routines[self._jump_destination]}'
-        except KeyError:
-            logging.debug(f"Found unnamed jump destination {self.jump_destination}.")
-            post = ''
-        
-        return f'{self.PC} DJNZ {self.jump_destination}\t; {post}'
+    __slots__ = ()
+    template = '{PC} DJNZ {jump_destination}\t; {jump_destination.symbol}'
 
 class EI(z80.instructions.EI):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} EI\t\t\t; Enable interrupts.'
+    __slots__ = ()
+    template = '{PC} EI\t\t\t; Enable interrupts.'
 
 class EXX(z80.instructions.EXX):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} EXX\t\t;'
+    __slots__ = ()
+    template = '{PC} EXX\t\t;'
 
 class EX_AF_AFprime(z80.instructions.EX_AF_AFprime):
-    def __str__(self: Self) -> str:
-        return f"{self.PC} EX AF AF'\t\t;"
+    __slots__ = ()
+    template = "{PC} EX AF AF'\t\t;"
 
 class EX_deref_SP_HL(z80.instructions.EX_deref_SP_HL):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} EX (SP), HL\t;'
+    __slots__ = ()
+    template = '{PC} EX (SP), HL\t;'
 
 class EX_deref_SP_IX(z80.instructions.EX_deref_SP_IX):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} EX (SP), IX\t;'
+    __slots__ = ()
+    template = '{PC} EX (SP), IX\t;'
 
 class EX_deref_SP_IY(z80.instructions.EX_deref_SP_IY):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} EX (SP), IY\t;'
+    __slots__ = ()
+    template = '{PC} EX (SP), IY\t;'
 
 class EX_DE_HL(z80.instructions.EX_DE_HL):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} EX DE, HL\t\t;'
+    __slots__ = ()
+    template = '{PC} EX DE, HL\t\t;'
 
 class HALT(z80.instructions.HALT):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} HALT\t\t;'
+    __slots__ = ()
+    template = '{PC} HALT\t\t;'
 
 
 
 class IM_0(z80.instructions.IM_0):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} IM 0\t\t;'
+    __slots__ = ()
+    template = '{PC} IM 0\t\t;'
 
 class IM_1(z80.instructions.IM_1):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} IM 1\t\t;'
+    __slots__ = ()
+    template = '{PC} IM 1\t\t;'
 
 class IM_2(z80.instructions.IM_2):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} IM 2\t\t;'
+    __slots__ = ()
+    template = '{PC} IM 2\t\t;'
 
 
 
 class INC_deref_HL(z80.instructions.INC_deref_HL):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} INC (HL)\t\t; ++*(HL)'
+    __slots__ = ()
+    template = '{PC} INC (HL)\t\t; ++*(HL)'
 
 class INC_deref_IX_plus_d(z80.instructions.INC_deref_IX_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} INC (IX+{self.d})\t\t; ++IX[{self.d}]'
+    __slots__ = ()
+    template = '{PC} INC (IX+{d})\t\t; ++IX[{d}]'
 
 class INC_deref_IY_plus_d(z80.instructions.INC_deref_IY_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} INC (IY+{self.d})\t\t; ++IY[{self.d}]'
+    __slots__ = ()
+    template = '{PC} INC (IY+{d})\t\t; ++IY[{d}]'
 
 class INC_IX(z80.instructions.INC_IX):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} INC IX\t\t; ++IX'
+    __slots__ = ()
+    template = '{PC} INC IX\t\t; ++IX'
 
 class INC_IY(z80.instructions.INC_IY):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} INC IY\t\t; ++IY'
+    __slots__ = ()
+    template = '{PC} INC IY\t\t; ++IY'
 
 class INC_r(z80.instructions.INC_r):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} INC {self.r}\t\t; ++{self.r}'
+    __slots__ = ()
+    template = '{PC} INC {r}\t\t; ++{r}'
 
 class INC_ss(z80.instructions.INC_ss):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} INC {self.ss}\t\t; ++{self.ss}'
+    __slots__ = ()
+    template = '{PC} INC {ss}\t\t; ++{ss}'
 
 
 
 class IND(z80.instructions.IND):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} IND\t\t;'
+    __slots__ = ()
+    template = '{PC} IND\t\t;'
 
 class INDR(z80.instructions.INDR):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} INDR\t\t;'
+    __slots__ = ()
+    template = '{PC} INDR\t\t;'
 
 class INI(z80.instructions.INI):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} INI\t\t;'
+    __slots__ = ()
+    template = '{PC} INI\t\t;'
 
 class INIR(z80.instructions.INIR):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} INIR\t\t;'
+    __slots__ = ()
+    template = '{PC} INIR\t\t;'
 
 
 
 class IN_A_deref_n(z80.instructions.IN_A_deref_n):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} IN A, ({self.n})\t\t;'
+    __slots__ = ()
+    template = '{PC} IN A, ({n})\t\t;'
 
 class IN_r_deref_C(z80.instructions.IN_r_deref_C):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} IN {self.r}, (C)\t\t;'
+    __slots__ = ()
+    template = '{PC} IN {r}, (C)\t\t;'
 
 
 
 class JP_cc_nn(z80.instructions.JP_cc_nn):
-    def __str__(self: Self) -> str:
-        try:
-            post = f'{aux.routines[self._nn]}'
-        except KeyError:
-            logging.debug(f"Found unnamed jump destination {self.nn}.")
-            post = ''
-        
-        return f'{self.PC} JP {self.cc}, {self.nn}\t; {post}'
+    __slots__ = ()
+    template = '{PC} JP {cc}, {nn}\t; {nn.symbol}'
 
 class JP_deref_HL(z80.instructions.JP_deref_HL):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} JP (HL)\t\t;'
+    __slots__ = ()
+    template = '{PC} JP (HL)\t\t;'
+
+class JP_deref_IX(z80.instructions.JP_deref_IX):
+    __slots__ = ()
+    template = '{PC} JP (IX)\t\t;'
+
+class JP_deref_IY(z80.instructions.JP_deref_IY):
+    __slots__ = ()
+    template = '{PC} JP (IY)\t\t;'
 
 class JP_nn(z80.instructions.JP_nn):
-    def __str__(self: Self) -> str:
-        try:
-            post = f'{aux.routines[self._nn]}'
-        except KeyError:
-            logging.debug(f"Found unnamed jump destination {self.nn}.")
-            post = ''
-        
-        return f'{self.PC} JP {self.nn}\t\t; {post}'
+    __slots__ = ()
+    template = '{PC} JP {nn}\t\t; {nn.symbol}'
 
 
 
 class JR_C_e(z80.instructions.JR_C_e):
-    def __str__(self: Self) -> str:
-        try:
-            post = f'{aux.routines[self._jump_destination]}'
-        except KeyError:
-            logging.debug(f"Found unnamed jump destination {self.jump_destination}.")
-            post = ''
-        
-        return f'{self.PC} JR C, {self.jump_destination}\t; {post}'
+    __slots__ = ()
+    template = '{PC} JR C, {jump_destination}\t; {jump_destination.symbol}'
 
 class JR_e(z80.instructions.JR_e):
-    def __str__(self: Self) -> str:
-        try:
-            post = f'{aux.routines[self._jump_destination]}'
-        except KeyError:
-            logging.debug(f"Found unnamed jump destination {self.jump_destination}.")
-            post = ''
-        
-        return f'{self.PC} JR {self.jump_destination}\t\t; {post}'
+    __slots__ = ()
+    template = '{PC} JR {jump_destination}\t\t; {jump_destination.symbol}'
 
 class JR_NC_e(z80.instructions.JR_NC_e):
-    def __str__(self: Self) -> str:
-        try:
-            post = f'{aux.routines[self._jump_destination]}'
-        except KeyError:
-            logging.debug(f"Found unnamed jump destination {self.jump_destination}.")
-            post = ''
-        
-        return f'{self.PC} JR NC, {self.jump_destination}\t; {post}'
+    __slots__ = ()
+    template = '{PC} JR NC, {jump_destination}\t; {jump_destination.symbol}'
 
 class JR_NZ_e(z80.instructions.JR_NZ_e):
-    def __str__(self: Self) -> str:
-        try:
-            post = f'{aux.routines[self._jump_destination]}'
-        except KeyError:
-            logging.debug(f"Found unnamed jump destination {self.jump_destination}.")
-            post = ''
-        
-        return f'{self.PC} JR NZ, {self.jump_destination}\t; {post}'
+    __slots__ = ()
+    template = '{PC} JR NZ, {jump_destination}\t; {jump_destination.symbol}'
 
 class JR_Z_e(z80.instructions.JR_Z_e):
-    def __str__(self: Self) -> str:
-        try:
-            post = f'{aux.routines[self._jump_destination]}'
-        except KeyError:
-            logging.debug(f"Found unnamed jump destination {self.jump_destination}.")
-            post = ''
-        
-        return f'{self.PC} JR Z, {self.jump_destination}\t; {post}'
+    __slots__ = ()
+    template = '{PC} JR Z, {jump_destination}\t; {jump_destination.symbol}'
 
 
 
 class LDD(z80.instructions.LDD):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LDD\t\t;'
+    __slots__ = ()
+    template = '{PC} LDD\t\t;'
 
 class LDDR(z80.instructions.LDDR):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LDDR\t\t;'
+    __slots__ = ()
+    template = '{PC} LDDR\t\t;'
 
 class LDI(z80.instructions.LDI):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LDI\t\t;'
+    __slots__ = ()
+    template = '{PC} LDI\t\t;'
 
 class LDIR(z80.instructions.LDIR):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LDIR\t\t;'
+    __slots__ = ()
+    template = '{PC} LDIR\t\t;'
 
 
 
 class LD_A_deref_BC(z80.instructions.LD_A_deref_BC):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD A, (BC)\t\t; A = *(BC)'
+    __slots__ = ()
+    template = '{PC} LD A, (BC)\t\t; A = *(BC)'
 
 class LD_A_deref_DE(z80.instructions.LD_A_deref_DE):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD A, (DE)\t\t; A = *(DE)'
+    __slots__ = ()
+    template = '{PC} LD A, (DE)\t\t; A = *(DE)'
 
 class LD_A_deref_nn(z80.instructions.LD_A_deref_nn):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD A, ({self.nn})\t; A = {self.nn}'
+    __slots__ = ()
+    template = '{PC} LD A, ({nn})\t; A = {nn}'
 
 class LD_A_I(z80.instructions.LD_A_I):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD A, I\t\t; A = I'
+    __slots__ = ()
+    template = '{PC} LD A, I\t\t; A = I'
 
 class LD_A_R(z80.instructions.LD_A_R):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD A, R\t\t; A = R, register A now contains a somewhat unpredictable value'
+    __slots__ = ()
+    template = '{PC} LD A, R\t\t; A = R, register A now contains a somewhat unpredictable value'
 
 
 
 class LD_dd_deref_nn(z80.instructions.LD_dd_deref_nn):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD {self.dd}, ({self.nn})\t; {self.dd} = *({self.nn})'
-    def execute(self: Self):
-        self._registers.set_reg_dd(self._dd, self.nn)
+    __slots__ = ()
+    template = '{PC} LD {dd}, ({nn})\t; {dd} = *({nn})'
+    def trace(self: Self, cpu) -> None:
+        cpu.registers.set_reg_dd(self._dd, self._nn)
 
 class LD_dd_nn(z80.instructions.LD_dd_nn):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD {self.dd}, {self.nn}\t; {self.dd} = {self.nn}'
-    def execute(self: Self):
-        self._registers.set_reg_dd(self._dd, self.nn)
+    __slots__ = ()
+    template = '{PC} LD {dd}, {nn}\t; {dd} = {nn}'
+    def trace(self: Self, cpu) -> None:
+        cpu.registers.set_reg_dd(self._dd, self._nn)
 
 class LD_deref_BC_A(z80.instructions.LD_deref_BC_A):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD (BC), A\t\t; *(BC) = A'
+    __slots__ = ()
+    template = '{PC} LD (BC), A\t\t; *(BC) = A'
 
 class LD_deref_DE_A(z80.instructions.LD_deref_DE_A):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD (DE), A\t\t; *(DE) = A'
+    __slots__ = ()
+    template = '{PC} LD (DE), A\t\t; *(DE) = A'
 
 class LD_deref_HL_n(z80.instructions.LD_deref_HL_n):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD (HL), {self.n}\t; *(HL) = *(0x{self._registers.HL:02X}) = {self.n}'
+    __slots__ = ()
+    template = '{PC} LD (HL), {n}\t; *(HL) = *(0x{HL:02X}) = {n}'
 
 class LD_deref_HL_r(z80.instructions.LD_deref_HL_r):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD (HL), {self.r}\t\t; *(HL) = {self.r}'
+    __slots__ = ()
+    template = '{PC} LD (HL), {r}\t\t; *(HL) = {r}'
 
 class LD_deref_IX_plus_d_n(z80.instructions.LD_deref_IX_plus_d_n):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD (IX+{self.d}), {self.n}\t; IX[{self.d}] = {self.n}'
+    __slots__ = ()
+    template = '{PC} LD (IX+{d}), {n}\t; IX[{d}] = {n}'
 
 class LD_deref_IX_plus_d_r(z80.instructions.LD_deref_IX_plus_d_r):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD (IX+{self.d}), {self.r}\t; IX[{self.d}] = {self.r}'
+    __slots__ = ()
+    template = '{PC} LD (IX+{d}), {r}\t; IX[{d}] = {r}'
 
 class LD_deref_IY_plus_d_n(z80.instructions.LD_deref_IY_plus_d_n):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD (IY+{self.d}), {self.n}\t; IY[{self.d}] = {self.n}'
+    __slots__ = ()
+    template = '{PC} LD (IY+{d}), {n}\t; IY[{d}] = {n}'
 
 class LD_deref_IY_plus_d_r(z80.instructions.LD_deref_IY_plus_d_r):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD (IY+{self.d}), {self.r}\t; IY[{self.d}] = {self.r}'
+    __slots__ = ()
+    template = '{PC} LD (IY+{d}), {r}\t; IY[{d}] = {r}'
 
 class LD_deref_nn_A(z80.instructions.LD_deref_nn_A):
-    def __str__(self: Self) -> str:
-        comment = ''
+    __slots__ = ()
+    template = '{PC} LD ({nn}), A\t; *({nn}) = A{comment}'
+    @property
+    def comment(self: Self) -> str:
         if self._nn == 0xFD9A:
-            comment = 'H.KEYI[0] = A, 0xC3 means "JP"'
-        return f'{self.PC} LD ({self.nn}), A\t; *({self.nn}) = A' + (
-            (' ' + comment) if comment else comment)
+            return ' H.KEYI[0] = A, 0xC3 means "JP"'
+        return ''
 
 class LD_deref_nn_dd(z80.instructions.LD_deref_nn_dd):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD ({self.nn}), {self.dd}\t; *({self.nn}) = {self.dd}'
+    __slots__ = ()
+    template = '{PC} LD ({nn}), {dd}\t; *({nn}) = {dd}'
 
 class LD_deref_nn_HL(z80.instructions.LD_deref_nn_HL):
-    def __str__(self: Self) -> str:
-        comment = ''
-        if self.nn == 0xFD9B:
-            comment = 'H.KEYI[1] = L, H.KEYI[2] = H'
-        return f'{self.PC} LD ({self.nn}, HL\t;*({self.nn}) = HL (0x{self._registers.HL})' + (
-            (' ' + comment) if comment else comment)
-    def execute(self: Self) -> None:
-        self._ram.set_word(offset=self.nn, value=self._registers.HL)
+    __slots__ = ()
+    template = '{PC} LD ({nn}, HL\t;*({nn}) = HL (0x{HL}){comment}'
+    @property
+    def comment(self: Self) -> str:
+        if self._nn == 0xFD9B:
+            return ' H.KEYI[1] = L, H.KEYI[2] = H'
+        return ''
+    def trace(self: Self, cpu) -> None:
+        cpu.ram.set_word(offset=self._nn, value=cpu.registers.HL)
 
 class LD_deref_nn_IX(z80.instructions.LD_deref_nn_IX):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD ({self.nn}), IX\t; *({self.nn}) = IX'
+    __slots__ = ()
+    template = '{PC} LD ({nn}), IX\t; *({nn}) = IX'
+
+class LD_deref_nn_IY(z80.instructions.LD_deref_nn_IY):
+    __slots__ = ()
+    template = '{PC} LD ({nn}), IY\t; *({nn}) = IY'
 
 class LD_HL_deref_nn(z80.instructions.LD_HL_deref_nn):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD HL, ({self.nn})\t; HL = *({self.nn})'
+    __slots__ = ()
+    template = '{PC} LD HL, ({nn})\t; HL = *({nn})'
 
 class LD_IX_deref_nn(z80.instructions.LD_IX_deref_nn):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD IX, ({self.nn})\t; IX = *({self.nn})'
+    __slots__ = ()
+    template = '{PC} LD IX, ({nn})\t; IX = *({nn})'
 
 class LD_IX_nn(z80.instructions.LD_IX_nn):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD IX, {self.nn}\t; IX = {self.nn}'
+    __slots__ = ()
+    template = '{PC} LD IX, {nn}\t; IX = {nn}'
 
 class LD_IY_deref_nn(z80.instructions.LD_IY_deref_nn):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD IY, ({self.nn})\t; IY = *({self.nn})'
+    __slots__ = ()
+    template = '{PC} LD IY, ({nn})\t; IY = *({nn})'
 
 class LD_IY_nn(z80.instructions.LD_IY_nn):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD IY, {self.nn}\t; IY = {self.nn}'
+    __slots__ = ()
+    template = '{PC} LD IY, {nn}\t; IY = {nn}'
 
 class LD_I_A(z80.instructions.LD_I_A):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD I, A\t\t; I = A'
+    __slots__ = ()
+    template = '{PC} LD I, A\t\t; I = A'
 
 class LD_R_A(z80.instructions.LD_R_A):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD R, A\t\t; Weird!!!'
+    __slots__ = ()
+    template = '{PC} LD R, A\t\t; Weird!!!'
 
 class LD_r_deref_HL(z80.instructions.LD_r_deref_HL):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD {self.r}, (HL)\t\t; {self.r} = *(HL)'
+    __slots__ = ()
+    template = '{PC} LD {r}, (HL)\t\t; {r} = *(HL)'
 
 class LD_r_deref_IX_plus_d(z80.instructions.LD_r_deref_IX_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD {self.r}, (IX+{self.d})\t; {self.r} = IX[{self.d}]'
+    __slots__ = ()
+    template = '{PC} LD {r}, (IX+{d})\t; {r} = IX[{d}]'
 
 class LD_r_deref_IY_plus_d(z80.instructions.LD_r_deref_IY_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD {self.r}, (IY+{self.d})\t; {self.r} = IY[{self.d}]'
+    __slots__ = ()
+    template = '{PC} LD {r}, (IY+{d})\t; {r} = IY[{d}]'
 
 class LD_r_n(z80.instructions.LD_r_n):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD {self.r}, {self.n}\t\t; {self.r} = {self.n}'
-    def execute(self: Self):
-        self._registers.set_r_n(self._r, self.n)
+    __slots__ = ()
+    template = '{PC} LD {r}, {n}\t\t; {r} = {n}'
+    def trace(self: Self, cpu) -> None:
+        cpu.registers.set_r_n(self._r, self._n)
 
 class LD_r_rprime(z80.instructions.LD_r_rprime):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD {self.r}, {self.rprime}\t\t; {self.r} = {self.rprime}'
+    __slots__ = ()
+    template = '{PC} LD {r}, {rprime}\t\t; {r} = {rprime}'
 
 class LD_SP_HL(z80.instructions.LD_SP_HL):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD SP, HL\t\t; SP = HL'
+    __slots__ = ()
+    template = '{PC} LD SP, HL\t\t; SP = HL'
 
 class LD_SP_IX(z80.instructions.LD_SP_IX):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD SP, IX\t\t; SP = IX'
+    __slots__ = ()
+    template = '{PC} LD SP, IX\t\t; SP = IX'
 
 class LD_SP_IY(z80.instructions.LD_SP_IY):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} LD SP, IY\t\t; SP = IY'
+    __slots__ = ()
+    template = '{PC} LD SP, IY\t\t; SP = IY'
 
 class NEG(z80.instructions.NEG):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} NEG\t\t;'
+    __slots__ = ()
+    template = '{PC} NEG\t\t;'
 
 class NOP(z80.instructions.NOP):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} NOP\t\t;'
+    __slots__ = ()
+    template = '{PC} NOP\t\t;'
 
 class OR_deref_HL(z80.instructions.OR_deref_HL):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} OR (HL)\t\t; A |= *(HL)'
+    __slots__ = ()
+    template = '{PC} OR (HL)\t\t; A |= *(HL)'
 
 class OR_deref_IX_plus_d(z80.instructions.OR_deref_IX_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} OR (IX+{self.d})\t\t; A |= IX[{self.d}]'
+    __slots__ = ()
+    template = '{PC} OR (IX+{d})\t\t; A |= IX[{d}]'
 
 class OR_deref_IY_plus_d(z80.instructions.OR_deref_IY_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} OR (IY+{self.d})\t\t; A |= IY[{self.d}]'
+    __slots__ = ()
+    template = '{PC} OR (IY+{d})\t\t; A |= IY[{d}]'
 
 class OR_n(z80.instructions.OR_n):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} OR {self.n}\t\t; A |= {self.n}'
+    __slots__ = ()
+    template = '{PC} OR {n}\t\t; A |= {n}'
 
 class OR_r(z80.instructions.OR_r):
-    def __str__(self: Self) -> str:
-        if self._r == 0b111:
-            return f'{self.PC} OR {self.r}\t\t; A |= {self.r}, set flag Z/NZ.'
-        return f'{self.PC} OR {self.r}\t\t; A |= {self.r}'
+    __slots__ = ()
+    @classmethod
+    def template_for(cls, opcode: int) -> str:
+        if cls.constants(opcode)['r'] == 'A':
+            return '{PC} OR {r}\t\t; A |= {r}, set flag Z/NZ.'
+        return '{PC} OR {r}\t\t; A |= {r}'
 
 class OTDR(z80.instructions.OTDR):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} OTDR\t\t\t;'
+    __slots__ = ()
+    template = '{PC} OTDR\t\t\t;'
 
 class OTIR(z80.instructions.OTIR):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} OTIR\t\t\t;'
+    __slots__ = ()
+    template = '{PC} OTIR\t\t\t;'
 
 class OUTD(z80.instructions.OUTD):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} OUTD\t\t\t;'
+    __slots__ = ()
+    template = '{PC} OUTD\t\t\t;'
 
 class OUTI(z80.instructions.OUTI):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} OUTI\t\t\t;'
+    __slots__ = ()
+    template = '{PC} OUTI\t\t\t;'
 
 class OUT_deref_C_r(z80.instructions.OUT_deref_C_r):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} OUT (C), {self.r}\t\t;'
+    __slots__ = ()
+    template = '{PC} OUT (C), {r}\t\t;'
 
 class OUT_deref_n_A(z80.instructions.OUT_deref_n_A):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} OUT ({self.n}), A\t\t;'
+    __slots__ = ()
+    template = '{PC} OUT ({n}), A\t\t;'
 
 class POP_IX(z80.instructions.POP_IX):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} POP IX\t\t;'
+    __slots__ = ()
+    template = '{PC} POP IX\t\t;'
 
 class POP_IY(z80.instructions.POP_IY):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} POP IY\t\t;'
+    __slots__ = ()
+    template = '{PC} POP IY\t\t;'
 
 class POP_qq(z80.instructions.POP_qq):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} POP {self.qq}\t\t;'
+    __slots__ = ()
+    template = '{PC} POP {qq}\t\t;'
 
 class PUSH_IX(z80.instructions.PUSH_IX):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} PUSH IX\t\t;'
+    __slots__ = ()
+    template = '{PC} PUSH IX\t\t;'
 
 class PUSH_IY(z80.instructions.PUSH_IY):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} PUSH IY\t\t;'
+    __slots__ = ()
+    template = '{PC} PUSH IY\t\t;'
 
 class PUSH_qq(z80.instructions.PUSH_qq):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} PUSH {self.qq}\t\t;'
+    __slots__ = ()
+    template = '{PC} PUSH {qq}\t\t;'
+
+class RES_b_deref_HL(z80.instructions.RES_b_deref_HL):
+    __slots__ = ()
+    template = '{PC} RES {b}, (HL)\t\t;'
+
+class RES_b_deref_IX_plus_d(z80.instructions.RES_b_deref_IX_plus_d):
+    __slots__ = ()
+    template = '{PC} RES {b}, (IX+{d})\t\t;'
+
+class RES_b_deref_IY_plus_d(z80.instructions.RES_b_deref_IY_plus_d):
+    __slots__ = ()
+    template = '{PC} RES {b}, (IY+{d})\t\t;'
+
+class RES_b_r(z80.instructions.RES_b_r):
+    __slots__ = ()
+    template = '{PC} RES {b}, {r}\t\t;'
 
 class RET(z80.instructions.RET):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} RET\t\t;'
+    __slots__ = ()
+    template = '{PC} RET\t\t;'
 
 class RETI(z80.instructions.RETI):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} RETI\t\t;'
+    __slots__ = ()
+    template = '{PC} RETI\t\t;'
 
 class RETN(z80.instructions.RETN):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} RETN\t\t;'
+    __slots__ = ()
+    template = '{PC} RETN\t\t;'
 
 class RET_cc(z80.instructions.RET_cc):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} RET {self.cc}\t\t;if ({self.cc}) return'
+    __slots__ = ()
+    template = '{PC} RET {cc}\t\t;if ({cc}) return'
 
 class RLA(z80.instructions.RLA):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} RLA\t\t;'
+    __slots__ = ()
+    template = '{PC} RLA\t\t;'
 
 class RLCA(z80.instructions.RLCA):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} RLCA\t\t;'
+    __slots__ = ()
+    template = '{PC} RLCA\t\t;'
 
 class RLC_deref_HL(z80.instructions.RLC_deref_HL):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} RLC (HL)\t\t;'
+    __slots__ = ()
+    template = '{PC} RLC (HL)\t\t;'
 
 class RLC_deref_IX_plus_d(z80.instructions.RLC_deref_IX_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} RLC (IX+{self.d})\t\t;'
+    __slots__ = ()
+    template = '{PC} RLC (IX+{d})\t\t;'
 
 class RLC_r(z80.instructions.RLC_r):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} RLC {self.r}\t\t;'
+    __slots__ = ()
+    template = '{PC} RLC {r}\t\t;'
+
+class RLD(z80.instructions.RLD):
+    __slots__ = ()
+    template = '{PC} RLD\t\t;'
 
 class RL_deref_HL(z80.instructions.RL_deref_HL):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} RLC (HL)\t\t;'
+    __slots__ = ()
+    template = '{PC} RLC (HL)\t\t;'
 
 class RL_deref_IX_plus_d(z80.instructions.RL_deref_IX_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} RL (IX+{self.d})\t\t;'
+    __slots__ = ()
+    template = '{PC} RL (IX+{d})\t\t;'
 
 class RL_deref_IY_plus_d(z80.instructions.RL_deref_IY_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} RL (IY+{self.d})\t\t;'
+    __slots__ = ()
+    template = '{PC} RL (IY+{d})\t\t;'
 
 class RL_r(z80.instructions.RL_r):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} RL {self.r}\t\t;'
+    __slots__ = ()
+    template = '{PC} RL {r}\t\t;'
 
 class RRA(z80.instructions.RRA):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} RRA\t\t;'
+    __slots__ = ()
+    template = '{PC} RRA\t\t;'
 
 class RRCA(z80.instructions.RRCA):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} RRCA\t\t;'
+    __slots__ = ()
+    template = '{PC} RRCA\t\t;'
+
+class RRC_deref_HL(z80.instructions.RRC_deref_HL):
+    __slots__ = ()
+    template = '{PC} RRC (HL)\t\t;'
+
+class RRC_deref_IX_plus_d(z80.instructions.RRC_deref_IX_plus_d):
+    __slots__ = ()
+    template = '{PC} RRC (IX+{d})\t\t;'
+
+class RRC_deref_IY_plus_d(z80.instructions.RRC_deref_IY_plus_d):
+    __slots__ = ()
+    template = '{PC} RRC (IY+{d})\t\t;'
+
+class RRC_r(z80.instructions.RRC_r):
+    __slots__ = ()
+    template = '{PC} RRC {r}\t\t;'
+
+class RRD(z80.instructions.RRD):
+    __slots__ = ()
+    template = '{PC} RRD\t\t;'
 
 class RR_deref_HL(z80.instructions.RR_deref_HL):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} RR (HL)\t\t;'
+    __slots__ = ()
+    template = '{PC} RR (HL)\t\t;'
 
 class RR_deref_IX_plus_d(z80.instructions.RR_deref_IX_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} RR (IX+{self.d})\t\t;'
+    __slots__ = ()
+    template = '{PC} RR (IX+{d})\t\t;'
 
 class RR_deref_IY_plus_d(z80.instructions.RR_deref_IY_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} RR (IY+{self.d})\t\t;'
+    __slots__ = ()
+    template = '{PC} RR (IY+{d})\t\t;'
 
 class RR_r(z80.instructions.RR_r):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} RR {self.r}\t\t;'
+    __slots__ = ()
+    template = '{PC} RR {r}\t\t;'
 
 class RST_p(z80.instructions.RST_p):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} RST {self.p}\t\t;'
+    __slots__ = ()
+    template = '{PC} RST {p}\t\t;'
 
 class SBC_HL_ss(z80.instructions.SBC_HL_ss):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} SBC HL, {self.ss}\t\t;'
+    __slots__ = ()
+    template = '{PC} SBC HL, {ss}\t\t;'
 
 class SCF(z80.instructions.SCF):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} SCF\t\t;'
+    __slots__ = ()
+    template = '{PC} SCF\t\t;'
 
 class SET_b_deref_HL(z80.instructions.SET_b_deref_HL):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} SET {self.b}, (HL)\t\t;'
+    __slots__ = ()
+    template = '{PC} SET {b}, (HL)\t\t;'
 
 class SET_b_deref_IX_plus_d(z80.instructions.SET_b_deref_IX_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} SET {self.b}, (IX+{self.d})\t\t;'
+    __slots__ = ()
+    template = '{PC} SET {b}, (IX+{d})\t\t;'
 
 class SET_b_deref_IY_plus_d(z80.instructions.SET_b_deref_IY_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} SET {self.b}, (IY+{self.d})\t\t;'
+    __slots__ = ()
+    template = '{PC} SET {b}, (IY+{d})\t\t;'
 
 class SET_b_r(z80.instructions.SET_b_r):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} SET {self.b}, {self.r}\t\t;'
+    __slots__ = ()
+    template = '{PC} SET {b}, {r}\t\t;'
 
 class SLA_deref_HL(z80.instructions.SLA_deref_HL):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} SLA (HL)\t\t;'
+    __slots__ = ()
+    template = '{PC} SLA (HL)\t\t;'
 
 class SLA_deref_IX_plus_d(z80.instructions.SLA_deref_IX_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} SLA (IX+{self.d})\t\t;'
+    __slots__ = ()
+    template = '{PC} SLA (IX+{d})\t\t;'
 
 class SLA_deref_IY_plus_d(z80.instructions.SLA_deref_IY_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} SLA (IY+{self.d})\t\t;'
+    __slots__ = ()
+    template = '{PC} SLA (IY+{d})\t\t;'
 
 class SLA_r(z80.instructions.SLA_r):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} SLA {self.r})\t\t;'
+    __slots__ = ()
+    template = '{PC} SLA {r})\t\t;'
+
+class SLL_deref_HL(z80.instructions.SLL_deref_HL):
+    __slots__ = ()
+    template = '{PC} SLL (HL)\t\t;'
+
+class SLL_deref_IX_plus_d(z80.instructions.SLL_deref_IX_plus_d):
+    __slots__ = ()
+    template = '{PC} SLL (IX+{d})\t\t;'
+
+class SLL_deref_IY_plus_d(z80.instructions.SLL_deref_IY_plus_d):
+    __slots__ = ()
+    template = '{PC} SLL (IY+{d})\t\t;'
+
+class SLL_r(z80.instructions.SLL_r):
+    __slots__ = ()
+    template = '{PC} SLL {r}\t\t;'
+
+class SRA_deref_HL(z80.instructions.SRA_deref_HL):
+    __slots__ = ()
+    template = '{PC} SRA (HL)\t\t;'
+
+class SRA_deref_IX_plus_d(z80.instructions.SRA_deref_IX_plus_d):
+    __slots__ = ()
+    template = '{PC} SRA (IX+{d})\t\t;'
+
+class SRA_deref_IY_plus_d(z80.instructions.SRA_deref_IY_plus_d):
+    __slots__ = ()
+    template = '{PC} SRA (IY+{d})\t\t;'
+
+class SRA_r(z80.instructions.SRA_r):
+    __slots__ = ()
+    template = '{PC} SRA {r}\t\t;'
 
 class SRL_deref_HL(z80.instructions.SRL_deref_HL):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} SRL (HL)\t\t;'
+    __slots__ = ()
+    template = '{PC} SRL (HL)\t\t;'
 
 class SRL_deref_IX_plus_d(z80.instructions.SRL_deref_IX_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} SRL (IX+{self.d})\t\t;'
+    __slots__ = ()
+    template = '{PC} SRL (IX+{d})\t\t;'
 
 class SRL_deref_IY_plus_d(z80.instructions.SRL_deref_IY_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} SRL (IY+{self.d})\t\t;'
+    __slots__ = ()
+    template = '{PC} SRL (IY+{d})\t\t;'
 
 class SRL_r(z80.instructions.SRL_r):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} SRL {self.r}\t\t;'
+    __slots__ = ()
+    template = '{PC} SRL {r}\t\t;'
 
 class SUB_deref_HL(z80.instructions.SUB_deref_HL):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} SUB (HL)\t\t; A -= *(HL)'
+    __slots__ = ()
+    template = '{PC} SUB (HL)\t\t; A -= *(HL)'
 
 class SUB_deref_IX_plus_d(z80.instructions.SUB_deref_IX_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} SUB (IX+{self.d})\t\t; A -= IX[{self.d}]'
+    __slots__ = ()
+    template = '{PC} SUB (IX+{d})\t\t; A -= IX[{d}]'
 
 class SUB_deref_IY_plus_d(z80.instructions.SUB_deref_IY_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} SUB (IY+{self.d})\t\t; A -= IY[{self.d}]'
+    __slots__ = ()
+    template = '{PC} SUB (IY+{d})\t\t; A -= IY[{d}]'
 
 class SUB_n(z80.instructions.SUB_n):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} SUB {self.n}\t\t; A -= {self.n}'
+    __slots__ = ()
+    template = '{PC} SUB {n}\t\t; A -= {n}'
 
 class SUB_r(z80.instructions.SUB_r):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} SUB {self.r}\t\t; A -= {self.r}'
+    __slots__ = ()
+    template = '{PC} SUB {r}\t\t; A -= {r}'
 
 class XOR_deref_HL(z80.instructions.XOR_deref_HL):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} XOR (HL)\t\t; A ^= *(HL)'
+    __slots__ = ()
+    template = '{PC} XOR (HL)\t\t; A ^= *(HL)'
 
 class XOR_deref_IX_plus_d(z80.instructions.XOR_deref_IX_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} XOR (IX+{self.d})\t\t; A ^= IX[{self.d}]'
+    __slots__ = ()
+    template = '{PC} XOR (IX+{d})\t\t; A ^= IX[{d}]'
 
 class XOR_deref_IY_plus_d(z80.instructions.XOR_deref_IY_plus_d):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} XOR (IY+{self.d})\t\t; A ^= IY[{self.d}]'
+    __slots__ = ()
+    template = '{PC} XOR (IY+{d})\t\t; A ^= IY[{d}]'
 
 class XOR_n(z80.instructions.XOR_n):
-    def __str__(self: Self) -> str:
-        return f'{self.PC} XOR {self.n}\t\t; A ^= {self.n}'
+    __slots__ = ()
+    template = '{PC} XOR {n}\t\t; A ^= {n}'
 
 class XOR_rprime(z80.instructions.XOR_rprime):
-    def __str__(self: Self) -> str:
-        if self.rprime == 0b111:
-            return f'{self.PC} XOR {self.rprime}\t\t; A = 0, set flags.'
-        return f'{self.PC} XOR {self.rprime}\t\t; A ^= {self.rprime}'
+    __slots__ = ()
+    @classmethod
+    def template_for(cls, opcode: int) -> str:
+        if cls.constants(opcode)['rprime'] == 'A':
+            return '{PC} XOR {rprime}\t\t; A = 0, set flags.'
+        return '{PC} XOR {rprime}\t\t; A ^= {rprime}'
+
+
+
+z80.instruction.Instruction.compile_templates(__name__, STYLE)
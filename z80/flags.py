@@ -0,0 +1,100 @@
+from   typing import List
+
+
+
+## Flags of the 8 bit ALU operations, computed once at import, so the
+## generated execute() bodies and handlers index a table instead of working
+## out the half carry, overflow and parity of every result:
+##
+##   SZP[res]                               S, Z, Y, X and P (parity) of a result
+##   ADD[c << 16 | a << 8 | v]              flags of ADD/ADC A, v with carry c
+##   SUB[c << 16 | a << 8 | v]              flags of SUB/SBC A, v with carry c
+##   CP[a << 8 | v]                         flags of CP v, Y and X come from v
+##   INC[res], DEC[res]                     flags of INC/DEC giving res, except C
+##   DAA_AF[n << 10 | h << 9 | c << 8 | a]  A << 8 | F after DAA
+##
+## Flags: S 0x80, Z 0x40, Y 0x20, H 0x10, X 0x08, P/V 0x04, N 0x02, C 0x01.
+## The Y and X flags are copies of bits 5 and 3 of the result.
+
+def _szp(res: int) -> int:
+    return (res & 0xA8) | (res == 0) << 6 | (~res.bit_count() & 1) << 2
+
+def _add(c: int, a: int, v: int) -> int:
+    res = a + v + c
+    return (res & 0xA8) | ((res & 0xFF) == 0) << 6 | (a ^ v ^ res) & 0x10 | ((a ^ res) & (v ^ res) & 0x80) >> 5 | res >> 8
+
+def _sub(c: int, a: int, v: int) -> int:
+    res = a - v - c
+    return (res & 0xA8) | ((res & 0xFF) == 0) << 6 | (a ^ v ^ res) & 0x10 | ((a ^ v) & (a ^ res) & 0x80) >> 5 | 0x02 | (res >> 8) & 0x01
+
+def _daa(n: int, h: int, c: int, a: int) -> int:
+    diff = 0x06 if h or (a & 0x0F) > 0x09 else 0x00
+    if c or a > 0x99:
+        diff |= 0x60
+        c = 1
+    if n:
+        res = (a - diff) & 0xFF
+        h = h and (a & 0x0F) < 0x06
+    else:
+        res = (a + diff) & 0xFF
+        h = (a & 0x0F) > 0x09
+    return res << 8 | _szp(res) | h << 4 | n << 1 | c
+
+SZP: bytes = bytes(_szp(res) for res in range(0x100))
+ADD: bytes = bytes(_add(c, a, v) for c in range(2) for a in range(0x100) for v in range(0x100))
+SUB: bytes = bytes(_sub(c, a, v) for c in range(2) for a in range(0x100) for v in range(0x100))
+CP: bytes = bytes((flags & 0xD7) | (v & 0x28) for flags, v in zip(SUB[:0x10000], list(range(0x100)) * 0x100))
+INC: bytes = bytes((res & 0xA8) | (res == 0) << 6 | ((res & 0x0F) == 0x00) << 4 | (res == 0x80) << 2 for res in range(0x100))
+DEC: bytes = bytes((res & 0xA8) | (res == 0) << 6 | ((res & 0x0F) == 0x0F) << 4 | (res == 0x7F) << 2 | 0x02 for res in range(0x100))
+DAA_AF: List[int] = [ _daa(n, h, c, a) for n in range(2) for h in range(2) for c in range(2) for a in range(0x100) ]
+
+## Lazy flags
+##
+## With lazy flags (see Z80(lazy_flags=True)), an ALU operation does not look
+## up its flags, but stores the index of its entry in FLAGS in F. The index is
+## above 0xFF, and F is only looked up where it is read, as FLAGS[F]. The first
+## 0x100 entries of FLAGS are F itself, so this works for actual flags too.
+##
+##   LAZY_ADD | c << 16 | a << 8 | v     ADD[c << 16 | a << 8 | v]
+##   LAZY_SUB | c << 16 | a << 8 | v     SUB[c << 16 | a << 8 | v]
+##   LAZY_CP | a << 8 | v                CP[a << 8 | v]
+##   LAZY_SZP | c << 8 | res             SZP[res] | c
+##   LAZY_SZPH | res                     SZP[res] | H (AND)
+LAZY_ADD  = 0x20000
+LAZY_SUB  = 0x40000
+LAZY_CP   = 0x60000
+LAZY_SZP  = 0x70000
+LAZY_SZPH = 0x70200
+
+FLAGS: bytes = bytes(range(0x100)) + bytes(LAZY_ADD - 0x100) + ADD + SUB + CP + SZP + bytes(flags | 0x01 for flags in SZP) + bytes(flags | 0x10 for flags in SZP)
+
+
+
+## Times an ALU loop with eager and with lazy flags, the best of rounds runs
+## each. Lazy flags save a table lookup per ALU operation, which is lost in 
+## the noise of the interpreter: they are off by default. That they agree 
+## with the tables is checked by tests/test_flags.py.
+##
+##     python3 -m z80.flags [rounds] [instructions]
+if __name__ == '__main__':
+    import sys
+    import time
+    import z80
+    
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    instructions = int(sys.argv[2]) if len(sys.argv) > 2 else 200000
+    
+    ## ADD A, B; SUB C; AND D; XOR E; OR H; CP L; INC A; DJNZ in a loop. The
+    ## two take turns, so that both see the same load on the machine.
+    loop = bytes([ 0x80, 0x91, 0xA2, 0xAB, 0xB4, 0xBD, 0x3C, 0x10, 0xF7, 0x18, 0xF5 ])
+    best = { 'eager': 0.0, 'lazy': 0.0 }
+    for _ in range(rounds):
+        for name, options in (('eager', {}), ('lazy', { 'lazy_flags': True })):
+            cpu = z80.Z80(**options)
+            cpu.ram._ram[0x4000:0x4000 + len(loop)] = loop
+            cpu.registers.PC = 0x4000
+            start = time.perf_counter()
+            cpu.run(instructions)
+            best[name] = max(best[name], instructions / (time.perf_counter() - start) / 1e6)
+    for name, mips in best.items():
+        print(f'{name} flags: {mips:.2f} MIPS')
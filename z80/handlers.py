@@ -0,0 +1,14620 @@
+## Generated by: python3 -m z80.instruction handlers
+from   z80.flags import ADD, CP, DAA_AF, DEC, INC, SUB, SZP
+from   z80.flags import FLAGS, LAZY_ADD, LAZY_CP, LAZY_SUB, LAZY_SZP, LAZY_SZPH
+
+
+
+def illegal(cpu, PC: int) -> None:
+    raise NotImplementedError(cpu.ram[PC])
+
+def prefix_cb(cpu, PC: int) -> int:
+    return CB[cpu.ram[PC + 1]](cpu, PC)
+
+def prefix_cb_lazy(cpu, PC: int) -> int:
+    return LAZY_CB[cpu.ram[PC + 1]](cpu, PC)
+
+def prefix_dd(cpu, PC: int) -> int:
+    return DD[cpu.ram[PC + 1]](cpu, PC)
+
+def prefix_dd_lazy(cpu, PC: int) -> int:
+    return LAZY_DD[cpu.ram[PC + 1]](cpu, PC)
+
+def prefix_ed(cpu, PC: int) -> int:
+    return ED[cpu.ram[PC + 1]](cpu, PC)
+
+def prefix_ed_lazy(cpu, PC: int) -> int:
+    return LAZY_ED[cpu.ram[PC + 1]](cpu, PC)
+
+def prefix_fd(cpu, PC: int) -> int:
+    return FD[cpu.ram[PC + 1]](cpu, PC)
+
+def prefix_fd_lazy(cpu, PC: int) -> int:
+    return LAZY_FD[cpu.ram[PC + 1]](cpu, PC)
+
+def prefix_ddcb(cpu, PC: int) -> int:
+    return DDCB[cpu.ram[PC + 3]](cpu, PC)
+
+def prefix_ddcb_lazy(cpu, PC: int) -> int:
+    return LAZY_DDCB[cpu.ram[PC + 3]](cpu, PC)
+
+def prefix_fdcb(cpu, PC: int) -> int:
+    return FDCB[cpu.ram[PC + 3]](cpu, PC)
+
+def prefix_fdcb_lazy(cpu, PC: int) -> int:
+    return LAZY_FDCB[cpu.ram[PC + 3]](cpu, PC)
+
+
+## LD r, r', 0x40
+def ld_b_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[0] = R[0]
+    return 4
+
+## LD r, r', 0x41
+def ld_b_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[0] = R[1]
+    return 4
+
+## LD r, r', 0x42
+def ld_b_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[0] = R[2]
+    return 4
+
+## LD r, r', 0x43
+def ld_b_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[0] = R[3]
+    return 4
+
+## LD r, r', 0x44
+def ld_b_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[0] = R[4]
+    return 4
+
+## LD r, r', 0x45
+def ld_b_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[0] = R[5]
+    return 4
+
+## LD r, r', 0x47
+def ld_b_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[0] = R[7]
+    return 4
+
+## LD r, r', 0x48
+def ld_c_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[1] = R[0]
+    return 4
+
+## LD r, r', 0x49
+def ld_c_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[1] = R[1]
+    return 4
+
+## LD r, r', 0x4A
+def ld_c_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[1] = R[2]
+    return 4
+
+## LD r, r', 0x4B
+def ld_c_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[1] = R[3]
+    return 4
+
+## LD r, r', 0x4C
+def ld_c_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[1] = R[4]
+    return 4
+
+## LD r, r', 0x4D
+def ld_c_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[1] = R[5]
+    return 4
+
+## LD r, r', 0x4F
+def ld_c_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[1] = R[7]
+    return 4
+
+## LD r, r', 0x50
+def ld_d_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[2] = R[0]
+    return 4
+
+## LD r, r', 0x51
+def ld_d_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[2] = R[1]
+    return 4
+
+## LD r, r', 0x52
+def ld_d_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[2] = R[2]
+    return 4
+
+## LD r, r', 0x53
+def ld_d_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[2] = R[3]
+    return 4
+
+## LD r, r', 0x54
+def ld_d_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[2] = R[4]
+    return 4
+
+## LD r, r', 0x55
+def ld_d_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[2] = R[5]
+    return 4
+
+## LD r, r', 0x57
+def ld_d_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[2] = R[7]
+    return 4
+
+## LD r, r', 0x58
+def ld_e_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[3] = R[0]
+    return 4
+
+## LD r, r', 0x59
+def ld_e_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[3] = R[1]
+    return 4
+
+## LD r, r', 0x5A
+def ld_e_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[3] = R[2]
+    return 4
+
+## LD r, r', 0x5B
+def ld_e_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[3] = R[3]
+    return 4
+
+## LD r, r', 0x5C
+def ld_e_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[3] = R[4]
+    return 4
+
+## LD r, r', 0x5D
+def ld_e_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[3] = R[5]
+    return 4
+
+## LD r, r', 0x5F
+def ld_e_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[3] = R[7]
+    return 4
+
+## LD r, r', 0x60
+def ld_h_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[4] = R[0]
+    return 4
+
+## LD r, r', 0x61
+def ld_h_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[4] = R[1]
+    return 4
+
+## LD r, r', 0x62
+def ld_h_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[4] = R[2]
+    return 4
+
+## LD r, r', 0x63
+def ld_h_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[4] = R[3]
+    return 4
+
+## LD r, r', 0x64
+def ld_h_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[4] = R[4]
+    return 4
+
+## LD r, r', 0x65
+def ld_h_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[4] = R[5]
+    return 4
+
+## LD r, r', 0x67
+def ld_h_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[4] = R[7]
+    return 4
+
+## LD r, r', 0x68
+def ld_l_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[5] = R[0]
+    return 4
+
+## LD r, r', 0x69
+def ld_l_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[5] = R[1]
+    return 4
+
+## LD r, r', 0x6A
+def ld_l_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[5] = R[2]
+    return 4
+
+## LD r, r', 0x6B
+def ld_l_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[5] = R[3]
+    return 4
+
+## LD r, r', 0x6C
+def ld_l_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[5] = R[4]
+    return 4
+
+## LD r, r', 0x6D
+def ld_l_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[5] = R[5]
+    return 4
+
+## LD r, r', 0x6F
+def ld_l_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[5] = R[7]
+    return 4
+
+## LD r, r', 0x78
+def ld_a_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[7] = R[0]
+    return 4
+
+## LD r, r', 0x79
+def ld_a_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[7] = R[1]
+    return 4
+
+## LD r, r', 0x7A
+def ld_a_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[7] = R[2]
+    return 4
+
+## LD r, r', 0x7B
+def ld_a_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[7] = R[3]
+    return 4
+
+## LD r, r', 0x7C
+def ld_a_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[7] = R[4]
+    return 4
+
+## LD r, r', 0x7D
+def ld_a_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[7] = R[5]
+    return 4
+
+## LD r, r', 0x7F
+def ld_a_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[7] = R[7]
+    return 4
+
+## LD r, n, 0x06
+def ld_b_n(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    R[0] = n
+    return 7
+
+## LD r, n, 0x0E
+def ld_c_n(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    R[1] = n
+    return 7
+
+## LD r, n, 0x16
+def ld_d_n(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    R[2] = n
+    return 7
+
+## LD r, n, 0x1E
+def ld_e_n(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    R[3] = n
+    return 7
+
+## LD r, n, 0x26
+def ld_h_n(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    R[4] = n
+    return 7
+
+## LD r, n, 0x2E
+def ld_l_n(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    R[5] = n
+    return 7
+
+## LD r, n, 0x3E
+def ld_a_n(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    R[7] = n
+    return 7
+
+## LD r, (HL), 0x46
+def ld_b_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    R[0] = ram[R[4] << 8 | R[5]]
+    return 7
+
+## LD r, (HL), 0x4E
+def ld_c_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    R[1] = ram[R[4] << 8 | R[5]]
+    return 7
+
+## LD r, (HL), 0x56
+def ld_d_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    R[2] = ram[R[4] << 8 | R[5]]
+    return 7
+
+## LD r, (HL), 0x5E
+def ld_e_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    R[3] = ram[R[4] << 8 | R[5]]
+    return 7
+
+## LD r, (HL), 0x66
+def ld_h_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    R[4] = ram[R[4] << 8 | R[5]]
+    return 7
+
+## LD r, (HL), 0x6E
+def ld_l_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    R[5] = ram[R[4] << 8 | R[5]]
+    return 7
+
+## LD r, (HL), 0x7E
+def ld_a_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    R[7] = ram[R[4] << 8 | R[5]]
+    return 7
+
+## LD r, (IX+d), 0xDD46
+def ld_b_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[0] = ram[regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF]
+    return 19
+
+## LD r, (IX+d), 0xDD4E
+def ld_c_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[1] = ram[regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF]
+    return 19
+
+## LD r, (IX+d), 0xDD56
+def ld_d_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[2] = ram[regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF]
+    return 19
+
+## LD r, (IX+d), 0xDD5E
+def ld_e_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[3] = ram[regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF]
+    return 19
+
+## LD r, (IX+d), 0xDD66
+def ld_h_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[4] = ram[regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF]
+    return 19
+
+## LD r, (IX+d), 0xDD6E
+def ld_l_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[5] = ram[regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF]
+    return 19
+
+## LD r, (IX+d), 0xDD7E
+def ld_a_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[7] = ram[regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF]
+    return 19
+
+## LD r, (IY+d), 0xFD46
+def ld_b_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[0] = ram[regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF]
+    return 19
+
+## LD r, (IY+d), 0xFD4E
+def ld_c_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[1] = ram[regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF]
+    return 19
+
+## LD r, (IY+d), 0xFD56
+def ld_d_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[2] = ram[regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF]
+    return 19
+
+## LD r, (IY+d), 0xFD5E
+def ld_e_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[3] = ram[regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF]
+    return 19
+
+## LD r, (IY+d), 0xFD66
+def ld_h_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[4] = ram[regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF]
+    return 19
+
+## LD r, (IY+d), 0xFD6E
+def ld_l_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[5] = ram[regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF]
+    return 19
+
+## LD r, (IY+d), 0xFD7E
+def ld_a_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[7] = ram[regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF]
+    return 19
+
+## LD (HL), r, 0x70
+def ld_hl_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    ram[R[4] << 8 | R[5]] = R[0]
+    return 7
+
+## LD (HL), r, 0x71
+def ld_hl_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    ram[R[4] << 8 | R[5]] = R[1]
+    return 7
+
+## LD (HL), r, 0x72
+def ld_hl_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    ram[R[4] << 8 | R[5]] = R[2]
+    return 7
+
+## LD (HL), r, 0x73
+def ld_hl_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    ram[R[4] << 8 | R[5]] = R[3]
+    return 7
+
+## LD (HL), r, 0x74
+def ld_hl_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    ram[R[4] << 8 | R[5]] = R[4]
+    return 7
+
+## LD (HL), r, 0x75
+def ld_hl_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    ram[R[4] << 8 | R[5]] = R[5]
+    return 7
+
+## LD (HL), r, 0x77
+def ld_hl_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    ram[R[4] << 8 | R[5]] = R[7]
+    return 7
+
+## LD (IX+d), r, 0xDD70
+def ld_ixd_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    ram[regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF] = R[0]
+    return 19
+
+## LD (IX+d), r, 0xDD71
+def ld_ixd_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    ram[regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF] = R[1]
+    return 19
+
+## LD (IX+d), r, 0xDD72
+def ld_ixd_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    ram[regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF] = R[2]
+    return 19
+
+## LD (IX+d), r, 0xDD73
+def ld_ixd_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    ram[regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF] = R[3]
+    return 19
+
+## LD (IX+d), r, 0xDD74
+def ld_ixd_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    ram[regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF] = R[4]
+    return 19
+
+## LD (IX+d), r, 0xDD75
+def ld_ixd_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    ram[regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF] = R[5]
+    return 19
+
+## LD (IX+d), r, 0xDD77
+def ld_ixd_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    ram[regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF] = R[7]
+    return 19
+
+## LD (IY+d), r, 0xFD70
+def ld_iyd_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    ram[regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF] = R[0]
+    return 19
+
+## LD (IY+d), r, 0xFD71
+def ld_iyd_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    ram[regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF] = R[1]
+    return 19
+
+## LD (IY+d), r, 0xFD72
+def ld_iyd_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    ram[regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF] = R[2]
+    return 19
+
+## LD (IY+d), r, 0xFD73
+def ld_iyd_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    ram[regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF] = R[3]
+    return 19
+
+## LD (IY+d), r, 0xFD74
+def ld_iyd_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    ram[regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF] = R[4]
+    return 19
+
+## LD (IY+d), r, 0xFD75
+def ld_iyd_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    ram[regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF] = R[5]
+    return 19
+
+## LD (IY+d), r, 0xFD77
+def ld_iyd_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    ram[regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF] = R[7]
+    return 19
+
+## LD (HL), n, 0x36
+def ld_hl_n(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    ram[R[4] << 8 | R[5]] = n
+    return 10
+
+## LD (IX+d), n, 0xDD36
+def ld_ixd_n(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    n = ram[PC + 3]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    ram[regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF] = n
+    return 19
+
+## LD (IY+d), n, 0xFD36
+def ld_iyd_n(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    n = ram[PC + 3]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    ram[regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF] = n
+    return 19
+
+## LD A, (BC), 0x0A
+def ld_a_bc(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    R[7] = ram[R[0] << 8 | R[1]]
+    return 7
+
+## LD A, (DE), 0x1A
+def ld_a_de(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    R[7] = ram[R[2] << 8 | R[3]]
+    return 7
+
+## LD A, (nn), 0x3A
+def ld_a_at_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    R[7] = ram[nn]
+    return 13
+
+## LD (BC), A, 0x02
+def ld_bc_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    ram[R[0] << 8 | R[1]] = R[7]
+    return 7
+
+## LD (DE), A, 0x12
+def ld_de_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    ram[R[2] << 8 | R[3]] = R[7]
+    return 7
+
+## LD (nn), A, 0x32
+def ld_at_nn_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    ram[nn] = R[7]
+    return 13
+
+## LD A, I, 0xED57
+def ld_a_i(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[7] = regs.I
+    R[6] = R[6] & 1 | regs.I & 0xA8 | (regs.I == 0) << 6 | regs.IFF2 << 2
+    return 9
+
+## LD A, I, 0xED57, lazy flags
+def ld_a_i_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[7] = regs.I
+    R[6] = FLAGS[R[6]] & 1 | regs.I & 0xA8 | (regs.I == 0) << 6 | regs.IFF2 << 2
+    return 9
+
+## LD A, R, 0xED5F
+def ld_a_r(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[7] = regs.R
+    R[6] = R[6] & 1 | regs.R & 0xA8 | (regs.R == 0) << 6 | regs.IFF2 << 2
+    return 9
+
+## LD A, R, 0xED5F, lazy flags
+def ld_a_r_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[7] = regs.R
+    R[6] = FLAGS[R[6]] & 1 | regs.R & 0xA8 | (regs.R == 0) << 6 | regs.IFF2 << 2
+    return 9
+
+## LD I, A, 0xED47
+def ld_i_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    regs.I = R[7]
+    return 9
+
+## LD R, A, 0xED4F
+def ld_r_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    regs.R = R[7]
+    return 9
+
+## LD dd, nn, 0x01
+def ld_bc_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    R[0] = nn >> 8
+    R[1] = nn & 0xFF
+    return 10
+
+## LD dd, nn, 0x11
+def ld_de_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    R[2] = nn >> 8
+    R[3] = nn & 0xFF
+    return 10
+
+## LD dd, nn, 0x21
+def ld_hl_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    R[4] = nn >> 8
+    R[5] = nn & 0xFF
+    return 10
+
+## LD dd, nn, 0x31
+def ld_sp_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.SP = nn
+    return 10
+
+## LD IX, nn, 0xDD21
+def ld_ix_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    nn = ram[PC + 2] | ram[PC + 3] << 8
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    regs.IX = nn
+    return 14
+
+## LD IY, nn, 0xFD21
+def ld_iy_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    nn = ram[PC + 2] | ram[PC + 3] << 8
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    regs.IY = nn
+    return 14
+
+## LD HL, (nn), 0x2A
+def ld_hl_at_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    R[5] = ram[nn]
+    R[4] = ram[nn + 1 & 0xFFFF]
+    return 16
+
+## LD dd, (nn), 0xED4B
+def ld_bc_at_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 2] | ram[PC + 3] << 8
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = ram[nn] | ram[nn + 1 & 0xFFFF] << 8
+    R[0] = v >> 8
+    R[1] = v & 0xFF
+    return 20
+
+## LD dd, (nn), 0xED5B
+def ld_de_at_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 2] | ram[PC + 3] << 8
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = ram[nn] | ram[nn + 1 & 0xFFFF] << 8
+    R[2] = v >> 8
+    R[3] = v & 0xFF
+    return 20
+
+## LD dd, (nn), 0xED6B
+def ld_hl_at_nn_ed6b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 2] | ram[PC + 3] << 8
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = ram[nn] | ram[nn + 1 & 0xFFFF] << 8
+    R[4] = v >> 8
+    R[5] = v & 0xFF
+    return 20
+
+## LD dd, (nn), 0xED7B
+def ld_sp_at_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    nn = ram[PC + 2] | ram[PC + 3] << 8
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = ram[nn] | ram[nn + 1 & 0xFFFF] << 8
+    regs.SP = v
+    return 20
+
+## LD IX, (nn), 0xDD2A
+def ld_ix_at_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    nn = ram[PC + 2] | ram[PC + 3] << 8
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    regs.IX = ram[nn] | ram[nn + 1 & 0xFFFF] << 8
+    return 20
+
+## LD IY, (nn), 0xFD2A
+def ld_iy_at_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    nn = ram[PC + 2] | ram[PC + 3] << 8
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    regs.IY = ram[nn] | ram[nn + 1 & 0xFFFF] << 8
+    return 20
+
+## LD (nn), HL, 0x22
+def ld_at_nn_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    ram[nn] = R[5]
+    ram[nn + 1 & 0xFFFF] = R[4]
+    return 16
+
+## LD (nn), dd, 0xED43
+def ld_at_nn_bc(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 2] | ram[PC + 3] << 8
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0] << 8 | R[1]
+    ram[nn] = v & 0xFF
+    ram[nn + 1 & 0xFFFF] = v >> 8
+    return 20
+
+## LD (nn), dd, 0xED53
+def ld_at_nn_de(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 2] | ram[PC + 3] << 8
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2] << 8 | R[3]
+    ram[nn] = v & 0xFF
+    ram[nn + 1 & 0xFFFF] = v >> 8
+    return 20
+
+## LD (nn), dd, 0xED63
+def ld_at_nn_hl_ed63(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 2] | ram[PC + 3] << 8
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4] << 8 | R[5]
+    ram[nn] = v & 0xFF
+    ram[nn + 1 & 0xFFFF] = v >> 8
+    return 20
+
+## LD (nn), dd, 0xED73
+def ld_at_nn_sp(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    nn = ram[PC + 2] | ram[PC + 3] << 8
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = regs.SP
+    ram[nn] = v & 0xFF
+    ram[nn + 1 & 0xFFFF] = v >> 8
+    return 20
+
+## LD (nn), IX, 0xDD22
+def ld_at_nn_ix(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    nn = ram[PC + 2] | ram[PC + 3] << 8
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    ram[nn] = regs.IX & 0xFF
+    ram[nn + 1 & 0xFFFF] = regs.IX >> 8
+    return 20
+
+## LD (nn), IY, 0xFD22
+def ld_at_nn_iy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    nn = ram[PC + 2] | ram[PC + 3] << 8
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    ram[nn] = regs.IY & 0xFF
+    ram[nn + 1 & 0xFFFF] = regs.IY >> 8
+    return 20
+
+## LD SP, HL, 0xF9
+def ld_sp_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    regs.SP = R[4] << 8 | R[5]
+    return 6
+
+## LD SP, IX, 0xDDF9
+def ld_sp_ix(cpu, PC: int) -> int:
+    regs = cpu.registers
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    regs.SP = regs.IX
+    return 10
+
+## LD SP, IY, 0xFDF9
+def ld_sp_iy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    regs.SP = regs.IY
+    return 10
+
+## PUSH qq, 0xC5
+def push_bc(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    hi, lo = (R[0], R[1])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    return 11
+
+## PUSH qq, 0xD5
+def push_de(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    hi, lo = (R[2], R[3])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    return 11
+
+## PUSH qq, 0xE5
+def push_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    hi, lo = (R[4], R[5])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    return 11
+
+## PUSH qq, 0xF5
+def push_af(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    hi, lo = (R[7], R[6])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    return 11
+
+## PUSH qq, 0xF5, lazy flags
+def push_af_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    hi, lo = (R[7], FLAGS[R[6]])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    return 11
+
+## PUSH IX, 0xDDE5
+def push_ix(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = regs.IX >> 8
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = regs.IX & 0xFF
+    regs.SP = sp
+    return 15
+
+## PUSH IY, 0xFDE5
+def push_iy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = regs.IY >> 8
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = regs.IY & 0xFF
+    regs.SP = sp
+    return 15
+
+## POP qq, 0xC1
+def pop_bc(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[0], R[1] = (hi, lo)
+    return 10
+
+## POP qq, 0xD1
+def pop_de(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[2], R[3] = (hi, lo)
+    return 10
+
+## POP qq, 0xE1
+def pop_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[4], R[5] = (hi, lo)
+    return 10
+
+## POP qq, 0xF1
+def pop_af(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[7], R[6] = (hi, lo)
+    return 10
+
+## POP IX, 0xDDE1
+def pop_ix(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    regs.IX = hi << 8 | lo
+    return 14
+
+## POP IY, 0xFDE1
+def pop_iy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    regs.IY = hi << 8 | lo
+    return 14
+
+## EX DE, HL, 0xEB
+def ex_de_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[2], R[3], R[4], R[5] = (R[4], R[5], R[2], R[3])
+    return 4
+
+## EX AF, AF', 0x08
+def ex_af_afprime(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    P = regs.r_prime
+    R[6], R[7], P[6], P[7] = (P[6], P[7], R[6], R[7])
+    return 4
+
+## EX AF, AF', 0x08, lazy flags
+def ex_af_afprime_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    P = regs.r_prime
+    R[6], R[7], P[6], P[7] = (P[6], P[7], FLAGS[R[6]], R[7])
+    return 4
+
+## EXX, 0xD9
+def exx(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    P = regs.r_prime
+    R[0:6], P[0:6] = (P[0:6], R[0:6])
+    return 4
+
+## EX (SP), HL, 0xE3
+def ex_sp_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo, hi = (ram[sp], ram[sp + 1 & 0xFFFF])
+    ram[sp], ram[sp + 1 & 0xFFFF] = (R[5], R[4])
+    R[5], R[4] = (lo, hi)
+    return 19
+
+## EX (SP), IX, 0xDDE3
+def ex_sp_ix(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    sp = regs.SP
+    lo, hi = (ram[sp], ram[sp + 1 & 0xFFFF])
+    ram[sp], ram[sp + 1 & 0xFFFF] = (regs.IX & 0xFF, regs.IX >> 8)
+    regs.IX = hi << 8 | lo
+    return 23
+
+## EX (SP), IY, 0xFDE3
+def ex_sp_iy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    sp = regs.SP
+    lo, hi = (ram[sp], ram[sp + 1 & 0xFFFF])
+    ram[sp], ram[sp + 1 & 0xFFFF] = (regs.IY & 0xFF, regs.IY >> 8)
+    regs.IY = hi << 8 | lo
+    return 23
+
+## LDI, 0xEDA0
+def ldi(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    de = R[2] << 8 | R[3]
+    bc = (R[0] << 8 | R[1]) - 1 & 0xFFFF
+    v = ram[hl]
+    ram[de] = v
+    de = de + 1 & 0xFFFF
+    R[2] = de >> 8
+    R[3] = de & 0xFF
+    n = v + R[7]
+    R[6] = R[6] & 0xC1 | (bc != 0) << 2 | n & 8 | n << 4 & 0x20
+    hl = hl + 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    R[0] = bc >> 8
+    R[1] = bc & 0xFF
+    return 16
+
+## LDI, 0xEDA0, lazy flags
+def ldi_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    de = R[2] << 8 | R[3]
+    bc = (R[0] << 8 | R[1]) - 1 & 0xFFFF
+    v = ram[hl]
+    ram[de] = v
+    de = de + 1 & 0xFFFF
+    R[2] = de >> 8
+    R[3] = de & 0xFF
+    n = v + R[7]
+    R[6] = FLAGS[R[6]] & 0xC1 | (bc != 0) << 2 | n & 8 | n << 4 & 0x20
+    hl = hl + 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    R[0] = bc >> 8
+    R[1] = bc & 0xFF
+    return 16
+
+## LDIR, 0xEDB0
+def ldir(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    de = R[2] << 8 | R[3]
+    bc = (R[0] << 8 | R[1]) - 1 & 0xFFFF
+    v = ram[hl]
+    ram[de] = v
+    de = de + 1 & 0xFFFF
+    R[2] = de >> 8
+    R[3] = de & 0xFF
+    n = v + R[7]
+    R[6] = R[6] & 0xC1 | (bc != 0) << 2 | n & 8 | n << 4 & 0x20
+    hl = hl + 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    R[0] = bc >> 8
+    R[1] = bc & 0xFF
+    if bc:
+        regs.PC = regs.PC - 2 & 0xFFFF
+        return 21
+    return 16
+
+## LDIR, 0xEDB0, lazy flags
+def ldir_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    de = R[2] << 8 | R[3]
+    bc = (R[0] << 8 | R[1]) - 1 & 0xFFFF
+    v = ram[hl]
+    ram[de] = v
+    de = de + 1 & 0xFFFF
+    R[2] = de >> 8
+    R[3] = de & 0xFF
+    n = v + R[7]
+    R[6] = FLAGS[R[6]] & 0xC1 | (bc != 0) << 2 | n & 8 | n << 4 & 0x20
+    hl = hl + 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    R[0] = bc >> 8
+    R[1] = bc & 0xFF
+    if bc:
+        regs.PC = regs.PC - 2 & 0xFFFF
+        return 21
+    return 16
+
+## LDD, 0xEDA8
+def ldd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    de = R[2] << 8 | R[3]
+    bc = (R[0] << 8 | R[1]) - 1 & 0xFFFF
+    v = ram[hl]
+    ram[de] = v
+    de = de - 1 & 0xFFFF
+    R[2] = de >> 8
+    R[3] = de & 0xFF
+    n = v + R[7]
+    R[6] = R[6] & 0xC1 | (bc != 0) << 2 | n & 8 | n << 4 & 0x20
+    hl = hl - 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    R[0] = bc >> 8
+    R[1] = bc & 0xFF
+    return 16
+
+## LDD, 0xEDA8, lazy flags
+def ldd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    de = R[2] << 8 | R[3]
+    bc = (R[0] << 8 | R[1]) - 1 & 0xFFFF
+    v = ram[hl]
+    ram[de] = v
+    de = de - 1 & 0xFFFF
+    R[2] = de >> 8
+    R[3] = de & 0xFF
+    n = v + R[7]
+    R[6] = FLAGS[R[6]] & 0xC1 | (bc != 0) << 2 | n & 8 | n << 4 & 0x20
+    hl = hl - 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    R[0] = bc >> 8
+    R[1] = bc & 0xFF
+    return 16
+
+## LDDR, 0xEDB8
+def lddr(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    de = R[2] << 8 | R[3]
+    bc = (R[0] << 8 | R[1]) - 1 & 0xFFFF
+    v = ram[hl]
+    ram[de] = v
+    de = de - 1 & 0xFFFF
+    R[2] = de >> 8
+    R[3] = de & 0xFF
+    n = v + R[7]
+    R[6] = R[6] & 0xC1 | (bc != 0) << 2 | n & 8 | n << 4 & 0x20
+    hl = hl - 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    R[0] = bc >> 8
+    R[1] = bc & 0xFF
+    if bc:
+        regs.PC = regs.PC - 2 & 0xFFFF
+        return 21
+    return 16
+
+## LDDR, 0xEDB8, lazy flags
+def lddr_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    de = R[2] << 8 | R[3]
+    bc = (R[0] << 8 | R[1]) - 1 & 0xFFFF
+    v = ram[hl]
+    ram[de] = v
+    de = de - 1 & 0xFFFF
+    R[2] = de >> 8
+    R[3] = de & 0xFF
+    n = v + R[7]
+    R[6] = FLAGS[R[6]] & 0xC1 | (bc != 0) << 2 | n & 8 | n << 4 & 0x20
+    hl = hl - 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    R[0] = bc >> 8
+    R[1] = bc & 0xFF
+    if bc:
+        regs.PC = regs.PC - 2 & 0xFFFF
+        return 21
+    return 16
+
+## CPI, 0xEDA1
+def cpi(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    bc = (R[0] << 8 | R[1]) - 1 & 0xFFFF
+    a = R[7]
+    v = ram[hl]
+    res = a - v & 0xFF
+    h = (a ^ v ^ res) & 0x10
+    n = res - (h >> 4)
+    R[6] = R[6] & 1 | 2 | res & 0x80 | (res == 0) << 6 | h | (bc != 0) << 2 | n & 8 | n << 4 & 0x20
+    hl = hl + 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    R[0] = bc >> 8
+    R[1] = bc & 0xFF
+    return 16
+
+## CPI, 0xEDA1, lazy flags
+def cpi_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    bc = (R[0] << 8 | R[1]) - 1 & 0xFFFF
+    a = R[7]
+    v = ram[hl]
+    res = a - v & 0xFF
+    h = (a ^ v ^ res) & 0x10
+    n = res - (h >> 4)
+    R[6] = FLAGS[R[6]] & 1 | 2 | res & 0x80 | (res == 0) << 6 | h | (bc != 0) << 2 | n & 8 | n << 4 & 0x20
+    hl = hl + 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    R[0] = bc >> 8
+    R[1] = bc & 0xFF
+    return 16
+
+## CPIR, 0xEDB1
+def cpir(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    bc = (R[0] << 8 | R[1]) - 1 & 0xFFFF
+    a = R[7]
+    v = ram[hl]
+    res = a - v & 0xFF
+    h = (a ^ v ^ res) & 0x10
+    n = res - (h >> 4)
+    R[6] = R[6] & 1 | 2 | res & 0x80 | (res == 0) << 6 | h | (bc != 0) << 2 | n & 8 | n << 4 & 0x20
+    hl = hl + 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    R[0] = bc >> 8
+    R[1] = bc & 0xFF
+    if bc and res:
+        regs.PC = regs.PC - 2 & 0xFFFF
+        return 21
+    return 16
+
+## CPIR, 0xEDB1, lazy flags
+def cpir_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    bc = (R[0] << 8 | R[1]) - 1 & 0xFFFF
+    a = R[7]
+    v = ram[hl]
+    res = a - v & 0xFF
+    h = (a ^ v ^ res) & 0x10
+    n = res - (h >> 4)
+    R[6] = FLAGS[R[6]] & 1 | 2 | res & 0x80 | (res == 0) << 6 | h | (bc != 0) << 2 | n & 8 | n << 4 & 0x20
+    hl = hl + 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    R[0] = bc >> 8
+    R[1] = bc & 0xFF
+    if bc and res:
+        regs.PC = regs.PC - 2 & 0xFFFF
+        return 21
+    return 16
+
+## CPD, 0xEDA9
+def cpd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    bc = (R[0] << 8 | R[1]) - 1 & 0xFFFF
+    a = R[7]
+    v = ram[hl]
+    res = a - v & 0xFF
+    h = (a ^ v ^ res) & 0x10
+    n = res - (h >> 4)
+    R[6] = R[6] & 1 | 2 | res & 0x80 | (res == 0) << 6 | h | (bc != 0) << 2 | n & 8 | n << 4 & 0x20
+    hl = hl - 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    R[0] = bc >> 8
+    R[1] = bc & 0xFF
+    return 16
+
+## CPD, 0xEDA9, lazy flags
+def cpd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    bc = (R[0] << 8 | R[1]) - 1 & 0xFFFF
+    a = R[7]
+    v = ram[hl]
+    res = a - v & 0xFF
+    h = (a ^ v ^ res) & 0x10
+    n = res - (h >> 4)
+    R[6] = FLAGS[R[6]] & 1 | 2 | res & 0x80 | (res == 0) << 6 | h | (bc != 0) << 2 | n & 8 | n << 4 & 0x20
+    hl = hl - 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    R[0] = bc >> 8
+    R[1] = bc & 0xFF
+    return 16
+
+## CPDR, 0xEDB9
+def cpdr(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    bc = (R[0] << 8 | R[1]) - 1 & 0xFFFF
+    a = R[7]
+    v = ram[hl]
+    res = a - v & 0xFF
+    h = (a ^ v ^ res) & 0x10
+    n = res - (h >> 4)
+    R[6] = R[6] & 1 | 2 | res & 0x80 | (res == 0) << 6 | h | (bc != 0) << 2 | n & 8 | n << 4 & 0x20
+    hl = hl - 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    R[0] = bc >> 8
+    R[1] = bc & 0xFF
+    if bc and res:
+        regs.PC = regs.PC - 2 & 0xFFFF
+        return 21
+    return 16
+
+## CPDR, 0xEDB9, lazy flags
+def cpdr_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    bc = (R[0] << 8 | R[1]) - 1 & 0xFFFF
+    a = R[7]
+    v = ram[hl]
+    res = a - v & 0xFF
+    h = (a ^ v ^ res) & 0x10
+    n = res - (h >> 4)
+    R[6] = FLAGS[R[6]] & 1 | 2 | res & 0x80 | (res == 0) << 6 | h | (bc != 0) << 2 | n & 8 | n << 4 & 0x20
+    hl = hl - 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    R[0] = bc >> 8
+    R[1] = bc & 0xFF
+    if bc and res:
+        regs.PC = regs.PC - 2 & 0xFFFF
+        return 21
+    return 16
+
+## ADD A, r, 0x80
+def add_a_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[0]
+    R[7] = a + v & 0xFF
+    R[6] = ADD[a << 8 | v]
+    return 4
+
+## ADD A, r, 0x80, lazy flags
+def add_a_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[0]
+    R[7] = a + v & 0xFF
+    R[6] = LAZY_ADD | (a << 8 | v)
+    return 4
+
+## ADD A, r, 0x81
+def add_a_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[1]
+    R[7] = a + v & 0xFF
+    R[6] = ADD[a << 8 | v]
+    return 4
+
+## ADD A, r, 0x81, lazy flags
+def add_a_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[1]
+    R[7] = a + v & 0xFF
+    R[6] = LAZY_ADD | (a << 8 | v)
+    return 4
+
+## ADD A, r, 0x82
+def add_a_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[2]
+    R[7] = a + v & 0xFF
+    R[6] = ADD[a << 8 | v]
+    return 4
+
+## ADD A, r, 0x82, lazy flags
+def add_a_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[2]
+    R[7] = a + v & 0xFF
+    R[6] = LAZY_ADD | (a << 8 | v)
+    return 4
+
+## ADD A, r, 0x83
+def add_a_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[3]
+    R[7] = a + v & 0xFF
+    R[6] = ADD[a << 8 | v]
+    return 4
+
+## ADD A, r, 0x83, lazy flags
+def add_a_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[3]
+    R[7] = a + v & 0xFF
+    R[6] = LAZY_ADD | (a << 8 | v)
+    return 4
+
+## ADD A, r, 0x84
+def add_a_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[4]
+    R[7] = a + v & 0xFF
+    R[6] = ADD[a << 8 | v]
+    return 4
+
+## ADD A, r, 0x84, lazy flags
+def add_a_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[4]
+    R[7] = a + v & 0xFF
+    R[6] = LAZY_ADD | (a << 8 | v)
+    return 4
+
+## ADD A, r, 0x85
+def add_a_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[5]
+    R[7] = a + v & 0xFF
+    R[6] = ADD[a << 8 | v]
+    return 4
+
+## ADD A, r, 0x85, lazy flags
+def add_a_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[5]
+    R[7] = a + v & 0xFF
+    R[6] = LAZY_ADD | (a << 8 | v)
+    return 4
+
+## ADD A, r, 0x87
+def add_a_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[7]
+    R[7] = a + v & 0xFF
+    R[6] = ADD[a << 8 | v]
+    return 4
+
+## ADD A, r, 0x87, lazy flags
+def add_a_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[7]
+    R[7] = a + v & 0xFF
+    R[6] = LAZY_ADD | (a << 8 | v)
+    return 4
+
+## ADD A, n, 0xC6
+def add_a_n(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    a = R[7]
+    v = n
+    R[7] = a + v & 0xFF
+    R[6] = ADD[a << 8 | v]
+    return 7
+
+## ADD A, n, 0xC6, lazy flags
+def add_a_n_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    a = R[7]
+    v = n
+    R[7] = a + v & 0xFF
+    R[6] = LAZY_ADD | (a << 8 | v)
+    return 7
+
+## ADD A, (HL), 0x86
+def add_a_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    address = R[4] << 8 | R[5]
+    a = R[7]
+    v = ram[address]
+    R[7] = a + v & 0xFF
+    R[6] = ADD[a << 8 | v]
+    return 7
+
+## ADD A, (HL), 0x86, lazy flags
+def add_a_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    address = R[4] << 8 | R[5]
+    a = R[7]
+    v = ram[address]
+    R[7] = a + v & 0xFF
+    R[6] = LAZY_ADD | (a << 8 | v)
+    return 7
+
+## ADD A, (IX+d), 0xDD86
+def add_a_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    R[7] = a + v & 0xFF
+    R[6] = ADD[a << 8 | v]
+    return 19
+
+## ADD A, (IX+d), 0xDD86, lazy flags
+def add_a_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    R[7] = a + v & 0xFF
+    R[6] = LAZY_ADD | (a << 8 | v)
+    return 19
+
+## ADD A, (IY+d), 0xFD86
+def add_a_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    R[7] = a + v & 0xFF
+    R[6] = ADD[a << 8 | v]
+    return 19
+
+## ADD A, (IY+d), 0xFD86, lazy flags
+def add_a_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    R[7] = a + v & 0xFF
+    R[6] = LAZY_ADD | (a << 8 | v)
+    return 19
+
+## ADC A, r, 0x88
+def adc_a_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[0]
+    c = R[6] & 1
+    R[7] = a + v + c & 0xFF
+    R[6] = ADD[c << 16 | a << 8 | v]
+    return 4
+
+## ADC A, r, 0x88, lazy flags
+def adc_a_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[0]
+    c = FLAGS[R[6]] & 1
+    R[7] = a + v + c & 0xFF
+    R[6] = LAZY_ADD | (c << 16 | a << 8 | v)
+    return 4
+
+## ADC A, r, 0x89
+def adc_a_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[1]
+    c = R[6] & 1
+    R[7] = a + v + c & 0xFF
+    R[6] = ADD[c << 16 | a << 8 | v]
+    return 4
+
+## ADC A, r, 0x89, lazy flags
+def adc_a_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[1]
+    c = FLAGS[R[6]] & 1
+    R[7] = a + v + c & 0xFF
+    R[6] = LAZY_ADD | (c << 16 | a << 8 | v)
+    return 4
+
+## ADC A, r, 0x8A
+def adc_a_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[2]
+    c = R[6] & 1
+    R[7] = a + v + c & 0xFF
+    R[6] = ADD[c << 16 | a << 8 | v]
+    return 4
+
+## ADC A, r, 0x8A, lazy flags
+def adc_a_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[2]
+    c = FLAGS[R[6]] & 1
+    R[7] = a + v + c & 0xFF
+    R[6] = LAZY_ADD | (c << 16 | a << 8 | v)
+    return 4
+
+## ADC A, r, 0x8B
+def adc_a_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[3]
+    c = R[6] & 1
+    R[7] = a + v + c & 0xFF
+    R[6] = ADD[c << 16 | a << 8 | v]
+    return 4
+
+## ADC A, r, 0x8B, lazy flags
+def adc_a_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[3]
+    c = FLAGS[R[6]] & 1
+    R[7] = a + v + c & 0xFF
+    R[6] = LAZY_ADD | (c << 16 | a << 8 | v)
+    return 4
+
+## ADC A, r, 0x8C
+def adc_a_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[4]
+    c = R[6] & 1
+    R[7] = a + v + c & 0xFF
+    R[6] = ADD[c << 16 | a << 8 | v]
+    return 4
+
+## ADC A, r, 0x8C, lazy flags
+def adc_a_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[4]
+    c = FLAGS[R[6]] & 1
+    R[7] = a + v + c & 0xFF
+    R[6] = LAZY_ADD | (c << 16 | a << 8 | v)
+    return 4
+
+## ADC A, r, 0x8D
+def adc_a_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[5]
+    c = R[6] & 1
+    R[7] = a + v + c & 0xFF
+    R[6] = ADD[c << 16 | a << 8 | v]
+    return 4
+
+## ADC A, r, 0x8D, lazy flags
+def adc_a_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[5]
+    c = FLAGS[R[6]] & 1
+    R[7] = a + v + c & 0xFF
+    R[6] = LAZY_ADD | (c << 16 | a << 8 | v)
+    return 4
+
+## ADC A, r, 0x8F
+def adc_a_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[7]
+    c = R[6] & 1
+    R[7] = a + v + c & 0xFF
+    R[6] = ADD[c << 16 | a << 8 | v]
+    return 4
+
+## ADC A, r, 0x8F, lazy flags
+def adc_a_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[7]
+    c = FLAGS[R[6]] & 1
+    R[7] = a + v + c & 0xFF
+    R[6] = LAZY_ADD | (c << 16 | a << 8 | v)
+    return 4
+
+## ADC A, n, 0xCE
+def adc_a_n(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    a = R[7]
+    v = n
+    c = R[6] & 1
+    R[7] = a + v + c & 0xFF
+    R[6] = ADD[c << 16 | a << 8 | v]
+    return 7
+
+## ADC A, n, 0xCE, lazy flags
+def adc_a_n_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    a = R[7]
+    v = n
+    c = FLAGS[R[6]] & 1
+    R[7] = a + v + c & 0xFF
+    R[6] = LAZY_ADD | (c << 16 | a << 8 | v)
+    return 7
+
+## ADC A, (HL), 0x8E
+def adc_a_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    address = R[4] << 8 | R[5]
+    a = R[7]
+    v = ram[address]
+    c = R[6] & 1
+    R[7] = a + v + c & 0xFF
+    R[6] = ADD[c << 16 | a << 8 | v]
+    return 7
+
+## ADC A, (HL), 0x8E, lazy flags
+def adc_a_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    address = R[4] << 8 | R[5]
+    a = R[7]
+    v = ram[address]
+    c = FLAGS[R[6]] & 1
+    R[7] = a + v + c & 0xFF
+    R[6] = LAZY_ADD | (c << 16 | a << 8 | v)
+    return 7
+
+## ADC A, (IX+d), 0xDD8E
+def adc_a_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    c = R[6] & 1
+    R[7] = a + v + c & 0xFF
+    R[6] = ADD[c << 16 | a << 8 | v]
+    return 19
+
+## ADC A, (IX+d), 0xDD8E, lazy flags
+def adc_a_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    c = FLAGS[R[6]] & 1
+    R[7] = a + v + c & 0xFF
+    R[6] = LAZY_ADD | (c << 16 | a << 8 | v)
+    return 19
+
+## ADC A, (IY+d), 0xFD8E
+def adc_a_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    c = R[6] & 1
+    R[7] = a + v + c & 0xFF
+    R[6] = ADD[c << 16 | a << 8 | v]
+    return 19
+
+## ADC A, (IY+d), 0xFD8E, lazy flags
+def adc_a_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    c = FLAGS[R[6]] & 1
+    R[7] = a + v + c & 0xFF
+    R[6] = LAZY_ADD | (c << 16 | a << 8 | v)
+    return 19
+
+## SUB r, 0x90
+def sub_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[0]
+    R[7] = a - v & 0xFF
+    R[6] = SUB[a << 8 | v]
+    return 4
+
+## SUB r, 0x90, lazy flags
+def sub_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[0]
+    R[7] = a - v & 0xFF
+    R[6] = LAZY_SUB | (a << 8 | v)
+    return 4
+
+## SUB r, 0x91
+def sub_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[1]
+    R[7] = a - v & 0xFF
+    R[6] = SUB[a << 8 | v]
+    return 4
+
+## SUB r, 0x91, lazy flags
+def sub_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[1]
+    R[7] = a - v & 0xFF
+    R[6] = LAZY_SUB | (a << 8 | v)
+    return 4
+
+## SUB r, 0x92
+def sub_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[2]
+    R[7] = a - v & 0xFF
+    R[6] = SUB[a << 8 | v]
+    return 4
+
+## SUB r, 0x92, lazy flags
+def sub_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[2]
+    R[7] = a - v & 0xFF
+    R[6] = LAZY_SUB | (a << 8 | v)
+    return 4
+
+## SUB r, 0x93
+def sub_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[3]
+    R[7] = a - v & 0xFF
+    R[6] = SUB[a << 8 | v]
+    return 4
+
+## SUB r, 0x93, lazy flags
+def sub_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[3]
+    R[7] = a - v & 0xFF
+    R[6] = LAZY_SUB | (a << 8 | v)
+    return 4
+
+## SUB r, 0x94
+def sub_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[4]
+    R[7] = a - v & 0xFF
+    R[6] = SUB[a << 8 | v]
+    return 4
+
+## SUB r, 0x94, lazy flags
+def sub_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[4]
+    R[7] = a - v & 0xFF
+    R[6] = LAZY_SUB | (a << 8 | v)
+    return 4
+
+## SUB r, 0x95
+def sub_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[5]
+    R[7] = a - v & 0xFF
+    R[6] = SUB[a << 8 | v]
+    return 4
+
+## SUB r, 0x95, lazy flags
+def sub_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[5]
+    R[7] = a - v & 0xFF
+    R[6] = LAZY_SUB | (a << 8 | v)
+    return 4
+
+## SUB r, 0x97
+def sub_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[7]
+    R[7] = a - v & 0xFF
+    R[6] = SUB[a << 8 | v]
+    return 4
+
+## SUB r, 0x97, lazy flags
+def sub_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[7]
+    R[7] = a - v & 0xFF
+    R[6] = LAZY_SUB | (a << 8 | v)
+    return 4
+
+## SUB n, 0xD6
+def sub_n(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    a = R[7]
+    v = n
+    R[7] = a - v & 0xFF
+    R[6] = SUB[a << 8 | v]
+    return 7
+
+## SUB n, 0xD6, lazy flags
+def sub_n_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    a = R[7]
+    v = n
+    R[7] = a - v & 0xFF
+    R[6] = LAZY_SUB | (a << 8 | v)
+    return 7
+
+## SUB (HL), 0x96
+def sub_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    address = R[4] << 8 | R[5]
+    a = R[7]
+    v = ram[address]
+    R[7] = a - v & 0xFF
+    R[6] = SUB[a << 8 | v]
+    return 7
+
+## SUB (HL), 0x96, lazy flags
+def sub_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    address = R[4] << 8 | R[5]
+    a = R[7]
+    v = ram[address]
+    R[7] = a - v & 0xFF
+    R[6] = LAZY_SUB | (a << 8 | v)
+    return 7
+
+## SUB (IX+d), 0xDD96
+def sub_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    R[7] = a - v & 0xFF
+    R[6] = SUB[a << 8 | v]
+    return 19
+
+## SUB (IX+d), 0xDD96, lazy flags
+def sub_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    R[7] = a - v & 0xFF
+    R[6] = LAZY_SUB | (a << 8 | v)
+    return 19
+
+## SUB (IY+d), 0xFD96
+def sub_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    R[7] = a - v & 0xFF
+    R[6] = SUB[a << 8 | v]
+    return 19
+
+## SUB (IY+d), 0xFD96, lazy flags
+def sub_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    R[7] = a - v & 0xFF
+    R[6] = LAZY_SUB | (a << 8 | v)
+    return 19
+
+## SBC r, 0x98
+def sbc_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[0]
+    c = R[6] & 1
+    R[7] = a - v - c & 0xFF
+    R[6] = SUB[c << 16 | a << 8 | v]
+    return 4
+
+## SBC r, 0x98, lazy flags
+def sbc_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[0]
+    c = FLAGS[R[6]] & 1
+    R[7] = a - v - c & 0xFF
+    R[6] = LAZY_SUB | (c << 16 | a << 8 | v)
+    return 4
+
+## SBC r, 0x99
+def sbc_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[1]
+    c = R[6] & 1
+    R[7] = a - v - c & 0xFF
+    R[6] = SUB[c << 16 | a << 8 | v]
+    return 4
+
+## SBC r, 0x99, lazy flags
+def sbc_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[1]
+    c = FLAGS[R[6]] & 1
+    R[7] = a - v - c & 0xFF
+    R[6] = LAZY_SUB | (c << 16 | a << 8 | v)
+    return 4
+
+## SBC r, 0x9A
+def sbc_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[2]
+    c = R[6] & 1
+    R[7] = a - v - c & 0xFF
+    R[6] = SUB[c << 16 | a << 8 | v]
+    return 4
+
+## SBC r, 0x9A, lazy flags
+def sbc_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[2]
+    c = FLAGS[R[6]] & 1
+    R[7] = a - v - c & 0xFF
+    R[6] = LAZY_SUB | (c << 16 | a << 8 | v)
+    return 4
+
+## SBC r, 0x9B
+def sbc_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[3]
+    c = R[6] & 1
+    R[7] = a - v - c & 0xFF
+    R[6] = SUB[c << 16 | a << 8 | v]
+    return 4
+
+## SBC r, 0x9B, lazy flags
+def sbc_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[3]
+    c = FLAGS[R[6]] & 1
+    R[7] = a - v - c & 0xFF
+    R[6] = LAZY_SUB | (c << 16 | a << 8 | v)
+    return 4
+
+## SBC r, 0x9C
+def sbc_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[4]
+    c = R[6] & 1
+    R[7] = a - v - c & 0xFF
+    R[6] = SUB[c << 16 | a << 8 | v]
+    return 4
+
+## SBC r, 0x9C, lazy flags
+def sbc_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[4]
+    c = FLAGS[R[6]] & 1
+    R[7] = a - v - c & 0xFF
+    R[6] = LAZY_SUB | (c << 16 | a << 8 | v)
+    return 4
+
+## SBC r, 0x9D
+def sbc_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[5]
+    c = R[6] & 1
+    R[7] = a - v - c & 0xFF
+    R[6] = SUB[c << 16 | a << 8 | v]
+    return 4
+
+## SBC r, 0x9D, lazy flags
+def sbc_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[5]
+    c = FLAGS[R[6]] & 1
+    R[7] = a - v - c & 0xFF
+    R[6] = LAZY_SUB | (c << 16 | a << 8 | v)
+    return 4
+
+## SBC r, 0x9F
+def sbc_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[7]
+    c = R[6] & 1
+    R[7] = a - v - c & 0xFF
+    R[6] = SUB[c << 16 | a << 8 | v]
+    return 4
+
+## SBC r, 0x9F, lazy flags
+def sbc_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[7]
+    c = FLAGS[R[6]] & 1
+    R[7] = a - v - c & 0xFF
+    R[6] = LAZY_SUB | (c << 16 | a << 8 | v)
+    return 4
+
+## SBC n, 0xDE
+def sbc_n(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    a = R[7]
+    v = n
+    c = R[6] & 1
+    R[7] = a - v - c & 0xFF
+    R[6] = SUB[c << 16 | a << 8 | v]
+    return 7
+
+## SBC n, 0xDE, lazy flags
+def sbc_n_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    a = R[7]
+    v = n
+    c = FLAGS[R[6]] & 1
+    R[7] = a - v - c & 0xFF
+    R[6] = LAZY_SUB | (c << 16 | a << 8 | v)
+    return 7
+
+## SBC (HL), 0x9E
+def sbc_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    address = R[4] << 8 | R[5]
+    a = R[7]
+    v = ram[address]
+    c = R[6] & 1
+    R[7] = a - v - c & 0xFF
+    R[6] = SUB[c << 16 | a << 8 | v]
+    return 7
+
+## SBC (HL), 0x9E, lazy flags
+def sbc_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    address = R[4] << 8 | R[5]
+    a = R[7]
+    v = ram[address]
+    c = FLAGS[R[6]] & 1
+    R[7] = a - v - c & 0xFF
+    R[6] = LAZY_SUB | (c << 16 | a << 8 | v)
+    return 7
+
+## SBC (IX+d), 0xDD9E
+def sbc_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    c = R[6] & 1
+    R[7] = a - v - c & 0xFF
+    R[6] = SUB[c << 16 | a << 8 | v]
+    return 19
+
+## SBC (IX+d), 0xDD9E, lazy flags
+def sbc_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    c = FLAGS[R[6]] & 1
+    R[7] = a - v - c & 0xFF
+    R[6] = LAZY_SUB | (c << 16 | a << 8 | v)
+    return 19
+
+## SBC (IY+d), 0xFD9E
+def sbc_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    c = R[6] & 1
+    R[7] = a - v - c & 0xFF
+    R[6] = SUB[c << 16 | a << 8 | v]
+    return 19
+
+## SBC (IY+d), 0xFD9E, lazy flags
+def sbc_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    c = FLAGS[R[6]] & 1
+    R[7] = a - v - c & 0xFF
+    R[6] = LAZY_SUB | (c << 16 | a << 8 | v)
+    return 19
+
+## AND r, 0xA0
+def and_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[0]
+    res = a & v
+    R[7] = res
+    R[6] = SZP[res] | 0x10
+    return 4
+
+## AND r, 0xA0, lazy flags
+def and_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[0]
+    res = a & v
+    R[7] = res
+    R[6] = LAZY_SZPH | res
+    return 4
+
+## AND r, 0xA1
+def and_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[1]
+    res = a & v
+    R[7] = res
+    R[6] = SZP[res] | 0x10
+    return 4
+
+## AND r, 0xA1, lazy flags
+def and_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[1]
+    res = a & v
+    R[7] = res
+    R[6] = LAZY_SZPH | res
+    return 4
+
+## AND r, 0xA2
+def and_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[2]
+    res = a & v
+    R[7] = res
+    R[6] = SZP[res] | 0x10
+    return 4
+
+## AND r, 0xA2, lazy flags
+def and_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[2]
+    res = a & v
+    R[7] = res
+    R[6] = LAZY_SZPH | res
+    return 4
+
+## AND r, 0xA3
+def and_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[3]
+    res = a & v
+    R[7] = res
+    R[6] = SZP[res] | 0x10
+    return 4
+
+## AND r, 0xA3, lazy flags
+def and_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[3]
+    res = a & v
+    R[7] = res
+    R[6] = LAZY_SZPH | res
+    return 4
+
+## AND r, 0xA4
+def and_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[4]
+    res = a & v
+    R[7] = res
+    R[6] = SZP[res] | 0x10
+    return 4
+
+## AND r, 0xA4, lazy flags
+def and_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[4]
+    res = a & v
+    R[7] = res
+    R[6] = LAZY_SZPH | res
+    return 4
+
+## AND r, 0xA5
+def and_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[5]
+    res = a & v
+    R[7] = res
+    R[6] = SZP[res] | 0x10
+    return 4
+
+## AND r, 0xA5, lazy flags
+def and_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[5]
+    res = a & v
+    R[7] = res
+    R[6] = LAZY_SZPH | res
+    return 4
+
+## AND r, 0xA7
+def and_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[7]
+    res = a & v
+    R[7] = res
+    R[6] = SZP[res] | 0x10
+    return 4
+
+## AND r, 0xA7, lazy flags
+def and_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[7]
+    res = a & v
+    R[7] = res
+    R[6] = LAZY_SZPH | res
+    return 4
+
+## AND n, 0xE6
+def and_n(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    a = R[7]
+    v = n
+    res = a & v
+    R[7] = res
+    R[6] = SZP[res] | 0x10
+    return 7
+
+## AND n, 0xE6, lazy flags
+def and_n_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    a = R[7]
+    v = n
+    res = a & v
+    R[7] = res
+    R[6] = LAZY_SZPH | res
+    return 7
+
+## AND (HL), 0xA6
+def and_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    address = R[4] << 8 | R[5]
+    a = R[7]
+    v = ram[address]
+    res = a & v
+    R[7] = res
+    R[6] = SZP[res] | 0x10
+    return 7
+
+## AND (HL), 0xA6, lazy flags
+def and_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    address = R[4] << 8 | R[5]
+    a = R[7]
+    v = ram[address]
+    res = a & v
+    R[7] = res
+    R[6] = LAZY_SZPH | res
+    return 7
+
+## AND (IX+d), 0xDDA6
+def and_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    res = a & v
+    R[7] = res
+    R[6] = SZP[res] | 0x10
+    return 19
+
+## AND (IX+d), 0xDDA6, lazy flags
+def and_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    res = a & v
+    R[7] = res
+    R[6] = LAZY_SZPH | res
+    return 19
+
+## AND (IY+d), 0xFDA6
+def and_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    res = a & v
+    R[7] = res
+    R[6] = SZP[res] | 0x10
+    return 19
+
+## AND (IY+d), 0xFDA6, lazy flags
+def and_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    res = a & v
+    R[7] = res
+    R[6] = LAZY_SZPH | res
+    return 19
+
+## OR r, 0xB0
+def or_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[0]
+    res = a | v
+    R[7] = res
+    R[6] = SZP[res]
+    return 4
+
+## OR r, 0xB0, lazy flags
+def or_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[0]
+    res = a | v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 4
+
+## OR r, 0xB1
+def or_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[1]
+    res = a | v
+    R[7] = res
+    R[6] = SZP[res]
+    return 4
+
+## OR r, 0xB1, lazy flags
+def or_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[1]
+    res = a | v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 4
+
+## OR r, 0xB2
+def or_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[2]
+    res = a | v
+    R[7] = res
+    R[6] = SZP[res]
+    return 4
+
+## OR r, 0xB2, lazy flags
+def or_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[2]
+    res = a | v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 4
+
+## OR r, 0xB3
+def or_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[3]
+    res = a | v
+    R[7] = res
+    R[6] = SZP[res]
+    return 4
+
+## OR r, 0xB3, lazy flags
+def or_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[3]
+    res = a | v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 4
+
+## OR r, 0xB4
+def or_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[4]
+    res = a | v
+    R[7] = res
+    R[6] = SZP[res]
+    return 4
+
+## OR r, 0xB4, lazy flags
+def or_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[4]
+    res = a | v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 4
+
+## OR r, 0xB5
+def or_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[5]
+    res = a | v
+    R[7] = res
+    R[6] = SZP[res]
+    return 4
+
+## OR r, 0xB5, lazy flags
+def or_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[5]
+    res = a | v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 4
+
+## OR r, 0xB7
+def or_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[7]
+    res = a | v
+    R[7] = res
+    R[6] = SZP[res]
+    return 4
+
+## OR r, 0xB7, lazy flags
+def or_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[7]
+    res = a | v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 4
+
+## OR n, 0xF6
+def or_n(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    a = R[7]
+    v = n
+    res = a | v
+    R[7] = res
+    R[6] = SZP[res]
+    return 7
+
+## OR n, 0xF6, lazy flags
+def or_n_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    a = R[7]
+    v = n
+    res = a | v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 7
+
+## OR (HL), 0xB6
+def or_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    address = R[4] << 8 | R[5]
+    a = R[7]
+    v = ram[address]
+    res = a | v
+    R[7] = res
+    R[6] = SZP[res]
+    return 7
+
+## OR (HL), 0xB6, lazy flags
+def or_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    address = R[4] << 8 | R[5]
+    a = R[7]
+    v = ram[address]
+    res = a | v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 7
+
+## OR (IX+d), 0xDDB6
+def or_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    res = a | v
+    R[7] = res
+    R[6] = SZP[res]
+    return 19
+
+## OR (IX+d), 0xDDB6, lazy flags
+def or_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    res = a | v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 19
+
+## OR (IY+d), 0xFDB6
+def or_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    res = a | v
+    R[7] = res
+    R[6] = SZP[res]
+    return 19
+
+## OR (IY+d), 0xFDB6, lazy flags
+def or_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    res = a | v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 19
+
+## XOR r', 0xA8
+def xor_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[0]
+    res = a ^ v
+    R[7] = res
+    R[6] = SZP[res]
+    return 4
+
+## XOR r', 0xA8, lazy flags
+def xor_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[0]
+    res = a ^ v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 4
+
+## XOR r', 0xA9
+def xor_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[1]
+    res = a ^ v
+    R[7] = res
+    R[6] = SZP[res]
+    return 4
+
+## XOR r', 0xA9, lazy flags
+def xor_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[1]
+    res = a ^ v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 4
+
+## XOR r', 0xAA
+def xor_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[2]
+    res = a ^ v
+    R[7] = res
+    R[6] = SZP[res]
+    return 4
+
+## XOR r', 0xAA, lazy flags
+def xor_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[2]
+    res = a ^ v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 4
+
+## XOR r', 0xAB
+def xor_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[3]
+    res = a ^ v
+    R[7] = res
+    R[6] = SZP[res]
+    return 4
+
+## XOR r', 0xAB, lazy flags
+def xor_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[3]
+    res = a ^ v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 4
+
+## XOR r', 0xAC
+def xor_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[4]
+    res = a ^ v
+    R[7] = res
+    R[6] = SZP[res]
+    return 4
+
+## XOR r', 0xAC, lazy flags
+def xor_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[4]
+    res = a ^ v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 4
+
+## XOR r', 0xAD
+def xor_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[5]
+    res = a ^ v
+    R[7] = res
+    R[6] = SZP[res]
+    return 4
+
+## XOR r', 0xAD, lazy flags
+def xor_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[5]
+    res = a ^ v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 4
+
+## XOR r', 0xAF
+def xor_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[7]
+    res = a ^ v
+    R[7] = res
+    R[6] = SZP[res]
+    return 4
+
+## XOR r', 0xAF, lazy flags
+def xor_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[7]
+    res = a ^ v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 4
+
+## XOR n, 0xEE
+def xor_n(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    a = R[7]
+    v = n
+    res = a ^ v
+    R[7] = res
+    R[6] = SZP[res]
+    return 7
+
+## XOR n, 0xEE, lazy flags
+def xor_n_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    a = R[7]
+    v = n
+    res = a ^ v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 7
+
+## XOR (HL), 0xAE
+def xor_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    address = R[4] << 8 | R[5]
+    a = R[7]
+    v = ram[address]
+    res = a ^ v
+    R[7] = res
+    R[6] = SZP[res]
+    return 7
+
+## XOR (HL), 0xAE, lazy flags
+def xor_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    address = R[4] << 8 | R[5]
+    a = R[7]
+    v = ram[address]
+    res = a ^ v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 7
+
+## XOR (IX+d), 0xDDAE
+def xor_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    res = a ^ v
+    R[7] = res
+    R[6] = SZP[res]
+    return 19
+
+## XOR (IX+d), 0xDDAE, lazy flags
+def xor_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    res = a ^ v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 19
+
+## XOR (IY+d), 0xFDAE
+def xor_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    res = a ^ v
+    R[7] = res
+    R[6] = SZP[res]
+    return 19
+
+## XOR (IY+d), 0xFDAE, lazy flags
+def xor_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    res = a ^ v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 19
+
+## CP r, 0xB8
+def cp_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[0]
+    R[6] = CP[a << 8 | v]
+    return 4
+
+## CP r, 0xB8, lazy flags
+def cp_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[0]
+    R[6] = LAZY_CP | (a << 8 | v)
+    return 4
+
+## CP r, 0xB9
+def cp_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[1]
+    R[6] = CP[a << 8 | v]
+    return 4
+
+## CP r, 0xB9, lazy flags
+def cp_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[1]
+    R[6] = LAZY_CP | (a << 8 | v)
+    return 4
+
+## CP r, 0xBA
+def cp_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[2]
+    R[6] = CP[a << 8 | v]
+    return 4
+
+## CP r, 0xBA, lazy flags
+def cp_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[2]
+    R[6] = LAZY_CP | (a << 8 | v)
+    return 4
+
+## CP r, 0xBB
+def cp_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[3]
+    R[6] = CP[a << 8 | v]
+    return 4
+
+## CP r, 0xBB, lazy flags
+def cp_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[3]
+    R[6] = LAZY_CP | (a << 8 | v)
+    return 4
+
+## CP r, 0xBC
+def cp_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[4]
+    R[6] = CP[a << 8 | v]
+    return 4
+
+## CP r, 0xBC, lazy flags
+def cp_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[4]
+    R[6] = LAZY_CP | (a << 8 | v)
+    return 4
+
+## CP r, 0xBD
+def cp_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[5]
+    R[6] = CP[a << 8 | v]
+    return 4
+
+## CP r, 0xBD, lazy flags
+def cp_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[5]
+    R[6] = LAZY_CP | (a << 8 | v)
+    return 4
+
+## CP r, 0xBF
+def cp_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[7]
+    R[6] = CP[a << 8 | v]
+    return 4
+
+## CP r, 0xBF, lazy flags
+def cp_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[7]
+    R[6] = LAZY_CP | (a << 8 | v)
+    return 4
+
+## CP n, 0xFE
+def cp_n(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    a = R[7]
+    v = n
+    R[6] = CP[a << 8 | v]
+    return 7
+
+## CP n, 0xFE, lazy flags
+def cp_n_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    a = R[7]
+    v = n
+    R[6] = LAZY_CP | (a << 8 | v)
+    return 7
+
+## CP (HL), 0xBE
+def cp_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    address = R[4] << 8 | R[5]
+    a = R[7]
+    v = ram[address]
+    R[6] = CP[a << 8 | v]
+    return 7
+
+## CP (HL), 0xBE, lazy flags
+def cp_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    address = R[4] << 8 | R[5]
+    a = R[7]
+    v = ram[address]
+    R[6] = LAZY_CP | (a << 8 | v)
+    return 7
+
+## CP (IX+d), 0xDDBE
+def cp_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    R[6] = CP[a << 8 | v]
+    return 19
+
+## CP (IX+d), 0xDDBE, lazy flags
+def cp_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    R[6] = LAZY_CP | (a << 8 | v)
+    return 19
+
+## CP (IY+d), 0xFDBE
+def cp_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    R[6] = CP[a << 8 | v]
+    return 19
+
+## CP (IY+d), 0xFDBE, lazy flags
+def cp_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    a = R[7]
+    v = ram[address]
+    R[6] = LAZY_CP | (a << 8 | v)
+    return 19
+
+## INC r, 0x04
+def inc_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[0] + 1 & 0xFF
+    R[0] = res
+    R[6] = R[6] & 1 | INC[res]
+    return 4
+
+## INC r, 0x04, lazy flags
+def inc_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[0] + 1 & 0xFF
+    R[0] = res
+    R[6] = FLAGS[R[6]] & 1 | INC[res]
+    return 4
+
+## INC r, 0x0C
+def inc_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[1] + 1 & 0xFF
+    R[1] = res
+    R[6] = R[6] & 1 | INC[res]
+    return 4
+
+## INC r, 0x0C, lazy flags
+def inc_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[1] + 1 & 0xFF
+    R[1] = res
+    R[6] = FLAGS[R[6]] & 1 | INC[res]
+    return 4
+
+## INC r, 0x14
+def inc_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[2] + 1 & 0xFF
+    R[2] = res
+    R[6] = R[6] & 1 | INC[res]
+    return 4
+
+## INC r, 0x14, lazy flags
+def inc_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[2] + 1 & 0xFF
+    R[2] = res
+    R[6] = FLAGS[R[6]] & 1 | INC[res]
+    return 4
+
+## INC r, 0x1C
+def inc_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[3] + 1 & 0xFF
+    R[3] = res
+    R[6] = R[6] & 1 | INC[res]
+    return 4
+
+## INC r, 0x1C, lazy flags
+def inc_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[3] + 1 & 0xFF
+    R[3] = res
+    R[6] = FLAGS[R[6]] & 1 | INC[res]
+    return 4
+
+## INC r, 0x24
+def inc_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[4] + 1 & 0xFF
+    R[4] = res
+    R[6] = R[6] & 1 | INC[res]
+    return 4
+
+## INC r, 0x24, lazy flags
+def inc_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[4] + 1 & 0xFF
+    R[4] = res
+    R[6] = FLAGS[R[6]] & 1 | INC[res]
+    return 4
+
+## INC r, 0x2C
+def inc_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[5] + 1 & 0xFF
+    R[5] = res
+    R[6] = R[6] & 1 | INC[res]
+    return 4
+
+## INC r, 0x2C, lazy flags
+def inc_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[5] + 1 & 0xFF
+    R[5] = res
+    R[6] = FLAGS[R[6]] & 1 | INC[res]
+    return 4
+
+## INC r, 0x3C
+def inc_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[7] + 1 & 0xFF
+    R[7] = res
+    R[6] = R[6] & 1 | INC[res]
+    return 4
+
+## INC r, 0x3C, lazy flags
+def inc_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[7] + 1 & 0xFF
+    R[7] = res
+    R[6] = FLAGS[R[6]] & 1 | INC[res]
+    return 4
+
+## INC (HL), 0x34
+def inc_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    address = R[4] << 8 | R[5]
+    res = ram[address] + 1 & 0xFF
+    ram[address] = res
+    R[6] = R[6] & 1 | INC[res]
+    return 11
+
+## INC (HL), 0x34, lazy flags
+def inc_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    address = R[4] << 8 | R[5]
+    res = ram[address] + 1 & 0xFF
+    ram[address] = res
+    R[6] = FLAGS[R[6]] & 1 | INC[res]
+    return 11
+
+## INC (IX+d), 0xDD34
+def inc_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    res = ram[address] + 1 & 0xFF
+    ram[address] = res
+    R[6] = R[6] & 1 | INC[res]
+    return 23
+
+## INC (IX+d), 0xDD34, lazy flags
+def inc_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    res = ram[address] + 1 & 0xFF
+    ram[address] = res
+    R[6] = FLAGS[R[6]] & 1 | INC[res]
+    return 23
+
+## INC (IY+d), 0xFD34
+def inc_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    res = ram[address] + 1 & 0xFF
+    ram[address] = res
+    R[6] = R[6] & 1 | INC[res]
+    return 23
+
+## INC (IY+d), 0xFD34, lazy flags
+def inc_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    res = ram[address] + 1 & 0xFF
+    ram[address] = res
+    R[6] = FLAGS[R[6]] & 1 | INC[res]
+    return 23
+
+## DEC r, 0x05
+def dec_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[0] - 1 & 0xFF
+    R[0] = res
+    R[6] = R[6] & 1 | DEC[res]
+    return 4
+
+## DEC r, 0x05, lazy flags
+def dec_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[0] - 1 & 0xFF
+    R[0] = res
+    R[6] = FLAGS[R[6]] & 1 | DEC[res]
+    return 4
+
+## DEC r, 0x0D
+def dec_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[1] - 1 & 0xFF
+    R[1] = res
+    R[6] = R[6] & 1 | DEC[res]
+    return 4
+
+## DEC r, 0x0D, lazy flags
+def dec_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[1] - 1 & 0xFF
+    R[1] = res
+    R[6] = FLAGS[R[6]] & 1 | DEC[res]
+    return 4
+
+## DEC r, 0x15
+def dec_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[2] - 1 & 0xFF
+    R[2] = res
+    R[6] = R[6] & 1 | DEC[res]
+    return 4
+
+## DEC r, 0x15, lazy flags
+def dec_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[2] - 1 & 0xFF
+    R[2] = res
+    R[6] = FLAGS[R[6]] & 1 | DEC[res]
+    return 4
+
+## DEC r, 0x1D
+def dec_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[3] - 1 & 0xFF
+    R[3] = res
+    R[6] = R[6] & 1 | DEC[res]
+    return 4
+
+## DEC r, 0x1D, lazy flags
+def dec_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[3] - 1 & 0xFF
+    R[3] = res
+    R[6] = FLAGS[R[6]] & 1 | DEC[res]
+    return 4
+
+## DEC r, 0x25
+def dec_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[4] - 1 & 0xFF
+    R[4] = res
+    R[6] = R[6] & 1 | DEC[res]
+    return 4
+
+## DEC r, 0x25, lazy flags
+def dec_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[4] - 1 & 0xFF
+    R[4] = res
+    R[6] = FLAGS[R[6]] & 1 | DEC[res]
+    return 4
+
+## DEC r, 0x2D
+def dec_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[5] - 1 & 0xFF
+    R[5] = res
+    R[6] = R[6] & 1 | DEC[res]
+    return 4
+
+## DEC r, 0x2D, lazy flags
+def dec_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[5] - 1 & 0xFF
+    R[5] = res
+    R[6] = FLAGS[R[6]] & 1 | DEC[res]
+    return 4
+
+## DEC r, 0x3D
+def dec_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[7] - 1 & 0xFF
+    R[7] = res
+    R[6] = R[6] & 1 | DEC[res]
+    return 4
+
+## DEC r, 0x3D, lazy flags
+def dec_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    res = R[7] - 1 & 0xFF
+    R[7] = res
+    R[6] = FLAGS[R[6]] & 1 | DEC[res]
+    return 4
+
+## DEC (HL), 0x35
+def dec_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    address = R[4] << 8 | R[5]
+    res = ram[address] - 1 & 0xFF
+    ram[address] = res
+    R[6] = R[6] & 1 | DEC[res]
+    return 11
+
+## DEC (HL), 0x35, lazy flags
+def dec_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    address = R[4] << 8 | R[5]
+    res = ram[address] - 1 & 0xFF
+    ram[address] = res
+    R[6] = FLAGS[R[6]] & 1 | DEC[res]
+    return 11
+
+## DEC (IX+d), 0xDD35
+def dec_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    res = ram[address] - 1 & 0xFF
+    ram[address] = res
+    R[6] = R[6] & 1 | DEC[res]
+    return 23
+
+## DEC (IX+d), 0xDD35, lazy flags
+def dec_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    res = ram[address] - 1 & 0xFF
+    ram[address] = res
+    R[6] = FLAGS[R[6]] & 1 | DEC[res]
+    return 23
+
+## DEC (IY+d), 0xFD35
+def dec_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    res = ram[address] - 1 & 0xFF
+    ram[address] = res
+    R[6] = R[6] & 1 | DEC[res]
+    return 23
+
+## DEC (IY+d), 0xFD35, lazy flags
+def dec_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    res = ram[address] - 1 & 0xFF
+    ram[address] = res
+    R[6] = FLAGS[R[6]] & 1 | DEC[res]
+    return 23
+
+## DAA, 0x27
+def daa(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    f = R[6]
+    af = DAA_AF[(f & 2) << 9 | (f & 0x10) << 5 | (f & 1) << 8 | R[7]]
+    R[7] = af >> 8
+    R[6] = af & 0xFF
+    return 4
+
+## DAA, 0x27, lazy flags
+def daa_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    f = FLAGS[R[6]]
+    af = DAA_AF[(f & 2) << 9 | (f & 0x10) << 5 | (f & 1) << 8 | R[7]]
+    R[7] = af >> 8
+    R[6] = af & 0xFF
+    return 4
+
+## CPL, 0x2F
+def cpl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[7] ^= 0xFF
+    R[6] = R[6] & 0xC5 | R[7] & 0x28 | 0x12
+    return 4
+
+## CPL, 0x2F, lazy flags
+def cpl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[7] ^= 0xFF
+    R[6] = FLAGS[R[6]] & 0xC5 | R[7] & 0x28 | 0x12
+    return 4
+
+## NEG, 0xED44
+def neg(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    R[7] = -v & 0xFF
+    R[6] = SUB[v]
+    return 8
+
+## NEG, 0xED44, lazy flags
+def neg_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    R[7] = -v & 0xFF
+    R[6] = LAZY_SUB | v
+    return 8
+
+## NEG, 0xED4C
+def neg_ed4c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    R[7] = -v & 0xFF
+    R[6] = SUB[v]
+    return 8
+
+## NEG, 0xED4C, lazy flags
+def neg_ed4c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    R[7] = -v & 0xFF
+    R[6] = LAZY_SUB | v
+    return 8
+
+## NEG, 0xED54
+def neg_ed54(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    R[7] = -v & 0xFF
+    R[6] = SUB[v]
+    return 8
+
+## NEG, 0xED54, lazy flags
+def neg_ed54_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    R[7] = -v & 0xFF
+    R[6] = LAZY_SUB | v
+    return 8
+
+## NEG, 0xED5C
+def neg_ed5c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    R[7] = -v & 0xFF
+    R[6] = SUB[v]
+    return 8
+
+## NEG, 0xED5C, lazy flags
+def neg_ed5c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    R[7] = -v & 0xFF
+    R[6] = LAZY_SUB | v
+    return 8
+
+## NEG, 0xED64
+def neg_ed64(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    R[7] = -v & 0xFF
+    R[6] = SUB[v]
+    return 8
+
+## NEG, 0xED64, lazy flags
+def neg_ed64_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    R[7] = -v & 0xFF
+    R[6] = LAZY_SUB | v
+    return 8
+
+## NEG, 0xED6C
+def neg_ed6c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    R[7] = -v & 0xFF
+    R[6] = SUB[v]
+    return 8
+
+## NEG, 0xED6C, lazy flags
+def neg_ed6c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    R[7] = -v & 0xFF
+    R[6] = LAZY_SUB | v
+    return 8
+
+## NEG, 0xED74
+def neg_ed74(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    R[7] = -v & 0xFF
+    R[6] = SUB[v]
+    return 8
+
+## NEG, 0xED74, lazy flags
+def neg_ed74_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    R[7] = -v & 0xFF
+    R[6] = LAZY_SUB | v
+    return 8
+
+## NEG, 0xED7C
+def neg_ed7c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    R[7] = -v & 0xFF
+    R[6] = SUB[v]
+    return 8
+
+## NEG, 0xED7C, lazy flags
+def neg_ed7c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    R[7] = -v & 0xFF
+    R[6] = LAZY_SUB | v
+    return 8
+
+## CCF, 0x3F
+def ccf(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[6] = (R[6] & 0xC5 | R[7] & 0x28 | (R[6] & 1) << 4) ^ 1
+    return 4
+
+## CCF, 0x3F, lazy flags
+def ccf_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[6] = (FLAGS[R[6]] & 0xC5 | R[7] & 0x28 | (FLAGS[R[6]] & 1) << 4) ^ 1
+    return 4
+
+## SCF, 0x37
+def scf(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[6] = R[6] & 0xC4 | R[7] & 0x28 | 1
+    return 4
+
+## SCF, 0x37, lazy flags
+def scf_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    R[6] = FLAGS[R[6]] & 0xC4 | R[7] & 0x28 | 1
+    return 4
+
+## NOP, 0x00
+def nop(cpu, PC: int) -> int:
+    regs = cpu.registers
+    regs.PC = (PC + 1) & 0xFFFF
+    return 4
+
+## HALT, 0x76
+def halt(cpu, PC: int) -> int:
+    regs = cpu.registers
+    regs.PC = (PC + 1) & 0xFFFF
+    regs.halted = True
+    regs.PC = regs.PC - 1 & 0xFFFF
+    return 4
+
+## DI, 0xF3
+def di(cpu, PC: int) -> int:
+    regs = cpu.registers
+    regs.PC = (PC + 1) & 0xFFFF
+    regs.IFF1 = regs.IFF2 = 0
+    return 4
+
+## EI, 0xFB
+def ei(cpu, PC: int) -> int:
+    regs = cpu.registers
+    regs.PC = (PC + 1) & 0xFFFF
+    regs.IFF1 = regs.IFF2 = 1
+    if cpu.int_line:
+        cpu.enable_interrupts()
+    return 4
+
+## IM 0, 0xED46
+def im_0(cpu, PC: int) -> int:
+    regs = cpu.registers
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    regs.IM = 0
+    return 8
+
+## IM 0, 0xED4E
+def im_0_ed4e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    regs.IM = 0
+    return 8
+
+## IM 0, 0xED66
+def im_0_ed66(cpu, PC: int) -> int:
+    regs = cpu.registers
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    regs.IM = 0
+    return 8
+
+## IM 0, 0xED6E
+def im_0_ed6e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    regs.IM = 0
+    return 8
+
+## IM 1, 0xED56
+def im_1(cpu, PC: int) -> int:
+    regs = cpu.registers
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    regs.IM = 1
+    return 8
+
+## IM 1, 0xED76
+def im_1_ed76(cpu, PC: int) -> int:
+    regs = cpu.registers
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    regs.IM = 1
+    return 8
+
+## IM 2, 0xED5E
+def im_2(cpu, PC: int) -> int:
+    regs = cpu.registers
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    regs.IM = 2
+    return 8
+
+## IM 2, 0xED7E
+def im_2_ed7e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    regs.IM = 2
+    return 8
+
+## ADD HL, ss, 0x09
+def add_hl_bc(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    hl = R[4] << 8 | R[5]
+    v = R[0] << 8 | R[1]
+    res = hl + v
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = R[6] & 0xC4 | res >> 8 & 0x28 | (hl ^ v ^ res) >> 8 & 0x10 | res >> 16
+    return 11
+
+## ADD HL, ss, 0x09, lazy flags
+def add_hl_bc_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    hl = R[4] << 8 | R[5]
+    v = R[0] << 8 | R[1]
+    res = hl + v
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = FLAGS[R[6]] & 0xC4 | res >> 8 & 0x28 | (hl ^ v ^ res) >> 8 & 0x10 | res >> 16
+    return 11
+
+## ADD HL, ss, 0x19
+def add_hl_de(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    hl = R[4] << 8 | R[5]
+    v = R[2] << 8 | R[3]
+    res = hl + v
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = R[6] & 0xC4 | res >> 8 & 0x28 | (hl ^ v ^ res) >> 8 & 0x10 | res >> 16
+    return 11
+
+## ADD HL, ss, 0x19, lazy flags
+def add_hl_de_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    hl = R[4] << 8 | R[5]
+    v = R[2] << 8 | R[3]
+    res = hl + v
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = FLAGS[R[6]] & 0xC4 | res >> 8 & 0x28 | (hl ^ v ^ res) >> 8 & 0x10 | res >> 16
+    return 11
+
+## ADD HL, ss, 0x29
+def add_hl_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    hl = R[4] << 8 | R[5]
+    v = R[4] << 8 | R[5]
+    res = hl + v
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = R[6] & 0xC4 | res >> 8 & 0x28 | (hl ^ v ^ res) >> 8 & 0x10 | res >> 16
+    return 11
+
+## ADD HL, ss, 0x29, lazy flags
+def add_hl_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    hl = R[4] << 8 | R[5]
+    v = R[4] << 8 | R[5]
+    res = hl + v
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = FLAGS[R[6]] & 0xC4 | res >> 8 & 0x28 | (hl ^ v ^ res) >> 8 & 0x10 | res >> 16
+    return 11
+
+## ADD HL, ss, 0x39
+def add_hl_sp(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    hl = R[4] << 8 | R[5]
+    v = regs.SP
+    res = hl + v
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = R[6] & 0xC4 | res >> 8 & 0x28 | (hl ^ v ^ res) >> 8 & 0x10 | res >> 16
+    return 11
+
+## ADD HL, ss, 0x39, lazy flags
+def add_hl_sp_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    hl = R[4] << 8 | R[5]
+    v = regs.SP
+    res = hl + v
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = FLAGS[R[6]] & 0xC4 | res >> 8 & 0x28 | (hl ^ v ^ res) >> 8 & 0x10 | res >> 16
+    return 11
+
+## ADC HL, ss, 0xED4A
+def adc_hl_bc(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    v = R[0] << 8 | R[1]
+    res = hl + v + (R[6] & 1)
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = res >> 8 & 0xA8 | (res & 0xFFFF == 0) << 6 | (hl ^ v ^ res) >> 8 & 0x10 | ((hl ^ res) & (v ^ res) & 0x8000) >> 13 | res >> 16
+    return 15
+
+## ADC HL, ss, 0xED4A, lazy flags
+def adc_hl_bc_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    v = R[0] << 8 | R[1]
+    res = hl + v + (FLAGS[R[6]] & 1)
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = res >> 8 & 0xA8 | (res & 0xFFFF == 0) << 6 | (hl ^ v ^ res) >> 8 & 0x10 | ((hl ^ res) & (v ^ res) & 0x8000) >> 13 | res >> 16
+    return 15
+
+## ADC HL, ss, 0xED5A
+def adc_hl_de(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    v = R[2] << 8 | R[3]
+    res = hl + v + (R[6] & 1)
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = res >> 8 & 0xA8 | (res & 0xFFFF == 0) << 6 | (hl ^ v ^ res) >> 8 & 0x10 | ((hl ^ res) & (v ^ res) & 0x8000) >> 13 | res >> 16
+    return 15
+
+## ADC HL, ss, 0xED5A, lazy flags
+def adc_hl_de_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    v = R[2] << 8 | R[3]
+    res = hl + v + (FLAGS[R[6]] & 1)
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = res >> 8 & 0xA8 | (res & 0xFFFF == 0) << 6 | (hl ^ v ^ res) >> 8 & 0x10 | ((hl ^ res) & (v ^ res) & 0x8000) >> 13 | res >> 16
+    return 15
+
+## ADC HL, ss, 0xED6A
+def adc_hl_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    v = R[4] << 8 | R[5]
+    res = hl + v + (R[6] & 1)
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = res >> 8 & 0xA8 | (res & 0xFFFF == 0) << 6 | (hl ^ v ^ res) >> 8 & 0x10 | ((hl ^ res) & (v ^ res) & 0x8000) >> 13 | res >> 16
+    return 15
+
+## ADC HL, ss, 0xED6A, lazy flags
+def adc_hl_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    v = R[4] << 8 | R[5]
+    res = hl + v + (FLAGS[R[6]] & 1)
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = res >> 8 & 0xA8 | (res & 0xFFFF == 0) << 6 | (hl ^ v ^ res) >> 8 & 0x10 | ((hl ^ res) & (v ^ res) & 0x8000) >> 13 | res >> 16
+    return 15
+
+## ADC HL, ss, 0xED7A
+def adc_hl_sp(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    v = regs.SP
+    res = hl + v + (R[6] & 1)
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = res >> 8 & 0xA8 | (res & 0xFFFF == 0) << 6 | (hl ^ v ^ res) >> 8 & 0x10 | ((hl ^ res) & (v ^ res) & 0x8000) >> 13 | res >> 16
+    return 15
+
+## ADC HL, ss, 0xED7A, lazy flags
+def adc_hl_sp_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    v = regs.SP
+    res = hl + v + (FLAGS[R[6]] & 1)
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = res >> 8 & 0xA8 | (res & 0xFFFF == 0) << 6 | (hl ^ v ^ res) >> 8 & 0x10 | ((hl ^ res) & (v ^ res) & 0x8000) >> 13 | res >> 16
+    return 15
+
+## SBC HL, ss, 0xED42
+def sbc_hl_bc(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    v = R[0] << 8 | R[1]
+    res = hl - v - (R[6] & 1)
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = res >> 8 & 0xA8 | (res & 0xFFFF == 0) << 6 | (hl ^ v ^ res) >> 8 & 0x10 | ((hl ^ v) & (hl ^ res) & 0x8000) >> 13 | 2 | res >> 16 & 1
+    return 15
+
+## SBC HL, ss, 0xED42, lazy flags
+def sbc_hl_bc_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    v = R[0] << 8 | R[1]
+    res = hl - v - (FLAGS[R[6]] & 1)
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = res >> 8 & 0xA8 | (res & 0xFFFF == 0) << 6 | (hl ^ v ^ res) >> 8 & 0x10 | ((hl ^ v) & (hl ^ res) & 0x8000) >> 13 | 2 | res >> 16 & 1
+    return 15
+
+## SBC HL, ss, 0xED52
+def sbc_hl_de(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    v = R[2] << 8 | R[3]
+    res = hl - v - (R[6] & 1)
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = res >> 8 & 0xA8 | (res & 0xFFFF == 0) << 6 | (hl ^ v ^ res) >> 8 & 0x10 | ((hl ^ v) & (hl ^ res) & 0x8000) >> 13 | 2 | res >> 16 & 1
+    return 15
+
+## SBC HL, ss, 0xED52, lazy flags
+def sbc_hl_de_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    v = R[2] << 8 | R[3]
+    res = hl - v - (FLAGS[R[6]] & 1)
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = res >> 8 & 0xA8 | (res & 0xFFFF == 0) << 6 | (hl ^ v ^ res) >> 8 & 0x10 | ((hl ^ v) & (hl ^ res) & 0x8000) >> 13 | 2 | res >> 16 & 1
+    return 15
+
+## SBC HL, ss, 0xED62
+def sbc_hl_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    v = R[4] << 8 | R[5]
+    res = hl - v - (R[6] & 1)
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = res >> 8 & 0xA8 | (res & 0xFFFF == 0) << 6 | (hl ^ v ^ res) >> 8 & 0x10 | ((hl ^ v) & (hl ^ res) & 0x8000) >> 13 | 2 | res >> 16 & 1
+    return 15
+
+## SBC HL, ss, 0xED62, lazy flags
+def sbc_hl_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    v = R[4] << 8 | R[5]
+    res = hl - v - (FLAGS[R[6]] & 1)
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = res >> 8 & 0xA8 | (res & 0xFFFF == 0) << 6 | (hl ^ v ^ res) >> 8 & 0x10 | ((hl ^ v) & (hl ^ res) & 0x8000) >> 13 | 2 | res >> 16 & 1
+    return 15
+
+## SBC HL, ss, 0xED72
+def sbc_hl_sp(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    v = regs.SP
+    res = hl - v - (R[6] & 1)
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = res >> 8 & 0xA8 | (res & 0xFFFF == 0) << 6 | (hl ^ v ^ res) >> 8 & 0x10 | ((hl ^ v) & (hl ^ res) & 0x8000) >> 13 | 2 | res >> 16 & 1
+    return 15
+
+## SBC HL, ss, 0xED72, lazy flags
+def sbc_hl_sp_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    v = regs.SP
+    res = hl - v - (FLAGS[R[6]] & 1)
+    R[4] = res >> 8 & 0xFF
+    R[5] = res & 0xFF
+    R[6] = res >> 8 & 0xA8 | (res & 0xFFFF == 0) << 6 | (hl ^ v ^ res) >> 8 & 0x10 | ((hl ^ v) & (hl ^ res) & 0x8000) >> 13 | 2 | res >> 16 & 1
+    return 15
+
+## ADD IX, pp, 0xDD09
+def add_ix_bc(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0] << 8 | R[1]
+    res = regs.IX + v
+    R[6] = R[6] & 0xC4 | res >> 8 & 0x28 | (regs.IX ^ v ^ res) >> 8 & 0x10 | res >> 16
+    regs.IX = res & 0xFFFF
+    return 15
+
+## ADD IX, pp, 0xDD09, lazy flags
+def add_ix_bc_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0] << 8 | R[1]
+    res = regs.IX + v
+    R[6] = FLAGS[R[6]] & 0xC4 | res >> 8 & 0x28 | (regs.IX ^ v ^ res) >> 8 & 0x10 | res >> 16
+    regs.IX = res & 0xFFFF
+    return 15
+
+## ADD IX, pp, 0xDD19
+def add_ix_de(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2] << 8 | R[3]
+    res = regs.IX + v
+    R[6] = R[6] & 0xC4 | res >> 8 & 0x28 | (regs.IX ^ v ^ res) >> 8 & 0x10 | res >> 16
+    regs.IX = res & 0xFFFF
+    return 15
+
+## ADD IX, pp, 0xDD19, lazy flags
+def add_ix_de_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2] << 8 | R[3]
+    res = regs.IX + v
+    R[6] = FLAGS[R[6]] & 0xC4 | res >> 8 & 0x28 | (regs.IX ^ v ^ res) >> 8 & 0x10 | res >> 16
+    regs.IX = res & 0xFFFF
+    return 15
+
+## ADD IX, pp, 0xDD29
+def add_ix_ix(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = regs.IX
+    res = regs.IX + v
+    R[6] = R[6] & 0xC4 | res >> 8 & 0x28 | (regs.IX ^ v ^ res) >> 8 & 0x10 | res >> 16
+    regs.IX = res & 0xFFFF
+    return 15
+
+## ADD IX, pp, 0xDD29, lazy flags
+def add_ix_ix_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = regs.IX
+    res = regs.IX + v
+    R[6] = FLAGS[R[6]] & 0xC4 | res >> 8 & 0x28 | (regs.IX ^ v ^ res) >> 8 & 0x10 | res >> 16
+    regs.IX = res & 0xFFFF
+    return 15
+
+## ADD IX, pp, 0xDD39
+def add_ix_sp(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = regs.SP
+    res = regs.IX + v
+    R[6] = R[6] & 0xC4 | res >> 8 & 0x28 | (regs.IX ^ v ^ res) >> 8 & 0x10 | res >> 16
+    regs.IX = res & 0xFFFF
+    return 15
+
+## ADD IX, pp, 0xDD39, lazy flags
+def add_ix_sp_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = regs.SP
+    res = regs.IX + v
+    R[6] = FLAGS[R[6]] & 0xC4 | res >> 8 & 0x28 | (regs.IX ^ v ^ res) >> 8 & 0x10 | res >> 16
+    regs.IX = res & 0xFFFF
+    return 15
+
+## ADD IY, rr, 0xFD09
+def add_iy_bc(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0] << 8 | R[1]
+    res = regs.IY + v
+    R[6] = R[6] & 0xC4 | res >> 8 & 0x28 | (regs.IY ^ v ^ res) >> 8 & 0x10 | res >> 16
+    regs.IY = res & 0xFFFF
+    return 15
+
+## ADD IY, rr, 0xFD09, lazy flags
+def add_iy_bc_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0] << 8 | R[1]
+    res = regs.IY + v
+    R[6] = FLAGS[R[6]] & 0xC4 | res >> 8 & 0x28 | (regs.IY ^ v ^ res) >> 8 & 0x10 | res >> 16
+    regs.IY = res & 0xFFFF
+    return 15
+
+## ADD IY, rr, 0xFD19
+def add_iy_de(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2] << 8 | R[3]
+    res = regs.IY + v
+    R[6] = R[6] & 0xC4 | res >> 8 & 0x28 | (regs.IY ^ v ^ res) >> 8 & 0x10 | res >> 16
+    regs.IY = res & 0xFFFF
+    return 15
+
+## ADD IY, rr, 0xFD19, lazy flags
+def add_iy_de_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2] << 8 | R[3]
+    res = regs.IY + v
+    R[6] = FLAGS[R[6]] & 0xC4 | res >> 8 & 0x28 | (regs.IY ^ v ^ res) >> 8 & 0x10 | res >> 16
+    regs.IY = res & 0xFFFF
+    return 15
+
+## ADD IY, rr, 0xFD29
+def add_iy_iy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = regs.IY
+    res = regs.IY + v
+    R[6] = R[6] & 0xC4 | res >> 8 & 0x28 | (regs.IY ^ v ^ res) >> 8 & 0x10 | res >> 16
+    regs.IY = res & 0xFFFF
+    return 15
+
+## ADD IY, rr, 0xFD29, lazy flags
+def add_iy_iy_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = regs.IY
+    res = regs.IY + v
+    R[6] = FLAGS[R[6]] & 0xC4 | res >> 8 & 0x28 | (regs.IY ^ v ^ res) >> 8 & 0x10 | res >> 16
+    regs.IY = res & 0xFFFF
+    return 15
+
+## ADD IY, rr, 0xFD39
+def add_iy_sp(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = regs.SP
+    res = regs.IY + v
+    R[6] = R[6] & 0xC4 | res >> 8 & 0x28 | (regs.IY ^ v ^ res) >> 8 & 0x10 | res >> 16
+    regs.IY = res & 0xFFFF
+    return 15
+
+## ADD IY, rr, 0xFD39, lazy flags
+def add_iy_sp_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = regs.SP
+    res = regs.IY + v
+    R[6] = FLAGS[R[6]] & 0xC4 | res >> 8 & 0x28 | (regs.IY ^ v ^ res) >> 8 & 0x10 | res >> 16
+    regs.IY = res & 0xFFFF
+    return 15
+
+## INC ss, 0x03
+def inc_bc(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    v = (R[0] << 8 | R[1]) + 1 & 0xFFFF
+    R[0] = v >> 8
+    R[1] = v & 0xFF
+    return 6
+
+## INC ss, 0x13
+def inc_de(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    v = (R[2] << 8 | R[3]) + 1 & 0xFFFF
+    R[2] = v >> 8
+    R[3] = v & 0xFF
+    return 6
+
+## INC ss, 0x23
+def inc_hl_23(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    v = (R[4] << 8 | R[5]) + 1 & 0xFFFF
+    R[4] = v >> 8
+    R[5] = v & 0xFF
+    return 6
+
+## INC ss, 0x33
+def inc_sp(cpu, PC: int) -> int:
+    regs = cpu.registers
+    regs.PC = (PC + 1) & 0xFFFF
+    v = regs.SP + 1 & 0xFFFF
+    regs.SP = v
+    return 6
+
+## INC IX, 0xDD23
+def inc_ix(cpu, PC: int) -> int:
+    regs = cpu.registers
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    regs.IX = regs.IX + 1 & 0xFFFF
+    return 10
+
+## INC IY, 0xFD23
+def inc_iy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    regs.IY = regs.IY + 1 & 0xFFFF
+    return 10
+
+## DEC ss, 0x0B
+def dec_bc(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    v = (R[0] << 8 | R[1]) - 1 & 0xFFFF
+    R[0] = v >> 8
+    R[1] = v & 0xFF
+    return 6
+
+## DEC ss, 0x1B
+def dec_de(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    v = (R[2] << 8 | R[3]) - 1 & 0xFFFF
+    R[2] = v >> 8
+    R[3] = v & 0xFF
+    return 6
+
+## DEC ss, 0x2B
+def dec_hl_2b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    v = (R[4] << 8 | R[5]) - 1 & 0xFFFF
+    R[4] = v >> 8
+    R[5] = v & 0xFF
+    return 6
+
+## DEC ss, 0x3B
+def dec_sp(cpu, PC: int) -> int:
+    regs = cpu.registers
+    regs.PC = (PC + 1) & 0xFFFF
+    v = regs.SP - 1 & 0xFFFF
+    regs.SP = v
+    return 6
+
+## DEC IX, 0xDD2B
+def dec_ix(cpu, PC: int) -> int:
+    regs = cpu.registers
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    regs.IX = regs.IX - 1 & 0xFFFF
+    return 10
+
+## DEC IY, 0xFD2B
+def dec_iy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    regs.IY = regs.IY - 1 & 0xFFFF
+    return 10
+
+## RLCA, 0x07
+def rlca(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    R[7] = (a << 1 | a >> 7) & 0xFF
+    R[6] = R[6] & 0xC4 | R[7] & 0x28 | a >> 7
+    return 4
+
+## RLCA, 0x07, lazy flags
+def rlca_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    R[7] = (a << 1 | a >> 7) & 0xFF
+    R[6] = FLAGS[R[6]] & 0xC4 | R[7] & 0x28 | a >> 7
+    return 4
+
+## RLA, 0x17
+def rla(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    R[7] = (a << 1 | R[6] & 1) & 0xFF
+    R[6] = R[6] & 0xC4 | R[7] & 0x28 | a >> 7
+    return 4
+
+## RLA, 0x17, lazy flags
+def rla_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    R[7] = (a << 1 | FLAGS[R[6]] & 1) & 0xFF
+    R[6] = FLAGS[R[6]] & 0xC4 | R[7] & 0x28 | a >> 7
+    return 4
+
+## RRCA, 0x0F
+def rrca(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    R[7] = (a >> 1 | a << 7) & 0xFF
+    R[6] = R[6] & 0xC4 | R[7] & 0x28 | a & 1
+    return 4
+
+## RRCA, 0x0F, lazy flags
+def rrca_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    R[7] = (a >> 1 | a << 7) & 0xFF
+    R[6] = FLAGS[R[6]] & 0xC4 | R[7] & 0x28 | a & 1
+    return 4
+
+## RRA, 0x1F
+def rra(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    R[7] = a >> 1 | (R[6] & 1) << 7
+    R[6] = R[6] & 0xC4 | R[7] & 0x28 | a & 1
+    return 4
+
+## RRA, 0x1F, lazy flags
+def rra_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    R[7] = a >> 1 | (FLAGS[R[6]] & 1) << 7
+    R[6] = FLAGS[R[6]] & 0xC4 | R[7] & 0x28 | a & 1
+    return 4
+
+## RLC r, 0xCB00
+def rlc_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = (v << 1 | v >> 7) & 0xFF
+    c = v >> 7
+    R[0] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RLC r, 0xCB00, lazy flags
+def rlc_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = (v << 1 | v >> 7) & 0xFF
+    c = v >> 7
+    R[0] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RLC r, 0xCB01
+def rlc_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = (v << 1 | v >> 7) & 0xFF
+    c = v >> 7
+    R[1] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RLC r, 0xCB01, lazy flags
+def rlc_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = (v << 1 | v >> 7) & 0xFF
+    c = v >> 7
+    R[1] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RLC r, 0xCB02
+def rlc_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = (v << 1 | v >> 7) & 0xFF
+    c = v >> 7
+    R[2] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RLC r, 0xCB02, lazy flags
+def rlc_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = (v << 1 | v >> 7) & 0xFF
+    c = v >> 7
+    R[2] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RLC r, 0xCB03
+def rlc_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = (v << 1 | v >> 7) & 0xFF
+    c = v >> 7
+    R[3] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RLC r, 0xCB03, lazy flags
+def rlc_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = (v << 1 | v >> 7) & 0xFF
+    c = v >> 7
+    R[3] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RLC r, 0xCB04
+def rlc_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = (v << 1 | v >> 7) & 0xFF
+    c = v >> 7
+    R[4] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RLC r, 0xCB04, lazy flags
+def rlc_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = (v << 1 | v >> 7) & 0xFF
+    c = v >> 7
+    R[4] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RLC r, 0xCB05
+def rlc_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = (v << 1 | v >> 7) & 0xFF
+    c = v >> 7
+    R[5] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RLC r, 0xCB05, lazy flags
+def rlc_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = (v << 1 | v >> 7) & 0xFF
+    c = v >> 7
+    R[5] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RLC r, 0xCB07
+def rlc_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = (v << 1 | v >> 7) & 0xFF
+    c = v >> 7
+    R[7] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RLC r, 0xCB07, lazy flags
+def rlc_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = (v << 1 | v >> 7) & 0xFF
+    c = v >> 7
+    R[7] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RLC (HL), 0xCB06
+def rlc_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = (v << 1 | v >> 7) & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 15
+
+## RLC (HL), 0xCB06, lazy flags
+def rlc_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = (v << 1 | v >> 7) & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 15
+
+## RLC (IX+d), 0xDDCB06
+def rlc_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = (v << 1 | v >> 7) & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 23
+
+## RLC (IX+d), 0xDDCB06, lazy flags
+def rlc_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = (v << 1 | v >> 7) & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 23
+
+## RLC (IY+d), 0xFDCB06
+def rlc_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = (v << 1 | v >> 7) & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 23
+
+## RLC (IY+d), 0xFDCB06, lazy flags
+def rlc_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = (v << 1 | v >> 7) & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 23
+
+## RRC r, 0xCB08
+def rrc_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = (v >> 1 | v << 7) & 0xFF
+    c = v & 1
+    R[0] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RRC r, 0xCB08, lazy flags
+def rrc_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = (v >> 1 | v << 7) & 0xFF
+    c = v & 1
+    R[0] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RRC r, 0xCB09
+def rrc_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = (v >> 1 | v << 7) & 0xFF
+    c = v & 1
+    R[1] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RRC r, 0xCB09, lazy flags
+def rrc_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = (v >> 1 | v << 7) & 0xFF
+    c = v & 1
+    R[1] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RRC r, 0xCB0A
+def rrc_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = (v >> 1 | v << 7) & 0xFF
+    c = v & 1
+    R[2] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RRC r, 0xCB0A, lazy flags
+def rrc_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = (v >> 1 | v << 7) & 0xFF
+    c = v & 1
+    R[2] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RRC r, 0xCB0B
+def rrc_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = (v >> 1 | v << 7) & 0xFF
+    c = v & 1
+    R[3] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RRC r, 0xCB0B, lazy flags
+def rrc_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = (v >> 1 | v << 7) & 0xFF
+    c = v & 1
+    R[3] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RRC r, 0xCB0C
+def rrc_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = (v >> 1 | v << 7) & 0xFF
+    c = v & 1
+    R[4] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RRC r, 0xCB0C, lazy flags
+def rrc_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = (v >> 1 | v << 7) & 0xFF
+    c = v & 1
+    R[4] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RRC r, 0xCB0D
+def rrc_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = (v >> 1 | v << 7) & 0xFF
+    c = v & 1
+    R[5] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RRC r, 0xCB0D, lazy flags
+def rrc_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = (v >> 1 | v << 7) & 0xFF
+    c = v & 1
+    R[5] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RRC r, 0xCB0F
+def rrc_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = (v >> 1 | v << 7) & 0xFF
+    c = v & 1
+    R[7] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RRC r, 0xCB0F, lazy flags
+def rrc_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = (v >> 1 | v << 7) & 0xFF
+    c = v & 1
+    R[7] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RRC (HL), 0xCB0E
+def rrc_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = (v >> 1 | v << 7) & 0xFF
+    c = v & 1
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 15
+
+## RRC (HL), 0xCB0E, lazy flags
+def rrc_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = (v >> 1 | v << 7) & 0xFF
+    c = v & 1
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 15
+
+## RRC (IX+d), 0xDDCB0E
+def rrc_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = (v >> 1 | v << 7) & 0xFF
+    c = v & 1
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 23
+
+## RRC (IX+d), 0xDDCB0E, lazy flags
+def rrc_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = (v >> 1 | v << 7) & 0xFF
+    c = v & 1
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 23
+
+## RRC (IY+d), 0xFDCB0E
+def rrc_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = (v >> 1 | v << 7) & 0xFF
+    c = v & 1
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 23
+
+## RRC (IY+d), 0xFDCB0E, lazy flags
+def rrc_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = (v >> 1 | v << 7) & 0xFF
+    c = v & 1
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 23
+
+## RL r, 0xCB10
+def rl_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = (v << 1 | R[6] & 1) & 0xFF
+    c = v >> 7
+    R[0] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RL r, 0xCB10, lazy flags
+def rl_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = (v << 1 | FLAGS[R[6]] & 1) & 0xFF
+    c = v >> 7
+    R[0] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RL r, 0xCB11
+def rl_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = (v << 1 | R[6] & 1) & 0xFF
+    c = v >> 7
+    R[1] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RL r, 0xCB11, lazy flags
+def rl_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = (v << 1 | FLAGS[R[6]] & 1) & 0xFF
+    c = v >> 7
+    R[1] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RL r, 0xCB12
+def rl_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = (v << 1 | R[6] & 1) & 0xFF
+    c = v >> 7
+    R[2] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RL r, 0xCB12, lazy flags
+def rl_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = (v << 1 | FLAGS[R[6]] & 1) & 0xFF
+    c = v >> 7
+    R[2] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RL r, 0xCB13
+def rl_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = (v << 1 | R[6] & 1) & 0xFF
+    c = v >> 7
+    R[3] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RL r, 0xCB13, lazy flags
+def rl_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = (v << 1 | FLAGS[R[6]] & 1) & 0xFF
+    c = v >> 7
+    R[3] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RL r, 0xCB14
+def rl_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = (v << 1 | R[6] & 1) & 0xFF
+    c = v >> 7
+    R[4] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RL r, 0xCB14, lazy flags
+def rl_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = (v << 1 | FLAGS[R[6]] & 1) & 0xFF
+    c = v >> 7
+    R[4] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RL r, 0xCB15
+def rl_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = (v << 1 | R[6] & 1) & 0xFF
+    c = v >> 7
+    R[5] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RL r, 0xCB15, lazy flags
+def rl_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = (v << 1 | FLAGS[R[6]] & 1) & 0xFF
+    c = v >> 7
+    R[5] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RL r, 0xCB17
+def rl_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = (v << 1 | R[6] & 1) & 0xFF
+    c = v >> 7
+    R[7] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RL r, 0xCB17, lazy flags
+def rl_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = (v << 1 | FLAGS[R[6]] & 1) & 0xFF
+    c = v >> 7
+    R[7] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RL (HL), 0xCB16
+def rl_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = (v << 1 | R[6] & 1) & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 15
+
+## RL (HL), 0xCB16, lazy flags
+def rl_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = (v << 1 | FLAGS[R[6]] & 1) & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 15
+
+## RL (IX+d), 0xDDCB16
+def rl_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = (v << 1 | R[6] & 1) & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 23
+
+## RL (IX+d), 0xDDCB16, lazy flags
+def rl_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = (v << 1 | FLAGS[R[6]] & 1) & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 23
+
+## RL (IY+d), 0xFDCB16
+def rl_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = (v << 1 | R[6] & 1) & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 23
+
+## RL (IY+d), 0xFDCB16, lazy flags
+def rl_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = (v << 1 | FLAGS[R[6]] & 1) & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 23
+
+## RR r, 0xCB18
+def rr_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v >> 1 | (R[6] & 1) << 7
+    c = v & 1
+    R[0] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RR r, 0xCB18, lazy flags
+def rr_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v >> 1 | (FLAGS[R[6]] & 1) << 7
+    c = v & 1
+    R[0] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RR r, 0xCB19
+def rr_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v >> 1 | (R[6] & 1) << 7
+    c = v & 1
+    R[1] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RR r, 0xCB19, lazy flags
+def rr_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v >> 1 | (FLAGS[R[6]] & 1) << 7
+    c = v & 1
+    R[1] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RR r, 0xCB1A
+def rr_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v >> 1 | (R[6] & 1) << 7
+    c = v & 1
+    R[2] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RR r, 0xCB1A, lazy flags
+def rr_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v >> 1 | (FLAGS[R[6]] & 1) << 7
+    c = v & 1
+    R[2] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RR r, 0xCB1B
+def rr_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v >> 1 | (R[6] & 1) << 7
+    c = v & 1
+    R[3] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RR r, 0xCB1B, lazy flags
+def rr_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v >> 1 | (FLAGS[R[6]] & 1) << 7
+    c = v & 1
+    R[3] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RR r, 0xCB1C
+def rr_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v >> 1 | (R[6] & 1) << 7
+    c = v & 1
+    R[4] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RR r, 0xCB1C, lazy flags
+def rr_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v >> 1 | (FLAGS[R[6]] & 1) << 7
+    c = v & 1
+    R[4] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RR r, 0xCB1D
+def rr_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v >> 1 | (R[6] & 1) << 7
+    c = v & 1
+    R[5] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RR r, 0xCB1D, lazy flags
+def rr_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v >> 1 | (FLAGS[R[6]] & 1) << 7
+    c = v & 1
+    R[5] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RR r, 0xCB1F
+def rr_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v >> 1 | (R[6] & 1) << 7
+    c = v & 1
+    R[7] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## RR r, 0xCB1F, lazy flags
+def rr_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v >> 1 | (FLAGS[R[6]] & 1) << 7
+    c = v & 1
+    R[7] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## RR (HL), 0xCB1E
+def rr_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v >> 1 | (R[6] & 1) << 7
+    c = v & 1
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 15
+
+## RR (HL), 0xCB1E, lazy flags
+def rr_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v >> 1 | (FLAGS[R[6]] & 1) << 7
+    c = v & 1
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 15
+
+## RR (IX+d), 0xDDCB1E
+def rr_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v >> 1 | (R[6] & 1) << 7
+    c = v & 1
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 23
+
+## RR (IX+d), 0xDDCB1E, lazy flags
+def rr_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v >> 1 | (FLAGS[R[6]] & 1) << 7
+    c = v & 1
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 23
+
+## RR (IY+d), 0xFDCB1E
+def rr_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v >> 1 | (R[6] & 1) << 7
+    c = v & 1
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 23
+
+## RR (IY+d), 0xFDCB1E, lazy flags
+def rr_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v >> 1 | (FLAGS[R[6]] & 1) << 7
+    c = v & 1
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 23
+
+## SLA r, 0xCB20
+def sla_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v << 1 & 0xFF
+    c = v >> 7
+    R[0] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SLA r, 0xCB20, lazy flags
+def sla_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v << 1 & 0xFF
+    c = v >> 7
+    R[0] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SLA r, 0xCB21
+def sla_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v << 1 & 0xFF
+    c = v >> 7
+    R[1] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SLA r, 0xCB21, lazy flags
+def sla_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v << 1 & 0xFF
+    c = v >> 7
+    R[1] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SLA r, 0xCB22
+def sla_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v << 1 & 0xFF
+    c = v >> 7
+    R[2] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SLA r, 0xCB22, lazy flags
+def sla_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v << 1 & 0xFF
+    c = v >> 7
+    R[2] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SLA r, 0xCB23
+def sla_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v << 1 & 0xFF
+    c = v >> 7
+    R[3] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SLA r, 0xCB23, lazy flags
+def sla_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v << 1 & 0xFF
+    c = v >> 7
+    R[3] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SLA r, 0xCB24
+def sla_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v << 1 & 0xFF
+    c = v >> 7
+    R[4] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SLA r, 0xCB24, lazy flags
+def sla_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v << 1 & 0xFF
+    c = v >> 7
+    R[4] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SLA r, 0xCB25
+def sla_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v << 1 & 0xFF
+    c = v >> 7
+    R[5] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SLA r, 0xCB25, lazy flags
+def sla_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v << 1 & 0xFF
+    c = v >> 7
+    R[5] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SLA r, 0xCB27
+def sla_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v << 1 & 0xFF
+    c = v >> 7
+    R[7] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SLA r, 0xCB27, lazy flags
+def sla_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v << 1 & 0xFF
+    c = v >> 7
+    R[7] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SLA (HL), 0xCB26
+def sla_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v << 1 & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 15
+
+## SLA (HL), 0xCB26, lazy flags
+def sla_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v << 1 & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 15
+
+## SLA (IX+d), 0xDDCB26
+def sla_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v << 1 & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 23
+
+## SLA (IX+d), 0xDDCB26, lazy flags
+def sla_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v << 1 & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 23
+
+## SLA (IY+d), 0xFDCB26
+def sla_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v << 1 & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 23
+
+## SLA (IY+d), 0xFDCB26, lazy flags
+def sla_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v << 1 & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 23
+
+## SRA r, 0xCB28
+def sra_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v >> 1 | v & 0x80
+    c = v & 1
+    R[0] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SRA r, 0xCB28, lazy flags
+def sra_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v >> 1 | v & 0x80
+    c = v & 1
+    R[0] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SRA r, 0xCB29
+def sra_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v >> 1 | v & 0x80
+    c = v & 1
+    R[1] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SRA r, 0xCB29, lazy flags
+def sra_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v >> 1 | v & 0x80
+    c = v & 1
+    R[1] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SRA r, 0xCB2A
+def sra_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v >> 1 | v & 0x80
+    c = v & 1
+    R[2] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SRA r, 0xCB2A, lazy flags
+def sra_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v >> 1 | v & 0x80
+    c = v & 1
+    R[2] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SRA r, 0xCB2B
+def sra_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v >> 1 | v & 0x80
+    c = v & 1
+    R[3] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SRA r, 0xCB2B, lazy flags
+def sra_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v >> 1 | v & 0x80
+    c = v & 1
+    R[3] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SRA r, 0xCB2C
+def sra_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v >> 1 | v & 0x80
+    c = v & 1
+    R[4] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SRA r, 0xCB2C, lazy flags
+def sra_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v >> 1 | v & 0x80
+    c = v & 1
+    R[4] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SRA r, 0xCB2D
+def sra_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v >> 1 | v & 0x80
+    c = v & 1
+    R[5] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SRA r, 0xCB2D, lazy flags
+def sra_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v >> 1 | v & 0x80
+    c = v & 1
+    R[5] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SRA r, 0xCB2F
+def sra_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v >> 1 | v & 0x80
+    c = v & 1
+    R[7] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SRA r, 0xCB2F, lazy flags
+def sra_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v >> 1 | v & 0x80
+    c = v & 1
+    R[7] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SRA (HL), 0xCB2E
+def sra_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v >> 1 | v & 0x80
+    c = v & 1
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 15
+
+## SRA (HL), 0xCB2E, lazy flags
+def sra_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v >> 1 | v & 0x80
+    c = v & 1
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 15
+
+## SRA (IX+d), 0xDDCB2E
+def sra_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v >> 1 | v & 0x80
+    c = v & 1
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 23
+
+## SRA (IX+d), 0xDDCB2E, lazy flags
+def sra_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v >> 1 | v & 0x80
+    c = v & 1
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 23
+
+## SRA (IY+d), 0xFDCB2E
+def sra_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v >> 1 | v & 0x80
+    c = v & 1
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 23
+
+## SRA (IY+d), 0xFDCB2E, lazy flags
+def sra_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v >> 1 | v & 0x80
+    c = v & 1
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 23
+
+## SLL r, 0xCB30
+def sll_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = (v << 1 | 1) & 0xFF
+    c = v >> 7
+    R[0] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SLL r, 0xCB30, lazy flags
+def sll_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = (v << 1 | 1) & 0xFF
+    c = v >> 7
+    R[0] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SLL r, 0xCB31
+def sll_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = (v << 1 | 1) & 0xFF
+    c = v >> 7
+    R[1] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SLL r, 0xCB31, lazy flags
+def sll_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = (v << 1 | 1) & 0xFF
+    c = v >> 7
+    R[1] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SLL r, 0xCB32
+def sll_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = (v << 1 | 1) & 0xFF
+    c = v >> 7
+    R[2] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SLL r, 0xCB32, lazy flags
+def sll_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = (v << 1 | 1) & 0xFF
+    c = v >> 7
+    R[2] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SLL r, 0xCB33
+def sll_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = (v << 1 | 1) & 0xFF
+    c = v >> 7
+    R[3] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SLL r, 0xCB33, lazy flags
+def sll_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = (v << 1 | 1) & 0xFF
+    c = v >> 7
+    R[3] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SLL r, 0xCB34
+def sll_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = (v << 1 | 1) & 0xFF
+    c = v >> 7
+    R[4] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SLL r, 0xCB34, lazy flags
+def sll_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = (v << 1 | 1) & 0xFF
+    c = v >> 7
+    R[4] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SLL r, 0xCB35
+def sll_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = (v << 1 | 1) & 0xFF
+    c = v >> 7
+    R[5] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SLL r, 0xCB35, lazy flags
+def sll_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = (v << 1 | 1) & 0xFF
+    c = v >> 7
+    R[5] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SLL r, 0xCB37
+def sll_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = (v << 1 | 1) & 0xFF
+    c = v >> 7
+    R[7] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SLL r, 0xCB37, lazy flags
+def sll_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = (v << 1 | 1) & 0xFF
+    c = v >> 7
+    R[7] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SLL (HL), 0xCB36
+def sll_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = (v << 1 | 1) & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 15
+
+## SLL (HL), 0xCB36, lazy flags
+def sll_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = (v << 1 | 1) & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 15
+
+## SLL (IX+d), 0xDDCB36
+def sll_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = (v << 1 | 1) & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 23
+
+## SLL (IX+d), 0xDDCB36, lazy flags
+def sll_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = (v << 1 | 1) & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 23
+
+## SLL (IY+d), 0xFDCB36
+def sll_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = (v << 1 | 1) & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 23
+
+## SLL (IY+d), 0xFDCB36, lazy flags
+def sll_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = (v << 1 | 1) & 0xFF
+    c = v >> 7
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 23
+
+## SRL r, 0xCB38
+def srl_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v >> 1
+    c = v & 1
+    R[0] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SRL r, 0xCB38, lazy flags
+def srl_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v >> 1
+    c = v & 1
+    R[0] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SRL r, 0xCB39
+def srl_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v >> 1
+    c = v & 1
+    R[1] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SRL r, 0xCB39, lazy flags
+def srl_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v >> 1
+    c = v & 1
+    R[1] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SRL r, 0xCB3A
+def srl_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v >> 1
+    c = v & 1
+    R[2] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SRL r, 0xCB3A, lazy flags
+def srl_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v >> 1
+    c = v & 1
+    R[2] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SRL r, 0xCB3B
+def srl_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v >> 1
+    c = v & 1
+    R[3] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SRL r, 0xCB3B, lazy flags
+def srl_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v >> 1
+    c = v & 1
+    R[3] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SRL r, 0xCB3C
+def srl_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v >> 1
+    c = v & 1
+    R[4] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SRL r, 0xCB3C, lazy flags
+def srl_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v >> 1
+    c = v & 1
+    R[4] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SRL r, 0xCB3D
+def srl_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v >> 1
+    c = v & 1
+    R[5] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SRL r, 0xCB3D, lazy flags
+def srl_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v >> 1
+    c = v & 1
+    R[5] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SRL r, 0xCB3F
+def srl_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v >> 1
+    c = v & 1
+    R[7] = res
+    R[6] = SZP[res] | c
+    return 8
+
+## SRL r, 0xCB3F, lazy flags
+def srl_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v >> 1
+    c = v & 1
+    R[7] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 8
+
+## SRL (HL), 0xCB3E
+def srl_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v >> 1
+    c = v & 1
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 15
+
+## SRL (HL), 0xCB3E, lazy flags
+def srl_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v >> 1
+    c = v & 1
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 15
+
+## SRL (IX+d), 0xDDCB3E
+def srl_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v >> 1
+    c = v & 1
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 23
+
+## SRL (IX+d), 0xDDCB3E, lazy flags
+def srl_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v >> 1
+    c = v & 1
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 23
+
+## SRL (IY+d), 0xFDCB3E
+def srl_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v >> 1
+    c = v & 1
+    ram[address] = res
+    R[6] = SZP[res] | c
+    return 23
+
+## SRL (IY+d), 0xFDCB3E, lazy flags
+def srl_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v >> 1
+    c = v & 1
+    ram[address] = res
+    R[6] = LAZY_SZP | c << 8 | res
+    return 23
+
+## RLD, 0xED6F
+def rld(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    v = ram[hl]
+    a = R[7]
+    ram[hl] = (v << 4 | a & 15) & 0xFF
+    a = a & 0xF0 | v >> 4
+    R[7] = a
+    R[6] = R[6] & 1 | SZP[a]
+    return 18
+
+## RLD, 0xED6F, lazy flags
+def rld_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    v = ram[hl]
+    a = R[7]
+    ram[hl] = (v << 4 | a & 15) & 0xFF
+    a = a & 0xF0 | v >> 4
+    R[7] = a
+    R[6] = FLAGS[R[6]] & 1 | SZP[a]
+    return 18
+
+## RRD, 0xED67
+def rrd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    v = ram[hl]
+    a = R[7]
+    ram[hl] = (a << 4 | v >> 4) & 0xFF
+    a = a & 0xF0 | v & 15
+    R[7] = a
+    R[6] = R[6] & 1 | SZP[a]
+    return 18
+
+## RRD, 0xED67, lazy flags
+def rrd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    v = ram[hl]
+    a = R[7]
+    ram[hl] = (a << 4 | v >> 4) & 0xFF
+    a = a & 0xF0 | v & 15
+    R[7] = a
+    R[6] = FLAGS[R[6]] & 1 | SZP[a]
+    return 18
+
+## BIT b, r, 0xCB40
+def bit_0_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v & 1
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB40, lazy flags
+def bit_0_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v & 1
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB41
+def bit_0_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v & 1
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB41, lazy flags
+def bit_0_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v & 1
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB42
+def bit_0_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v & 1
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB42, lazy flags
+def bit_0_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v & 1
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB43
+def bit_0_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v & 1
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB43, lazy flags
+def bit_0_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v & 1
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB44
+def bit_0_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v & 1
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB44, lazy flags
+def bit_0_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v & 1
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB45
+def bit_0_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v & 1
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB45, lazy flags
+def bit_0_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v & 1
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB47
+def bit_0_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v & 1
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB47, lazy flags
+def bit_0_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v & 1
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB48
+def bit_1_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v & 2
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB48, lazy flags
+def bit_1_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v & 2
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB49
+def bit_1_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v & 2
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB49, lazy flags
+def bit_1_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v & 2
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB4A
+def bit_1_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v & 2
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB4A, lazy flags
+def bit_1_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v & 2
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB4B
+def bit_1_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v & 2
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB4B, lazy flags
+def bit_1_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v & 2
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB4C
+def bit_1_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v & 2
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB4C, lazy flags
+def bit_1_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v & 2
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB4D
+def bit_1_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v & 2
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB4D, lazy flags
+def bit_1_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v & 2
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB4F
+def bit_1_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v & 2
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB4F, lazy flags
+def bit_1_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v & 2
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB50
+def bit_2_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v & 4
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB50, lazy flags
+def bit_2_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v & 4
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB51
+def bit_2_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v & 4
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB51, lazy flags
+def bit_2_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v & 4
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB52
+def bit_2_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v & 4
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB52, lazy flags
+def bit_2_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v & 4
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB53
+def bit_2_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v & 4
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB53, lazy flags
+def bit_2_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v & 4
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB54
+def bit_2_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v & 4
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB54, lazy flags
+def bit_2_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v & 4
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB55
+def bit_2_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v & 4
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB55, lazy flags
+def bit_2_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v & 4
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB57
+def bit_2_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v & 4
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB57, lazy flags
+def bit_2_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v & 4
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB58
+def bit_3_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v & 8
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB58, lazy flags
+def bit_3_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v & 8
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB59
+def bit_3_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v & 8
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB59, lazy flags
+def bit_3_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v & 8
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB5A
+def bit_3_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v & 8
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB5A, lazy flags
+def bit_3_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v & 8
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB5B
+def bit_3_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v & 8
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB5B, lazy flags
+def bit_3_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v & 8
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB5C
+def bit_3_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v & 8
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB5C, lazy flags
+def bit_3_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v & 8
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB5D
+def bit_3_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v & 8
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB5D, lazy flags
+def bit_3_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v & 8
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB5F
+def bit_3_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v & 8
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB5F, lazy flags
+def bit_3_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v & 8
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB60
+def bit_4_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v & 0x10
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB60, lazy flags
+def bit_4_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v & 0x10
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB61
+def bit_4_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v & 0x10
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB61, lazy flags
+def bit_4_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v & 0x10
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB62
+def bit_4_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v & 0x10
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB62, lazy flags
+def bit_4_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v & 0x10
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB63
+def bit_4_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v & 0x10
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB63, lazy flags
+def bit_4_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v & 0x10
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB64
+def bit_4_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v & 0x10
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB64, lazy flags
+def bit_4_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v & 0x10
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB65
+def bit_4_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v & 0x10
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB65, lazy flags
+def bit_4_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v & 0x10
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB67
+def bit_4_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v & 0x10
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB67, lazy flags
+def bit_4_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v & 0x10
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB68
+def bit_5_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v & 0x20
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB68, lazy flags
+def bit_5_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v & 0x20
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB69
+def bit_5_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v & 0x20
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB69, lazy flags
+def bit_5_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v & 0x20
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB6A
+def bit_5_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v & 0x20
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB6A, lazy flags
+def bit_5_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v & 0x20
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB6B
+def bit_5_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v & 0x20
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB6B, lazy flags
+def bit_5_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v & 0x20
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB6C
+def bit_5_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v & 0x20
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB6C, lazy flags
+def bit_5_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v & 0x20
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB6D
+def bit_5_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v & 0x20
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB6D, lazy flags
+def bit_5_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v & 0x20
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB6F
+def bit_5_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v & 0x20
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB6F, lazy flags
+def bit_5_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v & 0x20
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB70
+def bit_6_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v & 0x40
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB70, lazy flags
+def bit_6_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v & 0x40
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB71
+def bit_6_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v & 0x40
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB71, lazy flags
+def bit_6_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v & 0x40
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB72
+def bit_6_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v & 0x40
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB72, lazy flags
+def bit_6_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v & 0x40
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB73
+def bit_6_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v & 0x40
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB73, lazy flags
+def bit_6_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v & 0x40
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB74
+def bit_6_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v & 0x40
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB74, lazy flags
+def bit_6_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v & 0x40
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB75
+def bit_6_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v & 0x40
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB75, lazy flags
+def bit_6_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v & 0x40
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB77
+def bit_6_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v & 0x40
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB77, lazy flags
+def bit_6_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v & 0x40
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB78
+def bit_7_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v & 0x80
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB78, lazy flags
+def bit_7_b_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[0]
+    res = v & 0x80
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB79
+def bit_7_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v & 0x80
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB79, lazy flags
+def bit_7_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[1]
+    res = v & 0x80
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB7A
+def bit_7_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v & 0x80
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB7A, lazy flags
+def bit_7_d_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[2]
+    res = v & 0x80
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB7B
+def bit_7_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v & 0x80
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB7B, lazy flags
+def bit_7_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[3]
+    res = v & 0x80
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB7C
+def bit_7_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v & 0x80
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB7C, lazy flags
+def bit_7_h_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[4]
+    res = v & 0x80
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB7D
+def bit_7_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v & 0x80
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB7D, lazy flags
+def bit_7_l_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[5]
+    res = v & 0x80
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB7F
+def bit_7_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v & 0x80
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, r, 0xCB7F, lazy flags
+def bit_7_a_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    v = R[7]
+    res = v & 0x80
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | v & 0x28
+    return 8
+
+## BIT b, (HL), 0xCB46
+def bit_0_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v & 1
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 12
+
+## BIT b, (HL), 0xCB46, lazy flags
+def bit_0_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v & 1
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 12
+
+## BIT b, (HL), 0xCB4E
+def bit_1_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v & 2
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 12
+
+## BIT b, (HL), 0xCB4E, lazy flags
+def bit_1_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v & 2
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 12
+
+## BIT b, (HL), 0xCB56
+def bit_2_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v & 4
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 12
+
+## BIT b, (HL), 0xCB56, lazy flags
+def bit_2_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v & 4
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 12
+
+## BIT b, (HL), 0xCB5E
+def bit_3_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v & 8
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 12
+
+## BIT b, (HL), 0xCB5E, lazy flags
+def bit_3_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v & 8
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 12
+
+## BIT b, (HL), 0xCB66
+def bit_4_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v & 0x10
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 12
+
+## BIT b, (HL), 0xCB66, lazy flags
+def bit_4_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v & 0x10
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 12
+
+## BIT b, (HL), 0xCB6E
+def bit_5_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v & 0x20
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 12
+
+## BIT b, (HL), 0xCB6E, lazy flags
+def bit_5_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v & 0x20
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 12
+
+## BIT b, (HL), 0xCB76
+def bit_6_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v & 0x40
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 12
+
+## BIT b, (HL), 0xCB76, lazy flags
+def bit_6_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v & 0x40
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 12
+
+## BIT b, (HL), 0xCB7E
+def bit_7_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v & 0x80
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 12
+
+## BIT b, (HL), 0xCB7E, lazy flags
+def bit_7_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    v = ram[address]
+    res = v & 0x80
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 12
+
+## BIT b, (IX+d), 0xDDCB46
+def bit_0_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 1
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IX+d), 0xDDCB46, lazy flags
+def bit_0_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 1
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IX+d), 0xDDCB4E
+def bit_1_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 2
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IX+d), 0xDDCB4E, lazy flags
+def bit_1_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 2
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IX+d), 0xDDCB56
+def bit_2_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 4
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IX+d), 0xDDCB56, lazy flags
+def bit_2_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 4
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IX+d), 0xDDCB5E
+def bit_3_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 8
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IX+d), 0xDDCB5E, lazy flags
+def bit_3_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 8
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IX+d), 0xDDCB66
+def bit_4_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 0x10
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IX+d), 0xDDCB66, lazy flags
+def bit_4_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 0x10
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IX+d), 0xDDCB6E
+def bit_5_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 0x20
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IX+d), 0xDDCB6E, lazy flags
+def bit_5_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 0x20
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IX+d), 0xDDCB76
+def bit_6_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 0x40
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IX+d), 0xDDCB76, lazy flags
+def bit_6_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 0x40
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IX+d), 0xDDCB7E
+def bit_7_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 0x80
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IX+d), 0xDDCB7E, lazy flags
+def bit_7_ixd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 0x80
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IY+d), 0xFDCB46
+def bit_0_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 1
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IY+d), 0xFDCB46, lazy flags
+def bit_0_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 1
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IY+d), 0xFDCB4E
+def bit_1_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 2
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IY+d), 0xFDCB4E, lazy flags
+def bit_1_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 2
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IY+d), 0xFDCB56
+def bit_2_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 4
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IY+d), 0xFDCB56, lazy flags
+def bit_2_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 4
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IY+d), 0xFDCB5E
+def bit_3_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 8
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IY+d), 0xFDCB5E, lazy flags
+def bit_3_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 8
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IY+d), 0xFDCB66
+def bit_4_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 0x10
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IY+d), 0xFDCB66, lazy flags
+def bit_4_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 0x10
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IY+d), 0xFDCB6E
+def bit_5_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 0x20
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IY+d), 0xFDCB6E, lazy flags
+def bit_5_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 0x20
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IY+d), 0xFDCB76
+def bit_6_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 0x40
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IY+d), 0xFDCB76, lazy flags
+def bit_6_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 0x40
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IY+d), 0xFDCB7E
+def bit_7_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 0x80
+    R[6] = R[6] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## BIT b, (IY+d), 0xFDCB7E, lazy flags
+def bit_7_iyd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    v = ram[address]
+    res = v & 0x80
+    R[6] = FLAGS[R[6]] & 1 | 0x10 | res & 0x80 | (res == 0) * 0x44 | address >> 8 & 0x28
+    return 20
+
+## SET b, r, 0xCBC0
+def set_0_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[0] = R[0] | 1
+    return 8
+
+## SET b, r, 0xCBC1
+def set_0_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[1] = R[1] | 1
+    return 8
+
+## SET b, r, 0xCBC2
+def set_0_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[2] = R[2] | 1
+    return 8
+
+## SET b, r, 0xCBC3
+def set_0_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[3] = R[3] | 1
+    return 8
+
+## SET b, r, 0xCBC4
+def set_0_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[4] = R[4] | 1
+    return 8
+
+## SET b, r, 0xCBC5
+def set_0_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[5] = R[5] | 1
+    return 8
+
+## SET b, r, 0xCBC7
+def set_0_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[7] = R[7] | 1
+    return 8
+
+## SET b, r, 0xCBC8
+def set_1_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[0] = R[0] | 2
+    return 8
+
+## SET b, r, 0xCBC9
+def set_1_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[1] = R[1] | 2
+    return 8
+
+## SET b, r, 0xCBCA
+def set_1_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[2] = R[2] | 2
+    return 8
+
+## SET b, r, 0xCBCB
+def set_1_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[3] = R[3] | 2
+    return 8
+
+## SET b, r, 0xCBCC
+def set_1_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[4] = R[4] | 2
+    return 8
+
+## SET b, r, 0xCBCD
+def set_1_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[5] = R[5] | 2
+    return 8
+
+## SET b, r, 0xCBCF
+def set_1_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[7] = R[7] | 2
+    return 8
+
+## SET b, r, 0xCBD0
+def set_2_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[0] = R[0] | 4
+    return 8
+
+## SET b, r, 0xCBD1
+def set_2_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[1] = R[1] | 4
+    return 8
+
+## SET b, r, 0xCBD2
+def set_2_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[2] = R[2] | 4
+    return 8
+
+## SET b, r, 0xCBD3
+def set_2_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[3] = R[3] | 4
+    return 8
+
+## SET b, r, 0xCBD4
+def set_2_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[4] = R[4] | 4
+    return 8
+
+## SET b, r, 0xCBD5
+def set_2_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[5] = R[5] | 4
+    return 8
+
+## SET b, r, 0xCBD7
+def set_2_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[7] = R[7] | 4
+    return 8
+
+## SET b, r, 0xCBD8
+def set_3_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[0] = R[0] | 8
+    return 8
+
+## SET b, r, 0xCBD9
+def set_3_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[1] = R[1] | 8
+    return 8
+
+## SET b, r, 0xCBDA
+def set_3_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[2] = R[2] | 8
+    return 8
+
+## SET b, r, 0xCBDB
+def set_3_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[3] = R[3] | 8
+    return 8
+
+## SET b, r, 0xCBDC
+def set_3_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[4] = R[4] | 8
+    return 8
+
+## SET b, r, 0xCBDD
+def set_3_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[5] = R[5] | 8
+    return 8
+
+## SET b, r, 0xCBDF
+def set_3_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[7] = R[7] | 8
+    return 8
+
+## SET b, r, 0xCBE0
+def set_4_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[0] = R[0] | 0x10
+    return 8
+
+## SET b, r, 0xCBE1
+def set_4_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[1] = R[1] | 0x10
+    return 8
+
+## SET b, r, 0xCBE2
+def set_4_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[2] = R[2] | 0x10
+    return 8
+
+## SET b, r, 0xCBE3
+def set_4_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[3] = R[3] | 0x10
+    return 8
+
+## SET b, r, 0xCBE4
+def set_4_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[4] = R[4] | 0x10
+    return 8
+
+## SET b, r, 0xCBE5
+def set_4_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[5] = R[5] | 0x10
+    return 8
+
+## SET b, r, 0xCBE7
+def set_4_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[7] = R[7] | 0x10
+    return 8
+
+## SET b, r, 0xCBE8
+def set_5_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[0] = R[0] | 0x20
+    return 8
+
+## SET b, r, 0xCBE9
+def set_5_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[1] = R[1] | 0x20
+    return 8
+
+## SET b, r, 0xCBEA
+def set_5_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[2] = R[2] | 0x20
+    return 8
+
+## SET b, r, 0xCBEB
+def set_5_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[3] = R[3] | 0x20
+    return 8
+
+## SET b, r, 0xCBEC
+def set_5_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[4] = R[4] | 0x20
+    return 8
+
+## SET b, r, 0xCBED
+def set_5_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[5] = R[5] | 0x20
+    return 8
+
+## SET b, r, 0xCBEF
+def set_5_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[7] = R[7] | 0x20
+    return 8
+
+## SET b, r, 0xCBF0
+def set_6_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[0] = R[0] | 0x40
+    return 8
+
+## SET b, r, 0xCBF1
+def set_6_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[1] = R[1] | 0x40
+    return 8
+
+## SET b, r, 0xCBF2
+def set_6_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[2] = R[2] | 0x40
+    return 8
+
+## SET b, r, 0xCBF3
+def set_6_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[3] = R[3] | 0x40
+    return 8
+
+## SET b, r, 0xCBF4
+def set_6_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[4] = R[4] | 0x40
+    return 8
+
+## SET b, r, 0xCBF5
+def set_6_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[5] = R[5] | 0x40
+    return 8
+
+## SET b, r, 0xCBF7
+def set_6_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[7] = R[7] | 0x40
+    return 8
+
+## SET b, r, 0xCBF8
+def set_7_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[0] = R[0] | 0x80
+    return 8
+
+## SET b, r, 0xCBF9
+def set_7_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[1] = R[1] | 0x80
+    return 8
+
+## SET b, r, 0xCBFA
+def set_7_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[2] = R[2] | 0x80
+    return 8
+
+## SET b, r, 0xCBFB
+def set_7_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[3] = R[3] | 0x80
+    return 8
+
+## SET b, r, 0xCBFC
+def set_7_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[4] = R[4] | 0x80
+    return 8
+
+## SET b, r, 0xCBFD
+def set_7_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[5] = R[5] | 0x80
+    return 8
+
+## SET b, r, 0xCBFF
+def set_7_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[7] = R[7] | 0x80
+    return 8
+
+## SET b, (HL), 0xCBC6
+def set_0_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    ram[address] = ram[address] | 1
+    return 15
+
+## SET b, (HL), 0xCBCE
+def set_1_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    ram[address] = ram[address] | 2
+    return 15
+
+## SET b, (HL), 0xCBD6
+def set_2_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    ram[address] = ram[address] | 4
+    return 15
+
+## SET b, (HL), 0xCBDE
+def set_3_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    ram[address] = ram[address] | 8
+    return 15
+
+## SET b, (HL), 0xCBE6
+def set_4_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    ram[address] = ram[address] | 0x10
+    return 15
+
+## SET b, (HL), 0xCBEE
+def set_5_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    ram[address] = ram[address] | 0x20
+    return 15
+
+## SET b, (HL), 0xCBF6
+def set_6_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    ram[address] = ram[address] | 0x40
+    return 15
+
+## SET b, (HL), 0xCBFE
+def set_7_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    ram[address] = ram[address] | 0x80
+    return 15
+
+## SET b, (IX+d), 0xDDCBC6
+def set_0_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] | 1
+    return 23
+
+## SET b, (IX+d), 0xDDCBCE
+def set_1_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] | 2
+    return 23
+
+## SET b, (IX+d), 0xDDCBD6
+def set_2_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] | 4
+    return 23
+
+## SET b, (IX+d), 0xDDCBDE
+def set_3_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] | 8
+    return 23
+
+## SET b, (IX+d), 0xDDCBE6
+def set_4_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] | 0x10
+    return 23
+
+## SET b, (IX+d), 0xDDCBEE
+def set_5_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] | 0x20
+    return 23
+
+## SET b, (IX+d), 0xDDCBF6
+def set_6_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] | 0x40
+    return 23
+
+## SET b, (IX+d), 0xDDCBFE
+def set_7_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] | 0x80
+    return 23
+
+## SET b, (IY+d), 0xFDCBC6
+def set_0_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] | 1
+    return 23
+
+## SET b, (IY+d), 0xFDCBCE
+def set_1_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] | 2
+    return 23
+
+## SET b, (IY+d), 0xFDCBD6
+def set_2_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] | 4
+    return 23
+
+## SET b, (IY+d), 0xFDCBDE
+def set_3_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] | 8
+    return 23
+
+## SET b, (IY+d), 0xFDCBE6
+def set_4_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] | 0x10
+    return 23
+
+## SET b, (IY+d), 0xFDCBEE
+def set_5_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] | 0x20
+    return 23
+
+## SET b, (IY+d), 0xFDCBF6
+def set_6_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] | 0x40
+    return 23
+
+## SET b, (IY+d), 0xFDCBFE
+def set_7_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] | 0x80
+    return 23
+
+## RES b, r, 0xCB80
+def res_0_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[0] = R[0] & 0xFE
+    return 8
+
+## RES b, r, 0xCB81
+def res_0_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[1] = R[1] & 0xFE
+    return 8
+
+## RES b, r, 0xCB82
+def res_0_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[2] = R[2] & 0xFE
+    return 8
+
+## RES b, r, 0xCB83
+def res_0_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[3] = R[3] & 0xFE
+    return 8
+
+## RES b, r, 0xCB84
+def res_0_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[4] = R[4] & 0xFE
+    return 8
+
+## RES b, r, 0xCB85
+def res_0_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[5] = R[5] & 0xFE
+    return 8
+
+## RES b, r, 0xCB87
+def res_0_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[7] = R[7] & 0xFE
+    return 8
+
+## RES b, r, 0xCB88
+def res_1_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[0] = R[0] & 0xFD
+    return 8
+
+## RES b, r, 0xCB89
+def res_1_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[1] = R[1] & 0xFD
+    return 8
+
+## RES b, r, 0xCB8A
+def res_1_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[2] = R[2] & 0xFD
+    return 8
+
+## RES b, r, 0xCB8B
+def res_1_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[3] = R[3] & 0xFD
+    return 8
+
+## RES b, r, 0xCB8C
+def res_1_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[4] = R[4] & 0xFD
+    return 8
+
+## RES b, r, 0xCB8D
+def res_1_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[5] = R[5] & 0xFD
+    return 8
+
+## RES b, r, 0xCB8F
+def res_1_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[7] = R[7] & 0xFD
+    return 8
+
+## RES b, r, 0xCB90
+def res_2_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[0] = R[0] & 0xFB
+    return 8
+
+## RES b, r, 0xCB91
+def res_2_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[1] = R[1] & 0xFB
+    return 8
+
+## RES b, r, 0xCB92
+def res_2_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[2] = R[2] & 0xFB
+    return 8
+
+## RES b, r, 0xCB93
+def res_2_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[3] = R[3] & 0xFB
+    return 8
+
+## RES b, r, 0xCB94
+def res_2_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[4] = R[4] & 0xFB
+    return 8
+
+## RES b, r, 0xCB95
+def res_2_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[5] = R[5] & 0xFB
+    return 8
+
+## RES b, r, 0xCB97
+def res_2_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[7] = R[7] & 0xFB
+    return 8
+
+## RES b, r, 0xCB98
+def res_3_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[0] = R[0] & 0xF7
+    return 8
+
+## RES b, r, 0xCB99
+def res_3_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[1] = R[1] & 0xF7
+    return 8
+
+## RES b, r, 0xCB9A
+def res_3_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[2] = R[2] & 0xF7
+    return 8
+
+## RES b, r, 0xCB9B
+def res_3_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[3] = R[3] & 0xF7
+    return 8
+
+## RES b, r, 0xCB9C
+def res_3_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[4] = R[4] & 0xF7
+    return 8
+
+## RES b, r, 0xCB9D
+def res_3_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[5] = R[5] & 0xF7
+    return 8
+
+## RES b, r, 0xCB9F
+def res_3_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[7] = R[7] & 0xF7
+    return 8
+
+## RES b, r, 0xCBA0
+def res_4_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[0] = R[0] & 0xEF
+    return 8
+
+## RES b, r, 0xCBA1
+def res_4_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[1] = R[1] & 0xEF
+    return 8
+
+## RES b, r, 0xCBA2
+def res_4_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[2] = R[2] & 0xEF
+    return 8
+
+## RES b, r, 0xCBA3
+def res_4_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[3] = R[3] & 0xEF
+    return 8
+
+## RES b, r, 0xCBA4
+def res_4_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[4] = R[4] & 0xEF
+    return 8
+
+## RES b, r, 0xCBA5
+def res_4_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[5] = R[5] & 0xEF
+    return 8
+
+## RES b, r, 0xCBA7
+def res_4_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[7] = R[7] & 0xEF
+    return 8
+
+## RES b, r, 0xCBA8
+def res_5_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[0] = R[0] & 0xDF
+    return 8
+
+## RES b, r, 0xCBA9
+def res_5_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[1] = R[1] & 0xDF
+    return 8
+
+## RES b, r, 0xCBAA
+def res_5_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[2] = R[2] & 0xDF
+    return 8
+
+## RES b, r, 0xCBAB
+def res_5_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[3] = R[3] & 0xDF
+    return 8
+
+## RES b, r, 0xCBAC
+def res_5_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[4] = R[4] & 0xDF
+    return 8
+
+## RES b, r, 0xCBAD
+def res_5_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[5] = R[5] & 0xDF
+    return 8
+
+## RES b, r, 0xCBAF
+def res_5_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[7] = R[7] & 0xDF
+    return 8
+
+## RES b, r, 0xCBB0
+def res_6_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[0] = R[0] & 0xBF
+    return 8
+
+## RES b, r, 0xCBB1
+def res_6_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[1] = R[1] & 0xBF
+    return 8
+
+## RES b, r, 0xCBB2
+def res_6_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[2] = R[2] & 0xBF
+    return 8
+
+## RES b, r, 0xCBB3
+def res_6_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[3] = R[3] & 0xBF
+    return 8
+
+## RES b, r, 0xCBB4
+def res_6_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[4] = R[4] & 0xBF
+    return 8
+
+## RES b, r, 0xCBB5
+def res_6_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[5] = R[5] & 0xBF
+    return 8
+
+## RES b, r, 0xCBB7
+def res_6_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[7] = R[7] & 0xBF
+    return 8
+
+## RES b, r, 0xCBB8
+def res_7_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[0] = R[0] & 0x7F
+    return 8
+
+## RES b, r, 0xCBB9
+def res_7_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[1] = R[1] & 0x7F
+    return 8
+
+## RES b, r, 0xCBBA
+def res_7_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[2] = R[2] & 0x7F
+    return 8
+
+## RES b, r, 0xCBBB
+def res_7_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[3] = R[3] & 0x7F
+    return 8
+
+## RES b, r, 0xCBBC
+def res_7_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[4] = R[4] & 0x7F
+    return 8
+
+## RES b, r, 0xCBBD
+def res_7_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[5] = R[5] & 0x7F
+    return 8
+
+## RES b, r, 0xCBBF
+def res_7_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    R[7] = R[7] & 0x7F
+    return 8
+
+## RES b, (HL), 0xCB86
+def res_0_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    ram[address] = ram[address] & 0xFE
+    return 15
+
+## RES b, (HL), 0xCB8E
+def res_1_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    ram[address] = ram[address] & 0xFD
+    return 15
+
+## RES b, (HL), 0xCB96
+def res_2_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    ram[address] = ram[address] & 0xFB
+    return 15
+
+## RES b, (HL), 0xCB9E
+def res_3_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    ram[address] = ram[address] & 0xF7
+    return 15
+
+## RES b, (HL), 0xCBA6
+def res_4_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    ram[address] = ram[address] & 0xEF
+    return 15
+
+## RES b, (HL), 0xCBAE
+def res_5_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    ram[address] = ram[address] & 0xDF
+    return 15
+
+## RES b, (HL), 0xCBB6
+def res_6_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    ram[address] = ram[address] & 0xBF
+    return 15
+
+## RES b, (HL), 0xCBBE
+def res_7_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = R[4] << 8 | R[5]
+    ram[address] = ram[address] & 0x7F
+    return 15
+
+## RES b, (IX+d), 0xDDCB86
+def res_0_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] & 0xFE
+    return 23
+
+## RES b, (IX+d), 0xDDCB8E
+def res_1_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] & 0xFD
+    return 23
+
+## RES b, (IX+d), 0xDDCB96
+def res_2_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] & 0xFB
+    return 23
+
+## RES b, (IX+d), 0xDDCB9E
+def res_3_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] & 0xF7
+    return 23
+
+## RES b, (IX+d), 0xDDCBA6
+def res_4_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] & 0xEF
+    return 23
+
+## RES b, (IX+d), 0xDDCBAE
+def res_5_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] & 0xDF
+    return 23
+
+## RES b, (IX+d), 0xDDCBB6
+def res_6_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] & 0xBF
+    return 23
+
+## RES b, (IX+d), 0xDDCBBE
+def res_7_ixd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IX + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] & 0x7F
+    return 23
+
+## RES b, (IY+d), 0xFDCB86
+def res_0_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] & 0xFE
+    return 23
+
+## RES b, (IY+d), 0xFDCB8E
+def res_1_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] & 0xFD
+    return 23
+
+## RES b, (IY+d), 0xFDCB96
+def res_2_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] & 0xFB
+    return 23
+
+## RES b, (IY+d), 0xFDCB9E
+def res_3_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] & 0xF7
+    return 23
+
+## RES b, (IY+d), 0xFDCBA6
+def res_4_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] & 0xEF
+    return 23
+
+## RES b, (IY+d), 0xFDCBAE
+def res_5_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] & 0xDF
+    return 23
+
+## RES b, (IY+d), 0xFDCBB6
+def res_6_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] & 0xBF
+    return 23
+
+## RES b, (IY+d), 0xFDCBBE
+def res_7_iyd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    d = ram[PC + 2]
+    regs.PC = (PC + 4) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    address = regs.IY + (d ^ 0x80) - 0x80 & 0xFFFF
+    ram[address] = ram[address] & 0x7F
+    return 23
+
+## JP nn, 0xC3
+def jp_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    regs.PC = nn
+    return 10
+
+## JP cc, nn, 0xC2
+def jp_nz_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if not R[6] & 0x40:
+        regs.PC = nn
+    return 10
+
+## JP cc, nn, 0xC2, lazy flags
+def jp_nz_nn_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if not FLAGS[R[6]] & 0x40:
+        regs.PC = nn
+    return 10
+
+## JP cc, nn, 0xCA
+def jp_z_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if R[6] & 0x40:
+        regs.PC = nn
+    return 10
+
+## JP cc, nn, 0xCA, lazy flags
+def jp_z_nn_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if FLAGS[R[6]] & 0x40:
+        regs.PC = nn
+    return 10
+
+## JP cc, nn, 0xD2
+def jp_nc_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if not R[6] & 1:
+        regs.PC = nn
+    return 10
+
+## JP cc, nn, 0xD2, lazy flags
+def jp_nc_nn_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if not FLAGS[R[6]] & 1:
+        regs.PC = nn
+    return 10
+
+## JP cc, nn, 0xDA
+def jp_c_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if R[6] & 1:
+        regs.PC = nn
+    return 10
+
+## JP cc, nn, 0xDA, lazy flags
+def jp_c_nn_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if FLAGS[R[6]] & 1:
+        regs.PC = nn
+    return 10
+
+## JP cc, nn, 0xE2
+def jp_po_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if not R[6] & 4:
+        regs.PC = nn
+    return 10
+
+## JP cc, nn, 0xE2, lazy flags
+def jp_po_nn_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if not FLAGS[R[6]] & 4:
+        regs.PC = nn
+    return 10
+
+## JP cc, nn, 0xEA
+def jp_pe_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if R[6] & 4:
+        regs.PC = nn
+    return 10
+
+## JP cc, nn, 0xEA, lazy flags
+def jp_pe_nn_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if FLAGS[R[6]] & 4:
+        regs.PC = nn
+    return 10
+
+## JP cc, nn, 0xF2
+def jp_p_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if not R[6] & 0x80:
+        regs.PC = nn
+    return 10
+
+## JP cc, nn, 0xF2, lazy flags
+def jp_p_nn_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if not FLAGS[R[6]] & 0x80:
+        regs.PC = nn
+    return 10
+
+## JP cc, nn, 0xFA
+def jp_m_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if R[6] & 0x80:
+        regs.PC = nn
+    return 10
+
+## JP cc, nn, 0xFA, lazy flags
+def jp_m_nn_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if FLAGS[R[6]] & 0x80:
+        regs.PC = nn
+    return 10
+
+## JR e, 0x18
+def jr_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    e = (ram[PC + 1] ^ 0x80) - 0x80
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.PC = regs.PC + e & 0xFFFF
+    return 12
+
+## JR C, e, 0x38
+def jr_c_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    e = (ram[PC + 1] ^ 0x80) - 0x80
+    regs.PC = (PC + 2) & 0xFFFF
+    if R[6] & 1:
+        regs.PC = regs.PC + e & 0xFFFF
+        return 12
+    return 7
+
+## JR C, e, 0x38, lazy flags
+def jr_c_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    e = (ram[PC + 1] ^ 0x80) - 0x80
+    regs.PC = (PC + 2) & 0xFFFF
+    if FLAGS[R[6]] & 1:
+        regs.PC = regs.PC + e & 0xFFFF
+        return 12
+    return 7
+
+## JR NC, e, 0x30
+def jr_nc_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    e = (ram[PC + 1] ^ 0x80) - 0x80
+    regs.PC = (PC + 2) & 0xFFFF
+    if not R[6] & 1:
+        regs.PC = regs.PC + e & 0xFFFF
+        return 12
+    return 7
+
+## JR NC, e, 0x30, lazy flags
+def jr_nc_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    e = (ram[PC + 1] ^ 0x80) - 0x80
+    regs.PC = (PC + 2) & 0xFFFF
+    if not FLAGS[R[6]] & 1:
+        regs.PC = regs.PC + e & 0xFFFF
+        return 12
+    return 7
+
+## JR Z, e, 0x28
+def jr_z_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    e = (ram[PC + 1] ^ 0x80) - 0x80
+    regs.PC = (PC + 2) & 0xFFFF
+    if R[6] & 0x40:
+        regs.PC = regs.PC + e & 0xFFFF
+        return 12
+    return 7
+
+## JR Z, e, 0x28, lazy flags
+def jr_z_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    e = (ram[PC + 1] ^ 0x80) - 0x80
+    regs.PC = (PC + 2) & 0xFFFF
+    if FLAGS[R[6]] & 0x40:
+        regs.PC = regs.PC + e & 0xFFFF
+        return 12
+    return 7
+
+## JR NZ, e, 0x20
+def jr_nz_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    e = (ram[PC + 1] ^ 0x80) - 0x80
+    regs.PC = (PC + 2) & 0xFFFF
+    if not R[6] & 0x40:
+        regs.PC = regs.PC + e & 0xFFFF
+        return 12
+    return 7
+
+## JR NZ, e, 0x20, lazy flags
+def jr_nz_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    e = (ram[PC + 1] ^ 0x80) - 0x80
+    regs.PC = (PC + 2) & 0xFFFF
+    if not FLAGS[R[6]] & 0x40:
+        regs.PC = regs.PC + e & 0xFFFF
+        return 12
+    return 7
+
+## JP (HL), 0xE9
+def jp_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 1) & 0xFFFF
+    regs.PC = R[4] << 8 | R[5]
+    return 4
+
+## JP (IX), 0xDDE9
+def jp_ix(cpu, PC: int) -> int:
+    regs = cpu.registers
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    regs.PC = regs.IX
+    return 8
+
+## JP (IY), 0xFDE9
+def jp_iy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    regs.PC = regs.IY
+    return 8
+
+## DJNZ, e, 0x10
+def djnz_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    e = (ram[PC + 1] ^ 0x80) - 0x80
+    regs.PC = (PC + 2) & 0xFFFF
+    R[0] = R[0] - 1 & 0xFF
+    if R[0]:
+        regs.PC = regs.PC + e & 0xFFFF
+        return 13
+    return 8
+
+## CALL nn, 0xCD
+def call_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = regs.PC >> 8
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = regs.PC & 0xFF
+    regs.SP = sp
+    regs.PC = nn
+    return 17
+
+## CALL cc, nn, 0xC4
+def call_nz_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if not R[6] & 0x40:
+        sp = regs.SP - 1 & 0xFFFF
+        ram[sp] = regs.PC >> 8
+        sp = sp - 1 & 0xFFFF
+        ram[sp] = regs.PC & 0xFF
+        regs.SP = sp
+        regs.PC = nn
+        return 17
+    return 10
+
+## CALL cc, nn, 0xC4, lazy flags
+def call_nz_nn_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if not FLAGS[R[6]] & 0x40:
+        sp = regs.SP - 1 & 0xFFFF
+        ram[sp] = regs.PC >> 8
+        sp = sp - 1 & 0xFFFF
+        ram[sp] = regs.PC & 0xFF
+        regs.SP = sp
+        regs.PC = nn
+        return 17
+    return 10
+
+## CALL cc, nn, 0xCC
+def call_z_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if R[6] & 0x40:
+        sp = regs.SP - 1 & 0xFFFF
+        ram[sp] = regs.PC >> 8
+        sp = sp - 1 & 0xFFFF
+        ram[sp] = regs.PC & 0xFF
+        regs.SP = sp
+        regs.PC = nn
+        return 17
+    return 10
+
+## CALL cc, nn, 0xCC, lazy flags
+def call_z_nn_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if FLAGS[R[6]] & 0x40:
+        sp = regs.SP - 1 & 0xFFFF
+        ram[sp] = regs.PC >> 8
+        sp = sp - 1 & 0xFFFF
+        ram[sp] = regs.PC & 0xFF
+        regs.SP = sp
+        regs.PC = nn
+        return 17
+    return 10
+
+## CALL cc, nn, 0xD4
+def call_nc_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if not R[6] & 1:
+        sp = regs.SP - 1 & 0xFFFF
+        ram[sp] = regs.PC >> 8
+        sp = sp - 1 & 0xFFFF
+        ram[sp] = regs.PC & 0xFF
+        regs.SP = sp
+        regs.PC = nn
+        return 17
+    return 10
+
+## CALL cc, nn, 0xD4, lazy flags
+def call_nc_nn_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if not FLAGS[R[6]] & 1:
+        sp = regs.SP - 1 & 0xFFFF
+        ram[sp] = regs.PC >> 8
+        sp = sp - 1 & 0xFFFF
+        ram[sp] = regs.PC & 0xFF
+        regs.SP = sp
+        regs.PC = nn
+        return 17
+    return 10
+
+## CALL cc, nn, 0xDC
+def call_c_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if R[6] & 1:
+        sp = regs.SP - 1 & 0xFFFF
+        ram[sp] = regs.PC >> 8
+        sp = sp - 1 & 0xFFFF
+        ram[sp] = regs.PC & 0xFF
+        regs.SP = sp
+        regs.PC = nn
+        return 17
+    return 10
+
+## CALL cc, nn, 0xDC, lazy flags
+def call_c_nn_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if FLAGS[R[6]] & 1:
+        sp = regs.SP - 1 & 0xFFFF
+        ram[sp] = regs.PC >> 8
+        sp = sp - 1 & 0xFFFF
+        ram[sp] = regs.PC & 0xFF
+        regs.SP = sp
+        regs.PC = nn
+        return 17
+    return 10
+
+## CALL cc, nn, 0xE4
+def call_po_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if not R[6] & 4:
+        sp = regs.SP - 1 & 0xFFFF
+        ram[sp] = regs.PC >> 8
+        sp = sp - 1 & 0xFFFF
+        ram[sp] = regs.PC & 0xFF
+        regs.SP = sp
+        regs.PC = nn
+        return 17
+    return 10
+
+## CALL cc, nn, 0xE4, lazy flags
+def call_po_nn_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if not FLAGS[R[6]] & 4:
+        sp = regs.SP - 1 & 0xFFFF
+        ram[sp] = regs.PC >> 8
+        sp = sp - 1 & 0xFFFF
+        ram[sp] = regs.PC & 0xFF
+        regs.SP = sp
+        regs.PC = nn
+        return 17
+    return 10
+
+## CALL cc, nn, 0xEC
+def call_pe_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if R[6] & 4:
+        sp = regs.SP - 1 & 0xFFFF
+        ram[sp] = regs.PC >> 8
+        sp = sp - 1 & 0xFFFF
+        ram[sp] = regs.PC & 0xFF
+        regs.SP = sp
+        regs.PC = nn
+        return 17
+    return 10
+
+## CALL cc, nn, 0xEC, lazy flags
+def call_pe_nn_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if FLAGS[R[6]] & 4:
+        sp = regs.SP - 1 & 0xFFFF
+        ram[sp] = regs.PC >> 8
+        sp = sp - 1 & 0xFFFF
+        ram[sp] = regs.PC & 0xFF
+        regs.SP = sp
+        regs.PC = nn
+        return 17
+    return 10
+
+## CALL cc, nn, 0xF4
+def call_p_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if not R[6] & 0x80:
+        sp = regs.SP - 1 & 0xFFFF
+        ram[sp] = regs.PC >> 8
+        sp = sp - 1 & 0xFFFF
+        ram[sp] = regs.PC & 0xFF
+        regs.SP = sp
+        regs.PC = nn
+        return 17
+    return 10
+
+## CALL cc, nn, 0xF4, lazy flags
+def call_p_nn_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if not FLAGS[R[6]] & 0x80:
+        sp = regs.SP - 1 & 0xFFFF
+        ram[sp] = regs.PC >> 8
+        sp = sp - 1 & 0xFFFF
+        ram[sp] = regs.PC & 0xFF
+        regs.SP = sp
+        regs.PC = nn
+        return 17
+    return 10
+
+## CALL cc, nn, 0xFC
+def call_m_nn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if R[6] & 0x80:
+        sp = regs.SP - 1 & 0xFFFF
+        ram[sp] = regs.PC >> 8
+        sp = sp - 1 & 0xFFFF
+        ram[sp] = regs.PC & 0xFF
+        regs.SP = sp
+        regs.PC = nn
+        return 17
+    return 10
+
+## CALL cc, nn, 0xFC, lazy flags
+def call_m_nn_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    nn = ram[PC + 1] | ram[PC + 2] << 8
+    regs.PC = (PC + 3) & 0xFFFF
+    if FLAGS[R[6]] & 0x80:
+        sp = regs.SP - 1 & 0xFFFF
+        ram[sp] = regs.PC >> 8
+        sp = sp - 1 & 0xFFFF
+        ram[sp] = regs.PC & 0xFF
+        regs.SP = sp
+        regs.PC = nn
+        return 17
+    return 10
+
+## RET, 0xC9
+def ret(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    regs.PC = hi << 8 | lo
+    return 10
+
+## RET cc, 0xC0
+def ret_nz(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    if not R[6] & 0x40:
+        sp = regs.SP
+        lo = ram[sp]
+        hi = ram[sp + 1 & 0xFFFF]
+        regs.SP = sp + 2 & 0xFFFF
+        regs.PC = hi << 8 | lo
+        return 11
+    return 5
+
+## RET cc, 0xC0, lazy flags
+def ret_nz_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    if not FLAGS[R[6]] & 0x40:
+        sp = regs.SP
+        lo = ram[sp]
+        hi = ram[sp + 1 & 0xFFFF]
+        regs.SP = sp + 2 & 0xFFFF
+        regs.PC = hi << 8 | lo
+        return 11
+    return 5
+
+## RET cc, 0xC8
+def ret_z(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    if R[6] & 0x40:
+        sp = regs.SP
+        lo = ram[sp]
+        hi = ram[sp + 1 & 0xFFFF]
+        regs.SP = sp + 2 & 0xFFFF
+        regs.PC = hi << 8 | lo
+        return 11
+    return 5
+
+## RET cc, 0xC8, lazy flags
+def ret_z_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    if FLAGS[R[6]] & 0x40:
+        sp = regs.SP
+        lo = ram[sp]
+        hi = ram[sp + 1 & 0xFFFF]
+        regs.SP = sp + 2 & 0xFFFF
+        regs.PC = hi << 8 | lo
+        return 11
+    return 5
+
+## RET cc, 0xD0
+def ret_nc(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    if not R[6] & 1:
+        sp = regs.SP
+        lo = ram[sp]
+        hi = ram[sp + 1 & 0xFFFF]
+        regs.SP = sp + 2 & 0xFFFF
+        regs.PC = hi << 8 | lo
+        return 11
+    return 5
+
+## RET cc, 0xD0, lazy flags
+def ret_nc_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    if not FLAGS[R[6]] & 1:
+        sp = regs.SP
+        lo = ram[sp]
+        hi = ram[sp + 1 & 0xFFFF]
+        regs.SP = sp + 2 & 0xFFFF
+        regs.PC = hi << 8 | lo
+        return 11
+    return 5
+
+## RET cc, 0xD8
+def ret_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    if R[6] & 1:
+        sp = regs.SP
+        lo = ram[sp]
+        hi = ram[sp + 1 & 0xFFFF]
+        regs.SP = sp + 2 & 0xFFFF
+        regs.PC = hi << 8 | lo
+        return 11
+    return 5
+
+## RET cc, 0xD8, lazy flags
+def ret_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    if FLAGS[R[6]] & 1:
+        sp = regs.SP
+        lo = ram[sp]
+        hi = ram[sp + 1 & 0xFFFF]
+        regs.SP = sp + 2 & 0xFFFF
+        regs.PC = hi << 8 | lo
+        return 11
+    return 5
+
+## RET cc, 0xE0
+def ret_po(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    if not R[6] & 4:
+        sp = regs.SP
+        lo = ram[sp]
+        hi = ram[sp + 1 & 0xFFFF]
+        regs.SP = sp + 2 & 0xFFFF
+        regs.PC = hi << 8 | lo
+        return 11
+    return 5
+
+## RET cc, 0xE0, lazy flags
+def ret_po_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    if not FLAGS[R[6]] & 4:
+        sp = regs.SP
+        lo = ram[sp]
+        hi = ram[sp + 1 & 0xFFFF]
+        regs.SP = sp + 2 & 0xFFFF
+        regs.PC = hi << 8 | lo
+        return 11
+    return 5
+
+## RET cc, 0xE8
+def ret_pe(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    if R[6] & 4:
+        sp = regs.SP
+        lo = ram[sp]
+        hi = ram[sp + 1 & 0xFFFF]
+        regs.SP = sp + 2 & 0xFFFF
+        regs.PC = hi << 8 | lo
+        return 11
+    return 5
+
+## RET cc, 0xE8, lazy flags
+def ret_pe_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    if FLAGS[R[6]] & 4:
+        sp = regs.SP
+        lo = ram[sp]
+        hi = ram[sp + 1 & 0xFFFF]
+        regs.SP = sp + 2 & 0xFFFF
+        regs.PC = hi << 8 | lo
+        return 11
+    return 5
+
+## RET cc, 0xF0
+def ret_p(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    if not R[6] & 0x80:
+        sp = regs.SP
+        lo = ram[sp]
+        hi = ram[sp + 1 & 0xFFFF]
+        regs.SP = sp + 2 & 0xFFFF
+        regs.PC = hi << 8 | lo
+        return 11
+    return 5
+
+## RET cc, 0xF0, lazy flags
+def ret_p_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    if not FLAGS[R[6]] & 0x80:
+        sp = regs.SP
+        lo = ram[sp]
+        hi = ram[sp + 1 & 0xFFFF]
+        regs.SP = sp + 2 & 0xFFFF
+        regs.PC = hi << 8 | lo
+        return 11
+    return 5
+
+## RET cc, 0xF8
+def ret_m(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    if R[6] & 0x80:
+        sp = regs.SP
+        lo = ram[sp]
+        hi = ram[sp + 1 & 0xFFFF]
+        regs.SP = sp + 2 & 0xFFFF
+        regs.PC = hi << 8 | lo
+        return 11
+    return 5
+
+## RET cc, 0xF8, lazy flags
+def ret_m_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    if FLAGS[R[6]] & 0x80:
+        sp = regs.SP
+        lo = ram[sp]
+        hi = ram[sp + 1 & 0xFFFF]
+        regs.SP = sp + 2 & 0xFFFF
+        regs.PC = hi << 8 | lo
+        return 11
+    return 5
+
+## RETI, 0xED4D
+def reti(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    regs.PC = hi << 8 | lo
+    regs.IFF1 = regs.IFF2
+    if regs.IFF1 and cpu.int_line:
+        cpu.end_slice()
+    return 14
+
+## RETN, 0xED45
+def retn(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    regs.PC = hi << 8 | lo
+    regs.IFF1 = regs.IFF2
+    if regs.IFF1 and cpu.int_line:
+        cpu.end_slice()
+    return 14
+
+## RETN, 0xED55
+def retn_ed55(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    regs.PC = hi << 8 | lo
+    regs.IFF1 = regs.IFF2
+    if regs.IFF1 and cpu.int_line:
+        cpu.end_slice()
+    return 14
+
+## RETN, 0xED5D
+def retn_ed5d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    regs.PC = hi << 8 | lo
+    regs.IFF1 = regs.IFF2
+    if regs.IFF1 and cpu.int_line:
+        cpu.end_slice()
+    return 14
+
+## RETN, 0xED65
+def retn_ed65(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    regs.PC = hi << 8 | lo
+    regs.IFF1 = regs.IFF2
+    if regs.IFF1 and cpu.int_line:
+        cpu.end_slice()
+    return 14
+
+## RETN, 0xED6D
+def retn_ed6d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    regs.PC = hi << 8 | lo
+    regs.IFF1 = regs.IFF2
+    if regs.IFF1 and cpu.int_line:
+        cpu.end_slice()
+    return 14
+
+## RETN, 0xED75
+def retn_ed75(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    regs.PC = hi << 8 | lo
+    regs.IFF1 = regs.IFF2
+    if regs.IFF1 and cpu.int_line:
+        cpu.end_slice()
+    return 14
+
+## RETN, 0xED7D
+def retn_ed7d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    regs.PC = hi << 8 | lo
+    regs.IFF1 = regs.IFF2
+    if regs.IFF1 and cpu.int_line:
+        cpu.end_slice()
+    return 14
+
+## RST p, 0xC7
+def rst_00h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = regs.PC >> 8
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = regs.PC & 0xFF
+    regs.SP = sp
+    regs.PC = 0
+    return 11
+
+## RST p, 0xCF
+def rst_08h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = regs.PC >> 8
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = regs.PC & 0xFF
+    regs.SP = sp
+    regs.PC = 8
+    return 11
+
+## RST p, 0xD7
+def rst_10h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = regs.PC >> 8
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = regs.PC & 0xFF
+    regs.SP = sp
+    regs.PC = 0x10
+    return 11
+
+## RST p, 0xDF
+def rst_18h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = regs.PC >> 8
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = regs.PC & 0xFF
+    regs.SP = sp
+    regs.PC = 0x18
+    return 11
+
+## RST p, 0xE7
+def rst_20h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = regs.PC >> 8
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = regs.PC & 0xFF
+    regs.SP = sp
+    regs.PC = 0x20
+    return 11
+
+## RST p, 0xEF
+def rst_28h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = regs.PC >> 8
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = regs.PC & 0xFF
+    regs.SP = sp
+    regs.PC = 0x28
+    return 11
+
+## RST p, 0xF7
+def rst_30h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = regs.PC >> 8
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = regs.PC & 0xFF
+    regs.SP = sp
+    regs.PC = 0x30
+    return 11
+
+## RST p, 0xFF
+def rst_38h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    ram = cpu.ram
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = regs.PC >> 8
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = regs.PC & 0xFF
+    regs.SP = sp
+    regs.PC = 0x38
+    return 11
+
+## IN A, (n), 0xDB
+def in_a_n(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    R[7] = cpu.io.readers[n](n)
+    return 11
+
+## IN r, (C), 0xED40
+def in_b_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    port = R[1]
+    res = cpu.io.readers[port](port)
+    R[0] = res
+    R[6] = R[6] & 1 | SZP[res]
+    return 12
+
+## IN r, (C), 0xED40, lazy flags
+def in_b_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    port = R[1]
+    res = cpu.io.readers[port](port)
+    R[0] = res
+    R[6] = FLAGS[R[6]] & 1 | SZP[res]
+    return 12
+
+## IN r, (C), 0xED48
+def in_c_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    port = R[1]
+    res = cpu.io.readers[port](port)
+    R[1] = res
+    R[6] = R[6] & 1 | SZP[res]
+    return 12
+
+## IN r, (C), 0xED48, lazy flags
+def in_c_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    port = R[1]
+    res = cpu.io.readers[port](port)
+    R[1] = res
+    R[6] = FLAGS[R[6]] & 1 | SZP[res]
+    return 12
+
+## IN r, (C), 0xED50
+def in_d_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    port = R[1]
+    res = cpu.io.readers[port](port)
+    R[2] = res
+    R[6] = R[6] & 1 | SZP[res]
+    return 12
+
+## IN r, (C), 0xED50, lazy flags
+def in_d_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    port = R[1]
+    res = cpu.io.readers[port](port)
+    R[2] = res
+    R[6] = FLAGS[R[6]] & 1 | SZP[res]
+    return 12
+
+## IN r, (C), 0xED58
+def in_e_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    port = R[1]
+    res = cpu.io.readers[port](port)
+    R[3] = res
+    R[6] = R[6] & 1 | SZP[res]
+    return 12
+
+## IN r, (C), 0xED58, lazy flags
+def in_e_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    port = R[1]
+    res = cpu.io.readers[port](port)
+    R[3] = res
+    R[6] = FLAGS[R[6]] & 1 | SZP[res]
+    return 12
+
+## IN r, (C), 0xED60
+def in_h_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    port = R[1]
+    res = cpu.io.readers[port](port)
+    R[4] = res
+    R[6] = R[6] & 1 | SZP[res]
+    return 12
+
+## IN r, (C), 0xED60, lazy flags
+def in_h_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    port = R[1]
+    res = cpu.io.readers[port](port)
+    R[4] = res
+    R[6] = FLAGS[R[6]] & 1 | SZP[res]
+    return 12
+
+## IN r, (C), 0xED68
+def in_l_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    port = R[1]
+    res = cpu.io.readers[port](port)
+    R[5] = res
+    R[6] = R[6] & 1 | SZP[res]
+    return 12
+
+## IN r, (C), 0xED68, lazy flags
+def in_l_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    port = R[1]
+    res = cpu.io.readers[port](port)
+    R[5] = res
+    R[6] = FLAGS[R[6]] & 1 | SZP[res]
+    return 12
+
+## IN r, (C), 0xED78
+def in_a_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    port = R[1]
+    res = cpu.io.readers[port](port)
+    R[7] = res
+    R[6] = R[6] & 1 | SZP[res]
+    return 12
+
+## IN r, (C), 0xED78, lazy flags
+def in_a_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    port = R[1]
+    res = cpu.io.readers[port](port)
+    R[7] = res
+    R[6] = FLAGS[R[6]] & 1 | SZP[res]
+    return 12
+
+## INI, 0xEDA2
+def ini(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    port = R[1]
+    ram[hl] = cpu.io.readers[port](port)
+    R[0] = R[0] - 1 & 0xFF
+    R[6] = R[6] & 1 | 2 | R[0] & 0xA8 | (R[0] == 0) << 6
+    hl = hl + 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    return 16
+
+## INI, 0xEDA2, lazy flags
+def ini_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    port = R[1]
+    ram[hl] = cpu.io.readers[port](port)
+    R[0] = R[0] - 1 & 0xFF
+    R[6] = FLAGS[R[6]] & 1 | 2 | R[0] & 0xA8 | (R[0] == 0) << 6
+    hl = hl + 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    return 16
+
+## INIR, 0xEDB2
+def inir(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    port = R[1]
+    ram[hl] = cpu.io.readers[port](port)
+    R[0] = R[0] - 1 & 0xFF
+    R[6] = R[6] & 1 | 2 | R[0] & 0xA8 | (R[0] == 0) << 6
+    hl = hl + 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    if R[0]:
+        regs.PC = regs.PC - 2 & 0xFFFF
+        return 21
+    return 16
+
+## INIR, 0xEDB2, lazy flags
+def inir_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    port = R[1]
+    ram[hl] = cpu.io.readers[port](port)
+    R[0] = R[0] - 1 & 0xFF
+    R[6] = FLAGS[R[6]] & 1 | 2 | R[0] & 0xA8 | (R[0] == 0) << 6
+    hl = hl + 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    if R[0]:
+        regs.PC = regs.PC - 2 & 0xFFFF
+        return 21
+    return 16
+
+## IND, 0xEDAA
+def ind(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    port = R[1]
+    ram[hl] = cpu.io.readers[port](port)
+    R[0] = R[0] - 1 & 0xFF
+    R[6] = R[6] & 1 | 2 | R[0] & 0xA8 | (R[0] == 0) << 6
+    hl = hl - 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    return 16
+
+## IND, 0xEDAA, lazy flags
+def ind_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    port = R[1]
+    ram[hl] = cpu.io.readers[port](port)
+    R[0] = R[0] - 1 & 0xFF
+    R[6] = FLAGS[R[6]] & 1 | 2 | R[0] & 0xA8 | (R[0] == 0) << 6
+    hl = hl - 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    return 16
+
+## INDR, 0xEDBA
+def indr(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    port = R[1]
+    ram[hl] = cpu.io.readers[port](port)
+    R[0] = R[0] - 1 & 0xFF
+    R[6] = R[6] & 1 | 2 | R[0] & 0xA8 | (R[0] == 0) << 6
+    hl = hl - 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    if R[0]:
+        regs.PC = regs.PC - 2 & 0xFFFF
+        return 21
+    return 16
+
+## INDR, 0xEDBA, lazy flags
+def indr_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    port = R[1]
+    ram[hl] = cpu.io.readers[port](port)
+    R[0] = R[0] - 1 & 0xFF
+    R[6] = FLAGS[R[6]] & 1 | 2 | R[0] & 0xA8 | (R[0] == 0) << 6
+    hl = hl - 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    if R[0]:
+        regs.PC = regs.PC - 2 & 0xFFFF
+        return 21
+    return 16
+
+## OUT (n), A, 0xD3
+def out_n_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    regs.PC = (PC + 2) & 0xFFFF
+    cpu.io.writers[n](n, R[7])
+    return 11
+
+## OUT (C), r, 0xED41
+def out_c_b(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    port = R[1]
+    cpu.io.writers[port](port, R[0])
+    return 12
+
+## OUT (C), r, 0xED49
+def out_c_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    port = R[1]
+    cpu.io.writers[port](port, R[1])
+    return 12
+
+## OUT (C), r, 0xED51
+def out_c_d(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    port = R[1]
+    cpu.io.writers[port](port, R[2])
+    return 12
+
+## OUT (C), r, 0xED59
+def out_c_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    port = R[1]
+    cpu.io.writers[port](port, R[3])
+    return 12
+
+## OUT (C), r, 0xED61
+def out_c_h(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    port = R[1]
+    cpu.io.writers[port](port, R[4])
+    return 12
+
+## OUT (C), r, 0xED69
+def out_c_l(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    port = R[1]
+    cpu.io.writers[port](port, R[5])
+    return 12
+
+## OUT (C), r, 0xED79
+def out_c_a(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    port = R[1]
+    cpu.io.writers[port](port, R[7])
+    return 12
+
+## OUTI, 0xEDA3
+def outi(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    R[0] = R[0] - 1 & 0xFF
+    port = R[1]
+    cpu.io.writers[port](port, ram[hl])
+    R[6] = R[6] & 1 | 2 | R[0] & 0xA8 | (R[0] == 0) << 6
+    hl = hl + 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    return 16
+
+## OUTI, 0xEDA3, lazy flags
+def outi_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    R[0] = R[0] - 1 & 0xFF
+    port = R[1]
+    cpu.io.writers[port](port, ram[hl])
+    R[6] = FLAGS[R[6]] & 1 | 2 | R[0] & 0xA8 | (R[0] == 0) << 6
+    hl = hl + 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    return 16
+
+## OTIR, 0xEDB3
+def otir(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    R[0] = R[0] - 1 & 0xFF
+    port = R[1]
+    cpu.io.writers[port](port, ram[hl])
+    R[6] = R[6] & 1 | 2 | R[0] & 0xA8 | (R[0] == 0) << 6
+    hl = hl + 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    if R[0]:
+        regs.PC = regs.PC - 2 & 0xFFFF
+        return 21
+    return 16
+
+## OTIR, 0xEDB3, lazy flags
+def otir_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    R[0] = R[0] - 1 & 0xFF
+    port = R[1]
+    cpu.io.writers[port](port, ram[hl])
+    R[6] = FLAGS[R[6]] & 1 | 2 | R[0] & 0xA8 | (R[0] == 0) << 6
+    hl = hl + 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    if R[0]:
+        regs.PC = regs.PC - 2 & 0xFFFF
+        return 21
+    return 16
+
+## OUTD, 0xEDAB
+def outd(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    R[0] = R[0] - 1 & 0xFF
+    port = R[1]
+    cpu.io.writers[port](port, ram[hl])
+    R[6] = R[6] & 1 | 2 | R[0] & 0xA8 | (R[0] == 0) << 6
+    hl = hl - 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    return 16
+
+## OUTD, 0xEDAB, lazy flags
+def outd_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    R[0] = R[0] - 1 & 0xFF
+    port = R[1]
+    cpu.io.writers[port](port, ram[hl])
+    R[6] = FLAGS[R[6]] & 1 | 2 | R[0] & 0xA8 | (R[0] == 0) << 6
+    hl = hl - 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    return 16
+
+## OTDR, 0xEDBB
+def otdr(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    R[0] = R[0] - 1 & 0xFF
+    port = R[1]
+    cpu.io.writers[port](port, ram[hl])
+    R[6] = R[6] & 1 | 2 | R[0] & 0xA8 | (R[0] == 0) << 6
+    hl = hl - 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    if R[0]:
+        regs.PC = regs.PC - 2 & 0xFFFF
+        return 21
+    return 16
+
+## OTDR, 0xEDBB, lazy flags
+def otdr_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    regs.PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | regs.R + 1 & 0x7F
+    hl = R[4] << 8 | R[5]
+    R[0] = R[0] - 1 & 0xFF
+    port = R[1]
+    cpu.io.writers[port](port, ram[hl])
+    R[6] = FLAGS[R[6]] & 1 | 2 | R[0] & 0xA8 | (R[0] == 0) << 6
+    hl = hl - 1 & 0xFFFF
+    R[4] = hl >> 8
+    R[5] = hl & 0xFF
+    if R[0]:
+        regs.PC = regs.PC - 2 & 0xFFFF
+        return 21
+    return 16
+
+## LD r, (HL) + INC ss, 0x7E 0x23
+def ld_a_hl__inc_hl_23(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    R[7] = ram[R[4] << 8 | R[5]]
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    v = (R[4] << 8 | R[5]) + 1 & 0xFFFF
+    R[4] = v >> 8
+    R[5] = v & 0xFF
+    return 13
+
+## LD (HL), r + INC ss, 0x77 0x23
+def ld_hl_a__inc_hl_23(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    ram[R[4] << 8 | R[5]] = R[7]
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    v = (R[4] << 8 | R[5]) + 1 & 0xFFFF
+    R[4] = v >> 8
+    R[5] = v & 0xFF
+    return 13
+
+## LD A, (DE) + INC ss, 0x1A 0x13
+def ld_a_de__inc_de(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    R[7] = ram[R[2] << 8 | R[3]]
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    v = (R[2] << 8 | R[3]) + 1 & 0xFFFF
+    R[2] = v >> 8
+    R[3] = v & 0xFF
+    return 13
+
+## LD (DE), A + INC ss, 0x12 0x13
+def ld_de_a__inc_de(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    ram[R[2] << 8 | R[3]] = R[7]
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    v = (R[2] << 8 | R[3]) + 1 & 0xFFFF
+    R[2] = v >> 8
+    R[3] = v & 0xFF
+    return 13
+
+## OUT (n), A + INC ss, 0xD3 0x23
+def out_n_a__inc_hl_23(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    n = ram[PC + 1]
+    cpu.io.writers[n](n, R[7])
+    PC = (PC + 2) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    v = (R[4] << 8 | R[5]) + 1 & 0xFFFF
+    R[4] = v >> 8
+    R[5] = v & 0xFF
+    return 17
+
+## DEC r + JR NZ, e, 0x05 0x20
+def dec_b__jr_nz_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    res = R[0] - 1 & 0xFF
+    R[0] = res
+    R[6] = R[6] & 1 | DEC[res]
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    e = (ram[PC + 1] ^ 0x80) - 0x80
+    regs.PC = (PC + 2) & 0xFFFF
+    if not R[6] & 0x40:
+        regs.PC = regs.PC + e & 0xFFFF
+        return 16
+    return 11
+
+## DEC r + JR NZ, e, 0x05 0x20, lazy flags
+def dec_b__jr_nz_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    res = R[0] - 1 & 0xFF
+    R[0] = res
+    R[6] = FLAGS[R[6]] & 1 | DEC[res]
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    e = (ram[PC + 1] ^ 0x80) - 0x80
+    regs.PC = (PC + 2) & 0xFFFF
+    if not FLAGS[R[6]] & 0x40:
+        regs.PC = regs.PC + e & 0xFFFF
+        return 16
+    return 11
+
+## DEC r + JR NZ, e, 0x0D 0x20
+def dec_c__jr_nz_e(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    res = R[1] - 1 & 0xFF
+    R[1] = res
+    R[6] = R[6] & 1 | DEC[res]
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    e = (ram[PC + 1] ^ 0x80) - 0x80
+    regs.PC = (PC + 2) & 0xFFFF
+    if not R[6] & 0x40:
+        regs.PC = regs.PC + e & 0xFFFF
+        return 16
+    return 11
+
+## DEC r + JR NZ, e, 0x0D 0x20, lazy flags
+def dec_c__jr_nz_e_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    res = R[1] - 1 & 0xFF
+    R[1] = res
+    R[6] = FLAGS[R[6]] & 1 | DEC[res]
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    e = (ram[PC + 1] ^ 0x80) - 0x80
+    regs.PC = (PC + 2) & 0xFFFF
+    if not FLAGS[R[6]] & 0x40:
+        regs.PC = regs.PC + e & 0xFFFF
+        return 16
+    return 11
+
+## DEC ss + LD r, r' + OR r, 0x0B 0x78 0xB1
+def dec_bc__ld_a_b__or_c(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    v = (R[0] << 8 | R[1]) - 1 & 0xFFFF
+    R[0] = v >> 8
+    R[1] = v & 0xFF
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    R[7] = R[0]
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[1]
+    res = a | v
+    R[7] = res
+    R[6] = SZP[res]
+    return 14
+
+## DEC ss + LD r, r' + OR r, 0x0B 0x78 0xB1, lazy flags
+def dec_bc__ld_a_b__or_c_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    v = (R[0] << 8 | R[1]) - 1 & 0xFFFF
+    R[0] = v >> 8
+    R[1] = v & 0xFF
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    R[7] = R[0]
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    a = R[7]
+    v = R[1]
+    res = a | v
+    R[7] = res
+    R[6] = LAZY_SZP | res
+    return 14
+
+## PUSH qq + POP qq, 0xC5 0xC1
+def push_bc__pop_bc(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    hi, lo = (R[0], R[1])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[0], R[1] = (hi, lo)
+    return 21
+
+## PUSH qq + POP qq, 0xC5 0xD1
+def push_bc__pop_de(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    hi, lo = (R[0], R[1])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[2], R[3] = (hi, lo)
+    return 21
+
+## PUSH qq + POP qq, 0xC5 0xE1
+def push_bc__pop_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    hi, lo = (R[0], R[1])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[4], R[5] = (hi, lo)
+    return 21
+
+## PUSH qq + POP qq, 0xC5 0xF1
+def push_bc__pop_af(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    hi, lo = (R[0], R[1])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[7], R[6] = (hi, lo)
+    return 21
+
+## PUSH qq + POP qq, 0xD5 0xC1
+def push_de__pop_bc(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    hi, lo = (R[2], R[3])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[0], R[1] = (hi, lo)
+    return 21
+
+## PUSH qq + POP qq, 0xD5 0xD1
+def push_de__pop_de(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    hi, lo = (R[2], R[3])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[2], R[3] = (hi, lo)
+    return 21
+
+## PUSH qq + POP qq, 0xD5 0xE1
+def push_de__pop_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    hi, lo = (R[2], R[3])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[4], R[5] = (hi, lo)
+    return 21
+
+## PUSH qq + POP qq, 0xD5 0xF1
+def push_de__pop_af(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    hi, lo = (R[2], R[3])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[7], R[6] = (hi, lo)
+    return 21
+
+## PUSH qq + POP qq, 0xE5 0xC1
+def push_hl__pop_bc(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    hi, lo = (R[4], R[5])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[0], R[1] = (hi, lo)
+    return 21
+
+## PUSH qq + POP qq, 0xE5 0xD1
+def push_hl__pop_de(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    hi, lo = (R[4], R[5])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[2], R[3] = (hi, lo)
+    return 21
+
+## PUSH qq + POP qq, 0xE5 0xE1
+def push_hl__pop_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    hi, lo = (R[4], R[5])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[4], R[5] = (hi, lo)
+    return 21
+
+## PUSH qq + POP qq, 0xE5 0xF1
+def push_hl__pop_af(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    hi, lo = (R[4], R[5])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[7], R[6] = (hi, lo)
+    return 21
+
+## PUSH qq + POP qq, 0xF5 0xC1
+def push_af__pop_bc(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    hi, lo = (R[7], R[6])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[0], R[1] = (hi, lo)
+    return 21
+
+## PUSH qq + POP qq, 0xF5 0xC1, lazy flags
+def push_af__pop_bc_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    hi, lo = (R[7], FLAGS[R[6]])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[0], R[1] = (hi, lo)
+    return 21
+
+## PUSH qq + POP qq, 0xF5 0xD1
+def push_af__pop_de(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    hi, lo = (R[7], R[6])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[2], R[3] = (hi, lo)
+    return 21
+
+## PUSH qq + POP qq, 0xF5 0xD1, lazy flags
+def push_af__pop_de_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    hi, lo = (R[7], FLAGS[R[6]])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[2], R[3] = (hi, lo)
+    return 21
+
+## PUSH qq + POP qq, 0xF5 0xE1
+def push_af__pop_hl(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    hi, lo = (R[7], R[6])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[4], R[5] = (hi, lo)
+    return 21
+
+## PUSH qq + POP qq, 0xF5 0xE1, lazy flags
+def push_af__pop_hl_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    hi, lo = (R[7], FLAGS[R[6]])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[4], R[5] = (hi, lo)
+    return 21
+
+## PUSH qq + POP qq, 0xF5 0xF1
+def push_af__pop_af(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    hi, lo = (R[7], R[6])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[7], R[6] = (hi, lo)
+    return 21
+
+## PUSH qq + POP qq, 0xF5 0xF1, lazy flags
+def push_af__pop_af_lazy(cpu, PC: int) -> int:
+    regs = cpu.registers
+    R = regs.r
+    ram = cpu.ram
+    hi, lo = (R[7], FLAGS[R[6]])
+    sp = regs.SP - 1 & 0xFFFF
+    ram[sp] = hi
+    sp = sp - 1 & 0xFFFF
+    ram[sp] = lo
+    regs.SP = sp
+    PC = (PC + 1) & 0xFFFF
+    regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+    regs.PC = (PC + 1) & 0xFFFF
+    sp = regs.SP
+    lo = ram[sp]
+    hi = ram[sp + 1 & 0xFFFF]
+    regs.SP = sp + 2 & 0xFFFF
+    R[7], R[6] = (hi, lo)
+    return 21
+
+
+
+BASE =\
+[
+    nop,             ld_bc_nn,        ld_bc_a,         inc_bc,	## 0x00
+    inc_b,           dec_b,           ld_b_n,          rlca,	## 0x04
+    ex_af_afprime,   add_hl_bc,       ld_a_bc,         dec_bc,	## 0x08
+    inc_c,           dec_c,           ld_c_n,          rrca,	## 0x0C
+    djnz_e,          ld_de_nn,        ld_de_a,         inc_de,	## 0x10
+    inc_d,           dec_d,           ld_d_n,          rla,	## 0x14
+    jr_e,            add_hl_de,       ld_a_de,         dec_de,	## 0x18
+    inc_e,           dec_e,           ld_e_n,          rra,	## 0x1C
+    jr_nz_e,         ld_hl_nn,        ld_at_nn_hl,     inc_hl_23,	## 0x20
+    inc_h,           dec_h,           ld_h_n,          daa,	## 0x24
+    jr_z_e,          add_hl_hl,       ld_hl_at_nn,     dec_hl_2b,	## 0x28
+    inc_l,           dec_l,           ld_l_n,          cpl,	## 0x2C
+    jr_nc_e,         ld_sp_nn,        ld_at_nn_a,      inc_sp,	## 0x30
+    inc_hl,          dec_hl,          ld_hl_n,         scf,	## 0x34
+    jr_c_e,          add_hl_sp,       ld_a_at_nn,      dec_sp,	## 0x38
+    inc_a,           dec_a,           ld_a_n,          ccf,	## 0x3C
+    ld_b_b,          ld_b_c,          ld_b_d,          ld_b_e,	## 0x40
+    ld_b_h,          ld_b_l,          ld_b_hl,         ld_b_a,	## 0x44
+    ld_c_b,          ld_c_c,          ld_c_d,          ld_c_e,	## 0x48
+    ld_c_h,          ld_c_l,          ld_c_hl,         ld_c_a,	## 0x4C
+    ld_d_b,          ld_d_c,          ld_d_d,          ld_d_e,	## 0x50
+    ld_d_h,          ld_d_l,          ld_d_hl,         ld_d_a,	## 0x54
+    ld_e_b,          ld_e_c,          ld_e_d,          ld_e_e,	## 0x58
+    ld_e_h,          ld_e_l,          ld_e_hl,         ld_e_a,	## 0x5C
+    ld_h_b,          ld_h_c,          ld_h_d,          ld_h_e,	## 0x60
+    ld_h_h,          ld_h_l,          ld_h_hl,         ld_h_a,	## 0x64
+    ld_l_b,          ld_l_c,          ld_l_d,          ld_l_e,	## 0x68
+    ld_l_h,          ld_l_l,          ld_l_hl,         ld_l_a,	## 0x6C
+    ld_hl_b,         ld_hl_c,         ld_hl_d,         ld_hl_e,	## 0x70
+    ld_hl_h,         ld_hl_l,         halt,            ld_hl_a,	## 0x74
+    ld_a_b,          ld_a_c,          ld_a_d,          ld_a_e,	## 0x78
+    ld_a_h,          ld_a_l,          ld_a_hl,         ld_a_a,	## 0x7C
+    add_a_b,         add_a_c,         add_a_d,         add_a_e,	## 0x80
+    add_a_h,         add_a_l,         add_a_hl,        add_a_a,	## 0x84
+    adc_a_b,         adc_a_c,         adc_a_d,         adc_a_e,	## 0x88
+    adc_a_h,         adc_a_l,         adc_a_hl,        adc_a_a,	## 0x8C
+    sub_b,           sub_c,           sub_d,           sub_e,	## 0x90
+    sub_h,           sub_l,           sub_hl,          sub_a,	## 0x94
+    sbc_b,           sbc_c,           sbc_d,           sbc_e,	## 0x98
+    sbc_h,           sbc_l,           sbc_hl,          sbc_a,	## 0x9C
+    and_b,           and_c,           and_d,           and_e,	## 0xA0
+    and_h,           and_l,           and_hl,          and_a,	## 0xA4
+    xor_b,           xor_c,           xor_d,           xor_e,	## 0xA8
+    xor_h,           xor_l,           xor_hl,          xor_a,	## 0xAC
+    or_b,            or_c,            or_d,            or_e,	## 0xB0
+    or_h,            or_l,            or_hl,           or_a,	## 0xB4
+    cp_b,            cp_c,            cp_d,            cp_e,	## 0xB8
+    cp_h,            cp_l,            cp_hl,           cp_a,	## 0xBC
+    ret_nz,          pop_bc,          jp_nz_nn,        jp_nn,	## 0xC0
+    call_nz_nn,      push_bc,         add_a_n,         rst_00h,	## 0xC4
+    ret_z,           ret,             jp_z_nn,         prefix_cb,	## 0xC8
+    call_z_nn,       call_nn,         adc_a_n,         rst_08h,	## 0xCC
+    ret_nc,          pop_de,          jp_nc_nn,        out_n_a,	## 0xD0
+    call_nc_nn,      push_de,         sub_n,           rst_10h,	## 0xD4
+    ret_c,           exx,             jp_c_nn,         in_a_n,	## 0xD8
+    call_c_nn,       prefix_dd,       sbc_n,           rst_18h,	## 0xDC
+    ret_po,          pop_hl,          jp_po_nn,        ex_sp_hl,	## 0xE0
+    call_po_nn,      push_hl,         and_n,           rst_20h,	## 0xE4
+    ret_pe,          jp_hl,           jp_pe_nn,        ex_de_hl,	## 0xE8
+    call_pe_nn,      prefix_ed,       xor_n,           rst_28h,	## 0xEC
+    ret_p,           pop_af,          jp_p_nn,         di,	## 0xF0
+    call_p_nn,       push_af,         or_n,            rst_30h,	## 0xF4
+    ret_m,           ld_sp_hl,        jp_m_nn,         ei,	## 0xF8
+    call_m_nn,       prefix_fd,       cp_n,            rst_38h,	## 0xFC
+]
+
+
+
+CB =\
+[
+    rlc_b,           rlc_c,           rlc_d,           rlc_e,	## 0x00
+    rlc_h,           rlc_l,           rlc_hl,          rlc_a,	## 0x04
+    rrc_b,           rrc_c,           rrc_d,           rrc_e,	## 0x08
+    rrc_h,           rrc_l,           rrc_hl,          rrc_a,	## 0x0C
+    rl_b,            rl_c,            rl_d,            rl_e,	## 0x10
+    rl_h,            rl_l,            rl_hl,           rl_a,	## 0x14
+    rr_b,            rr_c,            rr_d,            rr_e,	## 0x18
+    rr_h,            rr_l,            rr_hl,           rr_a,	## 0x1C
+    sla_b,           sla_c,           sla_d,           sla_e,	## 0x20
+    sla_h,           sla_l,           sla_hl,          sla_a,	## 0x24
+    sra_b,           sra_c,           sra_d,           sra_e,	## 0x28
+    sra_h,           sra_l,           sra_hl,          sra_a,	## 0x2C
+    sll_b,           sll_c,           sll_d,           sll_e,	## 0x30
+    sll_h,           sll_l,           sll_hl,          sll_a,	## 0x34
+    srl_b,           srl_c,           srl_d,           srl_e,	## 0x38
+    srl_h,           srl_l,           srl_hl,          srl_a,	## 0x3C
+    bit_0_b,         bit_0_c,         bit_0_d,         bit_0_e,	## 0x40
+    bit_0_h,         bit_0_l,         bit_0_hl,        bit_0_a,	## 0x44
+    bit_1_b,         bit_1_c,         bit_1_d,         bit_1_e,	## 0x48
+    bit_1_h,         bit_1_l,         bit_1_hl,        bit_1_a,	## 0x4C
+    bit_2_b,         bit_2_c,         bit_2_d,         bit_2_e,	## 0x50
+    bit_2_h,         bit_2_l,         bit_2_hl,        bit_2_a,	## 0x54
+    bit_3_b,         bit_3_c,         bit_3_d,         bit_3_e,	## 0x58
+    bit_3_h,         bit_3_l,         bit_3_hl,        bit_3_a,	## 0x5C
+    bit_4_b,         bit_4_c,         bit_4_d,         bit_4_e,	## 0x60
+    bit_4_h,         bit_4_l,         bit_4_hl,        bit_4_a,	## 0x64
+    bit_5_b,         bit_5_c,         bit_5_d,         bit_5_e,	## 0x68
+    bit_5_h,         bit_5_l,         bit_5_hl,        bit_5_a,	## 0x6C
+    bit_6_b,         bit_6_c,         bit_6_d,         bit_6_e,	## 0x70
+    bit_6_h,         bit_6_l,         bit_6_hl,        bit_6_a,	## 0x74
+    bit_7_b,         bit_7_c,         bit_7_d,         bit_7_e,	## 0x78
+    bit_7_h,         bit_7_l,         bit_7_hl,        bit_7_a,	## 0x7C
+    res_0_b,         res_0_c,         res_0_d,         res_0_e,	## 0x80
+    res_0_h,         res_0_l,         res_0_hl,        res_0_a,	## 0x84
+    res_1_b,         res_1_c,         res_1_d,         res_1_e,	## 0x88
+    res_1_h,         res_1_l,         res_1_hl,        res_1_a,	## 0x8C
+    res_2_b,         res_2_c,         res_2_d,         res_2_e,	## 0x90
+    res_2_h,         res_2_l,         res_2_hl,        res_2_a,	## 0x94
+    res_3_b,         res_3_c,         res_3_d,         res_3_e,	## 0x98
+    res_3_h,         res_3_l,         res_3_hl,        res_3_a,	## 0x9C
+    res_4_b,         res_4_c,         res_4_d,         res_4_e,	## 0xA0
+    res_4_h,         res_4_l,         res_4_hl,        res_4_a,	## 0xA4
+    res_5_b,         res_5_c,         res_5_d,         res_5_e,	## 0xA8
+    res_5_h,         res_5_l,         res_5_hl,        res_5_a,	## 0xAC
+    res_6_b,         res_6_c,         res_6_d,         res_6_e,	## 0xB0
+    res_6_h,         res_6_l,         res_6_hl,        res_6_a,	## 0xB4
+    res_7_b,         res_7_c,         res_7_d,         res_7_e,	## 0xB8
+    res_7_h,         res_7_l,         res_7_hl,        res_7_a,	## 0xBC
+    set_0_b,         set_0_c,         set_0_d,         set_0_e,	## 0xC0
+    set_0_h,         set_0_l,         set_0_hl,        set_0_a,	## 0xC4
+    set_1_b,         set_1_c,         set_1_d,         set_1_e,	## 0xC8
+    set_1_h,         set_1_l,         set_1_hl,        set_1_a,	## 0xCC
+    set_2_b,         set_2_c,         set_2_d,         set_2_e,	## 0xD0
+    set_2_h,         set_2_l,         set_2_hl,        set_2_a,	## 0xD4
+    set_3_b,         set_3_c,         set_3_d,         set_3_e,	## 0xD8
+    set_3_h,         set_3_l,         set_3_hl,        set_3_a,	## 0xDC
+    set_4_b,         set_4_c,         set_4_d,         set_4_e,	## 0xE0
+    set_4_h,         set_4_l,         set_4_hl,        set_4_a,	## 0xE4
+    set_5_b,         set_5_c,         set_5_d,         set_5_e,	## 0xE8
+    set_5_h,         set_5_l,         set_5_hl,        set_5_a,	## 0xEC
+    set_6_b,         set_6_c,         set_6_d,         set_6_e,	## 0xF0
+    set_6_h,         set_6_l,         set_6_hl,        set_6_a,	## 0xF4
+    set_7_b,         set_7_c,         set_7_d,         set_7_e,	## 0xF8
+    set_7_h,         set_7_l,         set_7_hl,        set_7_a,	## 0xFC
+]
+
+
+
+DD =\
+[
+    illegal,         illegal,         illegal,         illegal,	## 0x00
+    illegal,         illegal,         illegal,         illegal,	## 0x04
+    illegal,         add_ix_bc,       illegal,         illegal,	## 0x08
+    illegal,         illegal,         illegal,         illegal,	## 0x0C
+    illegal,         illegal,         illegal,         illegal,	## 0x10
+    illegal,         illegal,         illegal,         illegal,	## 0x14
+    illegal,         add_ix_de,       illegal,         illegal,	## 0x18
+    illegal,         illegal,         illegal,         illegal,	## 0x1C
+    illegal,         ld_ix_nn,        ld_at_nn_ix,     inc_ix,	## 0x20
+    illegal,         illegal,         illegal,         illegal,	## 0x24
+    illegal,         add_ix_ix,       ld_ix_at_nn,     dec_ix,	## 0x28
+    illegal,         illegal,         illegal,         illegal,	## 0x2C
+    illegal,         illegal,         illegal,         illegal,	## 0x30
+    inc_ixd,         dec_ixd,         ld_ixd_n,        illegal,	## 0x34
+    illegal,         add_ix_sp,       illegal,         illegal,	## 0x38
+    illegal,         illegal,         illegal,         illegal,	## 0x3C
+    illegal,         illegal,         illegal,         illegal,	## 0x40
+    illegal,         illegal,         ld_b_ixd,        illegal,	## 0x44
+    illegal,         illegal,         illegal,         illegal,	## 0x48
+    illegal,         illegal,         ld_c_ixd,        illegal,	## 0x4C
+    illegal,         illegal,         illegal,         illegal,	## 0x50
+    illegal,         illegal,         ld_d_ixd,        illegal,	## 0x54
+    illegal,         illegal,         illegal,         illegal,	## 0x58
+    illegal,         illegal,         ld_e_ixd,        illegal,	## 0x5C
+    illegal,         illegal,         illegal,         illegal,	## 0x60
+    illegal,         illegal,         ld_h_ixd,        illegal,	## 0x64
+    illegal,         illegal,         illegal,         illegal,	## 0x68
+    illegal,         illegal,         ld_l_ixd,        illegal,	## 0x6C
+    ld_ixd_b,        ld_ixd_c,        ld_ixd_d,        ld_ixd_e,	## 0x70
+    ld_ixd_h,        ld_ixd_l,        illegal,         ld_ixd_a,	## 0x74
+    illegal,         illegal,         illegal,         illegal,	## 0x78
+    illegal,         illegal,         ld_a_ixd,        illegal,	## 0x7C
+    illegal,         illegal,         illegal,         illegal,	## 0x80
+    illegal,         illegal,         add_a_ixd,       illegal,	## 0x84
+    illegal,         illegal,         illegal,         illegal,	## 0x88
+    illegal,         illegal,         adc_a_ixd,       illegal,	## 0x8C
+    illegal,         illegal,         illegal,         illegal,	## 0x90
+    illegal,         illegal,         sub_ixd,         illegal,	## 0x94
+    illegal,         illegal,         illegal,         illegal,	## 0x98
+    illegal,         illegal,         sbc_ixd,         illegal,	## 0x9C
+    illegal,         illegal,         illegal,         illegal,	## 0xA0
+    illegal,         illegal,         and_ixd,         illegal,	## 0xA4
+    illegal,         illegal,         illegal,         illegal,	## 0xA8
+    illegal,         illegal,         xor_ixd,         illegal,	## 0xAC
+    illegal,         illegal,         illegal,         illegal,	## 0xB0
+    illegal,         illegal,         or_ixd,          illegal,	## 0xB4
+    illegal,         illegal,         illegal,         illegal,	## 0xB8
+    illegal,         illegal,         cp_ixd,          illegal,	## 0xBC
+    illegal,         illegal,         illegal,         illegal,	## 0xC0
+    illegal,         illegal,         illegal,         illegal,	## 0xC4
+    illegal,         illegal,         illegal,         prefix_ddcb,	## 0xC8
+    illegal,         illegal,         illegal,         illegal,	## 0xCC
+    illegal,         illegal,         illegal,         illegal,	## 0xD0
+    illegal,         illegal,         illegal,         illegal,	## 0xD4
+    illegal,         illegal,         illegal,         illegal,	## 0xD8
+    illegal,         illegal,         illegal,         illegal,	## 0xDC
+    illegal,         pop_ix,          illegal,         ex_sp_ix,	## 0xE0
+    illegal,         push_ix,         illegal,         illegal,	## 0xE4
+    illegal,         jp_ix,           illegal,         illegal,	## 0xE8
+    illegal,         illegal,         illegal,         illegal,	## 0xEC
+    illegal,         illegal,         illegal,         illegal,	## 0xF0
+    illegal,         illegal,         illegal,         illegal,	## 0xF4
+    illegal,         ld_sp_ix,        illegal,         illegal,	## 0xF8
+    illegal,         illegal,         illegal,         illegal,	## 0xFC
+]
+
+
+
+DDCB =\
+[
+    illegal,         illegal,         illegal,         illegal,	## 0x00
+    illegal,         illegal,         rlc_ixd,         illegal,	## 0x04
+    illegal,         illegal,         illegal,         illegal,	## 0x08
+    illegal,         illegal,         rrc_ixd,         illegal,	## 0x0C
+    illegal,         illegal,         illegal,         illegal,	## 0x10
+    illegal,         illegal,         rl_ixd,          illegal,	## 0x14
+    illegal,         illegal,         illegal,         illegal,	## 0x18
+    illegal,         illegal,         rr_ixd,          illegal,	## 0x1C
+    illegal,         illegal,         illegal,         illegal,	## 0x20
+    illegal,         illegal,         sla_ixd,         illegal,	## 0x24
+    illegal,         illegal,         illegal,         illegal,	## 0x28
+    illegal,         illegal,         sra_ixd,         illegal,	## 0x2C
+    illegal,         illegal,         illegal,         illegal,	## 0x30
+    illegal,         illegal,         sll_ixd,         illegal,	## 0x34
+    illegal,         illegal,         illegal,         illegal,	## 0x38
+    illegal,         illegal,         srl_ixd,         illegal,	## 0x3C
+    illegal,         illegal,         illegal,         illegal,	## 0x40
+    illegal,         illegal,         bit_0_ixd,       illegal,	## 0x44
+    illegal,         illegal,         illegal,         illegal,	## 0x48
+    illegal,         illegal,         bit_1_ixd,       illegal,	## 0x4C
+    illegal,         illegal,         illegal,         illegal,	## 0x50
+    illegal,         illegal,         bit_2_ixd,       illegal,	## 0x54
+    illegal,         illegal,         illegal,         illegal,	## 0x58
+    illegal,         illegal,         bit_3_ixd,       illegal,	## 0x5C
+    illegal,         illegal,         illegal,         illegal,	## 0x60
+    illegal,         illegal,         bit_4_ixd,       illegal,	## 0x64
+    illegal,         illegal,         illegal,         illegal,	## 0x68
+    illegal,         illegal,         bit_5_ixd,       illegal,	## 0x6C
+    illegal,         illegal,         illegal,         illegal,	## 0x70
+    illegal,         illegal,         bit_6_ixd,       illegal,	## 0x74
+    illegal,         illegal,         illegal,         illegal,	## 0x78
+    illegal,         illegal,         bit_7_ixd,       illegal,	## 0x7C
+    illegal,         illegal,         illegal,         illegal,	## 0x80
+    illegal,         illegal,         res_0_ixd,       illegal,	## 0x84
+    illegal,         illegal,         illegal,         illegal,	## 0x88
+    illegal,         illegal,         res_1_ixd,       illegal,	## 0x8C
+    illegal,         illegal,         illegal,         illegal,	## 0x90
+    illegal,         illegal,         res_2_ixd,       illegal,	## 0x94
+    illegal,         illegal,         illegal,         illegal,	## 0x98
+    illegal,         illegal,         res_3_ixd,       illegal,	## 0x9C
+    illegal,         illegal,         illegal,         illegal,	## 0xA0
+    illegal,         illegal,         res_4_ixd,       illegal,	## 0xA4
+    illegal,         illegal,         illegal,         illegal,	## 0xA8
+    illegal,         illegal,         res_5_ixd,       illegal,	## 0xAC
+    illegal,         illegal,         illegal,         illegal,	## 0xB0
+    illegal,         illegal,         res_6_ixd,       illegal,	## 0xB4
+    illegal,         illegal,         illegal,         illegal,	## 0xB8
+    illegal,         illegal,         res_7_ixd,       illegal,	## 0xBC
+    illegal,         illegal,         illegal,         illegal,	## 0xC0
+    illegal,         illegal,         set_0_ixd,       illegal,	## 0xC4
+    illegal,         illegal,         illegal,         illegal,	## 0xC8
+    illegal,         illegal,         set_1_ixd,       illegal,	## 0xCC
+    illegal,         illegal,         illegal,         illegal,	## 0xD0
+    illegal,         illegal,         set_2_ixd,       illegal,	## 0xD4
+    illegal,         illegal,         illegal,         illegal,	## 0xD8
+    illegal,         illegal,         set_3_ixd,       illegal,	## 0xDC
+    illegal,         illegal,         illegal,         illegal,	## 0xE0
+    illegal,         illegal,         set_4_ixd,       illegal,	## 0xE4
+    illegal,         illegal,         illegal,         illegal,	## 0xE8
+    illegal,         illegal,         set_5_ixd,       illegal,	## 0xEC
+    illegal,         illegal,         illegal,         illegal,	## 0xF0
+    illegal,         illegal,         set_6_ixd,       illegal,	## 0xF4
+    illegal,         illegal,         illegal,         illegal,	## 0xF8
+    illegal,         illegal,         set_7_ixd,       illegal,	## 0xFC
+]
+
+
+
+ED =\
+[
+    illegal,         illegal,         illegal,         illegal,	## 0x00
+    illegal,         illegal,         illegal,         illegal,	## 0x04
+    illegal,         illegal,         illegal,         illegal,	## 0x08
+    illegal,         illegal,         illegal,         illegal,	## 0x0C
+    illegal,         illegal,         illegal,         illegal,	## 0x10
+    illegal,         illegal,         illegal,         illegal,	## 0x14
+    illegal,         illegal,         illegal,         illegal,	## 0x18
+    illegal,         illegal,         illegal,         illegal,	## 0x1C
+    illegal,         illegal,         illegal,         illegal,	## 0x20
+    illegal,         illegal,         illegal,         illegal,	## 0x24
+    illegal,         illegal,         illegal,         illegal,	## 0x28
+    illegal,         illegal,         illegal,         illegal,	## 0x2C
+    illegal,         illegal,         illegal,         illegal,	## 0x30
+    illegal,         illegal,         illegal,         illegal,	## 0x34
+    illegal,         illegal,         illegal,         illegal,	## 0x38
+    illegal,         illegal,         illegal,         illegal,	## 0x3C
+    in_b_c,          out_c_b,         sbc_hl_bc,       ld_at_nn_bc,	## 0x40
+    neg,             retn,            im_0,            ld_i_a,	## 0x44
+    in_c_c,          out_c_c,         adc_hl_bc,       ld_bc_at_nn,	## 0x48
+    neg_ed4c,        reti,            im_0_ed4e,       ld_r_a,	## 0x4C
+    in_d_c,          out_c_d,         sbc_hl_de,       ld_at_nn_de,	## 0x50
+    neg_ed54,        retn_ed55,       im_1,            ld_a_i,	## 0x54
+    in_e_c,          out_c_e,         adc_hl_de,       ld_de_at_nn,	## 0x58
+    neg_ed5c,        retn_ed5d,       im_2,            ld_a_r,	## 0x5C
+    in_h_c,          out_c_h,         sbc_hl_hl,       ld_at_nn_hl_ed63,	## 0x60
+    neg_ed64,        retn_ed65,       im_0_ed66,       rrd,	## 0x64
+    in_l_c,          out_c_l,         adc_hl_hl,       ld_hl_at_nn_ed6b,	## 0x68
+    neg_ed6c,        retn_ed6d,       im_0_ed6e,       rld,	## 0x6C
+    illegal,         illegal,         sbc_hl_sp,       ld_at_nn_sp,	## 0x70
+    neg_ed74,        retn_ed75,       im_1_ed76,       illegal,	## 0x74
+    in_a_c,          out_c_a,         adc_hl_sp,       ld_sp_at_nn,	## 0x78
+    neg_ed7c,        retn_ed7d,       im_2_ed7e,       illegal,	## 0x7C
+    illegal,         illegal,         illegal,         illegal,	## 0x80
+    illegal,         illegal,         illegal,         illegal,	## 0x84
+    illegal,         illegal,         illegal,         illegal,	## 0x88
+    illegal,         illegal,         illegal,         illegal,	## 0x8C
+    illegal,         illegal,         illegal,         illegal,	## 0x90
+    illegal,         illegal,         illegal,         illegal,	## 0x94
+    illegal,         illegal,         illegal,         illegal,	## 0x98
+    illegal,         illegal,         illegal,         illegal,	## 0x9C
+    ldi,             cpi,             ini,             outi,	## 0xA0
+    illegal,         illegal,         illegal,         illegal,	## 0xA4
+    ldd,             cpd,             ind,             outd,	## 0xA8
+    illegal,         illegal,         illegal,         illegal,	## 0xAC
+    ldir,            cpir,            inir,            otir,	## 0xB0
+    illegal,         illegal,         illegal,         illegal,	## 0xB4
+    lddr,            cpdr,            indr,            otdr,	## 0xB8
+    illegal,         illegal,         illegal,         illegal,	## 0xBC
+    illegal,         illegal,         illegal,         illegal,	## 0xC0
+    illegal,         illegal,         illegal,         illegal,	## 0xC4
+    illegal,         illegal,         illegal,         illegal,	## 0xC8
+    illegal,         illegal,         illegal,         illegal,	## 0xCC
+    illegal,         illegal,         illegal,         illegal,	## 0xD0
+    illegal,         illegal,         illegal,         illegal,	## 0xD4
+    illegal,         illegal,         illegal,         illegal,	## 0xD8
+    illegal,         illegal,         illegal,         illegal,	## 0xDC
+    illegal,         illegal,         illegal,         illegal,	## 0xE0
+    illegal,         illegal,         illegal,         illegal,	## 0xE4
+    illegal,         illegal,         illegal,         illegal,	## 0xE8
+    illegal,         illegal,         illegal,         illegal,	## 0xEC
+    illegal,         illegal,         illegal,         illegal,	## 0xF0
+    illegal,         illegal,         illegal,         illegal,	## 0xF4
+    illegal,         illegal,         illegal,         illegal,	## 0xF8
+    illegal,         illegal,         illegal,         illegal,	## 0xFC
+]
+
+
+
+FD =\
+[
+    illegal,         illegal,         illegal,         illegal,	## 0x00
+    illegal,         illegal,         illegal,         illegal,	## 0x04
+    illegal,         add_iy_bc,       illegal,         illegal,	## 0x08
+    illegal,         illegal,         illegal,         illegal,	## 0x0C
+    illegal,         illegal,         illegal,         illegal,	## 0x10
+    illegal,         illegal,         illegal,         illegal,	## 0x14
+    illegal,         add_iy_de,       illegal,         illegal,	## 0x18
+    illegal,         illegal,         illegal,         illegal,	## 0x1C
+    illegal,         ld_iy_nn,        ld_at_nn_iy,     inc_iy,	## 0x20
+    illegal,         illegal,         illegal,         illegal,	## 0x24
+    illegal,         add_iy_iy,       ld_iy_at_nn,     dec_iy,	## 0x28
+    illegal,         illegal,         illegal,         illegal,	## 0x2C
+    illegal,         illegal,         illegal,         illegal,	## 0x30
+    inc_iyd,         dec_iyd,         ld_iyd_n,        illegal,	## 0x34
+    illegal,         add_iy_sp,       illegal,         illegal,	## 0x38
+    illegal,         illegal,         illegal,         illegal,	## 0x3C
+    illegal,         illegal,         illegal,         illegal,	## 0x40
+    illegal,         illegal,         ld_b_iyd,        illegal,	## 0x44
+    illegal,         illegal,         illegal,         illegal,	## 0x48
+    illegal,         illegal,         ld_c_iyd,        illegal,	## 0x4C
+    illegal,         illegal,         illegal,         illegal,	## 0x50
+    illegal,         illegal,         ld_d_iyd,        illegal,	## 0x54
+    illegal,         illegal,         illegal,         illegal,	## 0x58
+    illegal,         illegal,         ld_e_iyd,        illegal,	## 0x5C
+    illegal,         illegal,         illegal,         illegal,	## 0x60
+    illegal,         illegal,         ld_h_iyd,        illegal,	## 0x64
+    illegal,         illegal,         illegal,         illegal,	## 0x68
+    illegal,         illegal,         ld_l_iyd,        illegal,	## 0x6C
+    ld_iyd_b,        ld_iyd_c,        ld_iyd_d,        ld_iyd_e,	## 0x70
+    ld_iyd_h,        ld_iyd_l,        illegal,         ld_iyd_a,	## 0x74
+    illegal,         illegal,         illegal,         illegal,	## 0x78
+    illegal,         illegal,         ld_a_iyd,        illegal,	## 0x7C
+    illegal,         illegal,         illegal,         illegal,	## 0x80
+    illegal,         illegal,         add_a_iyd,       illegal,	## 0x84
+    illegal,         illegal,         illegal,         illegal,	## 0x88
+    illegal,         illegal,         adc_a_iyd,       illegal,	## 0x8C
+    illegal,         illegal,         illegal,         illegal,	## 0x90
+    illegal,         illegal,         sub_iyd,         illegal,	## 0x94
+    illegal,         illegal,         illegal,         illegal,	## 0x98
+    illegal,         illegal,         sbc_iyd,         illegal,	## 0x9C
+    illegal,         illegal,         illegal,         illegal,	## 0xA0
+    illegal,         illegal,         and_iyd,         illegal,	## 0xA4
+    illegal,         illegal,         illegal,         illegal,	## 0xA8
+    illegal,         illegal,         xor_iyd,         illegal,	## 0xAC
+    illegal,         illegal,         illegal,         illegal,	## 0xB0
+    illegal,         illegal,         or_iyd,          illegal,	## 0xB4
+    illegal,         illegal,         illegal,         illegal,	## 0xB8
+    illegal,         illegal,         cp_iyd,          illegal,	## 0xBC
+    illegal,         illegal,         illegal,         illegal,	## 0xC0
+    illegal,         illegal,         illegal,         illegal,	## 0xC4
+    illegal,         illegal,         illegal,         prefix_fdcb,	## 0xC8
+    illegal,         illegal,         illegal,         illegal,	## 0xCC
+    illegal,         illegal,         illegal,         illegal,	## 0xD0
+    illegal,         illegal,         illegal,         illegal,	## 0xD4
+    illegal,         illegal,         illegal,         illegal,	## 0xD8
+    illegal,         illegal,         illegal,         illegal,	## 0xDC
+    illegal,         pop_iy,          illegal,         ex_sp_iy,	## 0xE0
+    illegal,         push_iy,         illegal,         illegal,	## 0xE4
+    illegal,         jp_iy,           illegal,         illegal,	## 0xE8
+    illegal,         illegal,         illegal,         illegal,	## 0xEC
+    illegal,         illegal,         illegal,         illegal,	## 0xF0
+    illegal,         illegal,         illegal,         illegal,	## 0xF4
+    illegal,         ld_sp_iy,        illegal,         illegal,	## 0xF8
+    illegal,         illegal,         illegal,         illegal,	## 0xFC
+]
+
+
+
+FDCB =\
+[
+    illegal,         illegal,         illegal,         illegal,	## 0x00
+    illegal,         illegal,         rlc_iyd,         illegal,	## 0x04
+    illegal,         illegal,         illegal,         illegal,	## 0x08
+    illegal,         illegal,         rrc_iyd,         illegal,	## 0x0C
+    illegal,         illegal,         illegal,         illegal,	## 0x10
+    illegal,         illegal,         rl_iyd,          illegal,	## 0x14
+    illegal,         illegal,         illegal,         illegal,	## 0x18
+    illegal,         illegal,         rr_iyd,          illegal,	## 0x1C
+    illegal,         illegal,         illegal,         illegal,	## 0x20
+    illegal,         illegal,         sla_iyd,         illegal,	## 0x24
+    illegal,         illegal,         illegal,         illegal,	## 0x28
+    illegal,         illegal,         sra_iyd,         illegal,	## 0x2C
+    illegal,         illegal,         illegal,         illegal,	## 0x30
+    illegal,         illegal,         sll_iyd,         illegal,	## 0x34
+    illegal,         illegal,         illegal,         illegal,	## 0x38
+    illegal,         illegal,         srl_iyd,         illegal,	## 0x3C
+    illegal,         illegal,         illegal,         illegal,	## 0x40
+    illegal,         illegal,         bit_0_iyd,       illegal,	## 0x44
+    illegal,         illegal,         illegal,         illegal,	## 0x48
+    illegal,         illegal,         bit_1_iyd,       illegal,	## 0x4C
+    illegal,         illegal,         illegal,         illegal,	## 0x50
+    illegal,         illegal,         bit_2_iyd,       illegal,	## 0x54
+    illegal,         illegal,         illegal,         illegal,	## 0x58
+    illegal,         illegal,         bit_3_iyd,       illegal,	## 0x5C
+    illegal,         illegal,         illegal,         illegal,	## 0x60
+    illegal,         illegal,         bit_4_iyd,       illegal,	## 0x64
+    illegal,         illegal,         illegal,         illegal,	## 0x68
+    illegal,         illegal,         bit_5_iyd,       illegal,	## 0x6C
+    illegal,         illegal,         illegal,         illegal,	## 0x70
+    illegal,         illegal,         bit_6_iyd,       illegal,	## 0x74
+    illegal,         illegal,         illegal,         illegal,	## 0x78
+    illegal,         illegal,         bit_7_iyd,       illegal,	## 0x7C
+    illegal,         illegal,         illegal,         illegal,	## 0x80
+    illegal,         illegal,         res_0_iyd,       illegal,	## 0x84
+    illegal,         illegal,         illegal,         illegal,	## 0x88
+    illegal,         illegal,         res_1_iyd,       illegal,	## 0x8C
+    illegal,         illegal,         illegal,         illegal,	## 0x90
+    illegal,         illegal,         res_2_iyd,       illegal,	## 0x94
+    illegal,         illegal,         illegal,         illegal,	## 0x98
+    illegal,         illegal,         res_3_iyd,       illegal,	## 0x9C
+    illegal,         illegal,         illegal,         illegal,	## 0xA0
+    illegal,         illegal,         res_4_iyd,       illegal,	## 0xA4
+    illegal,         illegal,         illegal,         illegal,	## 0xA8
+    illegal,         illegal,         res_5_iyd,       illegal,	## 0xAC
+    illegal,         illegal,         illegal,         illegal,	## 0xB0
+    illegal,         illegal,         res_6_iyd,       illegal,	## 0xB4
+    illegal,         illegal,         illegal,         illegal,	## 0xB8
+    illegal,         illegal,         res_7_iyd,       illegal,	## 0xBC
+    illegal,         illegal,         illegal,         illegal,	## 0xC0
+    illegal,         illegal,         set_0_iyd,       illegal,	## 0xC4
+    illegal,         illegal,         illegal,         illegal,	## 0xC8
+    illegal,         illegal,         set_1_iyd,       illegal,	## 0xCC
+    illegal,         illegal,         illegal,         illegal,	## 0xD0
+    illegal,         illegal,         set_2_iyd,       illegal,	## 0xD4
+    illegal,         illegal,         illegal,         illegal,	## 0xD8
+    illegal,         illegal,         set_3_iyd,       illegal,	## 0xDC
+    illegal,         illegal,         illegal,         illegal,	## 0xE0
+    illegal,         illegal,         set_4_iyd,       illegal,	## 0xE4
+    illegal,         illegal,         illegal,         illegal,	## 0xE8
+    illegal,         illegal,         set_5_iyd,       illegal,	## 0xEC
+    illegal,         illegal,         illegal,         illegal,	## 0xF0
+    illegal,         illegal,         set_6_iyd,       illegal,	## 0xF4
+    illegal,         illegal,         illegal,         illegal,	## 0xF8
+    illegal,         illegal,         set_7_iyd,       illegal,	## 0xFC
+]
+
+
+
+## Lazy flags, see z80.flags.
+LAZY =\
+{
+    prefix_cb: prefix_cb_lazy,
+    prefix_dd: prefix_dd_lazy,
+    prefix_ed: prefix_ed_lazy,
+    prefix_fd: prefix_fd_lazy,
+    prefix_ddcb: prefix_ddcb_lazy,
+    prefix_fdcb: prefix_fdcb_lazy,
+    ld_a_i: ld_a_i_lazy,
+    ld_a_r: ld_a_r_lazy,
+    push_af: push_af_lazy,
+    ex_af_afprime: ex_af_afprime_lazy,
+    ldi: ldi_lazy,
+    ldir: ldir_lazy,
+    ldd: ldd_lazy,
+    lddr: lddr_lazy,
+    cpi: cpi_lazy,
+    cpir: cpir_lazy,
+    cpd: cpd_lazy,
+    cpdr: cpdr_lazy,
+    add_a_b: add_a_b_lazy,
+    add_a_c: add_a_c_lazy,
+    add_a_d: add_a_d_lazy,
+    add_a_e: add_a_e_lazy,
+    add_a_h: add_a_h_lazy,
+    add_a_l: add_a_l_lazy,
+    add_a_a: add_a_a_lazy,
+    add_a_n: add_a_n_lazy,
+    add_a_hl: add_a_hl_lazy,
+    add_a_ixd: add_a_ixd_lazy,
+    add_a_iyd: add_a_iyd_lazy,
+    adc_a_b: adc_a_b_lazy,
+    adc_a_c: adc_a_c_lazy,
+    adc_a_d: adc_a_d_lazy,
+    adc_a_e: adc_a_e_lazy,
+    adc_a_h: adc_a_h_lazy,
+    adc_a_l: adc_a_l_lazy,
+    adc_a_a: adc_a_a_lazy,
+    adc_a_n: adc_a_n_lazy,
+    adc_a_hl: adc_a_hl_lazy,
+    adc_a_ixd: adc_a_ixd_lazy,
+    adc_a_iyd: adc_a_iyd_lazy,
+    sub_b: sub_b_lazy,
+    sub_c: sub_c_lazy,
+    sub_d: sub_d_lazy,
+    sub_e: sub_e_lazy,
+    sub_h: sub_h_lazy,
+    sub_l: sub_l_lazy,
+    sub_a: sub_a_lazy,
+    sub_n: sub_n_lazy,
+    sub_hl: sub_hl_lazy,
+    sub_ixd: sub_ixd_lazy,
+    sub_iyd: sub_iyd_lazy,
+    sbc_b: sbc_b_lazy,
+    sbc_c: sbc_c_lazy,
+    sbc_d: sbc_d_lazy,
+    sbc_e: sbc_e_lazy,
+    sbc_h: sbc_h_lazy,
+    sbc_l: sbc_l_lazy,
+    sbc_a: sbc_a_lazy,
+    sbc_n: sbc_n_lazy,
+    sbc_hl: sbc_hl_lazy,
+    sbc_ixd: sbc_ixd_lazy,
+    sbc_iyd: sbc_iyd_lazy,
+    and_b: and_b_lazy,
+    and_c: and_c_lazy,
+    and_d: and_d_lazy,
+    and_e: and_e_lazy,
+    and_h: and_h_lazy,
+    and_l: and_l_lazy,
+    and_a: and_a_lazy,
+    and_n: and_n_lazy,
+    and_hl: and_hl_lazy,
+    and_ixd: and_ixd_lazy,
+    and_iyd: and_iyd_lazy,
+    or_b: or_b_lazy,
+    or_c: or_c_lazy,
+    or_d: or_d_lazy,
+    or_e: or_e_lazy,
+    or_h: or_h_lazy,
+    or_l: or_l_lazy,
+    or_a: or_a_lazy,
+    or_n: or_n_lazy,
+    or_hl: or_hl_lazy,
+    or_ixd: or_ixd_lazy,
+    or_iyd: or_iyd_lazy,
+    xor_b: xor_b_lazy,
+    xor_c: xor_c_lazy,
+    xor_d: xor_d_lazy,
+    xor_e: xor_e_lazy,
+    xor_h: xor_h_lazy,
+    xor_l: xor_l_lazy,
+    xor_a: xor_a_lazy,
+    xor_n: xor_n_lazy,
+    xor_hl: xor_hl_lazy,
+    xor_ixd: xor_ixd_lazy,
+    xor_iyd: xor_iyd_lazy,
+    cp_b: cp_b_lazy,
+    cp_c: cp_c_lazy,
+    cp_d: cp_d_lazy,
+    cp_e: cp_e_lazy,
+    cp_h: cp_h_lazy,
+    cp_l: cp_l_lazy,
+    cp_a: cp_a_lazy,
+    cp_n: cp_n_lazy,
+    cp_hl: cp_hl_lazy,
+    cp_ixd: cp_ixd_lazy,
+    cp_iyd: cp_iyd_lazy,
+    inc_b: inc_b_lazy,
+    inc_c: inc_c_lazy,
+    inc_d: inc_d_lazy,
+    inc_e: inc_e_lazy,
+    inc_h: inc_h_lazy,
+    inc_l: inc_l_lazy,
+    inc_a: inc_a_lazy,
+    inc_hl: inc_hl_lazy,
+    inc_ixd: inc_ixd_lazy,
+    inc_iyd: inc_iyd_lazy,
+    dec_b: dec_b_lazy,
+    dec_c: dec_c_lazy,
+    dec_d: dec_d_lazy,
+    dec_e: dec_e_lazy,
+    dec_h: dec_h_lazy,
+    dec_l: dec_l_lazy,
+    dec_a: dec_a_lazy,
+    dec_hl: dec_hl_lazy,
+    dec_ixd: dec_ixd_lazy,
+    dec_iyd: dec_iyd_lazy,
+    daa: daa_lazy,
+    cpl: cpl_lazy,
+    neg: neg_lazy,
+    neg_ed4c: neg_ed4c_lazy,
+    neg_ed54: neg_ed54_lazy,
+    neg_ed5c: neg_ed5c_lazy,
+    neg_ed64: neg_ed64_lazy,
+    neg_ed6c: neg_ed6c_lazy,
+    neg_ed74: neg_ed74_lazy,
+    neg_ed7c: neg_ed7c_lazy,
+    ccf: ccf_lazy,
+    scf: scf_lazy,
+    add_hl_bc: add_hl_bc_lazy,
+    add_hl_de: add_hl_de_lazy,
+    add_hl_hl: add_hl_hl_lazy,
+    add_hl_sp: add_hl_sp_lazy,
+    adc_hl_bc: adc_hl_bc_lazy,
+    adc_hl_de: adc_hl_de_lazy,
+    adc_hl_hl: adc_hl_hl_lazy,
+    adc_hl_sp: adc_hl_sp_lazy,
+    sbc_hl_bc: sbc_hl_bc_lazy,
+    sbc_hl_de: sbc_hl_de_lazy,
+    sbc_hl_hl: sbc_hl_hl_lazy,
+    sbc_hl_sp: sbc_hl_sp_lazy,
+    add_ix_bc: add_ix_bc_lazy,
+    add_ix_de: add_ix_de_lazy,
+    add_ix_ix: add_ix_ix_lazy,
+    add_ix_sp: add_ix_sp_lazy,
+    add_iy_bc: add_iy_bc_lazy,
+    add_iy_de: add_iy_de_lazy,
+    add_iy_iy: add_iy_iy_lazy,
+    add_iy_sp: add_iy_sp_lazy,
+    rlca: rlca_lazy,
+    rla: rla_lazy,
+    rrca: rrca_lazy,
+    rra: rra_lazy,
+    rlc_b: rlc_b_lazy,
+    rlc_c: rlc_c_lazy,
+    rlc_d: rlc_d_lazy,
+    rlc_e: rlc_e_lazy,
+    rlc_h: rlc_h_lazy,
+    rlc_l: rlc_l_lazy,
+    rlc_a: rlc_a_lazy,
+    rlc_hl: rlc_hl_lazy,
+    rlc_ixd: rlc_ixd_lazy,
+    rlc_iyd: rlc_iyd_lazy,
+    rrc_b: rrc_b_lazy,
+    rrc_c: rrc_c_lazy,
+    rrc_d: rrc_d_lazy,
+    rrc_e: rrc_e_lazy,
+    rrc_h: rrc_h_lazy,
+    rrc_l: rrc_l_lazy,
+    rrc_a: rrc_a_lazy,
+    rrc_hl: rrc_hl_lazy,
+    rrc_ixd: rrc_ixd_lazy,
+    rrc_iyd: rrc_iyd_lazy,
+    rl_b: rl_b_lazy,
+    rl_c: rl_c_lazy,
+    rl_d: rl_d_lazy,
+    rl_e: rl_e_lazy,
+    rl_h: rl_h_lazy,
+    rl_l: rl_l_lazy,
+    rl_a: rl_a_lazy,
+    rl_hl: rl_hl_lazy,
+    rl_ixd: rl_ixd_lazy,
+    rl_iyd: rl_iyd_lazy,
+    rr_b: rr_b_lazy,
+    rr_c: rr_c_lazy,
+    rr_d: rr_d_lazy,
+    rr_e: rr_e_lazy,
+    rr_h: rr_h_lazy,
+    rr_l: rr_l_lazy,
+    rr_a: rr_a_lazy,
+    rr_hl: rr_hl_lazy,
+    rr_ixd: rr_ixd_lazy,
+    rr_iyd: rr_iyd_lazy,
+    sla_b: sla_b_lazy,
+    sla_c: sla_c_lazy,
+    sla_d: sla_d_lazy,
+    sla_e: sla_e_lazy,
+    sla_h: sla_h_lazy,
+    sla_l: sla_l_lazy,
+    sla_a: sla_a_lazy,
+    sla_hl: sla_hl_lazy,
+    sla_ixd: sla_ixd_lazy,
+    sla_iyd: sla_iyd_lazy,
+    sra_b: sra_b_lazy,
+    sra_c: sra_c_lazy,
+    sra_d: sra_d_lazy,
+    sra_e: sra_e_lazy,
+    sra_h: sra_h_lazy,
+    sra_l: sra_l_lazy,
+    sra_a: sra_a_lazy,
+    sra_hl: sra_hl_lazy,
+    sra_ixd: sra_ixd_lazy,
+    sra_iyd: sra_iyd_lazy,
+    sll_b: sll_b_lazy,
+    sll_c: sll_c_lazy,
+    sll_d: sll_d_lazy,
+    sll_e: sll_e_lazy,
+    sll_h: sll_h_lazy,
+    sll_l: sll_l_lazy,
+    sll_a: sll_a_lazy,
+    sll_hl: sll_hl_lazy,
+    sll_ixd: sll_ixd_lazy,
+    sll_iyd: sll_iyd_lazy,
+    srl_b: srl_b_lazy,
+    srl_c: srl_c_lazy,
+    srl_d: srl_d_lazy,
+    srl_e: srl_e_lazy,
+    srl_h: srl_h_lazy,
+    srl_l: srl_l_lazy,
+    srl_a: srl_a_lazy,
+    srl_hl: srl_hl_lazy,
+    srl_ixd: srl_ixd_lazy,
+    srl_iyd: srl_iyd_lazy,
+    rld: rld_lazy,
+    rrd: rrd_lazy,
+    bit_0_b: bit_0_b_lazy,
+    bit_0_c: bit_0_c_lazy,
+    bit_0_d: bit_0_d_lazy,
+    bit_0_e: bit_0_e_lazy,
+    bit_0_h: bit_0_h_lazy,
+    bit_0_l: bit_0_l_lazy,
+    bit_0_a: bit_0_a_lazy,
+    bit_1_b: bit_1_b_lazy,
+    bit_1_c: bit_1_c_lazy,
+    bit_1_d: bit_1_d_lazy,
+    bit_1_e: bit_1_e_lazy,
+    bit_1_h: bit_1_h_lazy,
+    bit_1_l: bit_1_l_lazy,
+    bit_1_a: bit_1_a_lazy,
+    bit_2_b: bit_2_b_lazy,
+    bit_2_c: bit_2_c_lazy,
+    bit_2_d: bit_2_d_lazy,
+    bit_2_e: bit_2_e_lazy,
+    bit_2_h: bit_2_h_lazy,
+    bit_2_l: bit_2_l_lazy,
+    bit_2_a: bit_2_a_lazy,
+    bit_3_b: bit_3_b_lazy,
+    bit_3_c: bit_3_c_lazy,
+    bit_3_d: bit_3_d_lazy,
+    bit_3_e: bit_3_e_lazy,
+    bit_3_h: bit_3_h_lazy,
+    bit_3_l: bit_3_l_lazy,
+    bit_3_a: bit_3_a_lazy,
+    bit_4_b: bit_4_b_lazy,
+    bit_4_c: bit_4_c_lazy,
+    bit_4_d: bit_4_d_lazy,
+    bit_4_e: bit_4_e_lazy,
+    bit_4_h: bit_4_h_lazy,
+    bit_4_l: bit_4_l_lazy,
+    bit_4_a: bit_4_a_lazy,
+    bit_5_b: bit_5_b_lazy,
+    bit_5_c: bit_5_c_lazy,
+    bit_5_d: bit_5_d_lazy,
+    bit_5_e: bit_5_e_lazy,
+    bit_5_h: bit_5_h_lazy,
+    bit_5_l: bit_5_l_lazy,
+    bit_5_a: bit_5_a_lazy,
+    bit_6_b: bit_6_b_lazy,
+    bit_6_c: bit_6_c_lazy,
+    bit_6_d: bit_6_d_lazy,
+    bit_6_e: bit_6_e_lazy,
+    bit_6_h: bit_6_h_lazy,
+    bit_6_l: bit_6_l_lazy,
+    bit_6_a: bit_6_a_lazy,
+    bit_7_b: bit_7_b_lazy,
+    bit_7_c: bit_7_c_lazy,
+    bit_7_d: bit_7_d_lazy,
+    bit_7_e: bit_7_e_lazy,
+    bit_7_h: bit_7_h_lazy,
+    bit_7_l: bit_7_l_lazy,
+    bit_7_a: bit_7_a_lazy,
+    bit_0_hl: bit_0_hl_lazy,
+    bit_1_hl: bit_1_hl_lazy,
+    bit_2_hl: bit_2_hl_lazy,
+    bit_3_hl: bit_3_hl_lazy,
+    bit_4_hl: bit_4_hl_lazy,
+    bit_5_hl: bit_5_hl_lazy,
+    bit_6_hl: bit_6_hl_lazy,
+    bit_7_hl: bit_7_hl_lazy,
+    bit_0_ixd: bit_0_ixd_lazy,
+    bit_1_ixd: bit_1_ixd_lazy,
+    bit_2_ixd: bit_2_ixd_lazy,
+    bit_3_ixd: bit_3_ixd_lazy,
+    bit_4_ixd: bit_4_ixd_lazy,
+    bit_5_ixd: bit_5_ixd_lazy,
+    bit_6_ixd: bit_6_ixd_lazy,
+    bit_7_ixd: bit_7_ixd_lazy,
+    bit_0_iyd: bit_0_iyd_lazy,
+    bit_1_iyd: bit_1_iyd_lazy,
+    bit_2_iyd: bit_2_iyd_lazy,
+    bit_3_iyd: bit_3_iyd_lazy,
+    bit_4_iyd: bit_4_iyd_lazy,
+    bit_5_iyd: bit_5_iyd_lazy,
+    bit_6_iyd: bit_6_iyd_lazy,
+    bit_7_iyd: bit_7_iyd_lazy,
+    jp_nz_nn: jp_nz_nn_lazy,
+    jp_z_nn: jp_z_nn_lazy,
+    jp_nc_nn: jp_nc_nn_lazy,
+    jp_c_nn: jp_c_nn_lazy,
+    jp_po_nn: jp_po_nn_lazy,
+    jp_pe_nn: jp_pe_nn_lazy,
+    jp_p_nn: jp_p_nn_lazy,
+    jp_m_nn: jp_m_nn_lazy,
+    jr_c_e: jr_c_e_lazy,
+    jr_nc_e: jr_nc_e_lazy,
+    jr_z_e: jr_z_e_lazy,
+    jr_nz_e: jr_nz_e_lazy,
+    call_nz_nn: call_nz_nn_lazy,
+    call_z_nn: call_z_nn_lazy,
+    call_nc_nn: call_nc_nn_lazy,
+    call_c_nn: call_c_nn_lazy,
+    call_po_nn: call_po_nn_lazy,
+    call_pe_nn: call_pe_nn_lazy,
+    call_p_nn: call_p_nn_lazy,
+    call_m_nn: call_m_nn_lazy,
+    ret_nz: ret_nz_lazy,
+    ret_z: ret_z_lazy,
+    ret_nc: ret_nc_lazy,
+    ret_c: ret_c_lazy,
+    ret_po: ret_po_lazy,
+    ret_pe: ret_pe_lazy,
+    ret_p: ret_p_lazy,
+    ret_m: ret_m_lazy,
+    in_b_c: in_b_c_lazy,
+    in_c_c: in_c_c_lazy,
+    in_d_c: in_d_c_lazy,
+    in_e_c: in_e_c_lazy,
+    in_h_c: in_h_c_lazy,
+    in_l_c: in_l_c_lazy,
+    in_a_c: in_a_c_lazy,
+    ini: ini_lazy,
+    inir: inir_lazy,
+    ind: ind_lazy,
+    indr: indr_lazy,
+    outi: outi_lazy,
+    otir: otir_lazy,
+    outd: outd_lazy,
+    otdr: otdr_lazy,
+}
+
+LAZY_BASE = [ LAZY.get(handler, handler) for handler in BASE ]
+LAZY_CB = [ LAZY.get(handler, handler) for handler in CB ]
+LAZY_DD = [ LAZY.get(handler, handler) for handler in DD ]
+LAZY_DDCB = [ LAZY.get(handler, handler) for handler in DDCB ]
+LAZY_ED = [ LAZY.get(handler, handler) for handler in ED ]
+LAZY_FD = [ LAZY.get(handler, handler) for handler in FD ]
+LAZY_FDCB = [ LAZY.get(handler, handler) for handler in FDCB ]
+
+
+
+FUSED =\
+{
+    0x05: [ (((1, 0x20),), dec_b__jr_nz_e) ],
+    0x0B: [ (((1, 0x78), (2, 0xB1),), dec_bc__ld_a_b__or_c) ],
+    0x0D: [ (((1, 0x20),), dec_c__jr_nz_e) ],
+    0x12: [ (((1, 0x13),), ld_de_a__inc_de) ],
+    0x1A: [ (((1, 0x13),), ld_a_de__inc_de) ],
+    0x77: [ (((1, 0x23),), ld_hl_a__inc_hl_23) ],
+    0x7E: [ (((1, 0x23),), ld_a_hl__inc_hl_23) ],
+    0xC5: [ (((1, 0xC1),), push_bc__pop_bc), (((1, 0xD1),), push_bc__pop_de), (((1, 0xE1),), push_bc__pop_hl), (((1, 0xF1),), push_bc__pop_af) ],
+    0xD3: [ (((2, 0x23),), out_n_a__inc_hl_23) ],
+    0xD5: [ (((1, 0xC1),), push_de__pop_bc), (((1, 0xD1),), push_de__pop_de), (((1, 0xE1),), push_de__pop_hl), (((1, 0xF1),), push_de__pop_af) ],
+    0xE5: [ (((1, 0xC1),), push_hl__pop_bc), (((1, 0xD1),), push_hl__pop_de), (((1, 0xE1),), push_hl__pop_hl), (((1, 0xF1),), push_hl__pop_af) ],
+    0xF5: [ (((1, 0xC1),), push_af__pop_bc), (((1, 0xD1),), push_af__pop_de), (((1, 0xE1),), push_af__pop_hl), (((1, 0xF1),), push_af__pop_af) ],
+}
+
+
+
+LAZY_FUSED =\
+{
+    0x05: [ (((1, 0x20),), dec_b__jr_nz_e_lazy) ],
+    0x0B: [ (((1, 0x78), (2, 0xB1),), dec_bc__ld_a_b__or_c_lazy) ],
+    0x0D: [ (((1, 0x20),), dec_c__jr_nz_e_lazy) ],
+    0x12: [ (((1, 0x13),), ld_de_a__inc_de) ],
+    0x1A: [ (((1, 0x13),), ld_a_de__inc_de) ],
+    0x77: [ (((1, 0x23),), ld_hl_a__inc_hl_23) ],
+    0x7E: [ (((1, 0x23),), ld_a_hl__inc_hl_23) ],
+    0xC5: [ (((1, 0xC1),), push_bc__pop_bc), (((1, 0xD1),), push_bc__pop_de), (((1, 0xE1),), push_bc__pop_hl), (((1, 0xF1),), push_bc__pop_af) ],
+    0xD3: [ (((2, 0x23),), out_n_a__inc_hl_23) ],
+    0xD5: [ (((1, 0xC1),), push_de__pop_bc), (((1, 0xD1),), push_de__pop_de), (((1, 0xE1),), push_de__pop_hl), (((1, 0xF1),), push_de__pop_af) ],
+    0xE5: [ (((1, 0xC1),), push_hl__pop_bc), (((1, 0xD1),), push_hl__pop_de), (((1, 0xE1),), push_hl__pop_hl), (((1, 0xF1),), push_hl__pop_af) ],
+    0xF5: [ (((1, 0xC1),), push_af__pop_bc_lazy), (((1, 0xD1),), push_af__pop_de_lazy), (((1, 0xE1),), push_af__pop_hl_lazy), (((1, 0xF1),), push_af__pop_af_lazy) ],
+}
+
+
+
+## The table of the opcodes after a prefix, and the offset of their byte.
+PREFIXES =\
+{
+    prefix_cb: (CB, 1),
+    prefix_dd: (DD, 1),
+    prefix_ed: (ED, 1),
+    prefix_fd: (FD, 1),
+    prefix_ddcb: (DDCB, 3),
+    prefix_fdcb: (FDCB, 3),
+    prefix_cb_lazy: (LAZY_CB, 1),
+    prefix_dd_lazy: (LAZY_DD, 1),
+    prefix_ed_lazy: (LAZY_ED, 1),
+    prefix_fd_lazy: (LAZY_FD, 1),
+    prefix_ddcb_lazy: (LAZY_DDCB, 3),
+    prefix_fdcb_lazy: (LAZY_FDCB, 3),
+}
+
+
+
+## Checks of the handlers: python3 -m z80.handlers [runs] [instructions]
+## runs every opcode (runs times, on random state) through its handler 
+## and through the execute() of its class, which must agree, and times
+## a loop run both ways.
+if __name__ == '__main__':
+    import random
+    import sys
+    import time
+    import z80
+
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    instructions = int(sys.argv[2]) if len(sys.argv) > 2 else 200000
+
+    def state(cpu: 'z80.Z80') -> tuple:
+        regs = cpu.registers
+        return (tuple(regs.r), tuple(regs.r_prime), regs.SP, regs.PC, regs.IX, regs.IY, regs.I, regs.R,
+            regs.IFF1, regs.IFF2, regs.IM, regs.halted, cpu.cycles)
+
+    handlers, classes = z80.Z80(), z80.Z80()
+    rnd = random.Random(0)
+    checked = 0
+    for prefix, table in ((0x00, BASE), (0xCB, CB), (0xDD, DD), (0xED, ED), (0xFD, FD), (0xDDCB, DDCB), (0xFDCB, FDCB)):
+        for opcode, handler in enumerate(table):
+            if handler is illegal or handler in PREFIXES:
+                continue
+            match prefix:
+                case 0x00:
+                    code = [ opcode ]
+                case 0xDDCB | 0xFDCB:
+                    code = [ prefix >> 8, 0xCB, rnd.randrange(0x100), opcode ]
+                case _:
+                    code = [ prefix, opcode ]
+            for run in range(runs):
+                image = rnd.randbytes(0x10000)
+                operands = rnd.randbytes(2)
+                r = list(rnd.randbytes(8))
+                words = [ rnd.randrange(0x10000) for _ in range(3) ]
+                for cpu in (handlers, classes):
+                    cpu.ram._ram[:] = image * 2
+                    cpu.ram._ram[0x4000:0x4000 + len(code) + 2] = bytes(code) + operands
+                    cpu.registers.r[:] = r
+                    cpu.registers.SP, cpu.registers.IX, cpu.registers.IY = words
+                    cpu.registers.PC = 0x4000
+                    cpu.cycles = 0
+                handlers.run(1)
+                classes.stepi()
+                if state(handlers) != state(classes) or handlers.ram._ram != classes.ram._ram:
+                    sys.exit(f'{handler.__name__}: {state(handlers)} != {state(classes)}')
+            checked += 1
+    print(f'{checked} opcodes, {runs} runs each: the handlers match execute().')
+
+    ## ADD A, B; INC HL; BIT 3, (IX+0); DJNZ in a loop.
+    loop = bytes([ 0x06, 0x00, 0x80, 0x23, 0xDD, 0xCB, 0x00, 0x5E, 0x10, 0xF8, 0x18, 0xF4 ])
+    for name, cpu, run in (
+        ('handlers', handlers, lambda: handlers.run(instructions)),
+        ('execute()', classes, lambda: [ classes.stepi() for _ in range(instructions) ]),
+    ):
+        cpu.ram._ram[0x4000:0x4000 + len(loop)] = loop
+        cpu.registers.PC = 0x4000
+        start = time.perf_counter()
+        run()
+        print(f'{name}: {instructions / (time.perf_counter() - start) / 1e6:.2f} MIPS')
+
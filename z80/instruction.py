@@ -1,81 +1,149 @@
 import abc
+import ast
 import collections
 import logging
 import re
+import string
 import sys
-from   typing import Self, Dict, List, Type
+import textwrap
+from   typing import Self, Callable, Dict, List, Optional, Tuple, Type
 import z80.ram
 import z80.registers
 
 
 
-class b(int):
-    def __str__(self: Self) -> str: return f'{int(self)}'
-class d(int):
-    def __str__(self: Self) -> str: return f'0{int(self):02x}h'
-class cc(str):
-    def __str__(self: Self) -> str: return self.lower()
-class dd(str):
-    def __str__(self: Self) -> str: return self.lower()
-class e(int):
-    def __str__(self: Self) -> str: return f'{2+int(self):+}'
-class jp(int):
-    def __str__(self: Self) -> str: return f'0{int(self):04x}h'
-class PC(int):
-    def __str__(self: Self) -> str: return f'{int(self):04x}'
-class p(int):
-    def __str__(self: Self) -> str: return f'{int(self):{"02x" if self >= 10 else ""}}{"h" if self >= 10 else ""}'
-class n(int):
-    def __str__(self: Self) -> str: return f'0{int(self):02x}h'
-class nn(int):
-    def __str__(self: Self) -> str: return f'0{int(self):04x}h'
-class pp(str):
-    def __str__(self: Self) -> str: return self.lower()
-class qq(str):
-    def __str__(self: Self) -> str: return self.lower()
-class r(str):
-    def __str__(self: Self) -> str: return self.lower()
-class rr(str):
-    def __str__(self: Self) -> str: return self.lower()
-class ss(str):
-    def __str__(self: Self) -> str: return self.lower()
+## How an instruction set (style) writes its operands.
+##
+## Operands that follow from the opcode (registers, conditions, bit numbers,
+## restart addresses) get a function that turns the value into text. They are
+## written into the template of every opcode once, when it is compiled.
+##
+## The other operands come from the bytes after the opcode and get a format
+## string with a single '{}'. They become format fields on the raw int, e.g.
+## n='0x{:02X}' turns '{n}' into '0x{0._n:02X}'. A format spec in the template
+## itself, like '{n:09_b}', overrides the style.
+##
+## '{nn.symbol}' and '{jump_destination.symbol}' are replaced by the name of
+## the destination in the symbol table passed to render(), if it has one.
+##
+## Instructions do not know where they are, so the program counter (and the 
+## registers, for comments showing their value) are passed to render() too.
+##
+## Rendering an instruction is then a single str.format() of its template. A
+## style is not changed after it is made, the compiled templates are cached 
+## per instruction class. Different Z80 (and Disasm) objects can use different
+## styles at the same time.
+class Style:
+    ## The str.format() argument behind a format field, see render(). Fields 
+    ## that are not listed here are read from the instruction attribute with 
+    ## the same name.
+    fields =\
+    {
+        'd'               : '0._d',
+        'e'               : '0.offset',
+        'n'               : '0._n',
+        'nn'              : '0._nn',
+        'PC'              : '1',
+        'jump_destination': '2',
+        'HL'              : '4.HL',
+    }
+    
+    ## Operands that are written like another one.
+    aliases =\
+    {
+        'rprime': 'r',
+    }
+    
+    def __init__(self: Self, **formats) -> None:
+        self.formats: Dict[str, Callable | str] = formats
+        self._templates: Dict[type, Dict[int, Tuple[str, Optional[str]]]] = {}
+    
+    def derive(self: Self, **formats) -> 'Style':
+        return Style(**(self.formats | formats))
+    
+    def format(self: Self, operand: str):
+        return self.formats.get(operand, self.formats.get(self.aliases.get(operand)))
+    
+    ## Returns the template for str.format(), whether it needs the jump
+    ## destination, and the field whose symbol is shown (None if none is).
+    def compile(self: Self, instruction_class: Type['Instruction'], opcode: int) -> Tuple[str, bool, Optional[str]]:
+        constants = instruction_class.constants(opcode)
+        output = []
+        symbol = None
+        relative = False
+        for literal, field, spec, conversion in string.Formatter().parse(instruction_class.template_for(opcode)):
+            output.append(_escape(literal))
+            if field is None:
+                continue
+            
+            if field.endswith('.symbol'):
+                symbol = field.removesuffix('.symbol')
+                relative |= symbol == 'jump_destination'
+                output.append('{3}')
+                continue
+            
+            if field in constants:
+                value = constants[field]
+                if spec:
+                    output.append(_escape(format(value, spec)))
+                else:
+                    output.append(_escape((self.format(field) or str)(value)))
+                continue
+            
+            argument = self.fields.get(field, f'0.{field}')
+            relative |= field == 'jump_destination'
+            if spec:
+                output.append(f'{{{argument}:{spec}}}')
+                continue
+            for literal, placeholder, spec, conversion in string.Formatter().parse(self.format(field) or '{}'):
+                output.append(_escape(literal))
+                if placeholder is not None:
+                    output.append(f'{{{argument}:{spec}}}' if spec else f'{{{argument}}}')
+        return ''.join(output), relative, symbol
+    
+    ## The compiled templates of an instruction class, by opcode.
+    def templates(self: Self, instruction_class: Type['Instruction']) -> Dict[int, Tuple[str, bool, Optional[str]]]:
+        try:
+            return self._templates[instruction_class]
+        except KeyError:
+            templates = { opcode: self.compile(instruction_class, opcode) for opcode in instruction_class.opcodes() }
+            self._templates[instruction_class] = templates
+            return templates
+    
+    ## The text of instr at address PC.
+    def render(self: Self, instr: 'Instruction', PC: int, symbols: Dict[int, str], registers: z80.registers.Registers) -> str:
+        try:
+            template, relative, symbol = self.templates(type(instr))[instr._opcode]
+        except KeyError:
+            ## Illegal opcodes have no template.
+            return str(instr)
+        jump_destination = instr.jump_destination(PC) if relative else None
+        name = None
+        if symbol is not None:
+            name = symbols.get(jump_destination if symbol == 'jump_destination' else instr._nn, '')
+        return template.format(instr, PC, jump_destination, name, registers)
 
-class FormattingType:
-    b  = b
-    cc = cc
-    d  = d
-    dd = dd
-    e  = e
-    jp = jp
-    n  = n
-    nn = nn
-    PC = PC
-    p  = p
-    pp = pp
-    qq = qq
-    r  = r
-    rr = rr
-    ss = ss
-    @classmethod
-    def set(cls, typename, formatting_type):
-        match typename:
-            case 'b' : cls.b  = formatting_type
-            case 'cc': cls.cc = formatting_type
-            case 'd' : cls.d  = formatting_type
-            case 'dd': cls.dd = formatting_type
-            case 'e' : cls.e  = formatting_type
-            case 'jp': cls.jp = formatting_type
-            case 'n' : cls.n  = formatting_type
-            case 'nn': cls.nn = formatting_type
-            case 'PC': cls.PC = formatting_type
-            case 'p' : cls.p  = formatting_type
-            case 'pp': cls.pp = formatting_type
-            case 'qq': cls.qq = formatting_type
-            case 'r' : cls.r  = formatting_type
-            case 'rr': cls.rr = formatting_type
-            case 'ss': cls.ss = formatting_type
-            case _:
-                raise ValueError(f"Unknown typename '{typename}'.")
+def _escape(text: str) -> str:
+    return text.replace('{', '{{').replace('}', '}}')
+
+## The style of z80.instructions.
+STYLE = Style(
+    b  = str,
+    cc = str.lower,
+    dd = str.lower,
+    p  = lambda p: f'{p:02x}h' if p >= 10 else f'{p}',
+    pp = str.lower,
+    qq = str.lower,
+    r  = str.lower,
+    rr = str.lower,
+    ss = str.lower,
+    d  = '0{:02x}h',
+    e  = '{:+}',
+    jump_destination = '0{:04x}h',
+    n  = '0{:02x}h',
+    nn = '0{:04x}h',
+    PC = '{:04x}',
+)
 
 class Instruction(abc.ABC):
     ## The Z80 has instruction classes in which the instruction can be used on a 
@@ -209,18 +277,74 @@ class Instruction(abc.ABC):
         super().__init_subclass__(**kwargs)
         cls.instruction_sets[cls.__module__].append(cls)
     
+    ## Operands encoded in the opcode, as name: (shift, mask).
+    opcode_fields: Dict[str, Tuple[int, int]] = {}
+    ## The text of the instruction, see Style.
+    template = ''
+    ## The style of the instruction set, used by str(). A Z80 renders with its
+    ## own style.
+    style = STYLE
+    styles: Dict[str, Style] = {}
+    
+    ## Instructions hold the opcode and the operands only, nothing that depends
+    ## on where (or when) they were decoded. They are not changed after
+    ## __init__(), so one object can stand for every occurrence of the same 
+    ## bytes (see Z80.decode_instruction()).
+    __slots__ = ('_opcode',)
+    
+    ## The values of the operands encoded in opcode, by name.
+    @classmethod
+    def constants(cls, opcode: int) -> Dict[str, int | str]:
+        constants = {}
+        for name, (shift, mask) in cls.opcode_fields.items():
+            value = (opcode >> shift) & mask
+            match name:
+                case 'b':
+                    constants['b'] = value
+                    constants['bmask'] = 1 << value
+                case 'cc':
+                    constants['cc'] = cls.cc2name[value]
+                case 'dd':
+                    constants['dd'] = cls.dd2name[value]
+                case 'pp':
+                    constants['pp'] = cls.pp2name[value]
+                case 'qq':
+                    constants['qq'] = cls.qq2name[value]
+                case 'r' | 'rprime':
+                    constants[name] = cls.r2name[value]
+                case 'rr':
+                    constants['rr'] = cls.rr2name[value]
+                case 'ss':
+                    constants['ss'] = cls.ss2name[value]
+                case 't':
+                    constants['t'] = value
+                    constants['p'] = cls.t2p[value]
+                case _:
+                    raise ValueError(f"Unknown opcode field '{name}'.")
+        return constants
+    
+    ## Instructions that read differently for some opcodes override this.
+    @classmethod
+    def template_for(cls, opcode: int) -> str:
+        return cls.template
+    
+    ## Make style the style of all instructions of an instruction set, and 
+    ## compile their templates. Called once, when the instruction set is
+    ## defined.
+    @classmethod
+    def compile_templates(cls, instruction_set: str, style: Style) -> None:
+        cls.styles[instruction_set] = style
+        for instruction_class in cls.instruction_sets[instruction_set]:
+            instruction_class.style = style
+            style.templates(instruction_class)
+    
+    ## The operands are read from ram, at the instruction starting at PC.
     def __init__(self: Self,
-        registers: z80.registers.Registers,
         ram: z80.ram.RAM,
+        PC: int,
         opcode: int,
     ) -> None:
-        self._registers = registers
-        self._ram = ram
         self._opcode = opcode
-        ## The program counter will change, and soon. We make a copy of the 
-        ## current value so we can inspect the program counter without having 
-        ## to hurry.
-        self._PC = PC(self._registers.PC)
     
     @property
     def opcode(self: Self) -> int: return self._opcode
@@ -233,11 +357,24 @@ class Instruction(abc.ABC):
     @abc.abstractmethod
     def size(self: Self) -> int: pass
     
-    @property
-    def PC(self: Self) -> int:
-        return FormattingType.PC(self._PC)
+    ## As if at address 0.
+    def __str__(self: Self) -> str:
+        return self.style.render(self, 0, {}, z80.registers.Registers())
+    
+    ## Run the instruction on cpu, a z80.Z80. PC already points to the next
+    ## instruction. Returns the T-states it took. The bodies are generated, 
+    ## see the table below.
+    def execute(self: Self, cpu) -> int:
+        raise NotImplementedError(self._opcode)
+    
+    ## The part of execute() a disassembler wants to follow, e.g. constants
+    ## loaded into registers. Nothing by default.
+    def trace(self: Self, cpu) -> None:
+        pass
 
 class Illegal(Instruction):
+    __slots__ = ()
+    
     @classmethod
     def opcodes(cls) -> List[int]:
         return []
@@ -270,6 +407,188 @@ if __name__ == '__main__':
     ss = range(4)
     t = range(8)
     
+    ## Semantics
+    ##
+    ## The 'execute' entry of an instruction is the body of its execute(). It
+    ## works on locals only: R (the 8 bit registers, indexed like the r operand,
+    ## see z80.registers), regs (the other registers), ram and the operands (r, 
+    ## n, nn, d, e, ...). The generator binds the ones a body uses. Note that 
+    ## PC already points to the next instruction.
+    ##
+    ## 'cycles' is the number of T-states, returned at the end of the body. 
+    ## Where a taken branch or a repeat takes longer, the body returns that
+    ## itself.
+    ##
+    ## Flags: S 0x80, Z 0x40, Y 0x20, H 0x10, X 0x08, P/V 0x04, N 0x02, C 0x01.
+    ## The 8 bit ALU operations read them from the tables in z80.flags (ADD,
+    ## SUB, CP, INC, DEC, DAA_AF and SZP), which the generated modules import.
+    FLAG_TABLES = [ 'ADD', 'CP', 'DAA_AF', 'DEC', 'INC', 'SUB', 'SZP' ]
+    
+    ## Sequences of (unprefixed) opcodes that get a fused handler in 
+    ## z80.handlers, see Z80(fuse=True): the inner loops of block copies,
+    ## VRAM writes and counters.
+    FUSIONS = [
+        (0x7E, 0x23),		## LD A, (HL); INC HL
+        (0x77, 0x23),		## LD (HL), A; INC HL
+        (0x1A, 0x13),		## LD A, (DE); INC DE
+        (0x12, 0x13),		## LD (DE), A; INC DE
+        (0xD3, 0x23),		## OUT (n), A; INC HL
+        (0x05, 0x20),		## DEC B; JR NZ, e
+        (0x0D, 0x20),		## DEC C; JR NZ, e
+        (0x0B, 0x78, 0xB1),	## DEC BC; LD A, B; OR C
+    ] + [
+        (0xC5 | qq << 4, 0xC1 | qq2 << 4) for qq in range(4) for qq2 in range(4)	## PUSH qq; POP qq'
+    ]
+    
+    ## Code setting address (if it is a memory operand), and the expression of
+    ## an 8 bit operand.
+    def operand(mode: str) -> Tuple[str, str]:
+        match mode:
+            case 'r' | 'rprime':
+                return '', f'R[{mode}]'
+            case 'n':
+                return '', 'n'
+            case '(HL)':
+                return 'address = R[4] << 8 | R[5]\n', 'ram[address]'
+            case '(IX+d)':
+                return 'address = (regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF\n', 'ram[address]'
+            case '(IY+d)':
+                return 'address = (regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF\n', 'ram[address]'
+        raise ValueError(f"Unknown operand mode '{mode}'.")
+    
+    ## ADD, ADC, SUB, SBC, AND, OR, XOR and CP on A and an 8 bit operand.
+    def alu(operation: str, mode: str) -> str:
+        setup, v = operand(mode)
+        code = setup + f'a = R[7]\nv = {v}\n'
+        match operation:
+            case 'ADD':
+                code += 'R[7] = (a + v) & 0xFF\nR[6] = ADD[a << 8 | v]\n'
+            case 'ADC':
+                code += 'c = R[6] & 0x01\nR[7] = (a + v + c) & 0xFF\nR[6] = ADD[c << 16 | a << 8 | v]\n'
+            case 'SUB':
+                code += 'R[7] = (a - v) & 0xFF\nR[6] = SUB[a << 8 | v]\n'
+            case 'SBC':
+                code += 'c = R[6] & 0x01\nR[7] = (a - v - c) & 0xFF\nR[6] = SUB[c << 16 | a << 8 | v]\n'
+            case 'CP':
+                code += 'R[6] = CP[a << 8 | v]\n'
+            case 'AND':
+                code += 'res = a & v\nR[7] = res\nR[6] = SZP[res] | 0x10\n'
+            case 'OR':
+                code += 'res = a | v\nR[7] = res\nR[6] = SZP[res]\n'
+            case 'XOR':
+                code += 'res = a ^ v\nR[7] = res\nR[6] = SZP[res]\n'
+        return code
+    
+    ## INC and DEC of an 8 bit operand, the carry is kept.
+    def inc_dec(operation: str, mode: str) -> str:
+        setup, v = operand(mode)
+        code = setup
+        if operation == 'INC':
+            code += f'res = ({v} + 1) & 0xFF\n'
+        else:
+            code += f'res = ({v} - 1) & 0xFF\n'
+        return code + f'{v} = res\nR[6] = R[6] & 0x01 | {operation}[res]\n'
+    
+    ## The CB rotates and shifts.
+    def shift(operation: str, mode: str) -> str:
+        setup, v = operand(mode)
+        code = setup + f'v = {v}\n'
+        match operation:
+            case 'RLC':
+                code += 'res = (v << 1 | v >> 7) & 0xFF\nc = v >> 7\n'
+            case 'RL':
+                code += 'res = (v << 1 | R[6] & 0x01) & 0xFF\nc = v >> 7\n'
+            case 'RR':
+                code += 'res = v >> 1 | (R[6] & 0x01) << 7\nc = v & 0x01\n'
+            case 'SLA':
+                code += 'res = (v << 1) & 0xFF\nc = v >> 7\n'
+            case 'RRC':
+                code += 'res = (v >> 1 | v << 7) & 0xFF\nc = v & 0x01\n'
+            case 'SRA':
+                code += 'res = v >> 1 | v & 0x80\nc = v & 0x01\n'
+            case 'SLL':
+                code += 'res = (v << 1 | 0x01) & 0xFF\nc = v >> 7\n'
+            case 'SRL':
+                code += 'res = v >> 1\nc = v & 0x01\n'
+        return code + f'{v} = res\nR[6] = SZP[res] | c\n'
+    
+    ## BIT b. Y and X come from the operand, or from the high byte of the 
+    ## address for memory operands.
+    def bit(mode: str) -> str:
+        setup, v = operand(mode)
+        yx = '(v & 0x28)' if mode == 'r' else '(address >> 8) & 0x28'
+        return setup + f'v = {v}\nres = v & (1 << b)\nR[6] = R[6] & 0x01 | 0x10 | (res & 0x80) | (res == 0) * 0x44 | {yx}\n'
+    
+    def set_bit(mode: str) -> str:
+        setup, v = operand(mode)
+        return setup + f'{v} = {v} | 1 << b\n'
+    
+    def reset_bit(mode: str) -> str:
+        setup, v = operand(mode)
+        return setup + f'{v} = {v} & (0xFF ^ 1 << b)\n'
+    
+    ## Whether condition cc holds: NZ, Z, NC, C, PO, PE, P, M.
+    CONDITION = 'bool(R[6] & (0x40, 0x01, 0x04, 0x80)[cc >> 1]) == (cc & 1)'
+    
+    ## Push the word hi, lo, resp. pop it into lo and hi.
+    def push(hi: str, lo: str) -> str:
+        return f'sp = (regs.SP - 1) & 0xFFFF\nram[sp] = {hi}\nsp = (sp - 1) & 0xFFFF\nram[sp] = {lo}\nregs.SP = sp\n'
+    POP = 'sp = regs.SP\nlo = ram[sp]\nhi = ram[(sp + 1) & 0xFFFF]\nregs.SP = (sp + 2) & 0xFFFF\n'
+    
+    ## A register pair operand, with 0b11 being SP (or AF for qq), and 0b10
+    ## being HL, IX or IY.
+    def pair(operand: str, pair2: str='HL', pair3: str='SP') -> str:
+        if pair2 == 'HL':
+            return f'(regs.{pair3} if {operand} == 3 else R[2 * {operand}] << 8 | R[2 * {operand} + 1])'
+        return f'(regs.{pair3} if {operand} == 3 else regs.{pair2} if {operand} == 2 else R[2 * {operand}] << 8 | R[2 * {operand} + 1])'
+    
+    def set_pair(operand: str, value: str) -> str:
+        return f'if {operand} == 3:\n    regs.SP = {value}\nelse:\n    R[2 * {operand}] = {value} >> 8\n    R[2 * {operand} + 1] = {value} & 0xFF\n'
+    
+    ## LDI, LDD, CPI, CPD, INI, IND, OUTI and OUTD, and their repeating forms,
+    ## which run again (PC - 2) until done. HL (and DE) step by '+' or '-' 1.
+    def block(operation: str, step: str, repeat: bool) -> str:
+        code = 'hl = R[4] << 8 | R[5]\n'
+        match operation:
+            case 'LD':
+                code += 'de = R[2] << 8 | R[3]\n'
+                code += 'bc = ((R[0] << 8 | R[1]) - 1) & 0xFFFF\n'
+                code += 'v = ram[hl]\n'
+                code += 'ram[de] = v\n'
+                code += f'de = (de {step} 1) & 0xFFFF\n'
+                code += 'R[2] = de >> 8\nR[3] = de & 0xFF\n'
+                code += 'n = v + R[7]\n'
+                code += 'R[6] = R[6] & 0xC1 | (bc != 0) << 2 | n & 0x08 | (n << 4) & 0x20\n'
+                done = 'bc'
+            case 'CP':
+                code += 'bc = ((R[0] << 8 | R[1]) - 1) & 0xFFFF\n'
+                code += 'a = R[7]\n'
+                code += 'v = ram[hl]\n'
+                code += 'res = (a - v) & 0xFF\n'
+                code += 'h = (a ^ v ^ res) & 0x10\n'
+                code += 'n = res - (h >> 4)\n'
+                code += 'R[6] = R[6] & 0x01 | 0x02 | (res & 0x80) | (res == 0) << 6 | h | (bc != 0) << 2 | n & 0x08 | (n << 4) & 0x20\n'
+                done = 'bc and res'
+            case 'IN':
+                code += 'port = R[1]\n'
+                code += 'ram[hl] = cpu.io.readers[port](port)\n'
+                code += 'R[0] = (R[0] - 1) & 0xFF\n'
+                code += 'R[6] = R[6] & 0x01 | 0x02 | (R[0] & 0xA8) | (R[0] == 0) << 6\n'
+                done = 'R[0]'
+            case 'OUT':
+                code += 'R[0] = (R[0] - 1) & 0xFF\n'
+                code += 'port = R[1]\n'
+                code += 'cpu.io.writers[port](port, ram[hl])\n'
+                code += 'R[6] = R[6] & 0x01 | 0x02 | (R[0] & 0xA8) | (R[0] == 0) << 6\n'
+                done = 'R[0]'
+        code += f'hl = (hl {step} 1) & 0xFFFF\n'
+        code += 'R[4] = hl >> 8\nR[5] = hl & 0xFF\n'
+        if 'bc' in code:
+            code += 'R[0] = bc >> 8\nR[1] = bc & 0xFF\n'
+        if repeat:
+            code += f'if {done}:\n    regs.PC = (regs.PC - 2) & 0xFFFF\n    return 21\n'
+        return code
+    
     ## Instruction are in the same order as "Z80 CPU User Manual" (um0080.pdf)
     instructions =\
     {
@@ -283,7 +602,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b01_000_000 | (i << 3) | (j << 0) ) for i in r for j in r ],
             'size': 1,
+            'cycles': 4,
             'operands': [ 'r3', 'rprime0' ],
+            'execute': 'R[r] = R[rprime]',
         },
         
         ## Page 72
@@ -291,7 +612,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b00_000_110 | (i << 3)) for i in r ],
             'size': 2,
+            'cycles': 7,
             'operands': [ 'r3', 'n' ],
+            'execute': 'R[r] = n',
         },
         
         ## Page 74
@@ -299,7 +622,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b01_000_110 | (i << 3)) for i in r ],
             'size': 1,
+            'cycles': 7,
             'operands': [ 'r3' ],
+            'execute': 'R[r] = ram[R[4] << 8 | R[5]]',
         },
         
         ## Page 75
@@ -307,7 +632,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0xDD00 | 0b01_000_110 | (i << 3)) for i in r ],
             'size': 3,
+            'cycles': 19,
             'operands': [ 'r3', 'd' ],
+            'execute': 'R[r] = ram[(regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF]',
         },
         
         ## Page 77
@@ -315,7 +642,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0xFD00 | 0b01_000_110 | (i << 3)) for i in r ],
             'size': 3,
+            'cycles': 19,
             'operands': [ 'r3', 'd' ],
+            'execute': 'R[r] = ram[(regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF]',
         },
         
         ## Page 79
@@ -323,7 +652,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b01110_000 | (i << 0)) for i in r ],
             'size': 1,
+            'cycles': 7,
             'operands': [ 'r0' ],
+            'execute': 'ram[R[4] << 8 | R[5]] = R[r]',
         },
         
         ## Page 81
@@ -331,7 +662,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0xDD00 | 0b01110_000 | (i << 0)) for i in r ],
             'size': 3,
+            'cycles': 19,
             'operands': [ 'd', 'r0' ],
+            'execute': 'ram[(regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF] = R[r]',
         },
         
         ## Page 83
@@ -339,7 +672,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0xFD00 | 0b01110_000 | (i << 0)) for i in r ],
             'size': 3,
+            'cycles': 19,
             'operands': [ 'd', 'r0' ],
+            'execute': 'ram[(regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF] = R[r]',
         },
         
         ## Page 85
@@ -347,7 +682,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x36 ],
             'size': 2,
+            'cycles': 10,
             'operands': [ 'n' ],
+            'execute': 'ram[R[4] << 8 | R[5]] = n',
         },
         
         ## Page 86
@@ -355,7 +692,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDD36 ],
             'size': 4,
+            'cycles': 19,
             'operands': [ 'd', 'n' ],
+            'execute': 'ram[(regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF] = n',
         },
         
         ## Page 87
@@ -363,7 +702,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFD36 ],
             'size': 4,
+            'cycles': 19,
             'operands': [ 'd', 'n' ],
+            'execute': 'ram[(regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF] = n',
         },
         
         ## Page 88
@@ -371,7 +712,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x0A ],
             'size': 1,
+            'cycles': 7,
             'operands': [],
+            'execute': 'R[7] = ram[R[0] << 8 | R[1]]',
         },
         
         ## Page 89
@@ -379,7 +722,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x1A ],
             'size': 1,
+            'cycles': 7,
             'operands': [],
+            'execute': 'R[7] = ram[R[2] << 8 | R[3]]',
         },
         
         ## Page 90
@@ -387,7 +732,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x3A ],
             'size': 3,
+            'cycles': 13,
             'operands': [ 'nn' ],
+            'execute': 'R[7] = ram[nn]',
         },
         
         ## Page 91
@@ -395,7 +742,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x02 ],
             'size': 1,
+            'cycles': 7,
             'operands': [],
+            'execute': 'ram[R[0] << 8 | R[1]] = R[7]',
         },
         
         ## Page 92
@@ -403,7 +752,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x12 ],
             'size': 1,
+            'cycles': 7,
             'operands': [],
+            'execute': 'ram[R[2] << 8 | R[3]] = R[7]',
         },
         
         ## Page 93
@@ -411,8 +762,10 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x32 ],
             'size': 3,
+            'cycles': 13,
             #'operands': [ 'nn', 'A' ],
             'operands': [ 'nn' ],
+            'execute': 'ram[nn] = R[7]',
         },
         
         ## Page 94
@@ -420,7 +773,12 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xED57 ],
             'size': 2,
+            'cycles': 9,
             'operands': [],
+            'execute': '''
+                R[7] = regs.I
+                R[6] = R[6] & 0x01 | (regs.I & 0xA8) | (regs.I == 0) << 6 | regs.IFF2 << 2
+            ''',
         },
         
         ## Page 95
@@ -428,7 +786,12 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xED5F ],
             'size': 2,
+            'cycles': 9,
             'operands': [],
+            'execute': '''
+                R[7] = regs.R
+                R[6] = R[6] & 0x01 | (regs.R & 0xA8) | (regs.R == 0) << 6 | regs.IFF2 << 2
+            ''',
         },
         
         ## Page 96
@@ -436,7 +799,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xED47 ],
             'size': 2,
+            'cycles': 9,
             'operands': [],
+            'execute': 'regs.I = R[7]',
         },
         
         ## Page 97
@@ -444,7 +809,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xED4F ],
             'size': 2,
+            'cycles': 9,
             'operands': [],
+            'execute': 'regs.R = R[7]',
         },
         
         
@@ -459,7 +826,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b00_00_0001 | (i << 4)) for i in dd ],
             'size': 3,
+            'cycles': 10,
             'operands': [ 'dd4', 'nn' ],
+            'execute': set_pair('dd', 'nn'),
         },
         
         ## Page 100
@@ -467,7 +836,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDD21 ],
             'size': 4,
+            'cycles': 14,
             'operands': [ 'nn' ],
+            'execute': 'regs.IX = nn',
         },
         
         ## Page 101
@@ -475,7 +846,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFD21 ],
             'size': 4,
+            'cycles': 14,
             'operands': [ 'nn' ],
+            'execute': 'regs.IY = nn',
         },
         
         ## Page 102
@@ -483,7 +856,12 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x2A ],
             'size': 3,
+            'cycles': 16,
             'operands': [ 'nn' ],
+            'execute': '''
+                R[5] = ram[nn]
+                R[4] = ram[(nn + 1) & 0xFFFF]
+            ''',
         },
         
         ## Page 103
@@ -491,7 +869,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0xED00 | 0b01_00_1011 | (i << 4)) for i in dd ],
             'size': 4,
+            'cycles': 20,
             'operands': [ 'dd4', 'nn' ],
+            'execute': 'v = ram[nn] | ram[(nn + 1) & 0xFFFF] << 8\n' + set_pair('dd', 'v'),
         },
         
         ## Page 105
@@ -499,7 +879,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDD2A ],
             'size': 4,
+            'cycles': 20,
             'operands': [ 'nn' ],
+            'execute': 'regs.IX = ram[nn] | ram[(nn + 1) & 0xFFFF] << 8',
         },
         
         ## Page 106
@@ -507,7 +889,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFD2A ],
             'size': 4,
+            'cycles': 20,
             'operands': [ 'nn' ],
+            'execute': 'regs.IY = ram[nn] | ram[(nn + 1) & 0xFFFF] << 8',
         },
         
         ## Page 107
@@ -515,7 +899,12 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x22 ],
             'size': 3,
+            'cycles': 16,
             'operands': [ 'nn' ],
+            'execute': '''
+                ram[nn] = R[5]
+                ram[(nn + 1) & 0xFFFF] = R[4]
+            ''',
         },
         
         ## Page 108
@@ -523,7 +912,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0xED00 | 0b01_00_0011 | (i << 4)) for i in dd ],
             'size': 4,
+            'cycles': 20,
             'operands': [ 'nn', 'dd4' ],
+            'execute': f'v = {pair("dd")}\nram[nn] = v & 0xFF\nram[(nn + 1) & 0xFFFF] = v >> 8\n',
         },
         
         ## Page 110
@@ -531,15 +922,25 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDD22 ],
             'size': 4,
+            'cycles': 20,
             'operands': [ 'nn' ],
+            'execute': '''
+                ram[nn] = regs.IX & 0xFF
+                ram[(nn + 1) & 0xFFFF] = regs.IX >> 8
+            ''',
         },
         
         ## Page 111
-        "LD (nn), IX":\
+        "LD (nn), IY":\
         {
             'opcodes': [ 0xFD22 ],
             'size': 4,
+            'cycles': 20,
             'operands': [ 'nn' ],
+            'execute': '''
+                ram[nn] = regs.IY & 0xFF
+                ram[(nn + 1) & 0xFFFF] = regs.IY >> 8
+            ''',
         },
         
         ## Page 112
@@ -547,23 +948,29 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xF9 ],
             'size': 1,
+            'cycles': 6,
             'operands': [],
+            'execute': 'regs.SP = R[4] << 8 | R[5]',
         },
         
         ## Page 113
         "LD SP, IX":\
         {
             'opcodes': [ 0xDDF9 ],
-            'size': 1,
+            'size': 2,
+            'cycles': 10,
             'operands': [],
+            'execute': 'regs.SP = regs.IX',
         },
         
         ## Page 114
         "LD SP, IY":\
         {
             'opcodes': [ 0xFDF9 ],
-            'size': 1,
+            'size': 2,
+            'cycles': 10,
             'operands': [],
+            'execute': 'regs.SP = regs.IY',
         },
         
         ## Page 115
@@ -571,7 +978,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b11_00_0101 | (i << 4)) for i in qq ],
             'size': 1,
+            'cycles': 11,
             'operands': [ 'qq4' ],
+            'execute': 'hi, lo = (R[7], R[6]) if qq == 3 else (R[2 * qq], R[2 * qq + 1])\n' + push('hi', 'lo'),
         },
         
         ## Page 117
@@ -579,7 +988,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDDE5 ],
             'size': 2,
+            'cycles': 15,
             'operands': [],
+            'execute': push('regs.IX >> 8', 'regs.IX & 0xFF'),
         },
         
         ## Page 118
@@ -587,7 +998,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFDE5 ],
             'size': 2,
+            'cycles': 15,
             'operands': [],
+            'execute': push('regs.IY >> 8', 'regs.IY & 0xFF'),
         },
         
         ## Page 119
@@ -595,7 +1008,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b11_00_0001 | (i << 4)) for i in qq ],
             'size': 1,
+            'cycles': 10,
             'operands': [ 'qq4' ],
+            'execute': POP + 'if qq == 3:\n    R[7], R[6] = hi, lo\nelse:\n    R[2 * qq], R[2 * qq + 1] = hi, lo\n',
         },
         
         ## Page 121
@@ -603,7 +1018,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDDE1 ],
             'size': 2,
+            'cycles': 14,
             'operands': [],
+            'execute': POP + 'regs.IX = hi << 8 | lo\n',
         },
         
         ## Page 121
@@ -611,7 +1028,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFDE1 ],
             'size': 2,
+            'cycles': 14,
             'operands': [],
+            'execute': POP + 'regs.IY = hi << 8 | lo\n',
         },
         
         
@@ -626,7 +1045,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xEB ],
             'size': 1,
+            'cycles': 4,
             'operands': [],
+            'execute': 'R[2], R[3], R[4], R[5] = R[4], R[5], R[2], R[3]',
         },
         
         ## Page 125
@@ -634,7 +1055,12 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x08 ],
             'size': 1,
+            'cycles': 4,
             'operands': [],
+            'execute': '''
+                P = regs.r_prime
+                R[6], R[7], P[6], P[7] = P[6], P[7], R[6], R[7]
+            ''',
         },
         
         ## Page 126
@@ -642,7 +1068,12 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xD9 ],
             'size': 1,
+            'cycles': 4,
             'operands': [],
+            'execute': '''
+                P = regs.r_prime
+                R[0:6], P[0:6] = P[0:6], R[0:6]
+            ''',
         },
         
         ## Page 127
@@ -650,7 +1081,14 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xE3 ],
             'size': 1,
+            'cycles': 19,
             'operands': [],
+            'execute': '''
+                sp = regs.SP
+                lo, hi = ram[sp], ram[(sp + 1) & 0xFFFF]
+                ram[sp], ram[(sp + 1) & 0xFFFF] = R[5], R[4]
+                R[5], R[4] = lo, hi
+            ''',
         },
         
         ## Page 128
@@ -658,7 +1096,14 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDDE3 ],
             'size': 2,
+            'cycles': 23,
             'operands': [],
+            'execute': '''
+                sp = regs.SP
+                lo, hi = ram[sp], ram[(sp + 1) & 0xFFFF]
+                ram[sp], ram[(sp + 1) & 0xFFFF] = regs.IX & 0xFF, regs.IX >> 8
+                regs.IX = hi << 8 | lo
+            ''',
         },
         
         ## Page 129
@@ -666,7 +1111,14 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFDE3 ],
             'size': 2,
+            'cycles': 23,
             'operands': [],
+            'execute': '''
+                sp = regs.SP
+                lo, hi = ram[sp], ram[(sp + 1) & 0xFFFF]
+                ram[sp], ram[(sp + 1) & 0xFFFF] = regs.IY & 0xFF, regs.IY >> 8
+                regs.IY = hi << 8 | lo
+            ''',
         },
         
         ## Page 130
@@ -674,7 +1126,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xEDA0 ],
             'size': 2,
+            'cycles': 16,
             'operands': [],
+            'execute': block('LD', '+', False),
         },
         
         ## Page 132
@@ -682,7 +1136,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xEDB0 ],
             'size': 2,
+            'cycles': 16,
             'operands': [],
+            'execute': block('LD', '+', True),
         },
         
         ## Page 134
@@ -690,7 +1146,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xEDA8 ],
             'size': 2,
+            'cycles': 16,
             'operands': [],
+            'execute': block('LD', '-', False),
         },
         
         ## Page 136
@@ -698,7 +1156,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xEDB8 ],
             'size': 2,
+            'cycles': 16,
             'operands': [],
+            'execute': block('LD', '-', True),
         },
         
         ## Page 138
@@ -706,15 +1166,19 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xEDA1 ],
             'size': 2,
+            'cycles': 16,
             'operands': [],
+            'execute': block('CP', '+', False),
         },
         
         ## Page 139
         "CPIR":\
         {
-            'opcodes': [ 0xED81 ],
+            'opcodes': [ 0xEDB1 ],
             'size': 2,
+            'cycles': 16,
             'operands': [],
+            'execute': block('CP', '+', True),
         },
         
         ## Page 141
@@ -722,7 +1186,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xEDA9 ],
             'size': 2,
+            'cycles': 16,
             'operands': [],
+            'execute': block('CP', '-', False),
         },
         
         ## Page 142
@@ -730,7 +1196,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xEDB9 ],
             'size': 2,
+            'cycles': 16,
             'operands': [],
+            'execute': block('CP', '-', True),
         },
         
         
@@ -745,7 +1213,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b10000_000 | (i << 0)) for i in r ],
             'size': 1,
+            'cycles': 4,
             'operands': [ 'r0' ],
+            'execute': alu('ADD', 'r'),
         },
         
         ## Page 147
@@ -753,7 +1223,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xC6 ],
             'size': 2,
+            'cycles': 7,
             'operands': [ 'n' ],
+            'execute': alu('ADD', 'n'),
         },
         
         ## Page 148
@@ -761,7 +1233,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x86 ],
             'size': 1,
+            'cycles': 7,
             'operands': [],
+            'execute': alu('ADD', '(HL)'),
         },
         
         ## Page 149
@@ -769,7 +1243,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDD86 ],
             'size': 3,
+            'cycles': 19,
             'operands': [ 'd' ],
+            'execute': alu('ADD', '(IX+d)'),
         },
         
         ## Page 150
@@ -777,7 +1253,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFD86 ],
             'size': 3,
+            'cycles': 19,
             'operands': [ 'd' ],
+            'execute': alu('ADD', '(IY+d)'),
         },
         
         
@@ -787,7 +1265,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b10001_000 | (i << 0)) for i in r ],
             'size': 1,
+            'cycles': 4,
             'operands': [ 'r0' ],
+            'execute': alu('ADC', 'r'),
         },
         
         ## Page 151
@@ -795,7 +1275,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xCE ],
             'size': 2,
+            'cycles': 7,
             'operands': [ 'n' ],
+            'execute': alu('ADC', 'n'),
         },
         
         ## Page 151
@@ -803,7 +1285,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x8E ],
             'size': 1,
+            'cycles': 7,
             'operands': [],
+            'execute': alu('ADC', '(HL)'),
         },
         
         ## Page 151
@@ -811,7 +1295,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDD8E ],
             'size': 3,
+            'cycles': 19,
             'operands': [ 'd' ],
+            'execute': alu('ADC', '(IX+d)'),
         },
         
         ## Page 151
@@ -819,7 +1305,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFD8E ],
             'size': 3,
+            'cycles': 19,
             'operands': [ 'd' ],
+            'execute': alu('ADC', '(IY+d)'),
         },
         
         
@@ -829,7 +1317,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b10010_000 | (i << 0)) for i in r ],
             'size': 1,
+            'cycles': 4,
             'operands': [ 'r0' ],
+            'execute': alu('SUB', 'r'),
         },
         
         ## Page 153
@@ -837,7 +1327,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xD6 ],
             'size': 2,
+            'cycles': 7,
             'operands': [ 'n' ],
+            'execute': alu('SUB', 'n'),
         },
         
         ## Page 153
@@ -845,7 +1337,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x96 ],
             'size': 1,
+            'cycles': 7,
             'operands': [],
+            'execute': alu('SUB', '(HL)'),
         },
         
         ## Page 153
@@ -853,7 +1347,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDD96 ],
             'size': 3,
+            'cycles': 19,
             'operands': [ 'd' ],
+            'execute': alu('SUB', '(IX+d)'),
         },
         
         ## Page 153
@@ -861,7 +1357,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFD96 ],
             'size': 3,
+            'cycles': 19,
             'operands': [ 'd' ],
+            'execute': alu('SUB', '(IY+d)'),
         },
         
         
@@ -871,7 +1369,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b10011_000 | (i << 0)) for i in r ],
             'size': 1,
+            'cycles': 4,
             'operands': [ 'r0' ],
+            'execute': alu('SBC', 'r'),
         },
         
         ## Page 155
@@ -879,7 +1379,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDE ],
             'size': 2,
+            'cycles': 7,
             'operands': [ 'n' ],
+            'execute': alu('SBC', 'n'),
         },
         
         ## Page 155
@@ -887,7 +1389,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x9E ],
             'size': 1,
+            'cycles': 7,
             'operands': [],
+            'execute': alu('SBC', '(HL)'),
         },
         
         ## Page 155
@@ -895,7 +1399,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDD9E ],
             'size': 3,
+            'cycles': 19,
             'operands': [ 'd' ],
+            'execute': alu('SBC', '(IX+d)'),
         },
         
         ## Page 155
@@ -903,7 +1409,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFD9E ],
             'size': 3,
+            'cycles': 19,
             'operands': [ 'd' ],
+            'execute': alu('SBC', '(IY+d)'),
         },
         
         
@@ -913,7 +1421,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b10100_000 | (i << 0)) for i in r ],
             'size': 1,
+            'cycles': 4,
             'operands': [ 'r0' ],
+            'execute': alu('AND', 'r'),
         },
         
         ## Page 157
@@ -921,7 +1431,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xE6 ],
             'size': 2,
+            'cycles': 7,
             'operands': [ 'n' ],
+            'execute': alu('AND', 'n'),
         },
         
         ## Page 157
@@ -929,7 +1441,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xA6 ],
             'size': 1,
+            'cycles': 7,
             'operands': [],
+            'execute': alu('AND', '(HL)'),
         },
         
         ## Page 157
@@ -937,7 +1451,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDDA6 ],
             'size': 3,
+            'cycles': 19,
             'operands': [ 'd' ],
+            'execute': alu('AND', '(IX+d)'),
         },
         
         ## Page 157
@@ -945,7 +1461,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFDA6 ],
             'size': 3,
+            'cycles': 19,
             'operands': [ 'd' ],
+            'execute': alu('AND', '(IY+d)'),
         },
         
         
@@ -955,7 +1473,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b10110_000 | (i << 0)) for i in r ],
             'size': 1,
+            'cycles': 4,
             'operands': [ 'r0' ],
+            'execute': alu('OR', 'r'),
         },
         
         ## Page 159
@@ -963,7 +1483,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xF6 ],
             'size': 2,
+            'cycles': 7,
             'operands': [ 'n' ],
+            'execute': alu('OR', 'n'),
         },
         
         ## Page 159
@@ -971,23 +1493,29 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xB6 ],
             'size': 1,
+            'cycles': 7,
             'operands': [],
+            'execute': alu('OR', '(HL)'),
         },
         
         ## Page 159
         "OR (IX+d)":\
         {
             'opcodes': [ 0xDDB6 ],
-            'size': 1,
+            'size': 3,
+            'cycles': 19,
             'operands': [ 'd' ],
+            'execute': alu('OR', '(IX+d)'),
         },
         
         ## Page 159
         "OR (IY+d)":\
         {
             'opcodes': [ 0xFDB6 ],
-            'size': 1,
+            'size': 3,
+            'cycles': 19,
             'operands': [ 'd' ],
+            'execute': alu('OR', '(IY+d)'),
         },
         
         
@@ -997,7 +1525,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b10101_000 | (i << 0)) for i in r ],
             'size': 1,
+            'cycles': 4,
             'operands': [ 'rprime0' ],
+            'execute': alu('XOR', 'rprime'),
         },
         
         ## Page 161
@@ -1005,7 +1535,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xEE ],
             'size': 2,
+            'cycles': 7,
             'operands': [ 'n' ],
+            'execute': alu('XOR', 'n'),
         },
         
         ## Page 161
@@ -1013,23 +1545,29 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xAE ],
             'size': 1,
+            'cycles': 7,
             'operands': [],
+            'execute': alu('XOR', '(HL)'),
         },
         
         ## Page 161
         "XOR (IX+d)":\
         {
             'opcodes': [ 0xDDAE ],
-            'size': 2,
+            'size': 3,
+            'cycles': 19,
             'operands': [ 'd' ],
+            'execute': alu('XOR', '(IX+d)'),
         },
         
         ## Page 161
         "XOR (IY+d)":\
         {
             'opcodes': [ 0xFDAE ],
-            'size': 2,
+            'size': 3,
+            'cycles': 19,
             'operands': [ 'd' ],
+            'execute': alu('XOR', '(IY+d)'),
         },
         
         
@@ -1039,7 +1577,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b10111_000 | (i << 0)) for i in r ],
             'size': 1,
+            'cycles': 4,
             'operands': [ 'r0' ],
+            'execute': alu('CP', 'r'),
         },
         
         ## Page 163
@@ -1047,7 +1587,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFE ],
             'size': 2,
+            'cycles': 7,
             'operands': [ 'n' ],
+            'execute': alu('CP', 'n'),
         },
         
         ## Page 163
@@ -1055,7 +1597,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xBE ],
             'size': 1,
+            'cycles': 7,
             'operands': [],
+            'execute': alu('CP', '(HL)'),
         },
         
         ## Page 163
@@ -1063,7 +1607,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDDBE ],
             'size': 3,
+            'cycles': 19,
             'operands': [ 'd' ],
+            'execute': alu('CP', '(IX+d)'),
         },
         
         ## Page 163
@@ -1071,7 +1617,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFDBE ],
             'size': 3,
+            'cycles': 19,
             'operands': [ 'd' ],
+            'execute': alu('CP', '(IY+d)'),
         },
         
         
@@ -1081,7 +1629,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b00_000_100 | (i << 3)) for i in r],
             'size': 1,
+            'cycles': 4,
             'operands': [ 'r3' ],
+            'execute': inc_dec('INC', 'r'),
         },
         
         ## Page 167
@@ -1089,7 +1639,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x34 ],
             'size': 1,
+            'cycles': 11,
             'operands': [],
+            'execute': inc_dec('INC', '(HL)'),
         },
         
         ## Page 168
@@ -1097,7 +1649,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDD34 ],
             'size': 3,
+            'cycles': 23,
             'operands': [ 'd' ],
+            'execute': inc_dec('INC', '(IX+d)'),
         },
         
         ## Page 169
@@ -1105,7 +1659,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFD34 ],
             'size': 3,
+            'cycles': 23,
             'operands': [ 'd' ],
+            'execute': inc_dec('INC', '(IY+d)'),
         },
         
         
@@ -1115,7 +1671,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b00_000_101 | (i << 3)) for i in r],
             'size': 1,
+            'cycles': 4,
             'operands': [ 'r3' ],
+            'execute': inc_dec('DEC', 'r'),
         },
         
         ## Page 170
@@ -1123,7 +1681,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x35 ],
             'size': 1,
+            'cycles': 11,
             'operands': [],
+            'execute': inc_dec('DEC', '(HL)'),
         },
         
         ## Page 170
@@ -1131,7 +1691,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDD35 ],
             'size': 3,
+            'cycles': 23,
             'operands': [ 'd' ],
+            'execute': inc_dec('DEC', '(IX+d)'),
         },
         
         ## Page 170
@@ -1139,7 +1701,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFD35 ],
             'size': 3,
+            'cycles': 23,
             'operands': [ 'd' ],
+            'execute': inc_dec('DEC', '(IY+d)'),
         },
         
         
@@ -1154,7 +1718,14 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x27 ],
             'size': 1,
+            'cycles': 4,
             'operands': [],
+            'execute': '''
+                f = R[6]
+                af = DAA_AF[(f & 0x02) << 9 | (f & 0x10) << 5 | (f & 0x01) << 8 | R[7]]
+                R[7] = af >> 8
+                R[6] = af & 0xFF
+            ''',
         },
         
         ## Page 175
@@ -1162,15 +1733,27 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x2F ],
             'size': 1,
+            'cycles': 4,
             'operands': [],
+            'execute': '''
+                R[7] ^= 0xFF
+                R[6] = R[6] & 0xC5 | (R[7] & 0x28) | 0x12
+            ''',
         },
         
         ## Page 176
         "NEG":\
         {
-            'opcodes': [ 0xED44 ],
+            ## The other opcodes are undocumented mirrors.
+            'opcodes': [ 0xED44, 0xED4C, 0xED54, 0xED5C, 0xED64, 0xED6C, 0xED74, 0xED7C ],
             'size': 2,
+            'cycles': 8,
             'operands': [],
+            'execute': '''
+                v = R[7]
+                R[7] = -v & 0xFF
+                R[6] = SUB[v]
+            ''',
         },
         
         ## Page 178
@@ -1178,7 +1761,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x3F ],
             'size': 1,
+            'cycles': 4,
             'operands': [],
+            'execute': 'R[6] = (R[6] & 0xC5 | (R[7] & 0x28) | (R[6] & 0x01) << 4) ^ 0x01',
         },
         
         ## Page 179
@@ -1186,7 +1771,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x37 ],
             'size': 1,
+            'cycles': 4,
             'operands': [],
+            'execute': 'R[6] = R[6] & 0xC4 | (R[7] & 0x28) | 0x01',
         },
         
         ## Page 180
@@ -1194,7 +1781,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x00 ],
             'size': 1,
+            'cycles': 4,
             'operands': [],
+            'execute': 'pass',
         },
         
         ## Page 181
@@ -1202,7 +1791,13 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x76 ],
             'size': 1,
+            'cycles': 4,
             'operands': [],
+            'execute': '''
+                ## Stay on the HALT until an interrupt.
+                regs.halted = True
+                regs.PC = (regs.PC - 1) & 0xFFFF
+            ''',
         },
         
         ## Page 182
@@ -1210,7 +1805,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xF3 ],
             'size': 1,
+            'cycles': 4,
             'operands': [],
+            'execute': 'regs.IFF1 = regs.IFF2 = 0',
         },
         
         ## Page 183
@@ -1218,31 +1815,45 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFB ],
             'size': 1,
+            'cycles': 4,
             'operands': [],
+            'execute': '''
+                regs.IFF1 = regs.IFF2 = 1
+                ## The interrupt is accepted after the next instruction, see
+                ## Z80.enable_interrupts().
+                if cpu.int_line:
+                    cpu.enable_interrupts()
+            ''',
         },
         
         ## Page 184
         "IM 0":\
         {
-            'opcodes': [ 0xED46 ],
+            'opcodes': [ 0xED46, 0xED4E, 0xED66, 0xED6E ],
             'size': 2,
+            'cycles': 8,
             'operands': [],
+            'execute': 'regs.IM = 0',
         },
         
         ## Page 185
         "IM 1":\
         {
-            'opcodes': [ 0xED56 ],
+            'opcodes': [ 0xED56, 0xED76 ],
             'size': 2,
+            'cycles': 8,
             'operands': [],
+            'execute': 'regs.IM = 1',
         },
         
         ## Page 186
         "IM 2":\
         {
-            'opcodes': [ 0xED5E ],
+            'opcodes': [ 0xED5E, 0xED7E ],
             'size': 2,
+            'cycles': 8,
             'operands': [],
+            'execute': 'regs.IM = 2',
         },
         
         
@@ -1257,7 +1868,16 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b00_00_1001 | (i << 4)) for i in ss ],
             'size': 1,
+            'cycles': 11,
             'operands': [ 'ss4' ],
+            'execute': f'''
+                hl = R[4] << 8 | R[5]
+                v = {pair('ss')}
+                res = hl + v
+                R[4] = (res >> 8) & 0xFF
+                R[5] = res & 0xFF
+                R[6] = R[6] & 0xC4 | (res >> 8) & 0x28 | ((hl ^ v ^ res) >> 8) & 0x10 | res >> 16
+            ''',
         },
         
         ## Page 190
@@ -1265,7 +1885,16 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0xED00 | 0b01_00_1010 | (i << 4)) for i in ss ],
             'size': 2,
+            'cycles': 15,
             'operands': [ 'ss4' ],
+            'execute': f'''
+                hl = R[4] << 8 | R[5]
+                v = {pair('ss')}
+                res = hl + v + (R[6] & 0x01)
+                R[4] = (res >> 8) & 0xFF
+                R[5] = res & 0xFF
+                R[6] = (res >> 8) & 0xA8 | ((res & 0xFFFF) == 0) << 6 | ((hl ^ v ^ res) >> 8) & 0x10 | ((hl ^ res) & (v ^ res) & 0x8000) >> 13 | res >> 16
+            ''',
         },
         
         ## Page 192
@@ -1273,7 +1902,16 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0xED00 | 0b01_00_0010 | (i << 4)) for i in ss ],
             'size': 2,
+            'cycles': 15,
             'operands': [ 'ss4' ],
+            'execute': f'''
+                hl = R[4] << 8 | R[5]
+                v = {pair('ss')}
+                res = hl - v - (R[6] & 0x01)
+                R[4] = (res >> 8) & 0xFF
+                R[5] = res & 0xFF
+                R[6] = (res >> 8) & 0xA8 | ((res & 0xFFFF) == 0) << 6 | ((hl ^ v ^ res) >> 8) & 0x10 | ((hl ^ v) & (hl ^ res) & 0x8000) >> 13 | 0x02 | (res >> 16) & 0x01
+            ''',
         },
         
         ## Page 194
@@ -1281,15 +1919,29 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0xDD00 | 0b00_00_1001 | (i << 4)) for i in pp ],
             'size': 2,
+            'cycles': 15,
             'operands': [ 'pp4' ],
+            'execute': f'''
+                v = {pair('pp', 'IX')}
+                res = regs.IX + v
+                R[6] = R[6] & 0xC4 | (res >> 8) & 0x28 | ((regs.IX ^ v ^ res) >> 8) & 0x10 | res >> 16
+                regs.IX = res & 0xFFFF
+            ''',
         },
         
         ## Page 194
         "ADD IY, rr":\
         {
             'opcodes': [ (0xFD00 | 0b00_00_1001 | (i << 4)) for i in rr ],
-            'size': 1,
+            'size': 2,
+            'cycles': 15,
             'operands': [ 'rr4' ],
+            'execute': f'''
+                v = {pair('rr', 'IY')}
+                res = regs.IY + v
+                R[6] = R[6] & 0xC4 | (res >> 8) & 0x28 | ((regs.IY ^ v ^ res) >> 8) & 0x10 | res >> 16
+                regs.IY = res & 0xFFFF
+            ''',
         },
         
         ## Page 198
@@ -1297,7 +1949,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b00_00_0011 | (i << 4)) for i in ss ],
             'size': 1,
+            'cycles': 6,
             'operands': [ 'ss4' ],
+            'execute': f'v = ({pair("ss")} + 1) & 0xFFFF\n' + set_pair('ss', 'v'),
         },
         
         ## Page 199
@@ -1305,7 +1959,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDD23 ],
             'size': 2,
+            'cycles': 10,
             'operands': [],
+            'execute': 'regs.IX = (regs.IX + 1) & 0xFFFF',
         },
         
         ## Page 200
@@ -1313,7 +1969,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFD23 ],
             'size': 2,
+            'cycles': 10,
             'operands': [],
+            'execute': 'regs.IY = (regs.IY + 1) & 0xFFFF',
         },
         
         ## Page 201
@@ -1321,7 +1979,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b00_00_1011 | (i << 4)) for i in ss ],
             'size': 1,
+            'cycles': 6,
             'operands': [ 'ss4' ],
+            'execute': f'v = ({pair("ss")} - 1) & 0xFFFF\n' + set_pair('ss', 'v'),
         },
         
         ## Page 202
@@ -1329,7 +1989,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDD2B ],
             'size': 2,
+            'cycles': 10,
             'operands': [],
+            'execute': 'regs.IX = (regs.IX - 1) & 0xFFFF',
         },
         
         ## Page 203
@@ -1337,7 +1999,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFD2B ],
             'size': 2,
+            'cycles': 10,
             'operands': [],
+            'execute': 'regs.IY = (regs.IY - 1) & 0xFFFF',
         },
         
         
@@ -1352,7 +2016,13 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x07 ],
             'size': 1,
+            'cycles': 4,
             'operands': [],
+            'execute': '''
+                a = R[7]
+                R[7] = (a << 1 | a >> 7) & 0xFF
+                R[6] = R[6] & 0xC4 | (R[7] & 0x28) | a >> 7
+            ''',
         },
         
         ## Page 207
@@ -1360,7 +2030,13 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x17 ],
             'size': 1,
+            'cycles': 4,
             'operands': [],
+            'execute': '''
+                a = R[7]
+                R[7] = (a << 1 | R[6] & 0x01) & 0xFF
+                R[6] = R[6] & 0xC4 | (R[7] & 0x28) | a >> 7
+            ''',
         },
         
         ## Page 209
@@ -1368,7 +2044,13 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x0F ],
             'size': 1,
+            'cycles': 4,
             'operands': [],
+            'execute': '''
+                a = R[7]
+                R[7] = (a >> 1 | a << 7) & 0xFF
+                R[6] = R[6] & 0xC4 | (R[7] & 0x28) | a & 0x01
+            ''',
         },
         
         ## Page 211
@@ -1376,7 +2058,13 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x1F ],
             'size': 1,
+            'cycles': 4,
             'operands': [],
+            'execute': '''
+                a = R[7]
+                R[7] = a >> 1 | (R[6] & 0x01) << 7
+                R[6] = R[6] & 0xC4 | (R[7] & 0x28) | a & 0x01
+            ''',
         },
         
         ## Page 213
@@ -1385,7 +2073,9 @@ if __name__ == '__main__':
             #'opcodes': [ (0xCB00 | 0b0000_000 | (i << 0)) for i in r ],
             'opcodes': [ (0xCB00 | 0b0000_000 | (i << 0)) for i in r ],
             'size': 2,
+            'cycles': 8,
             'operands': [ 'r0' ],
+            'execute': shift('RLC', 'r'),
         },
         
         ## Page 215
@@ -1393,7 +2083,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xCB06 ],
             'size': 2,
+            'cycles': 15,
             'operands': [],
+            'execute': shift('RLC', '(HL)'),
         },
         
         ## Page 217
@@ -1401,7 +2093,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDDCB06 ],
             'size': 4,
+            'cycles': 23,
             'operands': [ 'd' ],
+            'execute': shift('RLC', '(IX+d)'),
         },
         
         ## Page 219
@@ -1409,7 +2103,50 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFDCB06 ],
             'size': 4,
+            'cycles': 23,
+            'operands': [ 'd' ],
+            'execute': shift('RLC', '(IY+d)'),
+        },
+        
+        
+        ## Page 223
+        "RRC r":\
+        {
+            'opcodes': [ (0xCB00 | 0b00001_000 | (i << 0)) for i in r ],
+            'size': 2,
+            'cycles': 8,
+            'operands': [ 'r0' ],
+            'execute': shift('RRC', 'r'),
+        },
+        
+        ## Page 223
+        "RRC (HL)":\
+        {
+            'opcodes': [ 0xCB0E ],
+            'size': 2,
+            'cycles': 15,
+            'operands': [],
+            'execute': shift('RRC', '(HL)'),
+        },
+        
+        ## Page 223
+        "RRC (IX+d)":\
+        {
+            'opcodes': [ 0xDDCB0E ],
+            'size': 4,
+            'cycles': 23,
+            'operands': [ 'd' ],
+            'execute': shift('RRC', '(IX+d)'),
+        },
+        
+        ## Page 223
+        "RRC (IY+d)":\
+        {
+            'opcodes': [ 0xFDCB0E ],
+            'size': 4,
+            'cycles': 23,
             'operands': [ 'd' ],
+            'execute': shift('RRC', '(IY+d)'),
         },
         
         
@@ -1419,7 +2156,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0xCB00 | 0b00010_000 | (i << 0)) for i in r ],
             'size': 2,
+            'cycles': 8,
             'operands': [ 'r0' ],
+            'execute': shift('RL', 'r'),
         },
         
         ## Page 221
@@ -1427,7 +2166,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xCB16 ],
             'size': 2,
+            'cycles': 15,
             'operands': [],
+            'execute': shift('RL', '(HL)'),
         },
         
         ## Page 221
@@ -1435,7 +2176,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDDCB16 ],
             'size': 4,
+            'cycles': 23,
             'operands': [ 'd' ],
+            'execute': shift('RL', '(IX+d)'),
         },
         
         ## Page 221
@@ -1443,7 +2186,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFDCB16 ],
             'size': 4,
+            'cycles': 23,
             'operands': [ 'd' ],
+            'execute': shift('RL', '(IY+d)'),
         },
         
         
@@ -1455,7 +2200,9 @@ if __name__ == '__main__':
             #'opcodes': [ (0xCB00 | 0b00001_000 | (i << 0)) for i in r ],
             'opcodes': [ (0xCB00 | 0b00011_000 | (i << 0)) for i in r ],
             'size': 2,
+            'cycles': 8,
             'operands': [ 'r0' ],
+            'execute': shift('RR', 'r'),
         },
         
         ## Page 227
@@ -1463,7 +2210,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xCB1E ],
             'size': 2,
+            'cycles': 15,
             'operands': [],
+            'execute': shift('RR', '(HL)'),
         },
         
         ## Page 227
@@ -1471,7 +2220,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDDCB1E ],
             'size': 4,
+            'cycles': 23,
             'operands': [ 'd' ],
+            'execute': shift('RR', '(IX+d)'),
         },
         
         ## Page 227
@@ -1479,7 +2230,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFDCB1E ],
             'size': 4,
+            'cycles': 23,
             'operands': [ 'd' ],
+            'execute': shift('RR', '(IY+d)'),
         },
         
         
@@ -1489,7 +2242,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0xCB00 | 0b00100_000 | (i << 0)) for i in r ],
             'size': 2,
+            'cycles': 8,
             'operands': [ 'r0' ],
+            'execute': shift('SLA', 'r'),
         },
         
         ## Page 230
@@ -1497,7 +2252,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xCB26 ],
             'size': 2,
+            'cycles': 15,
             'operands': [],
+            'execute': shift('SLA', '(HL)'),
         },
         
         ## Page 230
@@ -1505,7 +2262,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDDCB26 ],
             'size': 4,
+            'cycles': 23,
             'operands': [ 'd' ],
+            'execute': shift('SLA', '(IX+d)'),
         },
         
         ## Page 230
@@ -1513,7 +2272,91 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFDCB26 ],
             'size': 4,
+            'cycles': 23,
+            'operands': [ 'd' ],
+            'execute': shift('SLA', '(IY+d)'),
+        },
+        
+        
+        ## Page 233
+        "SRA r":\
+        {
+            'opcodes': [ (0xCB00 | 0b00101_000 | (i << 0)) for i in r ],
+            'size': 2,
+            'cycles': 8,
+            'operands': [ 'r0' ],
+            'execute': shift('SRA', 'r'),
+        },
+        
+        ## Page 233
+        "SRA (HL)":\
+        {
+            'opcodes': [ 0xCB2E ],
+            'size': 2,
+            'cycles': 15,
+            'operands': [],
+            'execute': shift('SRA', '(HL)'),
+        },
+        
+        ## Page 233
+        "SRA (IX+d)":\
+        {
+            'opcodes': [ 0xDDCB2E ],
+            'size': 4,
+            'cycles': 23,
+            'operands': [ 'd' ],
+            'execute': shift('SRA', '(IX+d)'),
+        },
+        
+        ## Page 233
+        "SRA (IY+d)":\
+        {
+            'opcodes': [ 0xFDCB2E ],
+            'size': 4,
+            'cycles': 23,
             'operands': [ 'd' ],
+            'execute': shift('SRA', '(IY+d)'),
+        },
+        
+        
+        ## Undocumented: shifts a 1 in
+        "SLL r":\
+        {
+            'opcodes': [ (0xCB00 | 0b00110_000 | (i << 0)) for i in r ],
+            'size': 2,
+            'cycles': 8,
+            'operands': [ 'r0' ],
+            'execute': shift('SLL', 'r'),
+        },
+        
+        ## Undocumented: shifts a 1 in
+        "SLL (HL)":\
+        {
+            'opcodes': [ 0xCB36 ],
+            'size': 2,
+            'cycles': 15,
+            'operands': [],
+            'execute': shift('SLL', '(HL)'),
+        },
+        
+        ## Undocumented: shifts a 1 in
+        "SLL (IX+d)":\
+        {
+            'opcodes': [ 0xDDCB36 ],
+            'size': 4,
+            'cycles': 23,
+            'operands': [ 'd' ],
+            'execute': shift('SLL', '(IX+d)'),
+        },
+        
+        ## Undocumented: shifts a 1 in
+        "SLL (IY+d)":\
+        {
+            'opcodes': [ 0xFDCB36 ],
+            'size': 4,
+            'cycles': 23,
+            'operands': [ 'd' ],
+            'execute': shift('SLL', '(IY+d)'),
         },
         
         
@@ -1523,7 +2366,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0xCB00 | 0b00111_000 | (i << 0)) for i in r ],
             'size': 2,
+            'cycles': 8,
             'operands': [ 'r0' ],
+            'execute': shift('SRL', 'r'),
         },
         
         ## Page 236
@@ -1531,7 +2376,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xCB3E ],
             'size': 2,
+            'cycles': 15,
             'operands': [],
+            'execute': shift('SRL', '(HL)'),
         },
         
         ## Page 236
@@ -1539,7 +2386,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDDCB3E ],
             'size': 4,
+            'cycles': 23,
             'operands': [ 'd' ],
+            'execute': shift('SRL', '(IX+d)'),
         },
         
         ## Page 236
@@ -1547,7 +2396,47 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xFDCB3E ],
             'size': 4,
+            'cycles': 23,
             'operands': [ 'd' ],
+            'execute': shift('SRL', '(IY+d)'),
+        },
+        
+        
+        
+        ## Page 238
+        "RLD":\
+        {
+            'opcodes': [ 0xED6F ],
+            'size': 2,
+            'cycles': 18,
+            'operands': [],
+            'execute': '''
+                hl = R[4] << 8 | R[5]
+                v = ram[hl]
+                a = R[7]
+                ram[hl] = (v << 4 | a & 0x0F) & 0xFF
+                a = a & 0xF0 | v >> 4
+                R[7] = a
+                R[6] = R[6] & 0x01 | SZP[a]
+            ''',
+        },
+        
+        ## Page 240
+        "RRD":\
+        {
+            'opcodes': [ 0xED67 ],
+            'size': 2,
+            'cycles': 18,
+            'operands': [],
+            'execute': '''
+                hl = R[4] << 8 | R[5]
+                v = ram[hl]
+                a = R[7]
+                ram[hl] = (a << 4 | v >> 4) & 0xFF
+                a = a & 0xF0 | v & 0x0F
+                R[7] = a
+                R[6] = R[6] & 0x01 | SZP[a]
+            ''',
         },
         
         
@@ -1562,7 +2451,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0xCB00 | 0b01_000_000 | (j << 3) | (i << 0)) for j in b for i in r ],
             'size': 2,
+            'cycles': 8,
             'operands': [ 'b3', 'r0' ],
+            'execute': bit('r'),
         },
         
         ## Page 245
@@ -1572,7 +2463,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0xCB00 | 0b01_000_110 | (i << 3)) for i in b ],
             'size': 2,
+            'cycles': 12,
             'operands': [ 'b3' ],
+            'execute': bit('(HL)'),
         },
         
         ## Page 247
@@ -1580,7 +2473,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0xDDCB00 | 0b01_000_110 | (i << 3)) for i in b ],
             'size': 4,
+            'cycles': 20,
             'operands': [ 'b3', 'd' ],
+            'execute': bit('(IX+d)'),
         },
         
         ## Page 249
@@ -1588,7 +2483,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0xFDCB00 | 0b01_000_110 | (i << 3)) for i in b ],
             'size': 4,
+            'cycles': 20,
             'operands': [ 'b3', 'd' ],
+            'execute': bit('(IY+d)'),
         },
         
         
@@ -1598,7 +2495,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0xCB00 | 0b11_000_000 | (j << 3) | (i << 0)) for j in b for i in r ],
             'size': 2,
+            'cycles': 8,
             'operands': [ 'b3', 'r0' ],
+            'execute': set_bit('r'),
         },
         
         ## Page 253
@@ -1606,7 +2505,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0xCB00 | 0b11_000_110 | (i << 3)) for i in b ],
             'size': 2,
+            'cycles': 15,
             'operands': [ 'b3' ],
+            'execute': set_bit('(HL)'),
         },
         
         ## Page 255
@@ -1614,7 +2515,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0xDDCB00 | 0b11_000_110 | (i << 3)) for i in b ],
             'size': 4,
+            'cycles': 23,
             'operands': [ 'b3', 'd' ],
+            'execute': set_bit('(IX+d)'),
         },
         
         ## Page 257
@@ -1622,7 +2525,51 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0xFDCB00 | 0b11_000_110 | (i << 3)) for i in b ],
             'size': 4,
+            'cycles': 23,
             'operands': [ 'b3', 'd' ],
+            'execute': set_bit('(IY+d)'),
+        },
+        
+        
+        
+        ## Page 259
+        "RES b, r":\
+        {
+            'opcodes': [ (0xCB00 | 0b10_000_000 | (j << 3) | (i << 0)) for j in b for i in r ],
+            'size': 2,
+            'cycles': 8,
+            'operands': [ 'b3', 'r0' ],
+            'execute': reset_bit('r'),
+        },
+        
+        ## Page 259
+        "RES b, (HL)":\
+        {
+            'opcodes': [ (0xCB00 | 0b10_000_110 | (i << 3)) for i in b ],
+            'size': 2,
+            'cycles': 15,
+            'operands': [ 'b3' ],
+            'execute': reset_bit('(HL)'),
+        },
+        
+        ## Page 259
+        "RES b, (IX+d)":\
+        {
+            'opcodes': [ (0xDDCB00 | 0b10_000_110 | (i << 3)) for i in b ],
+            'size': 4,
+            'cycles': 23,
+            'operands': [ 'b3', 'd' ],
+            'execute': reset_bit('(IX+d)'),
+        },
+        
+        ## Page 259
+        "RES b, (IY+d)":\
+        {
+            'opcodes': [ (0xFDCB00 | 0b10_000_110 | (i << 3)) for i in b ],
+            'size': 4,
+            'cycles': 23,
+            'operands': [ 'b3', 'd' ],
+            'execute': reset_bit('(IY+d)'),
         },
         
         
@@ -1637,7 +2584,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xC3 ],
             'size': 3,
+            'cycles': 10,
             'operands': [ 'nn' ],
+            'execute': 'regs.PC = nn',
         },
         
         ## Page 263
@@ -1645,7 +2594,12 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b11_000_010 | (i << 3)) for i in cc ],
             'size': 3,
+            'cycles': 10,
             'operands': [ 'cc3', 'nn' ],
+            'execute': f'''
+                if {CONDITION}:
+                    regs.PC = nn
+            ''',
         },
         
         ## Page 265
@@ -1653,7 +2607,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x18 ],
             'size': 2,
+            'cycles': 12,
             'operands': [ 'e' ],
+            'execute': 'regs.PC = (regs.PC + e) & 0xFFFF',
         },
         
         ## Page 267
@@ -1661,7 +2617,13 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x38 ],
             'size': 2,
+            'cycles': 7,
             'operands': [ 'e' ],
+            'execute': '''
+                if R[6] & 0x01:
+                    regs.PC = (regs.PC + e) & 0xFFFF
+                    return 12
+            ''',
         },
         
         ## Page 269
@@ -1669,7 +2631,13 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x30 ],
             'size': 2,
+            'cycles': 7,
             'operands': [ 'e' ],
+            'execute': '''
+                if not R[6] & 0x01:
+                    regs.PC = (regs.PC + e) & 0xFFFF
+                    return 12
+            ''',
         },
         
         ## Page 271
@@ -1677,7 +2645,13 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x28 ],
             'size': 2,
+            'cycles': 7,
             'operands': [ 'e' ],
+            'execute': '''
+                if R[6] & 0x40:
+                    regs.PC = (regs.PC + e) & 0xFFFF
+                    return 12
+            ''',
         },
         
         ## Page 273
@@ -1685,7 +2659,13 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x20 ],
             'size': 2,
+            'cycles': 7,
             'operands': [ 'e' ],
+            'execute': '''
+                if not R[6] & 0x40:
+                    regs.PC = (regs.PC + e) & 0xFFFF
+                    return 12
+            ''',
         },
         
         ## Page 275
@@ -1693,7 +2673,29 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xE9 ],
             'size': 1,
+            'cycles': 4,
+            'operands': [],
+            'execute': 'regs.PC = R[4] << 8 | R[5]',
+        },
+        
+        ## Page 276
+        "JP (IX)":\
+        {
+            'opcodes': [ 0xDDE9 ],
+            'size': 2,
+            'cycles': 8,
+            'operands': [],
+            'execute': 'regs.PC = regs.IX',
+        },
+        
+        ## Page 277
+        "JP (IY)":\
+        {
+            'opcodes': [ 0xFDE9 ],
+            'size': 2,
+            'cycles': 8,
             'operands': [],
+            'execute': 'regs.PC = regs.IY',
         },
         
         ## Page 278
@@ -1701,7 +2703,14 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0x10 ],
             'size': 2,
+            'cycles': 8,
             'operands': [ 'e' ],
+            'execute': '''
+                R[0] = (R[0] - 1) & 0xFF
+                if R[0]:
+                    regs.PC = (regs.PC + e) & 0xFFFF
+                    return 13
+            ''',
         },
         
         
@@ -1716,7 +2725,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xCD ],
             'size': 3,
+            'cycles': 17,
             'operands': [ 'nn' ],
+            'execute': push('regs.PC >> 8', 'regs.PC & 0xFF') + 'regs.PC = nn\n',
         },
         
         ## Page 283
@@ -1724,7 +2735,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b11_000_100 | (i << 3)) for i in cc ],
             'size': 3,
+            'cycles': 10,
             'operands': [ 'cc3', 'nn' ],
+            'execute': f'if {CONDITION}:\n' + textwrap.indent(push('regs.PC >> 8', 'regs.PC & 0xFF') + 'regs.PC = nn\nreturn 17\n', '    '),
         },
         
         ## Page 285
@@ -1732,7 +2745,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xC9 ],
             'size': 1,
+            'cycles': 10,
             'operands': [],
+            'execute': POP + 'regs.PC = hi << 8 | lo\n',
         },
         
         ## Page 286
@@ -1740,7 +2755,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b11_000_000 | (i << 3)) for i in cc ],
             'size': 1,
+            'cycles': 5,
             'operands': [ 'cc3' ],
+            'execute': f'if {CONDITION}:\n' + textwrap.indent(POP + 'regs.PC = hi << 8 | lo\nreturn 11\n', '    '),
         },
         
         ## Page 288
@@ -1748,15 +2765,19 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xED4D ],
             'size': 2,
+            'cycles': 14,
             'operands': [],
+            'execute': POP + 'regs.PC = hi << 8 | lo\nregs.IFF1 = regs.IFF2\nif regs.IFF1 and cpu.int_line:\n    cpu.end_slice()\n',
         },
         
         ## Page 290
         "RETN":\
         {
-            'opcodes': [ 0xED45 ],
+            'opcodes': [ 0xED45, 0xED55, 0xED5D, 0xED65, 0xED6D, 0xED75, 0xED7D ],
             'size': 2,
+            'cycles': 14,
             'operands': [],
+            'execute': POP + 'regs.PC = hi << 8 | lo\nregs.IFF1 = regs.IFF2\nif regs.IFF1 and cpu.int_line:\n    cpu.end_slice()\n',
         },
         
         ## Page 292
@@ -1764,7 +2785,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0b11_000_111 | (i << 3)) for i in t ],
             'size': 1,
+            'cycles': 11,
             'operands': [ 't3' ],
+            'execute': push('regs.PC >> 8', 'regs.PC & 0xFF') + 'regs.PC = p\n',
         },
         
         
@@ -1779,7 +2802,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xDB ],
             'size': 2,
+            'cycles': 11,
             'operands': [ 'n' ],
+            'execute': 'R[7] = cpu.io.readers[n](n)',
         },
         
         ## Page 296
@@ -1787,7 +2812,14 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0xED00 | 0b01_000_000 | (i << 3)) for i in r ],
             'size': 2,
+            'cycles': 12,
             'operands': [ 'r3' ],
+            'execute': '''
+                port = R[1]
+                res = cpu.io.readers[port](port)
+                R[r] = res
+                R[6] = R[6] & 0x01 | SZP[res]
+            ''',
         },
         
         ## Page 298
@@ -1795,7 +2827,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xEDA2 ],
             'size': 2,
+            'cycles': 16,
             'operands': [],
+            'execute': block('IN', '+', False),
         },
         
         ## Page 300
@@ -1803,7 +2837,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xEDB2 ],
             'size': 2,
+            'cycles': 16,
             'operands': [],
+            'execute': block('IN', '+', True),
         },
         
         ## Page 302
@@ -1811,7 +2847,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xEDAA ],
             'size': 2,
+            'cycles': 16,
             'operands': [],
+            'execute': block('IN', '-', False),
         },
         
         ## Page 304
@@ -1819,7 +2857,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xEDBA ],
             'size': 2,
+            'cycles': 16,
             'operands': [],
+            'execute': block('IN', '-', True),
         },
         
         ## Page 306
@@ -1827,7 +2867,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xD3 ],
             'size': 2,
+            'cycles': 11,
             'operands': [ 'n' ],
+            'execute': 'cpu.io.writers[n](n, R[7])',
         },
         
         ## Page 307
@@ -1835,7 +2877,12 @@ if __name__ == '__main__':
         {
             'opcodes': [ (0xED00 | 0b01_000_001 | (i << 3)) for i in r ],
             'size': 2,
+            'cycles': 12,
             'operands': [ 'r3' ],
+            'execute': '''
+                port = R[1]
+                cpu.io.writers[port](port, R[r])
+            ''',
         },
         
         ## Page 309
@@ -1843,7 +2890,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xEDA3 ],
             'size': 2,
+            'cycles': 16,
             'operands': [],
+            'execute': block('OUT', '+', False),
         },
         
         ## Page 311
@@ -1851,7 +2900,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xEDB3 ],
             'size': 2,
+            'cycles': 16,
             'operands': [],
+            'execute': block('OUT', '+', True),
         },
         
         ## Page 313
@@ -1859,7 +2910,9 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xEDAB ],
             'size': 2,
+            'cycles': 16,
             'operands': [],
+            'execute': block('OUT', '-', False),
         },
         
         ## Page 315
@@ -1867,16 +2920,52 @@ if __name__ == '__main__':
         {
             'opcodes': [ 0xEDBB ],
             'size': 2,
+            'cycles': 16,
             'operands': [],
+            'execute': block('OUT', '-', True),
         },
     }
     
+    ## A prefixed opcode is fetched in two M1 cycles, each incrementing R.
+    ## The run loops count one per instruction, the other is counted here.
+    for instr in instructions.values():
+        if min(instr['opcodes']) > 0xFF:
+            instr['execute'] = 'regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F\n' + textwrap.dedent(instr['execute']).strip('\n')
+    
+    ## Where the locals of the execute() bodies come from. The operands are
+    ## bound for the instructions that have them only, the t operand as p.
+    bindings =\
+    {
+        'regs': 'cpu.registers',
+        'R'   : 'regs.r',
+        'ram' : 'cpu.ram',
+    }
+    operand_bindings =\
+    {
+        'b'     : 'self._b',
+        'cc'    : 'self._cc',
+        'd'     : 'self._d',
+        'dd'    : 'self._dd',
+        'e'     : 'self._e',
+        'n'     : 'self._n',
+        'nn'    : 'self._nn',
+        'pp'    : 'self._pp',
+        'qq'    : 'self._qq',
+        'r'     : 'self._r',
+        'rprime': 'self._rprime',
+        'rr'    : 'self._rr',
+        'ss'    : 'self._ss',
+        'p'     : 'self._t << 3',
+    }
+    
     output = ''
     output += 'from   typing import Self, List, Type\n'
+    output += f'from   z80.flags import {", ".join(FLAG_TABLES)}\n'
     output += 'import z80.instruction\n'
     for instr_name, instr in instructions.items():
         set_variables = []
         str_args = []
+        opcode_fields = []
         for operand in instr['operands']:
             first_arg_offset = 1
             if instr['opcodes'][0] > 0xFF:
@@ -1887,50 +2976,63 @@ if __name__ == '__main__':
             
             if operand == 'b3':
                 set_variables.append(f'self._b = (opcode >> 3) & 0x07')
-                str_args.append('b={self.b}')
+                opcode_fields.append("'b': (3, 0x07)")
+                str_args.append('b={b}')
             elif operand == 'cc3':
                 set_variables.append(f'self._cc = (opcode >> 3) & 0x07')
-                str_args.append('cc={self.cc}')
+                opcode_fields.append("'cc': (3, 0x07)")
+                str_args.append('cc={cc}')
             elif operand == 'd':
-                set_variables.append(f'self._d = self._ram.get_byte(self._PC + 2, signed=False)')
-                str_args.append('d={self.d}')
+                set_variables.append(f'self._d = ram.get_byte(PC + 2, signed=False)')
+                str_args.append('d={d}')
             elif operand == 'dd4':
                 set_variables.append(f'self._dd = (opcode >> 4) & 0x03')
-                str_args.append('dd={self.dd}')
+                opcode_fields.append("'dd': (4, 0x03)")
+                str_args.append('dd={dd}')
             elif operand == 'e':
-                set_variables.append(f'self._e = self._ram.get_byte(self._PC + {first_arg_offset}, signed=True)')
-                set_variables.append(f'self._jump_destination = self._PC + self.size + self.e')
-                str_args.append('e={self.e}h')
+                set_variables.append(f'self._e = ram.get_byte(PC + {first_arg_offset}, signed=True)')
+                str_args.append('e={e}h')
             elif operand == 'n':
-                set_variables.append(f'self._n = self._ram.get_byte(self._PC + {first_arg_offset}, signed=False)')
-                str_args.append('n={self.n}')
+                ## LD (IX+d), n: n comes after d.
+                if 'd' in instr['operands']:
+                    first_arg_offset = 3
+                set_variables.append(f'self._n = ram.get_byte(PC + {first_arg_offset}, signed=False)')
+                str_args.append('n={n}')
             elif operand == 'nn':
-                set_variables.append(f'self._nn = self._ram.get_word(self._PC + {first_arg_offset})')
-                str_args.append('nn={self._nn}')
+                set_variables.append(f'self._nn = ram.get_word(PC + {first_arg_offset})')
+                str_args.append('nn={nn:d}')
             elif operand == 'pp4':
                 set_variables.append(f'self._pp = (opcode >> 4) & 0x03')
-                str_args.append('pp={self.pp}')
+                opcode_fields.append("'pp': (4, 0x03)")
+                str_args.append('pp={pp}')
             elif operand == 'qq4':
                 set_variables.append(f'self._qq = (opcode >> 4) & 0x03')
-                str_args.append('qq={self.qq}')
+                opcode_fields.append("'qq': (4, 0x03)")
+                str_args.append('qq={qq}')
             elif operand == 'r0':
                 set_variables.append(f'self._r = (opcode >> 0) & 0x07')
-                str_args.append('r={self.r}')
+                opcode_fields.append("'r': (0, 0x07)")
+                str_args.append('r={r}')
             elif operand == 'r3':
                 set_variables.append(f'self._r = (opcode >> 3) & 0x07')
-                str_args.append('r={self.r}')
+                opcode_fields.append("'r': (3, 0x07)")
+                str_args.append('r={r}')
             elif operand == 'rprime0':
                 set_variables.append(f'self._rprime = (opcode >> 0) & 0x07')
-                str_args.append("r'={self.rprime}")
+                opcode_fields.append("'rprime': (0, 0x07)")
+                str_args.append("r'={rprime}")
             elif operand == 'rr4':
                 set_variables.append(f'self._rr = (opcode >> 4) & 0x03')
-                str_args.append('rr={self.rr}')
+                opcode_fields.append("'rr': (4, 0x03)")
+                str_args.append('rr={rr}')
             elif operand == 't3':
                 set_variables.append(f'self._t = (opcode >> 3) & 0x07')
-                str_args.append('t={self._t}, p={self.p}')
+                opcode_fields.append("'t': (3, 0x07)")
+                str_args.append('t={t}, p={p}')
             elif operand == 'ss4':
                 set_variables.append(f'self._ss = (opcode >> 4) & 0x03')
-                str_args.append('ss={self.ss}')
+                opcode_fields.append("'ss': (4, 0x03)")
+                str_args.append('ss={ss}')
             else:
                 raise ValueError(f"Unknown operand name '{operand}'.")
         classname = instr_name.replace(" ", "_").replace('(', 'deref_').replace("'", 'prime').translate({ord(ch):None for ch in ',)'}).replace("+", "_plus_")
@@ -1944,96 +3046,469 @@ if __name__ == '__main__':
         output +=  '        return ['
         output +=  ', '.join(map(lambda i: f'0x{i:02X}', instr['opcodes']))
         output +=  ']\n'
-        output += f'    @property\n'
-        output += f'    def size(self: Self) -> int:\n'
-        output += f'        return {instr["size"]}\n'
-        output += f'    def __str__(self: Self) -> str:\n'
-        output += f'        return f"{instr_name};'
+        output += f'    __slots__ = {tuple(variable.split()[0].removeprefix("self.") for variable in set_variables)}\n'
+        output += f'    size = {instr["size"]}\n'
+        if len(opcode_fields) > 0:
+            output += f'    opcode_fields = {{ {", ".join(opcode_fields)} }}\n'
+        output += f'    template = "{instr_name};'
         if len(str_args) > 0:
             output += ' '
             output += ', '.join(str_args)
-        output += '"'
-        output +=  '\n'
-        output += f'    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:\n'
-        output += f'        super().__init__(registers, ram, opcode)\n'
+        output += '"\n'
+        output += f'    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:\n'
+        output += f'        super().__init__(ram, PC, opcode)\n'
         if len(set_variables) > 0:
             output += '        '
             output += '\n        '.join(set_variables) + '\n'
+        if any(re.sub(r'[0-9]$', '', operand) == 'e' for operand in instr['operands']):
+            output += '\n'
+            output += '    def jump_destination(self: Self, PC: int) -> int:\n'
+            output += '        return PC + self.size + self._e\n'
+            output += '\n'
+            output += '    ## The operand as written in assembly, relative to the instruction.\n'
+            output += '    @property\n'
+            output += '    def offset(self: Self) -> int:\n'
+            output += '        return self._e + 2\n'
+        
+        body = textwrap.dedent(instr['execute']).strip('\n')
+        prelude = []
+        uses = lambda name: re.search(rf'(?<![.\w]){name}\b', body)
+        if uses('regs') or uses('R'):
+            prelude.append(f'regs = {bindings["regs"]}')
+        if uses('R'):
+            prelude.append(f'R = {bindings["R"]}')
+        if uses('ram'):
+            prelude.append(f'ram = {bindings["ram"]}')
         for operand in instr['operands']:
-            operand_no_digit = re.sub(r'[0-9]$', '', operand)
-            match operand_no_digit:
+            operand = re.sub(r'[0-9]$', '', operand)
+            local = { 't': 'p' }.get(operand, operand)
+            if uses(local):
+                prelude.append(f'{local} = {operand_bindings[local]}')
+        output += '\n'
+        output += '    def execute(self: Self, cpu) -> int:\n'
+        ## The T-states, unless the body returns them itself.
+        if not body.split('\n')[-1].startswith('return '):
+            body += f'\nreturn {instr["cycles"]}'
+        output += textwrap.indent('\n'.join(prelude + [body]), '        ') + '\n'
+    output += '\n'
+    output += 'z80.instruction.Instruction.compile_templates(__name__, z80.instruction.STYLE)\n'
+    
+    
+    
+    ## One function per opcode
+    ##
+    ## With 'handlers' as argument, the module z80.handlers is written instead:
+    ##
+    ##     python3 -m z80.instruction handlers > z80/handlers.py
+    ##
+    ## It has a function for every opcode, with the operands encoded in the 
+    ## opcode filled in as constants (and folded away, see Specializer), e.g.
+    ## ld_b_c() for LD r, r' with r=B, r'=C. They are called as handler(cpu,
+    ## PC), with PC the address of the instruction, through the dispatch 
+    ## tables at the end of the module: BASE by the first byte, and CB, DD, 
+    ## DDCB, ED, FD and FDCB for the prefixed opcodes. The LAZY_ tables are
+    ## the same for lazy flags, PREFIXES tells which table a prefix handler
+    ## dispatches to.
+    
+    ## Replaces operands by constants and evaluates what became constant,
+    ## including the ifs.
+    class Specializer(ast.NodeTransformer):
+        FOLDABLE = (ast.BinOp, ast.UnaryOp, ast.Compare, ast.BoolOp, ast.Subscript, ast.Call)
+        
+        def __init__(self: Self, constants: Dict[str, int]) -> None:
+            self.constants = constants
+        
+        def visit_Name(self: Self, node: ast.Name) -> ast.AST:
+            if isinstance(node.ctx, ast.Load) and node.id in self.constants:
+                return ast.copy_location(ast.Constant(self.constants[node.id]), node)
+            return node
+        
+        ## Only bool() is called in a constant expression.
+        @staticmethod
+        def constant(node: ast.AST) -> bool:
+            for child in ast.walk(node):
+                if isinstance(child, ast.Name) and child.id != 'bool':
+                    return False
+                if isinstance(child, ast.Attribute):
+                    return False
+            return True
+        
+        def generic_visit(self: Self, node: ast.AST) -> ast.AST:
+            node = super().generic_visit(node)
+            if isinstance(node, self.FOLDABLE) and self.constant(node):
+                value = eval(compile(ast.fix_missing_locations(ast.Expression(node)), '<specializer>', 'eval'))
+                return ast.copy_location(ast.Constant(value), node)
+            ## bool(x) == 1 is x, bool(x) == 0 is not x.
+            if isinstance(node, ast.Compare) and isinstance(node.left, ast.Call) and getattr(node.left.func, 'id', None) == 'bool' \
+                and isinstance(node.ops[0], ast.Eq) and isinstance(node.comparators[0], ast.Constant):
+                if node.comparators[0].value:
+                    return node.left.args[0]
+                return ast.copy_location(ast.UnaryOp(ast.Not(), node.left.args[0]), node)
+            return node
+        
+        def visit_IfExp(self: Self, node: ast.IfExp) -> ast.AST:
+            node = self.generic_visit(node)
+            if isinstance(node.test, ast.Constant):
+                return node.body if node.test.value else node.orelse
+            return node
+        
+        def visit_If(self: Self, node: ast.If) -> ast.AST | List[ast.stmt]:
+            node = self.generic_visit(node)
+            if isinstance(node.test, ast.Constant):
+                return node.body if node.test.value else node.orelse
+            return node
+        
+        def specialize(self: Self, code: str) -> str:
+            tree = ast.fix_missing_locations(self.visit(ast.parse(code)))
+            if not tree.body:
+                tree.body.append(ast.Pass())
+            ## Numbers from 16 up are masks and addresses, written in hex. Shift
+            ## counts and T-states (returned) are not.
+            return re.sub(r'(?<![\w.])(?<!<< )(?<!>> )(?<!return )\d+(?![\w.])',
+                lambda m: m.group() if int(m.group()) < 16 else f'0x{int(m.group()):02X}',
+                ast.unparse(tree))
+    
+    ## Turns a (specialized) handler body into its lazy flags version (see
+    ## z80.flags): F is read as FLAGS[R[6]], and flags that are an entry of 
+    ## one of the tables are written as the index of that entry in FLAGS.
+    class LazyFlags(ast.NodeTransformer):
+        LAZY = { 'ADD': 'LAZY_ADD', 'SUB': 'LAZY_SUB', 'CP': 'LAZY_CP', 'SZP': 'LAZY_SZP' }
+        
+        @staticmethod
+        def is_f(node: ast.AST) -> bool:
+            return isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name) and node.value.id == 'R' \
+                and isinstance(node.slice, ast.Constant) and node.slice.value == 6
+        
+        @staticmethod
+        def table(node: ast.AST) -> Optional[str]:
+            if isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name) and node.value.id in LazyFlags.LAZY:
+                return node.value.id
+            return None
+        
+        def index(self: Self, value: ast.AST) -> Optional[ast.AST]:
+            ## TABLE[index]
+            if (table := self.table(value)) is not None:
+                return ast.BinOp(ast.Name(self.LAZY[table], ast.Load()), ast.BitOr(), value.slice)
+            ## SZP[res] | 0x10 (AND) and SZP[res] | c (shifts).
+            if isinstance(value, ast.BinOp) and isinstance(value.op, ast.BitOr) and self.table(value.left) == 'SZP':
+                res = value.left.slice
+                if isinstance(value.right, ast.Constant) and value.right.value == 0x10:
+                    return ast.BinOp(ast.Name('LAZY_SZPH', ast.Load()), ast.BitOr(), res)
+                if isinstance(value.right, ast.Name) and value.right.id == 'c':
+                    c = ast.BinOp(value.right, ast.LShift(), ast.Constant(8))
+                    return ast.BinOp(ast.BinOp(ast.Name('LAZY_SZP', ast.Load()), ast.BitOr(), c), ast.BitOr(), res)
+            return None
+        
+        def visit_Assign(self: Self, node: ast.Assign) -> ast.AST:
+            if len(node.targets) == 1 and self.is_f(node.targets[0]):
+                if (index := self.index(node.value)) is not None:
+                    node.value = index
+                    return node
+            node.value = self.visit(node.value)
+            return node
+        
+        def visit_Subscript(self: Self, node: ast.Subscript) -> ast.AST:
+            node = self.generic_visit(node)
+            if isinstance(node.ctx, ast.Load) and self.is_f(node):
+                return ast.Subscript(ast.Name('FLAGS', ast.Load()), node, ast.Load())
+            return node
+        
+        def rewrite(self: Self, code: str) -> str:
+            return ast.unparse(ast.fix_missing_locations(self.visit(ast.parse(code))))
+    
+    ## The values of the operands encoded in an opcode, by the name of the
+    ## local in the execute() bodies.
+    def opcode_constants(operands: List[str], opcode: int) -> Dict[str, int]:
+        constants = {}
+        for operand in operands:
+            if not operand[-1].isdigit():
+                continue
+            name, shift = operand[:-1], int(operand[-1])
+            value = (opcode >> shift) & (0x07 if shift != 4 else 0x03)
+            if name == 't':
+                constants['p'] = value << 3
+            else:
+                constants[name] = value
+        return constants
+    
+    ## Name of the handler, e.g. 'ADD A, (IX+d)' is add_a_ixd, (nn) is at_nn.
+    ## Names that would clash get the opcode appended: inc_hl is INC (HL), 
+    ## INC HL is inc_hl_23.
+    def handler_name(instr_name: str, constants: Dict[str, int]) -> str:
+        words = []
+        for word in re.split(r'[ ,]+', instr_name):
+            word = word.replace('(nn)', 'at_nn')
+            match word:
                 case 'b':
-                    output += '\n'
-                    output += '    @property\n'
-                    output += '    def b(self: Self) -> str:\n'
-                    output += '        return z80.instruction.FormattingType.b(self._b)\n'
+                    word = str(constants['b'])
                 case 'cc':
+                    word = Instruction.cc2name[constants['cc']]
+                case 'dd' | 'pp' | 'qq' | 'rr' | 'ss':
+                    word = getattr(Instruction, f'{word}2name')[constants[word]]
+                case 'r' | "r'":
+                    word = Instruction.r2name[constants[word.replace("'", 'prime')]]
+                case 'p':
+                    word = f'{constants["p"]:02x}h'
+            words.append(word.lower().replace("'", 'prime').translate({ord(ch): None for ch in '()+'}))
+        return '_'.join(words)
+    
+    if sys.argv[1:] == ['handlers']:
+        tables = { prefix: [ 'illegal' ] * 256 for prefix in ('BASE', 'CB', 'DD', 'DDCB', 'ED', 'FD', 'FDCB') }
+        tables['BASE'][0xCB] = 'prefix_cb'
+        tables['BASE'][0xDD] = 'prefix_dd'
+        tables['BASE'][0xED] = 'prefix_ed'
+        tables['BASE'][0xFD] = 'prefix_fd'
+        tables['DD'][0xCB] = 'prefix_ddcb'
+        tables['FD'][0xCB] = 'prefix_fdcb'
+        
+        ## Handlers of the lazy flags tables, where they differ.
+        lazy = { f'prefix_{prefix}': f'prefix_{prefix}_lazy' for prefix in ('cb', 'dd', 'ed', 'fd', 'ddcb', 'fdcb') }
+        
+        output = ''
+        output += '## Generated by: python3 -m z80.instruction handlers\n'
+        output += f'from   z80.flags import {", ".join(FLAG_TABLES)}\n'
+        output += 'from   z80.flags import FLAGS, LAZY_ADD, LAZY_CP, LAZY_SUB, LAZY_SZP, LAZY_SZPH\n'
+        output += '\n'
+        output += '\n'
+        output += '\n'
+        output += 'def illegal(cpu, PC: int) -> None:\n'
+        output += '    raise NotImplementedError(cpu.ram[PC])\n'
+        output += '\n'
+        for prefix, table, offset in (('cb', 'CB', 1), ('dd', 'DD', 1), ('ed', 'ED', 1), ('fd', 'FD', 1), ('ddcb', 'DDCB', 3), ('fdcb', 'FDCB', 3)):
+            output += f'def prefix_{prefix}(cpu, PC: int) -> int:\n'
+            output += f'    return {table}[cpu.ram[PC + {offset}]](cpu, PC)\n'
+            output += '\n'
+            output += f'def prefix_{prefix}_lazy(cpu, PC: int) -> int:\n'
+            output += f'    return LAZY_{table}[cpu.ram[PC + {offset}]](cpu, PC)\n'
+            output += '\n'
+        
+        ## Unprefixed handlers by opcode, for the fused handlers.
+        generated = {}
+        names = set()
+        for instr_name, instr in instructions.items():
+            body = textwrap.dedent(instr['execute']).strip('\n')
+            for opcode in instr['opcodes']:
+                constants = opcode_constants(instr['operands'], opcode)
+                name = handler_name(instr_name, constants)
+                if name in names:
+                    name += f'_{opcode:x}'
+                names.add(name)
+                
+                ## Operands that follow the opcode are read from ram.
+                reads = []
+                offset = 1 if opcode <= 0xFF else 2
+                for operand in instr['operands']:
+                    match operand:
+                        case 'd':
+                            reads.append('d = ram[PC + 2]')
+                        case 'e':
+                            reads.append(f'e = (ram[PC + {offset}] ^ 0x80) - 0x80')
+                        case 'n':
+                            reads.append(f'n = ram[PC + {3 if "d" in instr["operands"] else offset}]')
+                        case 'nn':
+                            reads.append(f'nn = ram[PC + {offset}] | ram[PC + {offset + 1}] << 8')
+                
+                code = Specializer(constants).specialize(body)
+                lazy_code = Specializer({}).specialize(LazyFlags().rewrite(code))
+                if lazy_code != code:
+                    lazy[name] = f'{name}_lazy'
+                
+                for handler, handler_code in ((name, code), (f'{name}_lazy', lazy_code)):
+                    if handler != name and handler not in lazy.values():
+                        break
+                    uses = lambda name: re.search(rf'(?<![.\w]){name}\b', handler_code)
                     output += '\n'
-                    output += '    @property\n'
-                    output += '    def cc(self: Self) -> str:\n'
-                    output += '        return z80.instruction.FormattingType.cc(self.cc2name[self._cc])\n'
-                case 'd':
-                    output += '\n'
-                    output += '    @property\n'
-                    output += '    def d(self: Self) -> str:\n'
-                    output += '        return z80.instruction.FormattingType.d(self._d)\n'
-                case 'dd':
-                    output += '\n'
-                    output += '    @property\n'
-                    output += '    def dd(self: Self) -> str:\n'
-                    output += '        return z80.instruction.FormattingType.dd(self.dd2name[self._dd])\n'
-                case 'e':
-                    output += '\n'
-                    output += '    @property\n'
-                    output += '    def e(self: Self) -> int:\n'
-                    output += '        return z80.instruction.FormattingType.e(self._e)\n'
-                    output += '\n'
-                    output += '    @property\n'
-                    output += '    def jump_destination(self: Self) -> str:\n'
-                    output += '        return z80.instruction.FormattingType.jp(self._jump_destination)\n'
-                case 'n':
-                    output += '\n'
-                    output += '    @property\n'
-                    output += '    def n(self: Self) -> str:\n'
-                    output += '        return z80.instruction.FormattingType.n(self._n)\n'
-                case 'nn':
-                    output += '\n'
-                    output += '    @property\n'
-                    output += '    def nn(self: Self) -> str:\n'
-                    output += '        return z80.instruction.FormattingType.nn(self._nn)\n'
-                case 'pp':
-                    output += '\n'
-                    output += '    @property\n'
-                    output += '    def pp(self: Self) -> str:\n'
-                    output += '        return z80.instruction.FormattingType.pp(self.pp2name[self._pp])\n'
-                case 'qq':
-                    output += '\n'
-                    output += '    @property\n'
-                    output += '    def qq(self: Self) -> str:\n'
-                    output += '        return z80.instruction.FormattingType.qq(self.qq2name[self._qq])\n'
-                case 'r':
-                    output += '\n'
-                    output += '    @property\n'
-                    output += '    def r(self: Self) -> str:\n'
-                    output += '        return z80.instruction.FormattingType.r(self.r2name[self._r])\n'
-                case 'rprime':
-                    output += '\n'
-                    output += '    @property\n'
-                    output += '    def rprime(self: Self) -> str:\n'
-                    output += '        return z80.instruction.FormattingType.r(self.r2name[self._rprime])\n'
-                case 'rr':
-                    output += '\n'
-                    output += '    @property\n'
-                    output += '    def rr(self: Self) -> str:\n'
-                    output += '        return z80.instruction.FormattingType.rr(self.rr2name[self._rr])\n'
-                case 'ss':
-                    output += '\n'
-                    output += '    @property\n'
-                    output += '    def ss(self: Self) -> str:\n'
-                    output += '        return z80.instruction.FormattingType.ss(self.ss2name[self._ss])\n'
-                case 't':
-                    output += '\n'
-                    output += '    @property\n'
-                    output += '    def p(self: Self) -> int:\n'
-                    output += '        return z80.instruction.FormattingType.p(self.t2p[self._t])\n'
+                    output += f'## {instr_name}, 0x{opcode:02X}{", lazy flags" if handler != name else ""}\n'
+                    output += f'def {handler}(cpu, PC: int) -> int:\n'
+                    output += '    regs = cpu.registers\n'
+                    if uses('R'):
+                        output += '    R = regs.r\n'
+                    if reads or uses('ram'):
+                        output += '    ram = cpu.ram\n'
+                    for read in reads:
+                        output += f'    {read}\n'
+                    output += f'    regs.PC = (PC + {instr["size"]}) & 0xFFFF\n'
+                    if handler_code != 'pass':
+                        output += textwrap.indent(handler_code, '    ') + '\n'
+                    if not handler_code.split('\n')[-1].startswith('return '):
+                        output += f'    return {instr["cycles"]}\n'
+                
+                if opcode <= 0xFF:
+                    tables['BASE'][opcode] = name
+                    generated[opcode] = (instr_name, name, instr['size'], instr['cycles'], reads, code, lazy_code)
+                else:
+                    tables[f'{opcode >> 8:X}'][opcode & 0xFF] = name
+        
+        ## Fused handlers, one for a sequence of instructions. They are 
+        ## called like the handler of the first one, and return the T-states 
+        ## of all of them. All but the last must go on to the next one.
+        ## Sequences are at most 4 bytes, the longest instruction, so writing
+        ## to one of their bytes drops them from the threaded code like any 
+        ## other instruction (see RAM.invalidate()).
+        fused = collections.defaultdict(list)
+        for opcodes in FUSIONS:
+            parts = [ generated[opcode] for opcode in opcodes ]
+            assert sum(part[2] for part in parts) <= 4
+            assert not any('return' in part[5] for part in parts[:-1])
+            name = '__'.join(part[1] for part in parts)
+            lazy_parts = any(part[5] != part[6] for part in parts)
+            
+            offsets = []
+            for handler, flags in ((name, 'code'), (f'{name}_lazy', 'lazy_code')):
+                if handler != name and not lazy_parts:
+                    break
+                lines = []
+                offset = 0
+                cycles = 0
+                for i, (instr_name, part_name, size, part_cycles, reads, code, lazy_code) in enumerate(parts):
+                    code = lazy_code if flags == 'lazy_code' else code
+                    if i > 0:
+                        lines.append(f'PC = (PC + {offset}) & 0xFFFF')
+                        lines.append('regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F')
+                    lines += reads
+                    if i == len(parts) - 1 or 'regs.PC' in code:
+                        lines.append(f'regs.PC = (PC + {size}) & 0xFFFF')
+                    ## A return in the last one, on a taken branch.
+                    lines.append(re.sub(r'^( *)return (\d+)$', lambda m: f'{m[1]}return {cycles + int(m[2])}', code, flags=re.M))
+                    offset = size
+                    cycles += part_cycles
+                code = '\n'.join(lines)
+                uses = lambda name: re.search(rf'(?<![.\w]){name}\b', code)
+                output += '\n'
+                output += f'## {" + ".join(part[0] for part in parts)}, {" ".join(f"0x{opcode:02X}" for opcode in opcodes)}{", lazy flags" if handler != name else ""}\n'
+                output += f'def {handler}(cpu, PC: int) -> int:\n'
+                output += '    regs = cpu.registers\n'
+                if uses('R'):
+                    output += '    R = regs.r\n'
+                if uses('ram'):
+                    output += '    ram = cpu.ram\n'
+                output += textwrap.indent(code, '    ') + '\n'
+                output += f'    return {cycles}\n'
+            
+            ## The opcodes after the first one, by their offset.
+            offset = 0
+            for opcode, part in zip(opcodes, parts):
+                if offset:
+                    offsets.append((offset, opcode))
+                offset += part[2]
+            fused[opcodes[0]].append((tuple(offsets), name, f'{name}_lazy' if lazy_parts else name))
+        
+        for table, handlers in tables.items():
+            output += '\n'
+            output += '\n'
+            output += '\n'
+            output += f'{table} =\\\n'
+            output += '[\n'
+            for row in range(0, 256, 4):
+                output += '    ' + ' '.join(f'{handler + ",":16}' for handler in handlers[row:row + 4]).rstrip() + f'\t## 0x{row:02X}\n'
+            output += ']\n'
+        
+        ## The lazy flags tables are the tables above, with the handlers that
+        ## have a lazy version replaced by it.
+        output += '\n'
+        output += '\n'
+        output += '\n'
+        output += '## Lazy flags, see z80.flags.\n'
+        output += 'LAZY =\\\n'
+        output += '{\n'
+        for handler, lazy_handler in lazy.items():
+            output += f'    {handler}: {lazy_handler},\n'
+        output += '}\n'
+        output += '\n'
+        for table in tables:
+            output += f'LAZY_{table} = [ LAZY.get(handler, handler) for handler in {table} ]\n'
+        
+        ## Fused handlers by their first opcode, with the opcodes that must
+        ## follow (offset, opcode).
+        for table, which in (('FUSED', 0), ('LAZY_FUSED', 1)):
+            output += '\n'
+            output += '\n'
+            output += '\n'
+            output += f'{table} =\\\n'
+            output += '{\n'
+            for first, candidates in sorted(fused.items()):
+                entries = [ f'(({"".join(f"({offset}, 0x{opcode:02X}), " for offset, opcode in offsets).rstrip()}), {candidate[which]})' for offsets, *candidate in candidates ]
+                output += f'    0x{first:02X}: [ {", ".join(entries)} ],\n'
+            output += '}\n'
+        
+        ## For decoding without going through the prefix handlers.
+        output += '\n'
+        output += '\n'
+        output += '\n'
+        output += '## The table of the opcodes after a prefix, and the offset of their byte.\n'
+        output += 'PREFIXES =\\\n'
+        output += '{\n'
+        for lazy_prefix in ('', '_lazy'):
+            for prefix, table, offset in (('cb', 'CB', 1), ('dd', 'DD', 1), ('ed', 'ED', 1), ('fd', 'FD', 1), ('ddcb', 'DDCB', 3), ('fdcb', 'FDCB', 3)):
+                output += f'    prefix_{prefix}{lazy_prefix}: ({"LAZY_" if lazy_prefix else ""}{table}, {offset}),\n'
+        output += '}\n'
+        
+        ## The checks of the handlers, against the execute() of the classes.
+        output += '\n'
+        output += '\n'
+        output += '\n'
+        output += textwrap.dedent('''\
+            ## Checks of the handlers: python3 -m z80.handlers [runs] [instructions]
+            ## runs every opcode (runs times, on random state) through its handler 
+            ## and through the execute() of its class, which must agree, and times
+            ## a loop run both ways.
+            if __name__ == '__main__':
+                import random
+                import sys
+                import time
+                import z80
+                
+                runs = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+                instructions = int(sys.argv[2]) if len(sys.argv) > 2 else 200000
+                
+                def state(cpu: 'z80.Z80') -> tuple:
+                    regs = cpu.registers
+                    return (tuple(regs.r), tuple(regs.r_prime), regs.SP, regs.PC, regs.IX, regs.IY, regs.I, regs.R,
+                        regs.IFF1, regs.IFF2, regs.IM, regs.halted, cpu.cycles)
+                
+                handlers, classes = z80.Z80(), z80.Z80()
+                rnd = random.Random(0)
+                checked = 0
+                for prefix, table in ((0x00, BASE), (0xCB, CB), (0xDD, DD), (0xED, ED), (0xFD, FD), (0xDDCB, DDCB), (0xFDCB, FDCB)):
+                    for opcode, handler in enumerate(table):
+                        if handler is illegal or handler in PREFIXES:
+                            continue
+                        match prefix:
+                            case 0x00:
+                                code = [ opcode ]
+                            case 0xDDCB | 0xFDCB:
+                                code = [ prefix >> 8, 0xCB, rnd.randrange(0x100), opcode ]
+                            case _:
+                                code = [ prefix, opcode ]
+                        for run in range(runs):
+                            image = rnd.randbytes(0x10000)
+                            operands = rnd.randbytes(2)
+                            r = list(rnd.randbytes(8))
+                            words = [ rnd.randrange(0x10000) for _ in range(3) ]
+                            for cpu in (handlers, classes):
+                                cpu.ram._ram[:] = image * 2
+                                cpu.ram._ram[0x4000:0x4000 + len(code) + 2] = bytes(code) + operands
+                                cpu.registers.r[:] = r
+                                cpu.registers.SP, cpu.registers.IX, cpu.registers.IY = words
+                                cpu.registers.PC = 0x4000
+                                cpu.cycles = 0
+                            handlers.run(1)
+                            classes.stepi()
+                            if state(handlers) != state(classes) or handlers.ram._ram != classes.ram._ram:
+                                sys.exit(f'{handler.__name__}: {state(handlers)} != {state(classes)}')
+                        checked += 1
+                print(f'{checked} opcodes, {runs} runs each: the handlers match execute().')
+                
+                ## ADD A, B; INC HL; BIT 3, (IX+0); DJNZ in a loop.
+                loop = bytes([ 0x06, 0x00, 0x80, 0x23, 0xDD, 0xCB, 0x00, 0x5E, 0x10, 0xF8, 0x18, 0xF4 ])
+                for name, cpu, run in (
+                    ('handlers', handlers, lambda: handlers.run(instructions)),
+                    ('execute()', classes, lambda: [ classes.stepi() for _ in range(instructions) ]),
+                ):
+                    cpu.ram._ram[0x4000:0x4000 + len(loop)] = loop
+                    cpu.registers.PC = 0x4000
+                    start = time.perf_counter()
+                    run()
+                    print(f'{name}: {instructions / (time.perf_counter() - start) / 1e6:.2f} MIPS')
+        ''')
     print(output)
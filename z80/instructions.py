@@ -1,4 +1,5 @@
 from   typing import Self, List, Type
+from   z80.flags import ADD, CP, DAA_AF, DEC, INC, SUB, SZP
 import z80.instruction
 
 class LD_r_rprime(z80.instruction.Instruction):
@@ -8,23 +9,22 @@ class LD_r_rprime(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x40, 0x41, 0x42, 0x43, 0x44, 0x45, 0x47, 0x48, 0x49, 0x4A, 0x4B, 0x4C, 0x4D, 0x4F, 0x50, 0x51, 0x52, 0x53, 0x54, 0x55, 0x57, 0x58, 0x59, 0x5A, 0x5B, 0x5C, 0x5D, 0x5F, 0x60, 0x61, 0x62, 0x63, 0x64, 0x65, 0x67, 0x68, 0x69, 0x6A, 0x6B, 0x6C, 0x6D, 0x6F, 0x78, 0x79, 0x7A, 0x7B, 0x7C, 0x7D, 0x7F]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"LD r, r'; r={self.r}, r'={self.rprime}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_r', '_rprime')
+    size = 1
+    opcode_fields = { 'r': (3, 0x07), 'rprime': (0, 0x07) }
+    template = "LD r, r'; r={r}, r'={rprime}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._r = (opcode >> 3) & 0x07
         self._rprime = (opcode >> 0) & 0x07
 
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
-
-    @property
-    def rprime(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._rprime])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        r = self._r
+        rprime = self._rprime
+        R[r] = R[rprime]
+        return 4
 
 class LD_r_n(z80.instruction.Instruction):
     @classmethod
@@ -33,23 +33,22 @@ class LD_r_n(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x06, 0x0E, 0x16, 0x1E, 0x26, 0x2E, 0x3E]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"LD r, n; r={self.r}, n={self.n}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_r', '_n')
+    size = 2
+    opcode_fields = { 'r': (3, 0x07) }
+    template = "LD r, n; r={r}, n={n}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._r = (opcode >> 3) & 0x07
-        self._n = self._ram.get_byte(self._PC + 1, signed=False)
-
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+        self._n = ram.get_byte(PC + 1, signed=False)
 
-    @property
-    def n(self: Self) -> str:
-        return z80.instruction.FormattingType.n(self._n)
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        r = self._r
+        n = self._n
+        R[r] = n
+        return 7
 
 class LD_r_deref_HL(z80.instruction.Instruction):
     @classmethod
@@ -58,18 +57,21 @@ class LD_r_deref_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x46, 0x4E, 0x56, 0x5E, 0x66, 0x6E, 0x7E]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"LD r, (HL); r={self.r}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_r',)
+    size = 1
+    opcode_fields = { 'r': (3, 0x07) }
+    template = "LD r, (HL); r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._r = (opcode >> 3) & 0x07
 
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        r = self._r
+        R[r] = ram[R[4] << 8 | R[5]]
+        return 7
 
 class LD_r_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -78,23 +80,24 @@ class LD_r_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDD46, 0xDD4E, 0xDD56, 0xDD5E, 0xDD66, 0xDD6E, 0xDD7E]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"LD r, (IX+d); r={self.r}, d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_r', '_d')
+    size = 3
+    opcode_fields = { 'r': (3, 0x07) }
+    template = "LD r, (IX+d); r={r}, d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._r = (opcode >> 3) & 0x07
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        r = self._r
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        R[r] = ram[(regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF]
+        return 19
 
 class LD_r_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -103,23 +106,24 @@ class LD_r_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFD46, 0xFD4E, 0xFD56, 0xFD5E, 0xFD66, 0xFD6E, 0xFD7E]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"LD r, (IY+d); r={self.r}, d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_r', '_d')
+    size = 3
+    opcode_fields = { 'r': (3, 0x07) }
+    template = "LD r, (IY+d); r={r}, d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._r = (opcode >> 3) & 0x07
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        r = self._r
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        R[r] = ram[(regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF]
+        return 19
 
 class LD_deref_HL_r(z80.instruction.Instruction):
     @classmethod
@@ -128,18 +132,21 @@ class LD_deref_HL_r(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x70, 0x71, 0x72, 0x73, 0x74, 0x75, 0x77]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"LD (HL), r; r={self.r}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_r',)
+    size = 1
+    opcode_fields = { 'r': (0, 0x07) }
+    template = "LD (HL), r; r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._r = (opcode >> 0) & 0x07
 
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        r = self._r
+        ram[R[4] << 8 | R[5]] = R[r]
+        return 7
 
 class LD_deref_IX_plus_d_r(z80.instruction.Instruction):
     @classmethod
@@ -148,23 +155,24 @@ class LD_deref_IX_plus_d_r(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDD70, 0xDD71, 0xDD72, 0xDD73, 0xDD74, 0xDD75, 0xDD77]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"LD (IX+d), r; d={self.d}, r={self.r}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
+    __slots__ = ('_d', '_r')
+    size = 3
+    opcode_fields = { 'r': (0, 0x07) }
+    template = "LD (IX+d), r; d={d}, r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
         self._r = (opcode >> 0) & 0x07
 
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
-
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        r = self._r
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        ram[(regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF] = R[r]
+        return 19
 
 class LD_deref_IY_plus_d_r(z80.instruction.Instruction):
     @classmethod
@@ -173,23 +181,24 @@ class LD_deref_IY_plus_d_r(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFD70, 0xFD71, 0xFD72, 0xFD73, 0xFD74, 0xFD75, 0xFD77]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"LD (IY+d), r; d={self.d}, r={self.r}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
+    __slots__ = ('_d', '_r')
+    size = 3
+    opcode_fields = { 'r': (0, 0x07) }
+    template = "LD (IY+d), r; d={d}, r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
         self._r = (opcode >> 0) & 0x07
 
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
-
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        r = self._r
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        ram[(regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF] = R[r]
+        return 19
 
 class LD_deref_HL_n(z80.instruction.Instruction):
     @classmethod
@@ -198,18 +207,20 @@ class LD_deref_HL_n(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x36]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"LD (HL), n; n={self.n}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._n = self._ram.get_byte(self._PC + 1, signed=False)
-
-    @property
-    def n(self: Self) -> str:
-        return z80.instruction.FormattingType.n(self._n)
+    __slots__ = ('_n',)
+    size = 2
+    template = "LD (HL), n; n={n}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._n = ram.get_byte(PC + 1, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        n = self._n
+        ram[R[4] << 8 | R[5]] = n
+        return 10
 
 class LD_deref_IX_plus_d_n(z80.instruction.Instruction):
     @classmethod
@@ -218,23 +229,22 @@ class LD_deref_IX_plus_d_n(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDD36]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"LD (IX+d), n; d={self.d}, n={self.n}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-        self._n = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
-
-    @property
-    def n(self: Self) -> str:
-        return z80.instruction.FormattingType.n(self._n)
+    __slots__ = ('_d', '_n')
+    size = 4
+    template = "LD (IX+d), n; d={d}, n={n}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+        self._n = ram.get_byte(PC + 3, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        ram = cpu.ram
+        d = self._d
+        n = self._n
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        ram[(regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF] = n
+        return 19
 
 class LD_deref_IY_plus_d_n(z80.instruction.Instruction):
     @classmethod
@@ -243,23 +253,22 @@ class LD_deref_IY_plus_d_n(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFD36]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"LD (IY+d), n; d={self.d}, n={self.n}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-        self._n = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
-
-    @property
-    def n(self: Self) -> str:
-        return z80.instruction.FormattingType.n(self._n)
+    __slots__ = ('_d', '_n')
+    size = 4
+    template = "LD (IY+d), n; d={d}, n={n}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+        self._n = ram.get_byte(PC + 3, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        ram = cpu.ram
+        d = self._d
+        n = self._n
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        ram[(regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF] = n
+        return 19
 
 class LD_A_deref_BC(z80.instruction.Instruction):
     @classmethod
@@ -268,13 +277,18 @@ class LD_A_deref_BC(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x0A]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"LD A, (BC);"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "LD A, (BC);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        R[7] = ram[R[0] << 8 | R[1]]
+        return 7
 
 class LD_A_deref_DE(z80.instruction.Instruction):
     @classmethod
@@ -283,13 +297,18 @@ class LD_A_deref_DE(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x1A]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"LD A, (DE);"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "LD A, (DE);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        R[7] = ram[R[2] << 8 | R[3]]
+        return 7
 
 class LD_A_deref_nn(z80.instruction.Instruction):
     @classmethod
@@ -298,18 +317,20 @@ class LD_A_deref_nn(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x3A]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"LD A, (nn); nn={self._nn}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._nn = self._ram.get_word(self._PC + 1)
-
-    @property
-    def nn(self: Self) -> str:
-        return z80.instruction.FormattingType.nn(self._nn)
+    __slots__ = ('_nn',)
+    size = 3
+    template = "LD A, (nn); nn={nn:d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._nn = ram.get_word(PC + 1)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        nn = self._nn
+        R[7] = ram[nn]
+        return 13
 
 class LD_deref_BC_A(z80.instruction.Instruction):
     @classmethod
@@ -318,13 +339,18 @@ class LD_deref_BC_A(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x02]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"LD (BC), A;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "LD (BC), A;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        ram[R[0] << 8 | R[1]] = R[7]
+        return 7
 
 class LD_deref_DE_A(z80.instruction.Instruction):
     @classmethod
@@ -333,13 +359,18 @@ class LD_deref_DE_A(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x12]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"LD (DE), A;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "LD (DE), A;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        ram[R[2] << 8 | R[3]] = R[7]
+        return 7
 
 class LD_deref_nn_A(z80.instruction.Instruction):
     @classmethod
@@ -348,18 +379,20 @@ class LD_deref_nn_A(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x32]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"LD (nn), A; nn={self._nn}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._nn = self._ram.get_word(self._PC + 1)
-
-    @property
-    def nn(self: Self) -> str:
-        return z80.instruction.FormattingType.nn(self._nn)
+    __slots__ = ('_nn',)
+    size = 3
+    template = "LD (nn), A; nn={nn:d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._nn = ram.get_word(PC + 1)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        nn = self._nn
+        ram[nn] = R[7]
+        return 13
 
 class LD_A_I(z80.instruction.Instruction):
     @classmethod
@@ -368,13 +401,19 @@ class LD_A_I(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xED57]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"LD A, I;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "LD A, I;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        R[7] = regs.I
+        R[6] = R[6] & 0x01 | (regs.I & 0xA8) | (regs.I == 0) << 6 | regs.IFF2 << 2
+        return 9
 
 class LD_A_R(z80.instruction.Instruction):
     @classmethod
@@ -383,13 +422,19 @@ class LD_A_R(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xED5F]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"LD A, R;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "LD A, R;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        R[7] = regs.R
+        R[6] = R[6] & 0x01 | (regs.R & 0xA8) | (regs.R == 0) << 6 | regs.IFF2 << 2
+        return 9
 
 class LD_I_A(z80.instruction.Instruction):
     @classmethod
@@ -398,13 +443,18 @@ class LD_I_A(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xED47]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"LD I, A;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "LD I, A;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        regs.I = R[7]
+        return 9
 
 class LD_R_A(z80.instruction.Instruction):
     @classmethod
@@ -413,13 +463,18 @@ class LD_R_A(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xED4F]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"LD R, A;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "LD R, A;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        regs.R = R[7]
+        return 9
 
 class LD_dd_nn(z80.instruction.Instruction):
     @classmethod
@@ -428,23 +483,26 @@ class LD_dd_nn(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x01, 0x11, 0x21, 0x31]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"LD dd, nn; dd={self.dd}, nn={self._nn}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_dd', '_nn')
+    size = 3
+    opcode_fields = { 'dd': (4, 0x03) }
+    template = "LD dd, nn; dd={dd}, nn={nn:d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._dd = (opcode >> 4) & 0x03
-        self._nn = self._ram.get_word(self._PC + 1)
-
-    @property
-    def dd(self: Self) -> str:
-        return z80.instruction.FormattingType.dd(self.dd2name[self._dd])
-
-    @property
-    def nn(self: Self) -> str:
-        return z80.instruction.FormattingType.nn(self._nn)
+        self._nn = ram.get_word(PC + 1)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        dd = self._dd
+        nn = self._nn
+        if dd == 3:
+            regs.SP = nn
+        else:
+            R[2 * dd] = nn >> 8
+            R[2 * dd + 1] = nn & 0xFF
+        return 10
 
 class LD_IX_nn(z80.instruction.Instruction):
     @classmethod
@@ -453,18 +511,19 @@ class LD_IX_nn(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDD21]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"LD IX, nn; nn={self._nn}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._nn = self._ram.get_word(self._PC + 2)
-
-    @property
-    def nn(self: Self) -> str:
-        return z80.instruction.FormattingType.nn(self._nn)
+    __slots__ = ('_nn',)
+    size = 4
+    template = "LD IX, nn; nn={nn:d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._nn = ram.get_word(PC + 2)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        nn = self._nn
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        regs.IX = nn
+        return 14
 
 class LD_IY_nn(z80.instruction.Instruction):
     @classmethod
@@ -473,18 +532,19 @@ class LD_IY_nn(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFD21]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"LD IY, nn; nn={self._nn}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._nn = self._ram.get_word(self._PC + 2)
-
-    @property
-    def nn(self: Self) -> str:
-        return z80.instruction.FormattingType.nn(self._nn)
+    __slots__ = ('_nn',)
+    size = 4
+    template = "LD IY, nn; nn={nn:d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._nn = ram.get_word(PC + 2)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        nn = self._nn
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        regs.IY = nn
+        return 14
 
 class LD_HL_deref_nn(z80.instruction.Instruction):
     @classmethod
@@ -493,18 +553,21 @@ class LD_HL_deref_nn(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x2A]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"LD HL, (nn); nn={self._nn}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._nn = self._ram.get_word(self._PC + 1)
-
-    @property
-    def nn(self: Self) -> str:
-        return z80.instruction.FormattingType.nn(self._nn)
+    __slots__ = ('_nn',)
+    size = 3
+    template = "LD HL, (nn); nn={nn:d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._nn = ram.get_word(PC + 1)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        nn = self._nn
+        R[5] = ram[nn]
+        R[4] = ram[(nn + 1) & 0xFFFF]
+        return 16
 
 class LD_dd_deref_nn(z80.instruction.Instruction):
     @classmethod
@@ -513,23 +576,29 @@ class LD_dd_deref_nn(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xED4B, 0xED5B, 0xED6B, 0xED7B]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"LD dd, (nn); dd={self.dd}, nn={self._nn}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_dd', '_nn')
+    size = 4
+    opcode_fields = { 'dd': (4, 0x03) }
+    template = "LD dd, (nn); dd={dd}, nn={nn:d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._dd = (opcode >> 4) & 0x03
-        self._nn = self._ram.get_word(self._PC + 2)
-
-    @property
-    def dd(self: Self) -> str:
-        return z80.instruction.FormattingType.dd(self.dd2name[self._dd])
-
-    @property
-    def nn(self: Self) -> str:
-        return z80.instruction.FormattingType.nn(self._nn)
+        self._nn = ram.get_word(PC + 2)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        dd = self._dd
+        nn = self._nn
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        v = ram[nn] | ram[(nn + 1) & 0xFFFF] << 8
+        if dd == 3:
+            regs.SP = v
+        else:
+            R[2 * dd] = v >> 8
+            R[2 * dd + 1] = v & 0xFF
+        return 20
 
 class LD_IX_deref_nn(z80.instruction.Instruction):
     @classmethod
@@ -538,18 +607,20 @@ class LD_IX_deref_nn(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDD2A]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"LD IX, (nn); nn={self._nn}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._nn = self._ram.get_word(self._PC + 2)
-
-    @property
-    def nn(self: Self) -> str:
-        return z80.instruction.FormattingType.nn(self._nn)
+    __slots__ = ('_nn',)
+    size = 4
+    template = "LD IX, (nn); nn={nn:d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._nn = ram.get_word(PC + 2)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        ram = cpu.ram
+        nn = self._nn
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        regs.IX = ram[nn] | ram[(nn + 1) & 0xFFFF] << 8
+        return 20
 
 class LD_IY_deref_nn(z80.instruction.Instruction):
     @classmethod
@@ -558,18 +629,20 @@ class LD_IY_deref_nn(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFD2A]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"LD IY, (nn); nn={self._nn}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._nn = self._ram.get_word(self._PC + 2)
-
-    @property
-    def nn(self: Self) -> str:
-        return z80.instruction.FormattingType.nn(self._nn)
+    __slots__ = ('_nn',)
+    size = 4
+    template = "LD IY, (nn); nn={nn:d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._nn = ram.get_word(PC + 2)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        ram = cpu.ram
+        nn = self._nn
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        regs.IY = ram[nn] | ram[(nn + 1) & 0xFFFF] << 8
+        return 20
 
 class LD_deref_nn_HL(z80.instruction.Instruction):
     @classmethod
@@ -578,18 +651,21 @@ class LD_deref_nn_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x22]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"LD (nn), HL; nn={self._nn}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._nn = self._ram.get_word(self._PC + 1)
-
-    @property
-    def nn(self: Self) -> str:
-        return z80.instruction.FormattingType.nn(self._nn)
+    __slots__ = ('_nn',)
+    size = 3
+    template = "LD (nn), HL; nn={nn:d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._nn = ram.get_word(PC + 1)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        nn = self._nn
+        ram[nn] = R[5]
+        ram[(nn + 1) & 0xFFFF] = R[4]
+        return 16
 
 class LD_deref_nn_dd(z80.instruction.Instruction):
     @classmethod
@@ -598,23 +674,26 @@ class LD_deref_nn_dd(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xED43, 0xED53, 0xED63, 0xED73]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"LD (nn), dd; nn={self._nn}, dd={self.dd}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._nn = self._ram.get_word(self._PC + 2)
+    __slots__ = ('_nn', '_dd')
+    size = 4
+    opcode_fields = { 'dd': (4, 0x03) }
+    template = "LD (nn), dd; nn={nn:d}, dd={dd}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._nn = ram.get_word(PC + 2)
         self._dd = (opcode >> 4) & 0x03
 
-    @property
-    def nn(self: Self) -> str:
-        return z80.instruction.FormattingType.nn(self._nn)
-
-    @property
-    def dd(self: Self) -> str:
-        return z80.instruction.FormattingType.dd(self.dd2name[self._dd])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        nn = self._nn
+        dd = self._dd
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        v = (regs.SP if dd == 3 else R[2 * dd] << 8 | R[2 * dd + 1])
+        ram[nn] = v & 0xFF
+        ram[(nn + 1) & 0xFFFF] = v >> 8
+        return 20
 
 class LD_deref_nn_IX(z80.instruction.Instruction):
     @classmethod
@@ -622,19 +701,45 @@ class LD_deref_nn_IX(z80.instruction.Instruction):
         return "LD (nn), IX"
     @classmethod
     def opcodes(cls) -> List[int]:
-        return [0xFD22]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"LD (nn), IX; nn={self._nn}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._nn = self._ram.get_word(self._PC + 2)
+        return [0xDD22]
+    __slots__ = ('_nn',)
+    size = 4
+    template = "LD (nn), IX; nn={nn:d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._nn = ram.get_word(PC + 2)
 
-    @property
-    def nn(self: Self) -> str:
-        return z80.instruction.FormattingType.nn(self._nn)
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        ram = cpu.ram
+        nn = self._nn
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        ram[nn] = regs.IX & 0xFF
+        ram[(nn + 1) & 0xFFFF] = regs.IX >> 8
+        return 20
+
+class LD_deref_nn_IY(z80.instruction.Instruction):
+    @classmethod
+    def name(cls) -> str:
+        return "LD (nn), IY"
+    @classmethod
+    def opcodes(cls) -> List[int]:
+        return [0xFD22]
+    __slots__ = ('_nn',)
+    size = 4
+    template = "LD (nn), IY; nn={nn:d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._nn = ram.get_word(PC + 2)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        ram = cpu.ram
+        nn = self._nn
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        ram[nn] = regs.IY & 0xFF
+        ram[(nn + 1) & 0xFFFF] = regs.IY >> 8
+        return 20
 
 class LD_SP_HL(z80.instruction.Instruction):
     @classmethod
@@ -643,13 +748,17 @@ class LD_SP_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xF9]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"LD SP, HL;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "LD SP, HL;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        regs.SP = R[4] << 8 | R[5]
+        return 6
 
 class LD_SP_IX(z80.instruction.Instruction):
     @classmethod
@@ -658,13 +767,17 @@ class LD_SP_IX(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDDF9]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"LD SP, IX;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "LD SP, IX;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        regs.SP = regs.IX
+        return 10
 
 class LD_SP_IY(z80.instruction.Instruction):
     @classmethod
@@ -673,13 +786,17 @@ class LD_SP_IY(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFDF9]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"LD SP, IY;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "LD SP, IY;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        regs.SP = regs.IY
+        return 10
 
 class PUSH_qq(z80.instruction.Instruction):
     @classmethod
@@ -688,18 +805,26 @@ class PUSH_qq(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xC5, 0xD5, 0xE5, 0xF5]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"PUSH qq; qq={self.qq}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_qq',)
+    size = 1
+    opcode_fields = { 'qq': (4, 0x03) }
+    template = "PUSH qq; qq={qq}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._qq = (opcode >> 4) & 0x03
 
-    @property
-    def qq(self: Self) -> str:
-        return z80.instruction.FormattingType.qq(self.qq2name[self._qq])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        qq = self._qq
+        hi, lo = (R[7], R[6]) if qq == 3 else (R[2 * qq], R[2 * qq + 1])
+        sp = (regs.SP - 1) & 0xFFFF
+        ram[sp] = hi
+        sp = (sp - 1) & 0xFFFF
+        ram[sp] = lo
+        regs.SP = sp
+        return 11
 
 class PUSH_IX(z80.instruction.Instruction):
     @classmethod
@@ -708,13 +833,22 @@ class PUSH_IX(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDDE5]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"PUSH IX;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "PUSH IX;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        sp = (regs.SP - 1) & 0xFFFF
+        ram[sp] = regs.IX >> 8
+        sp = (sp - 1) & 0xFFFF
+        ram[sp] = regs.IX & 0xFF
+        regs.SP = sp
+        return 15
 
 class PUSH_IY(z80.instruction.Instruction):
     @classmethod
@@ -723,13 +857,22 @@ class PUSH_IY(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFDE5]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"PUSH IY;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "PUSH IY;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        sp = (regs.SP - 1) & 0xFFFF
+        ram[sp] = regs.IY >> 8
+        sp = (sp - 1) & 0xFFFF
+        ram[sp] = regs.IY & 0xFF
+        regs.SP = sp
+        return 15
 
 class POP_qq(z80.instruction.Instruction):
     @classmethod
@@ -738,18 +881,28 @@ class POP_qq(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xC1, 0xD1, 0xE1, 0xF1]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"POP qq; qq={self.qq}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_qq',)
+    size = 1
+    opcode_fields = { 'qq': (4, 0x03) }
+    template = "POP qq; qq={qq}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._qq = (opcode >> 4) & 0x03
 
-    @property
-    def qq(self: Self) -> str:
-        return z80.instruction.FormattingType.qq(self.qq2name[self._qq])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        qq = self._qq
+        sp = regs.SP
+        lo = ram[sp]
+        hi = ram[(sp + 1) & 0xFFFF]
+        regs.SP = (sp + 2) & 0xFFFF
+        if qq == 3:
+            R[7], R[6] = hi, lo
+        else:
+            R[2 * qq], R[2 * qq + 1] = hi, lo
+        return 10
 
 class POP_IX(z80.instruction.Instruction):
     @classmethod
@@ -758,13 +911,22 @@ class POP_IX(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDDE1]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"POP IX;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "POP IX;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        sp = regs.SP
+        lo = ram[sp]
+        hi = ram[(sp + 1) & 0xFFFF]
+        regs.SP = (sp + 2) & 0xFFFF
+        regs.IX = hi << 8 | lo
+        return 14
 
 class POP_IY(z80.instruction.Instruction):
     @classmethod
@@ -773,13 +935,22 @@ class POP_IY(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFDE1]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"POP IY;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "POP IY;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        sp = regs.SP
+        lo = ram[sp]
+        hi = ram[(sp + 1) & 0xFFFF]
+        regs.SP = (sp + 2) & 0xFFFF
+        regs.IY = hi << 8 | lo
+        return 14
 
 class EX_DE_HL(z80.instruction.Instruction):
     @classmethod
@@ -788,13 +959,17 @@ class EX_DE_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xEB]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"EX DE, HL;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "EX DE, HL;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        R[2], R[3], R[4], R[5] = R[4], R[5], R[2], R[3]
+        return 4
 
 class EX_AF_AFprime(z80.instruction.Instruction):
     @classmethod
@@ -803,13 +978,18 @@ class EX_AF_AFprime(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x08]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"EX AF, AF';"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "EX AF, AF';"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        P = regs.r_prime
+        R[6], R[7], P[6], P[7] = P[6], P[7], R[6], R[7]
+        return 4
 
 class EXX(z80.instruction.Instruction):
     @classmethod
@@ -818,13 +998,18 @@ class EXX(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xD9]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"EXX;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "EXX;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        P = regs.r_prime
+        R[0:6], P[0:6] = P[0:6], R[0:6]
+        return 4
 
 class EX_deref_SP_HL(z80.instruction.Instruction):
     @classmethod
@@ -833,13 +1018,21 @@ class EX_deref_SP_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xE3]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"EX (SP), HL;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "EX (SP), HL;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        sp = regs.SP
+        lo, hi = ram[sp], ram[(sp + 1) & 0xFFFF]
+        ram[sp], ram[(sp + 1) & 0xFFFF] = R[5], R[4]
+        R[5], R[4] = lo, hi
+        return 19
 
 class EX_deref_SP_IX(z80.instruction.Instruction):
     @classmethod
@@ -848,13 +1041,21 @@ class EX_deref_SP_IX(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDDE3]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"EX (SP), IX;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "EX (SP), IX;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        sp = regs.SP
+        lo, hi = ram[sp], ram[(sp + 1) & 0xFFFF]
+        ram[sp], ram[(sp + 1) & 0xFFFF] = regs.IX & 0xFF, regs.IX >> 8
+        regs.IX = hi << 8 | lo
+        return 23
 
 class EX_deref_SP_IY(z80.instruction.Instruction):
     @classmethod
@@ -863,13 +1064,21 @@ class EX_deref_SP_IY(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFDE3]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"EX (SP), IY;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "EX (SP), IY;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        sp = regs.SP
+        lo, hi = ram[sp], ram[(sp + 1) & 0xFFFF]
+        ram[sp], ram[(sp + 1) & 0xFFFF] = regs.IY & 0xFF, regs.IY >> 8
+        regs.IY = hi << 8 | lo
+        return 23
 
 class LDI(z80.instruction.Instruction):
     @classmethod
@@ -878,13 +1087,33 @@ class LDI(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xEDA0]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"LDI;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "LDI;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        hl = R[4] << 8 | R[5]
+        de = R[2] << 8 | R[3]
+        bc = ((R[0] << 8 | R[1]) - 1) & 0xFFFF
+        v = ram[hl]
+        ram[de] = v
+        de = (de + 1) & 0xFFFF
+        R[2] = de >> 8
+        R[3] = de & 0xFF
+        n = v + R[7]
+        R[6] = R[6] & 0xC1 | (bc != 0) << 2 | n & 0x08 | (n << 4) & 0x20
+        hl = (hl + 1) & 0xFFFF
+        R[4] = hl >> 8
+        R[5] = hl & 0xFF
+        R[0] = bc >> 8
+        R[1] = bc & 0xFF
+        return 16
 
 class LDIR(z80.instruction.Instruction):
     @classmethod
@@ -893,13 +1122,36 @@ class LDIR(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xEDB0]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"LDIR;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "LDIR;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        hl = R[4] << 8 | R[5]
+        de = R[2] << 8 | R[3]
+        bc = ((R[0] << 8 | R[1]) - 1) & 0xFFFF
+        v = ram[hl]
+        ram[de] = v
+        de = (de + 1) & 0xFFFF
+        R[2] = de >> 8
+        R[3] = de & 0xFF
+        n = v + R[7]
+        R[6] = R[6] & 0xC1 | (bc != 0) << 2 | n & 0x08 | (n << 4) & 0x20
+        hl = (hl + 1) & 0xFFFF
+        R[4] = hl >> 8
+        R[5] = hl & 0xFF
+        R[0] = bc >> 8
+        R[1] = bc & 0xFF
+        if bc:
+            regs.PC = (regs.PC - 2) & 0xFFFF
+            return 21
+        return 16
 
 class LDD(z80.instruction.Instruction):
     @classmethod
@@ -908,13 +1160,33 @@ class LDD(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xEDA8]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"LDD;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "LDD;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        hl = R[4] << 8 | R[5]
+        de = R[2] << 8 | R[3]
+        bc = ((R[0] << 8 | R[1]) - 1) & 0xFFFF
+        v = ram[hl]
+        ram[de] = v
+        de = (de - 1) & 0xFFFF
+        R[2] = de >> 8
+        R[3] = de & 0xFF
+        n = v + R[7]
+        R[6] = R[6] & 0xC1 | (bc != 0) << 2 | n & 0x08 | (n << 4) & 0x20
+        hl = (hl - 1) & 0xFFFF
+        R[4] = hl >> 8
+        R[5] = hl & 0xFF
+        R[0] = bc >> 8
+        R[1] = bc & 0xFF
+        return 16
 
 class LDDR(z80.instruction.Instruction):
     @classmethod
@@ -923,13 +1195,36 @@ class LDDR(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xEDB8]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"LDDR;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "LDDR;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        hl = R[4] << 8 | R[5]
+        de = R[2] << 8 | R[3]
+        bc = ((R[0] << 8 | R[1]) - 1) & 0xFFFF
+        v = ram[hl]
+        ram[de] = v
+        de = (de - 1) & 0xFFFF
+        R[2] = de >> 8
+        R[3] = de & 0xFF
+        n = v + R[7]
+        R[6] = R[6] & 0xC1 | (bc != 0) << 2 | n & 0x08 | (n << 4) & 0x20
+        hl = (hl - 1) & 0xFFFF
+        R[4] = hl >> 8
+        R[5] = hl & 0xFF
+        R[0] = bc >> 8
+        R[1] = bc & 0xFF
+        if bc:
+            regs.PC = (regs.PC - 2) & 0xFFFF
+            return 21
+        return 16
 
 class CPI(z80.instruction.Instruction):
     @classmethod
@@ -938,13 +1233,31 @@ class CPI(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xEDA1]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"CPI;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "CPI;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        hl = R[4] << 8 | R[5]
+        bc = ((R[0] << 8 | R[1]) - 1) & 0xFFFF
+        a = R[7]
+        v = ram[hl]
+        res = (a - v) & 0xFF
+        h = (a ^ v ^ res) & 0x10
+        n = res - (h >> 4)
+        R[6] = R[6] & 0x01 | 0x02 | (res & 0x80) | (res == 0) << 6 | h | (bc != 0) << 2 | n & 0x08 | (n << 4) & 0x20
+        hl = (hl + 1) & 0xFFFF
+        R[4] = hl >> 8
+        R[5] = hl & 0xFF
+        R[0] = bc >> 8
+        R[1] = bc & 0xFF
+        return 16
 
 class CPIR(z80.instruction.Instruction):
     @classmethod
@@ -952,14 +1265,35 @@ class CPIR(z80.instruction.Instruction):
         return "CPIR"
     @classmethod
     def opcodes(cls) -> List[int]:
-        return [0xED81]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"CPIR;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+        return [0xEDB1]
+    __slots__ = ()
+    size = 2
+    template = "CPIR;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        hl = R[4] << 8 | R[5]
+        bc = ((R[0] << 8 | R[1]) - 1) & 0xFFFF
+        a = R[7]
+        v = ram[hl]
+        res = (a - v) & 0xFF
+        h = (a ^ v ^ res) & 0x10
+        n = res - (h >> 4)
+        R[6] = R[6] & 0x01 | 0x02 | (res & 0x80) | (res == 0) << 6 | h | (bc != 0) << 2 | n & 0x08 | (n << 4) & 0x20
+        hl = (hl + 1) & 0xFFFF
+        R[4] = hl >> 8
+        R[5] = hl & 0xFF
+        R[0] = bc >> 8
+        R[1] = bc & 0xFF
+        if bc and res:
+            regs.PC = (regs.PC - 2) & 0xFFFF
+            return 21
+        return 16
 
 class CPD(z80.instruction.Instruction):
     @classmethod
@@ -968,13 +1302,31 @@ class CPD(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xEDA9]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"CPD;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "CPD;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        hl = R[4] << 8 | R[5]
+        bc = ((R[0] << 8 | R[1]) - 1) & 0xFFFF
+        a = R[7]
+        v = ram[hl]
+        res = (a - v) & 0xFF
+        h = (a ^ v ^ res) & 0x10
+        n = res - (h >> 4)
+        R[6] = R[6] & 0x01 | 0x02 | (res & 0x80) | (res == 0) << 6 | h | (bc != 0) << 2 | n & 0x08 | (n << 4) & 0x20
+        hl = (hl - 1) & 0xFFFF
+        R[4] = hl >> 8
+        R[5] = hl & 0xFF
+        R[0] = bc >> 8
+        R[1] = bc & 0xFF
+        return 16
 
 class CPDR(z80.instruction.Instruction):
     @classmethod
@@ -983,13 +1335,34 @@ class CPDR(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xEDB9]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"CPDR;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "CPDR;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        hl = R[4] << 8 | R[5]
+        bc = ((R[0] << 8 | R[1]) - 1) & 0xFFFF
+        a = R[7]
+        v = ram[hl]
+        res = (a - v) & 0xFF
+        h = (a ^ v ^ res) & 0x10
+        n = res - (h >> 4)
+        R[6] = R[6] & 0x01 | 0x02 | (res & 0x80) | (res == 0) << 6 | h | (bc != 0) << 2 | n & 0x08 | (n << 4) & 0x20
+        hl = (hl - 1) & 0xFFFF
+        R[4] = hl >> 8
+        R[5] = hl & 0xFF
+        R[0] = bc >> 8
+        R[1] = bc & 0xFF
+        if bc and res:
+            regs.PC = (regs.PC - 2) & 0xFFFF
+            return 21
+        return 16
 
 class ADD_A_r(z80.instruction.Instruction):
     @classmethod
@@ -998,18 +1371,23 @@ class ADD_A_r(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x80, 0x81, 0x82, 0x83, 0x84, 0x85, 0x87]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"ADD A, r; r={self.r}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_r',)
+    size = 1
+    opcode_fields = { 'r': (0, 0x07) }
+    template = "ADD A, r; r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._r = (opcode >> 0) & 0x07
 
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        r = self._r
+        a = R[7]
+        v = R[r]
+        R[7] = (a + v) & 0xFF
+        R[6] = ADD[a << 8 | v]
+        return 4
 
 class ADD_A_n(z80.instruction.Instruction):
     @classmethod
@@ -1018,18 +1396,22 @@ class ADD_A_n(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xC6]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"ADD A, n; n={self.n}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._n = self._ram.get_byte(self._PC + 1, signed=False)
-
-    @property
-    def n(self: Self) -> str:
-        return z80.instruction.FormattingType.n(self._n)
+    __slots__ = ('_n',)
+    size = 2
+    template = "ADD A, n; n={n}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._n = ram.get_byte(PC + 1, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        n = self._n
+        a = R[7]
+        v = n
+        R[7] = (a + v) & 0xFF
+        R[6] = ADD[a << 8 | v]
+        return 7
 
 class ADD_A_deref_HL(z80.instruction.Instruction):
     @classmethod
@@ -1038,13 +1420,22 @@ class ADD_A_deref_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x86]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"ADD A, (HL);"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "ADD A, (HL);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        address = R[4] << 8 | R[5]
+        a = R[7]
+        v = ram[address]
+        R[7] = (a + v) & 0xFF
+        R[6] = ADD[a << 8 | v]
+        return 7
 
 class ADD_A_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -1053,18 +1444,25 @@ class ADD_A_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDD86]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"ADD A, (IX+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 3
+    template = "ADD A, (IX+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF
+        a = R[7]
+        v = ram[address]
+        R[7] = (a + v) & 0xFF
+        R[6] = ADD[a << 8 | v]
+        return 19
 
 class ADD_A_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -1073,18 +1471,25 @@ class ADD_A_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFD86]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"ADD A, (IY+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 3
+    template = "ADD A, (IY+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF
+        a = R[7]
+        v = ram[address]
+        R[7] = (a + v) & 0xFF
+        R[6] = ADD[a << 8 | v]
+        return 19
 
 class ADC_A_r(z80.instruction.Instruction):
     @classmethod
@@ -1093,18 +1498,24 @@ class ADC_A_r(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x88, 0x89, 0x8A, 0x8B, 0x8C, 0x8D, 0x8F]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"ADC A, r; r={self.r}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_r',)
+    size = 1
+    opcode_fields = { 'r': (0, 0x07) }
+    template = "ADC A, r; r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._r = (opcode >> 0) & 0x07
 
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        r = self._r
+        a = R[7]
+        v = R[r]
+        c = R[6] & 0x01
+        R[7] = (a + v + c) & 0xFF
+        R[6] = ADD[c << 16 | a << 8 | v]
+        return 4
 
 class ADC_A_n(z80.instruction.Instruction):
     @classmethod
@@ -1113,18 +1524,23 @@ class ADC_A_n(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xCE]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"ADC A, n; n={self.n}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._n = self._ram.get_byte(self._PC + 1, signed=False)
-
-    @property
-    def n(self: Self) -> str:
-        return z80.instruction.FormattingType.n(self._n)
+    __slots__ = ('_n',)
+    size = 2
+    template = "ADC A, n; n={n}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._n = ram.get_byte(PC + 1, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        n = self._n
+        a = R[7]
+        v = n
+        c = R[6] & 0x01
+        R[7] = (a + v + c) & 0xFF
+        R[6] = ADD[c << 16 | a << 8 | v]
+        return 7
 
 class ADC_A_deref_HL(z80.instruction.Instruction):
     @classmethod
@@ -1133,13 +1549,23 @@ class ADC_A_deref_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x8E]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"ADC A, (HL);"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "ADC A, (HL);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        address = R[4] << 8 | R[5]
+        a = R[7]
+        v = ram[address]
+        c = R[6] & 0x01
+        R[7] = (a + v + c) & 0xFF
+        R[6] = ADD[c << 16 | a << 8 | v]
+        return 7
 
 class ADC_A_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -1148,18 +1574,26 @@ class ADC_A_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDD8E]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"ADC A, (IX+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 3
+    template = "ADC A, (IX+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF
+        a = R[7]
+        v = ram[address]
+        c = R[6] & 0x01
+        R[7] = (a + v + c) & 0xFF
+        R[6] = ADD[c << 16 | a << 8 | v]
+        return 19
 
 class ADC_A_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -1168,18 +1602,26 @@ class ADC_A_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFD8E]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"ADC A, (IY+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 3
+    template = "ADC A, (IY+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF
+        a = R[7]
+        v = ram[address]
+        c = R[6] & 0x01
+        R[7] = (a + v + c) & 0xFF
+        R[6] = ADD[c << 16 | a << 8 | v]
+        return 19
 
 class SUB_r(z80.instruction.Instruction):
     @classmethod
@@ -1188,18 +1630,23 @@ class SUB_r(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x90, 0x91, 0x92, 0x93, 0x94, 0x95, 0x97]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"SUB r; r={self.r}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_r',)
+    size = 1
+    opcode_fields = { 'r': (0, 0x07) }
+    template = "SUB r; r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._r = (opcode >> 0) & 0x07
 
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        r = self._r
+        a = R[7]
+        v = R[r]
+        R[7] = (a - v) & 0xFF
+        R[6] = SUB[a << 8 | v]
+        return 4
 
 class SUB_n(z80.instruction.Instruction):
     @classmethod
@@ -1208,18 +1655,22 @@ class SUB_n(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xD6]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"SUB n; n={self.n}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._n = self._ram.get_byte(self._PC + 1, signed=False)
-
-    @property
-    def n(self: Self) -> str:
-        return z80.instruction.FormattingType.n(self._n)
+    __slots__ = ('_n',)
+    size = 2
+    template = "SUB n; n={n}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._n = ram.get_byte(PC + 1, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        n = self._n
+        a = R[7]
+        v = n
+        R[7] = (a - v) & 0xFF
+        R[6] = SUB[a << 8 | v]
+        return 7
 
 class SUB_deref_HL(z80.instruction.Instruction):
     @classmethod
@@ -1228,13 +1679,22 @@ class SUB_deref_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x96]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"SUB (HL);"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "SUB (HL);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        address = R[4] << 8 | R[5]
+        a = R[7]
+        v = ram[address]
+        R[7] = (a - v) & 0xFF
+        R[6] = SUB[a << 8 | v]
+        return 7
 
 class SUB_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -1243,18 +1703,25 @@ class SUB_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDD96]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"SUB (IX+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 3
+    template = "SUB (IX+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF
+        a = R[7]
+        v = ram[address]
+        R[7] = (a - v) & 0xFF
+        R[6] = SUB[a << 8 | v]
+        return 19
 
 class SUB_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -1263,18 +1730,25 @@ class SUB_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFD96]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"SUB (IY+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 3
+    template = "SUB (IY+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF
+        a = R[7]
+        v = ram[address]
+        R[7] = (a - v) & 0xFF
+        R[6] = SUB[a << 8 | v]
+        return 19
 
 class SBC_r(z80.instruction.Instruction):
     @classmethod
@@ -1283,18 +1757,24 @@ class SBC_r(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x98, 0x99, 0x9A, 0x9B, 0x9C, 0x9D, 0x9F]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"SBC r; r={self.r}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_r',)
+    size = 1
+    opcode_fields = { 'r': (0, 0x07) }
+    template = "SBC r; r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._r = (opcode >> 0) & 0x07
 
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        r = self._r
+        a = R[7]
+        v = R[r]
+        c = R[6] & 0x01
+        R[7] = (a - v - c) & 0xFF
+        R[6] = SUB[c << 16 | a << 8 | v]
+        return 4
 
 class SBC_n(z80.instruction.Instruction):
     @classmethod
@@ -1303,18 +1783,23 @@ class SBC_n(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDE]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"SBC n; n={self.n}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._n = self._ram.get_byte(self._PC + 1, signed=False)
-
-    @property
-    def n(self: Self) -> str:
-        return z80.instruction.FormattingType.n(self._n)
+    __slots__ = ('_n',)
+    size = 2
+    template = "SBC n; n={n}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._n = ram.get_byte(PC + 1, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        n = self._n
+        a = R[7]
+        v = n
+        c = R[6] & 0x01
+        R[7] = (a - v - c) & 0xFF
+        R[6] = SUB[c << 16 | a << 8 | v]
+        return 7
 
 class SBC_deref_HL(z80.instruction.Instruction):
     @classmethod
@@ -1323,13 +1808,23 @@ class SBC_deref_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x9E]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"SBC (HL);"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "SBC (HL);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        address = R[4] << 8 | R[5]
+        a = R[7]
+        v = ram[address]
+        c = R[6] & 0x01
+        R[7] = (a - v - c) & 0xFF
+        R[6] = SUB[c << 16 | a << 8 | v]
+        return 7
 
 class SBC_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -1338,18 +1833,26 @@ class SBC_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDD9E]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"SBC (IX+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 3
+    template = "SBC (IX+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF
+        a = R[7]
+        v = ram[address]
+        c = R[6] & 0x01
+        R[7] = (a - v - c) & 0xFF
+        R[6] = SUB[c << 16 | a << 8 | v]
+        return 19
 
 class SBC_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -1358,18 +1861,26 @@ class SBC_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFD9E]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"SBC (IY+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 3
+    template = "SBC (IY+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF
+        a = R[7]
+        v = ram[address]
+        c = R[6] & 0x01
+        R[7] = (a - v - c) & 0xFF
+        R[6] = SUB[c << 16 | a << 8 | v]
+        return 19
 
 class AND_r(z80.instruction.Instruction):
     @classmethod
@@ -1378,18 +1889,24 @@ class AND_r(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xA0, 0xA1, 0xA2, 0xA3, 0xA4, 0xA5, 0xA7]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"AND r; r={self.r}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_r',)
+    size = 1
+    opcode_fields = { 'r': (0, 0x07) }
+    template = "AND r; r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._r = (opcode >> 0) & 0x07
 
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        r = self._r
+        a = R[7]
+        v = R[r]
+        res = a & v
+        R[7] = res
+        R[6] = SZP[res] | 0x10
+        return 4
 
 class AND_n(z80.instruction.Instruction):
     @classmethod
@@ -1398,18 +1915,23 @@ class AND_n(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xE6]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"AND n; n={self.n}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._n = self._ram.get_byte(self._PC + 1, signed=False)
-
-    @property
-    def n(self: Self) -> str:
-        return z80.instruction.FormattingType.n(self._n)
+    __slots__ = ('_n',)
+    size = 2
+    template = "AND n; n={n}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._n = ram.get_byte(PC + 1, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        n = self._n
+        a = R[7]
+        v = n
+        res = a & v
+        R[7] = res
+        R[6] = SZP[res] | 0x10
+        return 7
 
 class AND_deref_HL(z80.instruction.Instruction):
     @classmethod
@@ -1418,13 +1940,23 @@ class AND_deref_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xA6]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"AND (HL);"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "AND (HL);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        address = R[4] << 8 | R[5]
+        a = R[7]
+        v = ram[address]
+        res = a & v
+        R[7] = res
+        R[6] = SZP[res] | 0x10
+        return 7
 
 class AND_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -1433,18 +1965,26 @@ class AND_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDDA6]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"AND (IX+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 3
+    template = "AND (IX+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF
+        a = R[7]
+        v = ram[address]
+        res = a & v
+        R[7] = res
+        R[6] = SZP[res] | 0x10
+        return 19
 
 class AND_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -1453,18 +1993,26 @@ class AND_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFDA6]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"AND (IY+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 3
+    template = "AND (IY+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF
+        a = R[7]
+        v = ram[address]
+        res = a & v
+        R[7] = res
+        R[6] = SZP[res] | 0x10
+        return 19
 
 class OR_r(z80.instruction.Instruction):
     @classmethod
@@ -1473,18 +2021,24 @@ class OR_r(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xB0, 0xB1, 0xB2, 0xB3, 0xB4, 0xB5, 0xB7]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"OR r; r={self.r}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_r',)
+    size = 1
+    opcode_fields = { 'r': (0, 0x07) }
+    template = "OR r; r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._r = (opcode >> 0) & 0x07
 
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        r = self._r
+        a = R[7]
+        v = R[r]
+        res = a | v
+        R[7] = res
+        R[6] = SZP[res]
+        return 4
 
 class OR_n(z80.instruction.Instruction):
     @classmethod
@@ -1493,18 +2047,23 @@ class OR_n(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xF6]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"OR n; n={self.n}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._n = self._ram.get_byte(self._PC + 1, signed=False)
-
-    @property
-    def n(self: Self) -> str:
-        return z80.instruction.FormattingType.n(self._n)
+    __slots__ = ('_n',)
+    size = 2
+    template = "OR n; n={n}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._n = ram.get_byte(PC + 1, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        n = self._n
+        a = R[7]
+        v = n
+        res = a | v
+        R[7] = res
+        R[6] = SZP[res]
+        return 7
 
 class OR_deref_HL(z80.instruction.Instruction):
     @classmethod
@@ -1513,13 +2072,23 @@ class OR_deref_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xB6]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"OR (HL);"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "OR (HL);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        address = R[4] << 8 | R[5]
+        a = R[7]
+        v = ram[address]
+        res = a | v
+        R[7] = res
+        R[6] = SZP[res]
+        return 7
 
 class OR_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -1528,18 +2097,26 @@ class OR_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDDB6]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"OR (IX+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 3
+    template = "OR (IX+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF
+        a = R[7]
+        v = ram[address]
+        res = a | v
+        R[7] = res
+        R[6] = SZP[res]
+        return 19
 
 class OR_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -1548,18 +2125,26 @@ class OR_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFDB6]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"OR (IY+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 3
+    template = "OR (IY+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF
+        a = R[7]
+        v = ram[address]
+        res = a | v
+        R[7] = res
+        R[6] = SZP[res]
+        return 19
 
 class XOR_rprime(z80.instruction.Instruction):
     @classmethod
@@ -1568,18 +2153,24 @@ class XOR_rprime(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xA8, 0xA9, 0xAA, 0xAB, 0xAC, 0xAD, 0xAF]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"XOR r'; r'={self.rprime}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_rprime',)
+    size = 1
+    opcode_fields = { 'rprime': (0, 0x07) }
+    template = "XOR r'; r'={rprime}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._rprime = (opcode >> 0) & 0x07
 
-    @property
-    def rprime(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._rprime])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        rprime = self._rprime
+        a = R[7]
+        v = R[rprime]
+        res = a ^ v
+        R[7] = res
+        R[6] = SZP[res]
+        return 4
 
 class XOR_n(z80.instruction.Instruction):
     @classmethod
@@ -1588,18 +2179,23 @@ class XOR_n(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xEE]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"XOR n; n={self.n}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._n = self._ram.get_byte(self._PC + 1, signed=False)
-
-    @property
-    def n(self: Self) -> str:
-        return z80.instruction.FormattingType.n(self._n)
+    __slots__ = ('_n',)
+    size = 2
+    template = "XOR n; n={n}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._n = ram.get_byte(PC + 1, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        n = self._n
+        a = R[7]
+        v = n
+        res = a ^ v
+        R[7] = res
+        R[6] = SZP[res]
+        return 7
 
 class XOR_deref_HL(z80.instruction.Instruction):
     @classmethod
@@ -1608,13 +2204,23 @@ class XOR_deref_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xAE]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"XOR (HL);"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "XOR (HL);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        address = R[4] << 8 | R[5]
+        a = R[7]
+        v = ram[address]
+        res = a ^ v
+        R[7] = res
+        R[6] = SZP[res]
+        return 7
 
 class XOR_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -1623,18 +2229,26 @@ class XOR_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDDAE]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"XOR (IX+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 3
+    template = "XOR (IX+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF
+        a = R[7]
+        v = ram[address]
+        res = a ^ v
+        R[7] = res
+        R[6] = SZP[res]
+        return 19
 
 class XOR_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -1643,18 +2257,26 @@ class XOR_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFDAE]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"XOR (IY+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 3
+    template = "XOR (IY+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF
+        a = R[7]
+        v = ram[address]
+        res = a ^ v
+        R[7] = res
+        R[6] = SZP[res]
+        return 19
 
 class CP_r(z80.instruction.Instruction):
     @classmethod
@@ -1663,18 +2285,22 @@ class CP_r(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xB8, 0xB9, 0xBA, 0xBB, 0xBC, 0xBD, 0xBF]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"CP r; r={self.r}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_r',)
+    size = 1
+    opcode_fields = { 'r': (0, 0x07) }
+    template = "CP r; r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._r = (opcode >> 0) & 0x07
 
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        r = self._r
+        a = R[7]
+        v = R[r]
+        R[6] = CP[a << 8 | v]
+        return 4
 
 class CP_n(z80.instruction.Instruction):
     @classmethod
@@ -1683,18 +2309,21 @@ class CP_n(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFE]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"CP n; n={self.n}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._n = self._ram.get_byte(self._PC + 1, signed=False)
-
-    @property
-    def n(self: Self) -> str:
-        return z80.instruction.FormattingType.n(self._n)
+    __slots__ = ('_n',)
+    size = 2
+    template = "CP n; n={n}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._n = ram.get_byte(PC + 1, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        n = self._n
+        a = R[7]
+        v = n
+        R[6] = CP[a << 8 | v]
+        return 7
 
 class CP_deref_HL(z80.instruction.Instruction):
     @classmethod
@@ -1703,13 +2332,21 @@ class CP_deref_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xBE]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"CP (HL);"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "CP (HL);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        address = R[4] << 8 | R[5]
+        a = R[7]
+        v = ram[address]
+        R[6] = CP[a << 8 | v]
+        return 7
 
 class CP_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -1718,18 +2355,24 @@ class CP_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDDBE]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"CP (IX+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 3
+    template = "CP (IX+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF
+        a = R[7]
+        v = ram[address]
+        R[6] = CP[a << 8 | v]
+        return 19
 
 class CP_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -1738,18 +2381,24 @@ class CP_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFDBE]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"CP (IY+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 3
+    template = "CP (IY+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF
+        a = R[7]
+        v = ram[address]
+        R[6] = CP[a << 8 | v]
+        return 19
 
 class INC_r(z80.instruction.Instruction):
     @classmethod
@@ -1758,18 +2407,22 @@ class INC_r(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x04, 0x0C, 0x14, 0x1C, 0x24, 0x2C, 0x3C]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"INC r; r={self.r}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_r',)
+    size = 1
+    opcode_fields = { 'r': (3, 0x07) }
+    template = "INC r; r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._r = (opcode >> 3) & 0x07
 
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        r = self._r
+        res = (R[r] + 1) & 0xFF
+        R[r] = res
+        R[6] = R[6] & 0x01 | INC[res]
+        return 4
 
 class INC_deref_HL(z80.instruction.Instruction):
     @classmethod
@@ -1778,13 +2431,21 @@ class INC_deref_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x34]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"INC (HL);"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "INC (HL);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        address = R[4] << 8 | R[5]
+        res = (ram[address] + 1) & 0xFF
+        ram[address] = res
+        R[6] = R[6] & 0x01 | INC[res]
+        return 11
 
 class INC_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -1793,18 +2454,24 @@ class INC_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDD34]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"INC (IX+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 3
+    template = "INC (IX+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF
+        res = (ram[address] + 1) & 0xFF
+        ram[address] = res
+        R[6] = R[6] & 0x01 | INC[res]
+        return 23
 
 class INC_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -1813,18 +2480,24 @@ class INC_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFD34]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"INC (IY+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 3
+    template = "INC (IY+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF
+        res = (ram[address] + 1) & 0xFF
+        ram[address] = res
+        R[6] = R[6] & 0x01 | INC[res]
+        return 23
 
 class DEC_r(z80.instruction.Instruction):
     @classmethod
@@ -1833,18 +2506,22 @@ class DEC_r(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x05, 0x0D, 0x15, 0x1D, 0x25, 0x2D, 0x3D]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"DEC r; r={self.r}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_r',)
+    size = 1
+    opcode_fields = { 'r': (3, 0x07) }
+    template = "DEC r; r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._r = (opcode >> 3) & 0x07
 
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        r = self._r
+        res = (R[r] - 1) & 0xFF
+        R[r] = res
+        R[6] = R[6] & 0x01 | DEC[res]
+        return 4
 
 class DEC_deref_HL(z80.instruction.Instruction):
     @classmethod
@@ -1853,13 +2530,21 @@ class DEC_deref_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x35]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"DEC (HL);"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "DEC (HL);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        address = R[4] << 8 | R[5]
+        res = (ram[address] - 1) & 0xFF
+        ram[address] = res
+        R[6] = R[6] & 0x01 | DEC[res]
+        return 11
 
 class DEC_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -1868,18 +2553,24 @@ class DEC_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDD35]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"DEC (IX+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 3
+    template = "DEC (IX+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF
+        res = (ram[address] - 1) & 0xFF
+        ram[address] = res
+        R[6] = R[6] & 0x01 | DEC[res]
+        return 23
 
 class DEC_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -1888,18 +2579,24 @@ class DEC_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFD35]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"DEC (IY+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 3
+    template = "DEC (IY+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF
+        res = (ram[address] - 1) & 0xFF
+        ram[address] = res
+        R[6] = R[6] & 0x01 | DEC[res]
+        return 23
 
 class DAA(z80.instruction.Instruction):
     @classmethod
@@ -1908,13 +2605,20 @@ class DAA(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x27]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"DAA;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "DAA;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        f = R[6]
+        af = DAA_AF[(f & 0x02) << 9 | (f & 0x10) << 5 | (f & 0x01) << 8 | R[7]]
+        R[7] = af >> 8
+        R[6] = af & 0xFF
+        return 4
 
 class CPL(z80.instruction.Instruction):
     @classmethod
@@ -1923,13 +2627,18 @@ class CPL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x2F]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"CPL;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "CPL;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        R[7] ^= 0xFF
+        R[6] = R[6] & 0xC5 | (R[7] & 0x28) | 0x12
+        return 4
 
 class NEG(z80.instruction.Instruction):
     @classmethod
@@ -1937,14 +2646,21 @@ class NEG(z80.instruction.Instruction):
         return "NEG"
     @classmethod
     def opcodes(cls) -> List[int]:
-        return [0xED44]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"NEG;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+        return [0xED44, 0xED4C, 0xED54, 0xED5C, 0xED64, 0xED6C, 0xED74, 0xED7C]
+    __slots__ = ()
+    size = 2
+    template = "NEG;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        v = R[7]
+        R[7] = -v & 0xFF
+        R[6] = SUB[v]
+        return 8
 
 class CCF(z80.instruction.Instruction):
     @classmethod
@@ -1953,13 +2669,17 @@ class CCF(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x3F]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"CCF;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "CCF;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        R[6] = (R[6] & 0xC5 | (R[7] & 0x28) | (R[6] & 0x01) << 4) ^ 0x01
+        return 4
 
 class SCF(z80.instruction.Instruction):
     @classmethod
@@ -1968,13 +2688,17 @@ class SCF(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x37]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"SCF;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "SCF;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        R[6] = R[6] & 0xC4 | (R[7] & 0x28) | 0x01
+        return 4
 
 class NOP(z80.instruction.Instruction):
     @classmethod
@@ -1983,13 +2707,15 @@ class NOP(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x00]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"NOP;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "NOP;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        pass
+        return 4
 
 class HALT(z80.instruction.Instruction):
     @classmethod
@@ -1998,13 +2724,18 @@ class HALT(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x76]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"HALT;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "HALT;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        ## Stay on the HALT until an interrupt.
+        regs.halted = True
+        regs.PC = (regs.PC - 1) & 0xFFFF
+        return 4
 
 class DI(z80.instruction.Instruction):
     @classmethod
@@ -2013,13 +2744,16 @@ class DI(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xF3]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"DI;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "DI;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        regs.IFF1 = regs.IFF2 = 0
+        return 4
 
 class EI(z80.instruction.Instruction):
     @classmethod
@@ -2028,13 +2762,20 @@ class EI(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFB]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"EI;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "EI;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        regs.IFF1 = regs.IFF2 = 1
+        ## The interrupt is accepted after the next instruction, see
+        ## Z80.enable_interrupts().
+        if cpu.int_line:
+            cpu.enable_interrupts()
+        return 4
 
 class IM_0(z80.instruction.Instruction):
     @classmethod
@@ -2042,14 +2783,18 @@ class IM_0(z80.instruction.Instruction):
         return "IM 0"
     @classmethod
     def opcodes(cls) -> List[int]:
-        return [0xED46]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"IM 0;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+        return [0xED46, 0xED4E, 0xED66, 0xED6E]
+    __slots__ = ()
+    size = 2
+    template = "IM 0;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        regs.IM = 0
+        return 8
 
 class IM_1(z80.instruction.Instruction):
     @classmethod
@@ -2057,14 +2802,18 @@ class IM_1(z80.instruction.Instruction):
         return "IM 1"
     @classmethod
     def opcodes(cls) -> List[int]:
-        return [0xED56]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"IM 1;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+        return [0xED56, 0xED76]
+    __slots__ = ()
+    size = 2
+    template = "IM 1;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        regs.IM = 1
+        return 8
 
 class IM_2(z80.instruction.Instruction):
     @classmethod
@@ -2072,14 +2821,18 @@ class IM_2(z80.instruction.Instruction):
         return "IM 2"
     @classmethod
     def opcodes(cls) -> List[int]:
-        return [0xED5E]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"IM 2;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+        return [0xED5E, 0xED7E]
+    __slots__ = ()
+    size = 2
+    template = "IM 2;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        regs.IM = 2
+        return 8
 
 class ADD_HL_ss(z80.instruction.Instruction):
     @classmethod
@@ -2088,18 +2841,25 @@ class ADD_HL_ss(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x09, 0x19, 0x29, 0x39]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"ADD HL, ss; ss={self.ss}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_ss',)
+    size = 1
+    opcode_fields = { 'ss': (4, 0x03) }
+    template = "ADD HL, ss; ss={ss}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._ss = (opcode >> 4) & 0x03
 
-    @property
-    def ss(self: Self) -> str:
-        return z80.instruction.FormattingType.ss(self.ss2name[self._ss])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ss = self._ss
+        hl = R[4] << 8 | R[5]
+        v = (regs.SP if ss == 3 else R[2 * ss] << 8 | R[2 * ss + 1])
+        res = hl + v
+        R[4] = (res >> 8) & 0xFF
+        R[5] = res & 0xFF
+        R[6] = R[6] & 0xC4 | (res >> 8) & 0x28 | ((hl ^ v ^ res) >> 8) & 0x10 | res >> 16
+        return 11
 
 class ADC_HL_ss(z80.instruction.Instruction):
     @classmethod
@@ -2108,18 +2868,26 @@ class ADC_HL_ss(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xED4A, 0xED5A, 0xED6A, 0xED7A]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"ADC HL, ss; ss={self.ss}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_ss',)
+    size = 2
+    opcode_fields = { 'ss': (4, 0x03) }
+    template = "ADC HL, ss; ss={ss}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._ss = (opcode >> 4) & 0x03
 
-    @property
-    def ss(self: Self) -> str:
-        return z80.instruction.FormattingType.ss(self.ss2name[self._ss])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ss = self._ss
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        hl = R[4] << 8 | R[5]
+        v = (regs.SP if ss == 3 else R[2 * ss] << 8 | R[2 * ss + 1])
+        res = hl + v + (R[6] & 0x01)
+        R[4] = (res >> 8) & 0xFF
+        R[5] = res & 0xFF
+        R[6] = (res >> 8) & 0xA8 | ((res & 0xFFFF) == 0) << 6 | ((hl ^ v ^ res) >> 8) & 0x10 | ((hl ^ res) & (v ^ res) & 0x8000) >> 13 | res >> 16
+        return 15
 
 class SBC_HL_ss(z80.instruction.Instruction):
     @classmethod
@@ -2128,18 +2896,26 @@ class SBC_HL_ss(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xED42, 0xED52, 0xED62, 0xED72]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"SBC HL, ss; ss={self.ss}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_ss',)
+    size = 2
+    opcode_fields = { 'ss': (4, 0x03) }
+    template = "SBC HL, ss; ss={ss}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._ss = (opcode >> 4) & 0x03
 
-    @property
-    def ss(self: Self) -> str:
-        return z80.instruction.FormattingType.ss(self.ss2name[self._ss])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ss = self._ss
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        hl = R[4] << 8 | R[5]
+        v = (regs.SP if ss == 3 else R[2 * ss] << 8 | R[2 * ss + 1])
+        res = hl - v - (R[6] & 0x01)
+        R[4] = (res >> 8) & 0xFF
+        R[5] = res & 0xFF
+        R[6] = (res >> 8) & 0xA8 | ((res & 0xFFFF) == 0) << 6 | ((hl ^ v ^ res) >> 8) & 0x10 | ((hl ^ v) & (hl ^ res) & 0x8000) >> 13 | 0x02 | (res >> 16) & 0x01
+        return 15
 
 class ADD_IX_pp(z80.instruction.Instruction):
     @classmethod
@@ -2148,18 +2924,24 @@ class ADD_IX_pp(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDD09, 0xDD19, 0xDD29, 0xDD39]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"ADD IX, pp; pp={self.pp}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_pp',)
+    size = 2
+    opcode_fields = { 'pp': (4, 0x03) }
+    template = "ADD IX, pp; pp={pp}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._pp = (opcode >> 4) & 0x03
 
-    @property
-    def pp(self: Self) -> str:
-        return z80.instruction.FormattingType.pp(self.pp2name[self._pp])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        pp = self._pp
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        v = (regs.SP if pp == 3 else regs.IX if pp == 2 else R[2 * pp] << 8 | R[2 * pp + 1])
+        res = regs.IX + v
+        R[6] = R[6] & 0xC4 | (res >> 8) & 0x28 | ((regs.IX ^ v ^ res) >> 8) & 0x10 | res >> 16
+        regs.IX = res & 0xFFFF
+        return 15
 
 class ADD_IY_rr(z80.instruction.Instruction):
     @classmethod
@@ -2168,18 +2950,24 @@ class ADD_IY_rr(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFD09, 0xFD19, 0xFD29, 0xFD39]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"ADD IY, rr; rr={self.rr}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_rr',)
+    size = 2
+    opcode_fields = { 'rr': (4, 0x03) }
+    template = "ADD IY, rr; rr={rr}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._rr = (opcode >> 4) & 0x03
 
-    @property
-    def rr(self: Self) -> str:
-        return z80.instruction.FormattingType.rr(self.rr2name[self._rr])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        rr = self._rr
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        v = (regs.SP if rr == 3 else regs.IY if rr == 2 else R[2 * rr] << 8 | R[2 * rr + 1])
+        res = regs.IY + v
+        R[6] = R[6] & 0xC4 | (res >> 8) & 0x28 | ((regs.IY ^ v ^ res) >> 8) & 0x10 | res >> 16
+        regs.IY = res & 0xFFFF
+        return 15
 
 class INC_ss(z80.instruction.Instruction):
     @classmethod
@@ -2188,18 +2976,25 @@ class INC_ss(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x03, 0x13, 0x23, 0x33]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"INC ss; ss={self.ss}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_ss',)
+    size = 1
+    opcode_fields = { 'ss': (4, 0x03) }
+    template = "INC ss; ss={ss}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._ss = (opcode >> 4) & 0x03
 
-    @property
-    def ss(self: Self) -> str:
-        return z80.instruction.FormattingType.ss(self.ss2name[self._ss])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ss = self._ss
+        v = ((regs.SP if ss == 3 else R[2 * ss] << 8 | R[2 * ss + 1]) + 1) & 0xFFFF
+        if ss == 3:
+            regs.SP = v
+        else:
+            R[2 * ss] = v >> 8
+            R[2 * ss + 1] = v & 0xFF
+        return 6
 
 class INC_IX(z80.instruction.Instruction):
     @classmethod
@@ -2208,13 +3003,17 @@ class INC_IX(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDD23]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"INC IX;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "INC IX;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        regs.IX = (regs.IX + 1) & 0xFFFF
+        return 10
 
 class INC_IY(z80.instruction.Instruction):
     @classmethod
@@ -2223,13 +3022,17 @@ class INC_IY(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFD23]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"INC IY;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "INC IY;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        regs.IY = (regs.IY + 1) & 0xFFFF
+        return 10
 
 class DEC_ss(z80.instruction.Instruction):
     @classmethod
@@ -2238,18 +3041,25 @@ class DEC_ss(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x0B, 0x1B, 0x2B, 0x3B]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"DEC ss; ss={self.ss}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_ss',)
+    size = 1
+    opcode_fields = { 'ss': (4, 0x03) }
+    template = "DEC ss; ss={ss}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._ss = (opcode >> 4) & 0x03
 
-    @property
-    def ss(self: Self) -> str:
-        return z80.instruction.FormattingType.ss(self.ss2name[self._ss])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ss = self._ss
+        v = ((regs.SP if ss == 3 else R[2 * ss] << 8 | R[2 * ss + 1]) - 1) & 0xFFFF
+        if ss == 3:
+            regs.SP = v
+        else:
+            R[2 * ss] = v >> 8
+            R[2 * ss + 1] = v & 0xFF
+        return 6
 
 class DEC_IX(z80.instruction.Instruction):
     @classmethod
@@ -2258,13 +3068,17 @@ class DEC_IX(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDD2B]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"DEC IX;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "DEC IX;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        regs.IX = (regs.IX - 1) & 0xFFFF
+        return 10
 
 class DEC_IY(z80.instruction.Instruction):
     @classmethod
@@ -2273,13 +3087,17 @@ class DEC_IY(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFD2B]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"DEC IY;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "DEC IY;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        regs.IY = (regs.IY - 1) & 0xFFFF
+        return 10
 
 class RLCA(z80.instruction.Instruction):
     @classmethod
@@ -2288,13 +3106,19 @@ class RLCA(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x07]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"RLCA;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "RLCA;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        a = R[7]
+        R[7] = (a << 1 | a >> 7) & 0xFF
+        R[6] = R[6] & 0xC4 | (R[7] & 0x28) | a >> 7
+        return 4
 
 class RLA(z80.instruction.Instruction):
     @classmethod
@@ -2303,13 +3127,19 @@ class RLA(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x17]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"RLA;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "RLA;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        a = R[7]
+        R[7] = (a << 1 | R[6] & 0x01) & 0xFF
+        R[6] = R[6] & 0xC4 | (R[7] & 0x28) | a >> 7
+        return 4
 
 class RRCA(z80.instruction.Instruction):
     @classmethod
@@ -2318,13 +3148,19 @@ class RRCA(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x0F]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"RRCA;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "RRCA;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        a = R[7]
+        R[7] = (a >> 1 | a << 7) & 0xFF
+        R[6] = R[6] & 0xC4 | (R[7] & 0x28) | a & 0x01
+        return 4
 
 class RRA(z80.instruction.Instruction):
     @classmethod
@@ -2333,13 +3169,19 @@ class RRA(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x1F]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"RRA;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "RRA;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        a = R[7]
+        R[7] = a >> 1 | (R[6] & 0x01) << 7
+        R[6] = R[6] & 0xC4 | (R[7] & 0x28) | a & 0x01
+        return 4
 
 class RLC_r(z80.instruction.Instruction):
     @classmethod
@@ -2348,18 +3190,25 @@ class RLC_r(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xCB00, 0xCB01, 0xCB02, 0xCB03, 0xCB04, 0xCB05, 0xCB07]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"RLC r; r={self.r}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_r',)
+    size = 2
+    opcode_fields = { 'r': (0, 0x07) }
+    template = "RLC r; r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._r = (opcode >> 0) & 0x07
 
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        r = self._r
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        v = R[r]
+        res = (v << 1 | v >> 7) & 0xFF
+        c = v >> 7
+        R[r] = res
+        R[6] = SZP[res] | c
+        return 8
 
 class RLC_deref_HL(z80.instruction.Instruction):
     @classmethod
@@ -2368,13 +3217,24 @@ class RLC_deref_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xCB06]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"RLC (HL);"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "RLC (HL);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = R[4] << 8 | R[5]
+        v = ram[address]
+        res = (v << 1 | v >> 7) & 0xFF
+        c = v >> 7
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 15
 
 class RLC_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -2383,18 +3243,26 @@ class RLC_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDDCB06]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"RLC (IX+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 4
+    template = "RLC (IX+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF
+        v = ram[address]
+        res = (v << 1 | v >> 7) & 0xFF
+        c = v >> 7
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 23
 
 class RLC_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -2403,18 +3271,135 @@ class RLC_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFDCB06]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"RLC (IY+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
+    __slots__ = ('_d',)
+    size = 4
+    template = "RLC (IY+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF
+        v = ram[address]
+        res = (v << 1 | v >> 7) & 0xFF
+        c = v >> 7
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 23
+
+class RRC_r(z80.instruction.Instruction):
+    @classmethod
+    def name(cls) -> str:
+        return "RRC r"
+    @classmethod
+    def opcodes(cls) -> List[int]:
+        return [0xCB08, 0xCB09, 0xCB0A, 0xCB0B, 0xCB0C, 0xCB0D, 0xCB0F]
+    __slots__ = ('_r',)
+    size = 2
+    opcode_fields = { 'r': (0, 0x07) }
+    template = "RRC r; r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._r = (opcode >> 0) & 0x07
 
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        r = self._r
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        v = R[r]
+        res = (v >> 1 | v << 7) & 0xFF
+        c = v & 0x01
+        R[r] = res
+        R[6] = SZP[res] | c
+        return 8
+
+class RRC_deref_HL(z80.instruction.Instruction):
+    @classmethod
+    def name(cls) -> str:
+        return "RRC (HL)"
+    @classmethod
+    def opcodes(cls) -> List[int]:
+        return [0xCB0E]
+    __slots__ = ()
+    size = 2
+    template = "RRC (HL);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = R[4] << 8 | R[5]
+        v = ram[address]
+        res = (v >> 1 | v << 7) & 0xFF
+        c = v & 0x01
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 15
+
+class RRC_deref_IX_plus_d(z80.instruction.Instruction):
+    @classmethod
+    def name(cls) -> str:
+        return "RRC (IX+d)"
+    @classmethod
+    def opcodes(cls) -> List[int]:
+        return [0xDDCB0E]
+    __slots__ = ('_d',)
+    size = 4
+    template = "RRC (IX+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF
+        v = ram[address]
+        res = (v >> 1 | v << 7) & 0xFF
+        c = v & 0x01
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 23
+
+class RRC_deref_IY_plus_d(z80.instruction.Instruction):
+    @classmethod
+    def name(cls) -> str:
+        return "RRC (IY+d)"
+    @classmethod
+    def opcodes(cls) -> List[int]:
+        return [0xFDCB0E]
+    __slots__ = ('_d',)
+    size = 4
+    template = "RRC (IY+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF
+        v = ram[address]
+        res = (v >> 1 | v << 7) & 0xFF
+        c = v & 0x01
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 23
 
 class RL_r(z80.instruction.Instruction):
     @classmethod
@@ -2423,18 +3408,25 @@ class RL_r(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xCB10, 0xCB11, 0xCB12, 0xCB13, 0xCB14, 0xCB15, 0xCB17]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"RL r; r={self.r}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_r',)
+    size = 2
+    opcode_fields = { 'r': (0, 0x07) }
+    template = "RL r; r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._r = (opcode >> 0) & 0x07
 
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        r = self._r
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        v = R[r]
+        res = (v << 1 | R[6] & 0x01) & 0xFF
+        c = v >> 7
+        R[r] = res
+        R[6] = SZP[res] | c
+        return 8
 
 class RL_deref_HL(z80.instruction.Instruction):
     @classmethod
@@ -2443,13 +3435,24 @@ class RL_deref_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xCB16]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"RL (HL);"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "RL (HL);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = R[4] << 8 | R[5]
+        v = ram[address]
+        res = (v << 1 | R[6] & 0x01) & 0xFF
+        c = v >> 7
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 15
 
 class RL_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -2458,18 +3461,26 @@ class RL_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDDCB16]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"RL (IX+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 4
+    template = "RL (IX+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF
+        v = ram[address]
+        res = (v << 1 | R[6] & 0x01) & 0xFF
+        c = v >> 7
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 23
 
 class RL_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -2478,18 +3489,26 @@ class RL_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFDCB16]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"RL (IY+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 4
+    template = "RL (IY+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF
+        v = ram[address]
+        res = (v << 1 | R[6] & 0x01) & 0xFF
+        c = v >> 7
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 23
 
 class RR_r(z80.instruction.Instruction):
     @classmethod
@@ -2498,18 +3517,25 @@ class RR_r(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xCB18, 0xCB19, 0xCB1A, 0xCB1B, 0xCB1C, 0xCB1D, 0xCB1F]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"RR r; r={self.r}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_r',)
+    size = 2
+    opcode_fields = { 'r': (0, 0x07) }
+    template = "RR r; r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._r = (opcode >> 0) & 0x07
 
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        r = self._r
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        v = R[r]
+        res = v >> 1 | (R[6] & 0x01) << 7
+        c = v & 0x01
+        R[r] = res
+        R[6] = SZP[res] | c
+        return 8
 
 class RR_deref_HL(z80.instruction.Instruction):
     @classmethod
@@ -2518,13 +3544,24 @@ class RR_deref_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xCB1E]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"RR (HL);"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "RR (HL);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = R[4] << 8 | R[5]
+        v = ram[address]
+        res = v >> 1 | (R[6] & 0x01) << 7
+        c = v & 0x01
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 15
 
 class RR_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -2533,18 +3570,26 @@ class RR_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDDCB1E]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"RR (IX+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 4
+    template = "RR (IX+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF
+        v = ram[address]
+        res = v >> 1 | (R[6] & 0x01) << 7
+        c = v & 0x01
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 23
 
 class RR_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -2553,18 +3598,26 @@ class RR_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFDCB1E]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"RR (IY+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 4
+    template = "RR (IY+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF
+        v = ram[address]
+        res = v >> 1 | (R[6] & 0x01) << 7
+        c = v & 0x01
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 23
 
 class SLA_r(z80.instruction.Instruction):
     @classmethod
@@ -2573,18 +3626,25 @@ class SLA_r(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xCB20, 0xCB21, 0xCB22, 0xCB23, 0xCB24, 0xCB25, 0xCB27]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"SLA r; r={self.r}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_r',)
+    size = 2
+    opcode_fields = { 'r': (0, 0x07) }
+    template = "SLA r; r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._r = (opcode >> 0) & 0x07
 
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        r = self._r
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        v = R[r]
+        res = (v << 1) & 0xFF
+        c = v >> 7
+        R[r] = res
+        R[6] = SZP[res] | c
+        return 8
 
 class SLA_deref_HL(z80.instruction.Instruction):
     @classmethod
@@ -2593,13 +3653,24 @@ class SLA_deref_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xCB26]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"SLA (HL);"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "SLA (HL);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = R[4] << 8 | R[5]
+        v = ram[address]
+        res = (v << 1) & 0xFF
+        c = v >> 7
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 15
 
 class SLA_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -2608,18 +3679,26 @@ class SLA_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDDCB26]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"SLA (IX+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 4
+    template = "SLA (IX+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF
+        v = ram[address]
+        res = (v << 1) & 0xFF
+        c = v >> 7
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 23
 
 class SLA_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -2628,18 +3707,244 @@ class SLA_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFDCB26]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"SLA (IY+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
+    __slots__ = ('_d',)
+    size = 4
+    template = "SLA (IY+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF
+        v = ram[address]
+        res = (v << 1) & 0xFF
+        c = v >> 7
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 23
+
+class SRA_r(z80.instruction.Instruction):
+    @classmethod
+    def name(cls) -> str:
+        return "SRA r"
+    @classmethod
+    def opcodes(cls) -> List[int]:
+        return [0xCB28, 0xCB29, 0xCB2A, 0xCB2B, 0xCB2C, 0xCB2D, 0xCB2F]
+    __slots__ = ('_r',)
+    size = 2
+    opcode_fields = { 'r': (0, 0x07) }
+    template = "SRA r; r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._r = (opcode >> 0) & 0x07
 
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        r = self._r
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        v = R[r]
+        res = v >> 1 | v & 0x80
+        c = v & 0x01
+        R[r] = res
+        R[6] = SZP[res] | c
+        return 8
+
+class SRA_deref_HL(z80.instruction.Instruction):
+    @classmethod
+    def name(cls) -> str:
+        return "SRA (HL)"
+    @classmethod
+    def opcodes(cls) -> List[int]:
+        return [0xCB2E]
+    __slots__ = ()
+    size = 2
+    template = "SRA (HL);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = R[4] << 8 | R[5]
+        v = ram[address]
+        res = v >> 1 | v & 0x80
+        c = v & 0x01
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 15
+
+class SRA_deref_IX_plus_d(z80.instruction.Instruction):
+    @classmethod
+    def name(cls) -> str:
+        return "SRA (IX+d)"
+    @classmethod
+    def opcodes(cls) -> List[int]:
+        return [0xDDCB2E]
+    __slots__ = ('_d',)
+    size = 4
+    template = "SRA (IX+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF
+        v = ram[address]
+        res = v >> 1 | v & 0x80
+        c = v & 0x01
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 23
+
+class SRA_deref_IY_plus_d(z80.instruction.Instruction):
+    @classmethod
+    def name(cls) -> str:
+        return "SRA (IY+d)"
+    @classmethod
+    def opcodes(cls) -> List[int]:
+        return [0xFDCB2E]
+    __slots__ = ('_d',)
+    size = 4
+    template = "SRA (IY+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF
+        v = ram[address]
+        res = v >> 1 | v & 0x80
+        c = v & 0x01
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 23
+
+class SLL_r(z80.instruction.Instruction):
+    @classmethod
+    def name(cls) -> str:
+        return "SLL r"
+    @classmethod
+    def opcodes(cls) -> List[int]:
+        return [0xCB30, 0xCB31, 0xCB32, 0xCB33, 0xCB34, 0xCB35, 0xCB37]
+    __slots__ = ('_r',)
+    size = 2
+    opcode_fields = { 'r': (0, 0x07) }
+    template = "SLL r; r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._r = (opcode >> 0) & 0x07
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        r = self._r
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        v = R[r]
+        res = (v << 1 | 0x01) & 0xFF
+        c = v >> 7
+        R[r] = res
+        R[6] = SZP[res] | c
+        return 8
+
+class SLL_deref_HL(z80.instruction.Instruction):
+    @classmethod
+    def name(cls) -> str:
+        return "SLL (HL)"
+    @classmethod
+    def opcodes(cls) -> List[int]:
+        return [0xCB36]
+    __slots__ = ()
+    size = 2
+    template = "SLL (HL);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = R[4] << 8 | R[5]
+        v = ram[address]
+        res = (v << 1 | 0x01) & 0xFF
+        c = v >> 7
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 15
+
+class SLL_deref_IX_plus_d(z80.instruction.Instruction):
+    @classmethod
+    def name(cls) -> str:
+        return "SLL (IX+d)"
+    @classmethod
+    def opcodes(cls) -> List[int]:
+        return [0xDDCB36]
+    __slots__ = ('_d',)
+    size = 4
+    template = "SLL (IX+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF
+        v = ram[address]
+        res = (v << 1 | 0x01) & 0xFF
+        c = v >> 7
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 23
+
+class SLL_deref_IY_plus_d(z80.instruction.Instruction):
+    @classmethod
+    def name(cls) -> str:
+        return "SLL (IY+d)"
+    @classmethod
+    def opcodes(cls) -> List[int]:
+        return [0xFDCB36]
+    __slots__ = ('_d',)
+    size = 4
+    template = "SLL (IY+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF
+        v = ram[address]
+        res = (v << 1 | 0x01) & 0xFF
+        c = v >> 7
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 23
 
 class SRL_r(z80.instruction.Instruction):
     @classmethod
@@ -2648,18 +3953,25 @@ class SRL_r(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xCB38, 0xCB39, 0xCB3A, 0xCB3B, 0xCB3C, 0xCB3D, 0xCB3F]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"SRL r; r={self.r}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_r',)
+    size = 2
+    opcode_fields = { 'r': (0, 0x07) }
+    template = "SRL r; r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._r = (opcode >> 0) & 0x07
 
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        r = self._r
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        v = R[r]
+        res = v >> 1
+        c = v & 0x01
+        R[r] = res
+        R[6] = SZP[res] | c
+        return 8
 
 class SRL_deref_HL(z80.instruction.Instruction):
     @classmethod
@@ -2668,13 +3980,24 @@ class SRL_deref_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xCB3E]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"SRL (HL);"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "SRL (HL);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = R[4] << 8 | R[5]
+        v = ram[address]
+        res = v >> 1
+        c = v & 0x01
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 15
 
 class SRL_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -2683,18 +4006,26 @@ class SRL_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDDCB3E]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"SRL (IX+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 4
+    template = "SRL (IX+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF
+        v = ram[address]
+        res = v >> 1
+        c = v & 0x01
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 23
 
 class SRL_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -2703,18 +4034,80 @@ class SRL_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFDCB3E]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"SRL (IY+d); d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+    __slots__ = ('_d',)
+    size = 4
+    template = "SRL (IY+d); d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF
+        v = ram[address]
+        res = v >> 1
+        c = v & 0x01
+        ram[address] = res
+        R[6] = SZP[res] | c
+        return 23
+
+class RLD(z80.instruction.Instruction):
+    @classmethod
+    def name(cls) -> str:
+        return "RLD"
+    @classmethod
+    def opcodes(cls) -> List[int]:
+        return [0xED6F]
+    __slots__ = ()
+    size = 2
+    template = "RLD;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        hl = R[4] << 8 | R[5]
+        v = ram[hl]
+        a = R[7]
+        ram[hl] = (v << 4 | a & 0x0F) & 0xFF
+        a = a & 0xF0 | v >> 4
+        R[7] = a
+        R[6] = R[6] & 0x01 | SZP[a]
+        return 18
+
+class RRD(z80.instruction.Instruction):
+    @classmethod
+    def name(cls) -> str:
+        return "RRD"
+    @classmethod
+    def opcodes(cls) -> List[int]:
+        return [0xED67]
+    __slots__ = ()
+    size = 2
+    template = "RRD;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        hl = R[4] << 8 | R[5]
+        v = ram[hl]
+        a = R[7]
+        ram[hl] = (a << 4 | v >> 4) & 0xFF
+        a = a & 0xF0 | v & 0x0F
+        R[7] = a
+        R[6] = R[6] & 0x01 | SZP[a]
+        return 18
 
 class BIT_b_r(z80.instruction.Instruction):
     @classmethod
@@ -2723,23 +4116,25 @@ class BIT_b_r(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xCB40, 0xCB41, 0xCB42, 0xCB43, 0xCB44, 0xCB45, 0xCB47, 0xCB48, 0xCB49, 0xCB4A, 0xCB4B, 0xCB4C, 0xCB4D, 0xCB4F, 0xCB50, 0xCB51, 0xCB52, 0xCB53, 0xCB54, 0xCB55, 0xCB57, 0xCB58, 0xCB59, 0xCB5A, 0xCB5B, 0xCB5C, 0xCB5D, 0xCB5F, 0xCB60, 0xCB61, 0xCB62, 0xCB63, 0xCB64, 0xCB65, 0xCB67, 0xCB68, 0xCB69, 0xCB6A, 0xCB6B, 0xCB6C, 0xCB6D, 0xCB6F, 0xCB70, 0xCB71, 0xCB72, 0xCB73, 0xCB74, 0xCB75, 0xCB77, 0xCB78, 0xCB79, 0xCB7A, 0xCB7B, 0xCB7C, 0xCB7D, 0xCB7F]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"BIT b, r; b={self.b}, r={self.r}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_b', '_r')
+    size = 2
+    opcode_fields = { 'b': (3, 0x07), 'r': (0, 0x07) }
+    template = "BIT b, r; b={b}, r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._b = (opcode >> 3) & 0x07
         self._r = (opcode >> 0) & 0x07
 
-    @property
-    def b(self: Self) -> str:
-        return z80.instruction.FormattingType.b(self._b)
-
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        b = self._b
+        r = self._r
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        v = R[r]
+        res = v & (1 << b)
+        R[6] = R[6] & 0x01 | 0x10 | (res & 0x80) | (res == 0) * 0x44 | (v & 0x28)
+        return 8
 
 class BIT_b_deref_HL(z80.instruction.Instruction):
     @classmethod
@@ -2748,18 +4143,25 @@ class BIT_b_deref_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xCB46, 0xCB4E, 0xCB56, 0xCB5E, 0xCB66, 0xCB6E, 0xCB76, 0xCB7E]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"BIT b, (HL); b={self.b}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_b',)
+    size = 2
+    opcode_fields = { 'b': (3, 0x07) }
+    template = "BIT b, (HL); b={b}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._b = (opcode >> 3) & 0x07
 
-    @property
-    def b(self: Self) -> str:
-        return z80.instruction.FormattingType.b(self._b)
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        b = self._b
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = R[4] << 8 | R[5]
+        v = ram[address]
+        res = v & (1 << b)
+        R[6] = R[6] & 0x01 | 0x10 | (res & 0x80) | (res == 0) * 0x44 | (address >> 8) & 0x28
+        return 12
 
 class BIT_b_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -2768,23 +4170,27 @@ class BIT_b_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDDCB46, 0xDDCB4E, 0xDDCB56, 0xDDCB5E, 0xDDCB66, 0xDDCB6E, 0xDDCB76, 0xDDCB7E]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"BIT b, (IX+d); b={self.b}, d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_b', '_d')
+    size = 4
+    opcode_fields = { 'b': (3, 0x07) }
+    template = "BIT b, (IX+d); b={b}, d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._b = (opcode >> 3) & 0x07
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def b(self: Self) -> str:
-        return z80.instruction.FormattingType.b(self._b)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        b = self._b
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF
+        v = ram[address]
+        res = v & (1 << b)
+        R[6] = R[6] & 0x01 | 0x10 | (res & 0x80) | (res == 0) * 0x44 | (address >> 8) & 0x28
+        return 20
 
 class BIT_b_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -2793,23 +4199,27 @@ class BIT_b_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFDCB46, 0xFDCB4E, 0xFDCB56, 0xFDCB5E, 0xFDCB66, 0xFDCB6E, 0xFDCB76, 0xFDCB7E]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"BIT b, (IY+d); b={self.b}, d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_b', '_d')
+    size = 4
+    opcode_fields = { 'b': (3, 0x07) }
+    template = "BIT b, (IY+d); b={b}, d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._b = (opcode >> 3) & 0x07
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def b(self: Self) -> str:
-        return z80.instruction.FormattingType.b(self._b)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        b = self._b
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF
+        v = ram[address]
+        res = v & (1 << b)
+        R[6] = R[6] & 0x01 | 0x10 | (res & 0x80) | (res == 0) * 0x44 | (address >> 8) & 0x28
+        return 20
 
 class SET_b_r(z80.instruction.Instruction):
     @classmethod
@@ -2818,23 +4228,23 @@ class SET_b_r(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xCBC0, 0xCBC1, 0xCBC2, 0xCBC3, 0xCBC4, 0xCBC5, 0xCBC7, 0xCBC8, 0xCBC9, 0xCBCA, 0xCBCB, 0xCBCC, 0xCBCD, 0xCBCF, 0xCBD0, 0xCBD1, 0xCBD2, 0xCBD3, 0xCBD4, 0xCBD5, 0xCBD7, 0xCBD8, 0xCBD9, 0xCBDA, 0xCBDB, 0xCBDC, 0xCBDD, 0xCBDF, 0xCBE0, 0xCBE1, 0xCBE2, 0xCBE3, 0xCBE4, 0xCBE5, 0xCBE7, 0xCBE8, 0xCBE9, 0xCBEA, 0xCBEB, 0xCBEC, 0xCBED, 0xCBEF, 0xCBF0, 0xCBF1, 0xCBF2, 0xCBF3, 0xCBF4, 0xCBF5, 0xCBF7, 0xCBF8, 0xCBF9, 0xCBFA, 0xCBFB, 0xCBFC, 0xCBFD, 0xCBFF]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"SET b, r; b={self.b}, r={self.r}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_b', '_r')
+    size = 2
+    opcode_fields = { 'b': (3, 0x07), 'r': (0, 0x07) }
+    template = "SET b, r; b={b}, r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._b = (opcode >> 3) & 0x07
         self._r = (opcode >> 0) & 0x07
 
-    @property
-    def b(self: Self) -> str:
-        return z80.instruction.FormattingType.b(self._b)
-
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        b = self._b
+        r = self._r
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        R[r] = R[r] | 1 << b
+        return 8
 
 class SET_b_deref_HL(z80.instruction.Instruction):
     @classmethod
@@ -2843,18 +4253,23 @@ class SET_b_deref_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xCBC6, 0xCBCE, 0xCBD6, 0xCBDE, 0xCBE6, 0xCBEE, 0xCBF6, 0xCBFE]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"SET b, (HL); b={self.b}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_b',)
+    size = 2
+    opcode_fields = { 'b': (3, 0x07) }
+    template = "SET b, (HL); b={b}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._b = (opcode >> 3) & 0x07
 
-    @property
-    def b(self: Self) -> str:
-        return z80.instruction.FormattingType.b(self._b)
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        b = self._b
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = R[4] << 8 | R[5]
+        ram[address] = ram[address] | 1 << b
+        return 15
 
 class SET_b_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -2863,23 +4278,24 @@ class SET_b_deref_IX_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDDCBC6, 0xDDCBCE, 0xDDCBD6, 0xDDCBDE, 0xDDCBE6, 0xDDCBEE, 0xDDCBF6, 0xDDCBFE]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"SET b, (IX+d); b={self.b}, d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_b', '_d')
+    size = 4
+    opcode_fields = { 'b': (3, 0x07) }
+    template = "SET b, (IX+d); b={b}, d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._b = (opcode >> 3) & 0x07
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
-
-    @property
-    def b(self: Self) -> str:
-        return z80.instruction.FormattingType.b(self._b)
-
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        ram = cpu.ram
+        b = self._b
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF
+        ram[address] = ram[address] | 1 << b
+        return 23
 
 class SET_b_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
@@ -2888,23 +4304,126 @@ class SET_b_deref_IY_plus_d(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xFDCBC6, 0xFDCBCE, 0xFDCBD6, 0xFDCBDE, 0xFDCBE6, 0xFDCBEE, 0xFDCBF6, 0xFDCBFE]
-    @property
-    def size(self: Self) -> int:
-        return 4
-    def __str__(self: Self) -> str:
-        return f"SET b, (IY+d); b={self.b}, d={self.d}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_b', '_d')
+    size = 4
+    opcode_fields = { 'b': (3, 0x07) }
+    template = "SET b, (IY+d); b={b}, d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._b = (opcode >> 3) & 0x07
-        self._d = self._ram.get_byte(self._PC + 2, signed=False)
+        self._d = ram.get_byte(PC + 2, signed=False)
 
-    @property
-    def b(self: Self) -> str:
-        return z80.instruction.FormattingType.b(self._b)
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        ram = cpu.ram
+        b = self._b
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF
+        ram[address] = ram[address] | 1 << b
+        return 23
 
-    @property
-    def d(self: Self) -> str:
-        return z80.instruction.FormattingType.d(self._d)
+class RES_b_r(z80.instruction.Instruction):
+    @classmethod
+    def name(cls) -> str:
+        return "RES b, r"
+    @classmethod
+    def opcodes(cls) -> List[int]:
+        return [0xCB80, 0xCB81, 0xCB82, 0xCB83, 0xCB84, 0xCB85, 0xCB87, 0xCB88, 0xCB89, 0xCB8A, 0xCB8B, 0xCB8C, 0xCB8D, 0xCB8F, 0xCB90, 0xCB91, 0xCB92, 0xCB93, 0xCB94, 0xCB95, 0xCB97, 0xCB98, 0xCB99, 0xCB9A, 0xCB9B, 0xCB9C, 0xCB9D, 0xCB9F, 0xCBA0, 0xCBA1, 0xCBA2, 0xCBA3, 0xCBA4, 0xCBA5, 0xCBA7, 0xCBA8, 0xCBA9, 0xCBAA, 0xCBAB, 0xCBAC, 0xCBAD, 0xCBAF, 0xCBB0, 0xCBB1, 0xCBB2, 0xCBB3, 0xCBB4, 0xCBB5, 0xCBB7, 0xCBB8, 0xCBB9, 0xCBBA, 0xCBBB, 0xCBBC, 0xCBBD, 0xCBBF]
+    __slots__ = ('_b', '_r')
+    size = 2
+    opcode_fields = { 'b': (3, 0x07), 'r': (0, 0x07) }
+    template = "RES b, r; b={b}, r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._b = (opcode >> 3) & 0x07
+        self._r = (opcode >> 0) & 0x07
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        b = self._b
+        r = self._r
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        R[r] = R[r] & (0xFF ^ 1 << b)
+        return 8
+
+class RES_b_deref_HL(z80.instruction.Instruction):
+    @classmethod
+    def name(cls) -> str:
+        return "RES b, (HL)"
+    @classmethod
+    def opcodes(cls) -> List[int]:
+        return [0xCB86, 0xCB8E, 0xCB96, 0xCB9E, 0xCBA6, 0xCBAE, 0xCBB6, 0xCBBE]
+    __slots__ = ('_b',)
+    size = 2
+    opcode_fields = { 'b': (3, 0x07) }
+    template = "RES b, (HL); b={b}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._b = (opcode >> 3) & 0x07
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        b = self._b
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = R[4] << 8 | R[5]
+        ram[address] = ram[address] & (0xFF ^ 1 << b)
+        return 15
+
+class RES_b_deref_IX_plus_d(z80.instruction.Instruction):
+    @classmethod
+    def name(cls) -> str:
+        return "RES b, (IX+d)"
+    @classmethod
+    def opcodes(cls) -> List[int]:
+        return [0xDDCB86, 0xDDCB8E, 0xDDCB96, 0xDDCB9E, 0xDDCBA6, 0xDDCBAE, 0xDDCBB6, 0xDDCBBE]
+    __slots__ = ('_b', '_d')
+    size = 4
+    opcode_fields = { 'b': (3, 0x07) }
+    template = "RES b, (IX+d); b={b}, d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._b = (opcode >> 3) & 0x07
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        ram = cpu.ram
+        b = self._b
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IX + (d ^ 0x80) - 0x80) & 0xFFFF
+        ram[address] = ram[address] & (0xFF ^ 1 << b)
+        return 23
+
+class RES_b_deref_IY_plus_d(z80.instruction.Instruction):
+    @classmethod
+    def name(cls) -> str:
+        return "RES b, (IY+d)"
+    @classmethod
+    def opcodes(cls) -> List[int]:
+        return [0xFDCB86, 0xFDCB8E, 0xFDCB96, 0xFDCB9E, 0xFDCBA6, 0xFDCBAE, 0xFDCBB6, 0xFDCBBE]
+    __slots__ = ('_b', '_d')
+    size = 4
+    opcode_fields = { 'b': (3, 0x07) }
+    template = "RES b, (IY+d); b={b}, d={d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._b = (opcode >> 3) & 0x07
+        self._d = ram.get_byte(PC + 2, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        ram = cpu.ram
+        b = self._b
+        d = self._d
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        address = (regs.IY + (d ^ 0x80) - 0x80) & 0xFFFF
+        ram[address] = ram[address] & (0xFF ^ 1 << b)
+        return 23
 
 class JP_nn(z80.instruction.Instruction):
     @classmethod
@@ -2913,18 +4432,18 @@ class JP_nn(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xC3]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"JP nn; nn={self._nn}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._nn = self._ram.get_word(self._PC + 1)
-
-    @property
-    def nn(self: Self) -> str:
-        return z80.instruction.FormattingType.nn(self._nn)
+    __slots__ = ('_nn',)
+    size = 3
+    template = "JP nn; nn={nn:d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._nn = ram.get_word(PC + 1)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        nn = self._nn
+        regs.PC = nn
+        return 10
 
 class JP_cc_nn(z80.instruction.Instruction):
     @classmethod
@@ -2933,23 +4452,23 @@ class JP_cc_nn(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xC2, 0xCA, 0xD2, 0xDA, 0xE2, 0xEA, 0xF2, 0xFA]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"JP cc, nn; cc={self.cc}, nn={self._nn}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_cc', '_nn')
+    size = 3
+    opcode_fields = { 'cc': (3, 0x07) }
+    template = "JP cc, nn; cc={cc}, nn={nn:d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._cc = (opcode >> 3) & 0x07
-        self._nn = self._ram.get_word(self._PC + 1)
-
-    @property
-    def cc(self: Self) -> str:
-        return z80.instruction.FormattingType.cc(self.cc2name[self._cc])
+        self._nn = ram.get_word(PC + 1)
 
-    @property
-    def nn(self: Self) -> str:
-        return z80.instruction.FormattingType.nn(self._nn)
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        cc = self._cc
+        nn = self._nn
+        if bool(R[6] & (0x40, 0x01, 0x04, 0x80)[cc >> 1]) == (cc & 1):
+            regs.PC = nn
+        return 10
 
 class JR_e(z80.instruction.Instruction):
     @classmethod
@@ -2958,23 +4477,26 @@ class JR_e(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x18]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"JR e; e={self.e}h"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._e = self._ram.get_byte(self._PC + 1, signed=True)
-        self._jump_destination = self._PC + self.size + self.e
+    __slots__ = ('_e',)
+    size = 2
+    template = "JR e; e={e}h"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._e = ram.get_byte(PC + 1, signed=True)
 
-    @property
-    def e(self: Self) -> int:
-        return z80.instruction.FormattingType.e(self._e)
+    def jump_destination(self: Self, PC: int) -> int:
+        return PC + self.size + self._e
 
+    ## The operand as written in assembly, relative to the instruction.
     @property
-    def jump_destination(self: Self) -> str:
-        return z80.instruction.FormattingType.jp(self._jump_destination)
+    def offset(self: Self) -> int:
+        return self._e + 2
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        e = self._e
+        regs.PC = (regs.PC + e) & 0xFFFF
+        return 12
 
 class JR_C_e(z80.instruction.Instruction):
     @classmethod
@@ -2983,23 +4505,29 @@ class JR_C_e(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x38]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"JR C, e; e={self.e}h"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._e = self._ram.get_byte(self._PC + 1, signed=True)
-        self._jump_destination = self._PC + self.size + self.e
-
-    @property
-    def e(self: Self) -> int:
-        return z80.instruction.FormattingType.e(self._e)
-
-    @property
-    def jump_destination(self: Self) -> str:
-        return z80.instruction.FormattingType.jp(self._jump_destination)
+    __slots__ = ('_e',)
+    size = 2
+    template = "JR C, e; e={e}h"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._e = ram.get_byte(PC + 1, signed=True)
+
+    def jump_destination(self: Self, PC: int) -> int:
+        return PC + self.size + self._e
+
+    ## The operand as written in assembly, relative to the instruction.
+    @property
+    def offset(self: Self) -> int:
+        return self._e + 2
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        e = self._e
+        if R[6] & 0x01:
+            regs.PC = (regs.PC + e) & 0xFFFF
+            return 12
+        return 7
 
 class JR_NC_e(z80.instruction.Instruction):
     @classmethod
@@ -3008,23 +4536,29 @@ class JR_NC_e(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x30]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"JR NC, e; e={self.e}h"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._e = self._ram.get_byte(self._PC + 1, signed=True)
-        self._jump_destination = self._PC + self.size + self.e
-
-    @property
-    def e(self: Self) -> int:
-        return z80.instruction.FormattingType.e(self._e)
-
-    @property
-    def jump_destination(self: Self) -> str:
-        return z80.instruction.FormattingType.jp(self._jump_destination)
+    __slots__ = ('_e',)
+    size = 2
+    template = "JR NC, e; e={e}h"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._e = ram.get_byte(PC + 1, signed=True)
+
+    def jump_destination(self: Self, PC: int) -> int:
+        return PC + self.size + self._e
+
+    ## The operand as written in assembly, relative to the instruction.
+    @property
+    def offset(self: Self) -> int:
+        return self._e + 2
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        e = self._e
+        if not R[6] & 0x01:
+            regs.PC = (regs.PC + e) & 0xFFFF
+            return 12
+        return 7
 
 class JR_Z_e(z80.instruction.Instruction):
     @classmethod
@@ -3033,23 +4567,29 @@ class JR_Z_e(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x28]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"JR Z, e; e={self.e}h"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._e = self._ram.get_byte(self._PC + 1, signed=True)
-        self._jump_destination = self._PC + self.size + self.e
-
-    @property
-    def e(self: Self) -> int:
-        return z80.instruction.FormattingType.e(self._e)
-
-    @property
-    def jump_destination(self: Self) -> str:
-        return z80.instruction.FormattingType.jp(self._jump_destination)
+    __slots__ = ('_e',)
+    size = 2
+    template = "JR Z, e; e={e}h"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._e = ram.get_byte(PC + 1, signed=True)
+
+    def jump_destination(self: Self, PC: int) -> int:
+        return PC + self.size + self._e
+
+    ## The operand as written in assembly, relative to the instruction.
+    @property
+    def offset(self: Self) -> int:
+        return self._e + 2
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        e = self._e
+        if R[6] & 0x40:
+            regs.PC = (regs.PC + e) & 0xFFFF
+            return 12
+        return 7
 
 class JR_NZ_e(z80.instruction.Instruction):
     @classmethod
@@ -3058,23 +4598,29 @@ class JR_NZ_e(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x20]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"JR NZ, e; e={self.e}h"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._e = self._ram.get_byte(self._PC + 1, signed=True)
-        self._jump_destination = self._PC + self.size + self.e
-
-    @property
-    def e(self: Self) -> int:
-        return z80.instruction.FormattingType.e(self._e)
-
-    @property
-    def jump_destination(self: Self) -> str:
-        return z80.instruction.FormattingType.jp(self._jump_destination)
+    __slots__ = ('_e',)
+    size = 2
+    template = "JR NZ, e; e={e}h"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._e = ram.get_byte(PC + 1, signed=True)
+
+    def jump_destination(self: Self, PC: int) -> int:
+        return PC + self.size + self._e
+
+    ## The operand as written in assembly, relative to the instruction.
+    @property
+    def offset(self: Self) -> int:
+        return self._e + 2
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        e = self._e
+        if not R[6] & 0x40:
+            regs.PC = (regs.PC + e) & 0xFFFF
+            return 12
+        return 7
 
 class JP_deref_HL(z80.instruction.Instruction):
     @classmethod
@@ -3083,13 +4629,55 @@ class JP_deref_HL(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xE9]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"JP (HL);"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "JP (HL);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        regs.PC = R[4] << 8 | R[5]
+        return 4
+
+class JP_deref_IX(z80.instruction.Instruction):
+    @classmethod
+    def name(cls) -> str:
+        return "JP (IX)"
+    @classmethod
+    def opcodes(cls) -> List[int]:
+        return [0xDDE9]
+    __slots__ = ()
+    size = 2
+    template = "JP (IX);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        regs.PC = regs.IX
+        return 8
+
+class JP_deref_IY(z80.instruction.Instruction):
+    @classmethod
+    def name(cls) -> str:
+        return "JP (IY)"
+    @classmethod
+    def opcodes(cls) -> List[int]:
+        return [0xFDE9]
+    __slots__ = ()
+    size = 2
+    template = "JP (IY);"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        regs.PC = regs.IY
+        return 8
 
 class DJNZ_e(z80.instruction.Instruction):
     @classmethod
@@ -3098,23 +4686,30 @@ class DJNZ_e(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0x10]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"DJNZ, e; e={self.e}h"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._e = self._ram.get_byte(self._PC + 1, signed=True)
-        self._jump_destination = self._PC + self.size + self.e
-
-    @property
-    def e(self: Self) -> int:
-        return z80.instruction.FormattingType.e(self._e)
-
-    @property
-    def jump_destination(self: Self) -> str:
-        return z80.instruction.FormattingType.jp(self._jump_destination)
+    __slots__ = ('_e',)
+    size = 2
+    template = "DJNZ, e; e={e}h"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._e = ram.get_byte(PC + 1, signed=True)
+
+    def jump_destination(self: Self, PC: int) -> int:
+        return PC + self.size + self._e
+
+    ## The operand as written in assembly, relative to the instruction.
+    @property
+    def offset(self: Self) -> int:
+        return self._e + 2
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        e = self._e
+        R[0] = (R[0] - 1) & 0xFF
+        if R[0]:
+            regs.PC = (regs.PC + e) & 0xFFFF
+            return 13
+        return 8
 
 class CALL_nn(z80.instruction.Instruction):
     @classmethod
@@ -3123,18 +4718,24 @@ class CALL_nn(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xCD]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"CALL nn; nn={self._nn}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._nn = self._ram.get_word(self._PC + 1)
-
-    @property
-    def nn(self: Self) -> str:
-        return z80.instruction.FormattingType.nn(self._nn)
+    __slots__ = ('_nn',)
+    size = 3
+    template = "CALL nn; nn={nn:d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._nn = ram.get_word(PC + 1)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        ram = cpu.ram
+        nn = self._nn
+        sp = (regs.SP - 1) & 0xFFFF
+        ram[sp] = regs.PC >> 8
+        sp = (sp - 1) & 0xFFFF
+        ram[sp] = regs.PC & 0xFF
+        regs.SP = sp
+        regs.PC = nn
+        return 17
 
 class CALL_cc_nn(z80.instruction.Instruction):
     @classmethod
@@ -3143,23 +4744,30 @@ class CALL_cc_nn(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xC4, 0xCC, 0xD4, 0xDC, 0xE4, 0xEC, 0xF4, 0xFC]
-    @property
-    def size(self: Self) -> int:
-        return 3
-    def __str__(self: Self) -> str:
-        return f"CALL cc, nn; cc={self.cc}, nn={self._nn}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_cc', '_nn')
+    size = 3
+    opcode_fields = { 'cc': (3, 0x07) }
+    template = "CALL cc, nn; cc={cc}, nn={nn:d}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._cc = (opcode >> 3) & 0x07
-        self._nn = self._ram.get_word(self._PC + 1)
-
-    @property
-    def cc(self: Self) -> str:
-        return z80.instruction.FormattingType.cc(self.cc2name[self._cc])
-
-    @property
-    def nn(self: Self) -> str:
-        return z80.instruction.FormattingType.nn(self._nn)
+        self._nn = ram.get_word(PC + 1)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        cc = self._cc
+        nn = self._nn
+        if bool(R[6] & (0x40, 0x01, 0x04, 0x80)[cc >> 1]) == (cc & 1):
+            sp = (regs.SP - 1) & 0xFFFF
+            ram[sp] = regs.PC >> 8
+            sp = (sp - 1) & 0xFFFF
+            ram[sp] = regs.PC & 0xFF
+            regs.SP = sp
+            regs.PC = nn
+            return 17
+        return 10
 
 class RET(z80.instruction.Instruction):
     @classmethod
@@ -3168,13 +4776,21 @@ class RET(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xC9]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"RET;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 1
+    template = "RET;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        ram = cpu.ram
+        sp = regs.SP
+        lo = ram[sp]
+        hi = ram[(sp + 1) & 0xFFFF]
+        regs.SP = (sp + 2) & 0xFFFF
+        regs.PC = hi << 8 | lo
+        return 10
 
 class RET_cc(z80.instruction.Instruction):
     @classmethod
@@ -3183,18 +4799,27 @@ class RET_cc(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xC0, 0xC8, 0xD0, 0xD8, 0xE0, 0xE8, 0xF0, 0xF8]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"RET cc; cc={self.cc}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_cc',)
+    size = 1
+    opcode_fields = { 'cc': (3, 0x07) }
+    template = "RET cc; cc={cc}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._cc = (opcode >> 3) & 0x07
 
-    @property
-    def cc(self: Self) -> str:
-        return z80.instruction.FormattingType.cc(self.cc2name[self._cc])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        cc = self._cc
+        if bool(R[6] & (0x40, 0x01, 0x04, 0x80)[cc >> 1]) == (cc & 1):
+            sp = regs.SP
+            lo = ram[sp]
+            hi = ram[(sp + 1) & 0xFFFF]
+            regs.SP = (sp + 2) & 0xFFFF
+            regs.PC = hi << 8 | lo
+            return 11
+        return 5
 
 class RETI(z80.instruction.Instruction):
     @classmethod
@@ -3203,13 +4828,25 @@ class RETI(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xED4D]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"RETI;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "RETI;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        sp = regs.SP
+        lo = ram[sp]
+        hi = ram[(sp + 1) & 0xFFFF]
+        regs.SP = (sp + 2) & 0xFFFF
+        regs.PC = hi << 8 | lo
+        regs.IFF1 = regs.IFF2
+        if regs.IFF1 and cpu.int_line:
+            cpu.end_slice()
+        return 14
 
 class RETN(z80.instruction.Instruction):
     @classmethod
@@ -3217,14 +4854,26 @@ class RETN(z80.instruction.Instruction):
         return "RETN"
     @classmethod
     def opcodes(cls) -> List[int]:
-        return [0xED45]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"RETN;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+        return [0xED45, 0xED55, 0xED5D, 0xED65, 0xED6D, 0xED75, 0xED7D]
+    __slots__ = ()
+    size = 2
+    template = "RETN;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        sp = regs.SP
+        lo = ram[sp]
+        hi = ram[(sp + 1) & 0xFFFF]
+        regs.SP = (sp + 2) & 0xFFFF
+        regs.PC = hi << 8 | lo
+        regs.IFF1 = regs.IFF2
+        if regs.IFF1 and cpu.int_line:
+            cpu.end_slice()
+        return 14
 
 class RST_p(z80.instruction.Instruction):
     @classmethod
@@ -3233,18 +4882,25 @@ class RST_p(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xC7, 0xCF, 0xD7, 0xDF, 0xE7, 0xEF, 0xF7, 0xFF]
-    @property
-    def size(self: Self) -> int:
-        return 1
-    def __str__(self: Self) -> str:
-        return f"RST p; t={self._t}, p={self.p}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_t',)
+    size = 1
+    opcode_fields = { 't': (3, 0x07) }
+    template = "RST p; t={t}, p={p}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._t = (opcode >> 3) & 0x07
 
-    @property
-    def p(self: Self) -> int:
-        return z80.instruction.FormattingType.p(self.t2p[self._t])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        ram = cpu.ram
+        p = self._t << 3
+        sp = (regs.SP - 1) & 0xFFFF
+        ram[sp] = regs.PC >> 8
+        sp = (sp - 1) & 0xFFFF
+        ram[sp] = regs.PC & 0xFF
+        regs.SP = sp
+        regs.PC = p
+        return 11
 
 class IN_A_deref_n(z80.instruction.Instruction):
     @classmethod
@@ -3253,18 +4909,19 @@ class IN_A_deref_n(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xDB]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"IN A, (n); n={self.n}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._n = self._ram.get_byte(self._PC + 1, signed=False)
-
-    @property
-    def n(self: Self) -> str:
-        return z80.instruction.FormattingType.n(self._n)
+    __slots__ = ('_n',)
+    size = 2
+    template = "IN A, (n); n={n}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._n = ram.get_byte(PC + 1, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        n = self._n
+        R[7] = cpu.io.readers[n](n)
+        return 11
 
 class IN_r_deref_C(z80.instruction.Instruction):
     @classmethod
@@ -3273,18 +4930,24 @@ class IN_r_deref_C(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xED40, 0xED48, 0xED50, 0xED58, 0xED60, 0xED68, 0xED78]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"IN r, (C); r={self.r}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_r',)
+    size = 2
+    opcode_fields = { 'r': (3, 0x07) }
+    template = "IN r, (C); r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._r = (opcode >> 3) & 0x07
 
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        r = self._r
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        port = R[1]
+        res = cpu.io.readers[port](port)
+        R[r] = res
+        R[6] = R[6] & 0x01 | SZP[res]
+        return 12
 
 class INI(z80.instruction.Instruction):
     @classmethod
@@ -3293,13 +4956,26 @@ class INI(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xEDA2]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"INI;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "INI;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        hl = R[4] << 8 | R[5]
+        port = R[1]
+        ram[hl] = cpu.io.readers[port](port)
+        R[0] = (R[0] - 1) & 0xFF
+        R[6] = R[6] & 0x01 | 0x02 | (R[0] & 0xA8) | (R[0] == 0) << 6
+        hl = (hl + 1) & 0xFFFF
+        R[4] = hl >> 8
+        R[5] = hl & 0xFF
+        return 16
 
 class INIR(z80.instruction.Instruction):
     @classmethod
@@ -3308,13 +4984,29 @@ class INIR(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xEDB2]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"INIR;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "INIR;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        hl = R[4] << 8 | R[5]
+        port = R[1]
+        ram[hl] = cpu.io.readers[port](port)
+        R[0] = (R[0] - 1) & 0xFF
+        R[6] = R[6] & 0x01 | 0x02 | (R[0] & 0xA8) | (R[0] == 0) << 6
+        hl = (hl + 1) & 0xFFFF
+        R[4] = hl >> 8
+        R[5] = hl & 0xFF
+        if R[0]:
+            regs.PC = (regs.PC - 2) & 0xFFFF
+            return 21
+        return 16
 
 class IND(z80.instruction.Instruction):
     @classmethod
@@ -3323,13 +5015,26 @@ class IND(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xEDAA]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"IND;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "IND;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        hl = R[4] << 8 | R[5]
+        port = R[1]
+        ram[hl] = cpu.io.readers[port](port)
+        R[0] = (R[0] - 1) & 0xFF
+        R[6] = R[6] & 0x01 | 0x02 | (R[0] & 0xA8) | (R[0] == 0) << 6
+        hl = (hl - 1) & 0xFFFF
+        R[4] = hl >> 8
+        R[5] = hl & 0xFF
+        return 16
 
 class INDR(z80.instruction.Instruction):
     @classmethod
@@ -3338,13 +5043,29 @@ class INDR(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xEDBA]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"INDR;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "INDR;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        hl = R[4] << 8 | R[5]
+        port = R[1]
+        ram[hl] = cpu.io.readers[port](port)
+        R[0] = (R[0] - 1) & 0xFF
+        R[6] = R[6] & 0x01 | 0x02 | (R[0] & 0xA8) | (R[0] == 0) << 6
+        hl = (hl - 1) & 0xFFFF
+        R[4] = hl >> 8
+        R[5] = hl & 0xFF
+        if R[0]:
+            regs.PC = (regs.PC - 2) & 0xFFFF
+            return 21
+        return 16
 
 class OUT_deref_n_A(z80.instruction.Instruction):
     @classmethod
@@ -3353,18 +5074,19 @@ class OUT_deref_n_A(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xD3]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"OUT (n), A; n={self.n}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
-        self._n = self._ram.get_byte(self._PC + 1, signed=False)
-
-    @property
-    def n(self: Self) -> str:
-        return z80.instruction.FormattingType.n(self._n)
+    __slots__ = ('_n',)
+    size = 2
+    template = "OUT (n), A; n={n}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+        self._n = ram.get_byte(PC + 1, signed=False)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        n = self._n
+        cpu.io.writers[n](n, R[7])
+        return 11
 
 class OUT_deref_C_r(z80.instruction.Instruction):
     @classmethod
@@ -3373,18 +5095,22 @@ class OUT_deref_C_r(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xED41, 0xED49, 0xED51, 0xED59, 0xED61, 0xED69, 0xED79]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"OUT (C), r; r={self.r}"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ('_r',)
+    size = 2
+    opcode_fields = { 'r': (3, 0x07) }
+    template = "OUT (C), r; r={r}"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
         self._r = (opcode >> 3) & 0x07
 
-    @property
-    def r(self: Self) -> str:
-        return z80.instruction.FormattingType.r(self.r2name[self._r])
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        r = self._r
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        port = R[1]
+        cpu.io.writers[port](port, R[r])
+        return 12
 
 class OUTI(z80.instruction.Instruction):
     @classmethod
@@ -3393,13 +5119,26 @@ class OUTI(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xEDA3]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"OUTI;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "OUTI;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        hl = R[4] << 8 | R[5]
+        R[0] = (R[0] - 1) & 0xFF
+        port = R[1]
+        cpu.io.writers[port](port, ram[hl])
+        R[6] = R[6] & 0x01 | 0x02 | (R[0] & 0xA8) | (R[0] == 0) << 6
+        hl = (hl + 1) & 0xFFFF
+        R[4] = hl >> 8
+        R[5] = hl & 0xFF
+        return 16
 
 class OTIR(z80.instruction.Instruction):
     @classmethod
@@ -3408,13 +5147,29 @@ class OTIR(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xEDB3]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"OTIR;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "OTIR;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        hl = R[4] << 8 | R[5]
+        R[0] = (R[0] - 1) & 0xFF
+        port = R[1]
+        cpu.io.writers[port](port, ram[hl])
+        R[6] = R[6] & 0x01 | 0x02 | (R[0] & 0xA8) | (R[0] == 0) << 6
+        hl = (hl + 1) & 0xFFFF
+        R[4] = hl >> 8
+        R[5] = hl & 0xFF
+        if R[0]:
+            regs.PC = (regs.PC - 2) & 0xFFFF
+            return 21
+        return 16
 
 class OUTD(z80.instruction.Instruction):
     @classmethod
@@ -3423,13 +5178,26 @@ class OUTD(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xEDAB]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"OUTD;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "OUTD;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        hl = R[4] << 8 | R[5]
+        R[0] = (R[0] - 1) & 0xFF
+        port = R[1]
+        cpu.io.writers[port](port, ram[hl])
+        R[6] = R[6] & 0x01 | 0x02 | (R[0] & 0xA8) | (R[0] == 0) << 6
+        hl = (hl - 1) & 0xFFFF
+        R[4] = hl >> 8
+        R[5] = hl & 0xFF
+        return 16
 
 class OTDR(z80.instruction.Instruction):
     @classmethod
@@ -3438,11 +5206,29 @@ class OTDR(z80.instruction.Instruction):
     @classmethod
     def opcodes(cls) -> List[int]:
         return [0xEDBB]
-    @property
-    def size(self: Self) -> int:
-        return 2
-    def __str__(self: Self) -> str:
-        return f"OTDR;"
-    def __init__(self: Self, registers: z80.registers.Registers, ram: z80.ram.RAM, opcode: int) -> None:
-        super().__init__(registers, ram, opcode)
+    __slots__ = ()
+    size = 2
+    template = "OTDR;"
+    def __init__(self: Self, ram: z80.ram.RAM, PC: int, opcode: int) -> None:
+        super().__init__(ram, PC, opcode)
+
+    def execute(self: Self, cpu) -> int:
+        regs = cpu.registers
+        R = regs.r
+        ram = cpu.ram
+        regs.R = regs.R & 0x80 | (regs.R + 1) & 0x7F
+        hl = R[4] << 8 | R[5]
+        R[0] = (R[0] - 1) & 0xFF
+        port = R[1]
+        cpu.io.writers[port](port, ram[hl])
+        R[6] = R[6] & 0x01 | 0x02 | (R[0] & 0xA8) | (R[0] == 0) << 6
+        hl = (hl - 1) & 0xFFFF
+        R[4] = hl >> 8
+        R[5] = hl & 0xFF
+        if R[0]:
+            regs.PC = (regs.PC - 2) & 0xFFFF
+            return 21
+        return 16
+
+z80.instruction.Instruction.compile_templates(__name__, z80.instruction.STYLE)
 
@@ -0,0 +1,27 @@
+from   typing import Self, Callable, List, Optional
+
+
+
+## The I/O ports: a handler for reading and one for writing for each of the
+## 256 ports, indexed by the port number, so IN and OUT cost one list index
+## (cpu.io.readers[port](port)). Ports nobody registered are open bus:
+## reading gives 0xFF, writes are lost.
+class IOBus:
+    def __init__(self: Self) -> None:
+        self.readers: List[Callable[[int], int]] = [ self.open_read ] * 0x100
+        self.writers: List[Callable[[int, int], None]] = [ self.open_write ] * 0x100
+    
+    def register(self: Self, port: int,
+        read: Optional[Callable[[int], int]]=None,
+        write: Optional[Callable[[int, int], None]]=None,
+    ) -> None:
+        self.readers[port] = self.open_read if read is None else read
+        self.writers[port] = self.open_write if write is None else write
+    
+    @staticmethod
+    def open_read(port: int) -> int:
+        return 0xFF
+    
+    @staticmethod
+    def open_write(port: int, value: int) -> None:
+        pass
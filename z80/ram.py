@@ -1,7 +1,11 @@
 import collections
 import logging
 import struct
-from   typing import Self, Iterable, List, Union, SupportsIndex, Any
+from   typing import Self, Callable, Iterable, List, Optional, Union, SupportsIndex, Any
+
+## Memory is mapped in pages of 256 bytes, see RAM.map().
+PAGE_SHIFT = 8
+PAGE_SIZE  = 1 << PAGE_SHIFT
 
 class RAM:
     def __init__(self: Self, size: int=128*1024) -> None:
@@ -17,11 +21,31 @@ class RAM:
         #self._ram = bytearray(size)
         self._ram: List[Union[int, None]] = [None] * size
         self._write_callback: dict = collections.defaultdict(list)
+        ## Handlers of the instructions at every address, see Z80.run(). A
+        ## write drops the ones whose opcode may include the byte written.
+        self.code: Optional[List[Any]] = None
+        ## The read and write handler of every page, None for plain memory.
+        ## See map().
+        self.read_pages: List[Optional[Callable[[int], int]]] = [None] * (size >> PAGE_SHIFT)
+        self.write_pages: List[Optional[Callable[[int, int], None]]] = [None] * (size >> PAGE_SHIFT)
     
     def __getitem__(self: Self, key: Union[int, SupportsIndex]) -> Union[int, None]:
-        return self._ram[key]
+        try:
+            read = self.read_pages[key >> PAGE_SHIFT]
+        except TypeError:
+            ## A slice, always plain memory.
+            return self._ram[key]
+        if read is None:
+            return self._ram[key]
+        return read(key)
     
     def __setitem__(self: Self, key: int, value: Union[int, None]) -> None:
+        write = self.write_pages[key >> PAGE_SHIFT]
+        if write is not None:
+            write(key, value)
+            return
+        
+        ## Plain memory, as in store().
         if value is not None:
             ## The bytes object does all the type and range checking for us.
             b = bytes([value])
@@ -29,11 +53,61 @@ class RAM:
         old_value = self._ram[key]
         self._ram[key] = value
         
+        if self.code is not None:
+            self.invalidate(key)
+        
         if key in self._write_callback:
             for func in self._write_callback[key]:
                 logging.debug(f'Calling write callback {func} with old_value={old_value}')
                 func(key, value, old_value)
     
+    ## A write to plain memory, for handlers that only take care of part of
+    ## their page.
+    def store(self: Self, key: int, value: Union[int, None]) -> None:
+        if value is not None:
+            bytes([value])
+        old_value = self._ram[key]
+        self._ram[key] = value
+        if self.code is not None:
+            self.invalidate(key)
+        if key in self._write_callback:
+            for func in self._write_callback[key]:
+                func(key, value, old_value)
+    
+    
+    
+    ## Memory mapped devices
+    ##
+    ## The pages from start to end (multiples of PAGE_SIZE) go to the
+    ## handlers: read(address) gives the byte at address, write(address, 
+    ## value) takes a write. Without a handler, that side of the page is 
+    ## plain memory again. Whether an access goes to a handler takes an 
+    ## index into read_pages or write_pages, plain memory pays nothing 
+    ## else. Reads of slices are always plain.
+    ##
+    ## A write handler that changes the memory behind the page (e.g. a bank
+    ## switch) calls invalidate() for it, see Z80.decode_handler().
+    def map(self: Self, start: int, end: int, read: Optional[Callable[[int], int]]=None, write: Optional[Callable[[int, int], None]]=None) -> None:
+        if start % PAGE_SIZE or end % PAGE_SIZE:
+            raise ValueError(f'Range 0x{start:04X}-0x{end:04X} is not made of whole pages.')
+        for page in range(start >> PAGE_SHIFT, end >> PAGE_SHIFT):
+            self.read_pages[page] = read
+            self.write_pages[page] = write
+    
+    
+    
+    ## Drops the decoded instructions that include address, or that overlap
+    ## a slice. Instructions are up to 4 bytes.
+    def invalidate(self: Self, key: Union[int, slice]) -> None:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self._ram))
+            start = max(start - 3, 0)
+            self.code[start:stop] = [None] * (stop - start)
+        elif key >= 3:
+            self.code[key - 3:key + 1] = (None, None, None, None)
+        else:
+            self.code[:key + 1] = (None,) * (key + 1)
+    
     
     
     def get_byte(self: Self, offset: int, signed=False) -> Union[int, None]:
@@ -1,159 +1,137 @@
 import logging
-from   typing import Self
-#import z80.register
+from   typing import Self, List
+from   z80.flags import FLAGS
 
 
-class RegPair:
-    def __init__(self: Self) -> None:
-        self._l = 0x00
-        self._h = 0x00
-    
-    @property
-    def h(self: Self) -> int:
-        return self._h
-    @h.setter
-    def h(self: Self, value: int) -> None:
+
+## Index of each 8 bit register in Registers.r. These are the numbers of the
+## r operand of the instructions, F takes the place of 0b110 ((HL)).
+B = 0
+C = 1
+D = 2
+E = 3
+H = 4
+L = 5
+F = 6
+A = 7
+NAMES = 'BCDEHLFA'
+
+## Bits of F.
+FLAG_C = 0x01	## Carry
+FLAG_N = 0x02	## Add/subtract
+FLAG_P = 0x04	## Parity/overflow
+FLAG_V = 0x04
+FLAG_X = 0x08	## Bit 3 of the result (undocumented)
+FLAG_H = 0x10	## Half carry
+FLAG_Y = 0x20	## Bit 5 of the result (undocumented)
+FLAG_Z = 0x40	## Zero
+FLAG_S = 0x80	## Sign
+
+
+
+## Properties for an 8 bit register, resp. a register pair, in Registers.r.
+## F is read through z80.flags.FLAGS, since it may hold lazy flags.
+def _byte(name: str) -> property:
+    index = NAMES.index(name)
+    def get(self: 'Registers') -> int:
+        return self.r[index]
+    def get_flags(self: 'Registers') -> int:
+        return FLAGS[self.r[index]]
+    def set(self: 'Registers', value: int) -> None:
         if value < 0 or value > 0xFF:
             raise ValueError(f'value not a byte, value={value}')
-        self._h = value
+        self.r[index] = value
+    return property(get_flags if index == F else get, set)
 
-    
-    @property
-    def l(self: Self) -> int:
-        return self._l
-    @l.setter
-    def l(self: Self, value: int) -> None:
-        if value < 0 or value > 0xFF:
-            raise ValueError
-        self._l = value
+def _word(high_name: str, low_name: str) -> property:
+    high, low = NAMES.index(high_name), NAMES.index(low_name)
+    def get(self: 'Registers') -> int:
+        return (self.r[high] << 8) | self.r[low]
+    def get_flags(self: 'Registers') -> int:
+        return (self.r[high] << 8) | FLAGS[self.r[low]]
+    def set(self: 'Registers', value: int) -> None:
+        if value < 0 or value > 0xFFFF:
+            raise ValueError(f'value not a word, value={value}')
+        self.r[high] = value >> 8
+        self.r[low] = value & 0xFF
+    return property(get_flags if low == F else get, set)
 
 
 
+## The registers are plain ints, the 8 bit ones in a list indexed by their
+## number (see above), so the generated execute() methods can work on them
+## without going through properties: R = registers.r; R[A] = R[B].
+##
+## The properties below are for everybody else, and check the range of the
+## value written. Note that r[F] may be lazy flags, see z80.flags.
 class Registers:
-    def __init__(self: Self):
-        self._AF = RegPair()
-        self._BC = RegPair()
-        self._DE = RegPair()
-        self._HL = RegPair()
-        self._PC = RegPair()
-        self._SP = RegPair()
-    
-    
-    
-    @property
-    def A(self: Self) -> int:
-        return self._AF.h
-    @A.setter
-    def A(self: Self, value: int) -> None:
-        self._AF.h = value
-    
-    
-    
-    @property
-    def B(self: Self) -> int:
-        return self._BC.l
-    @B.setter
-    def B(self: Self, value: int) -> None:
-        self._BC.l = value
-    
-    
-    
-    @property
-    def BC(self: Self) -> int:
-        return (self._BC.h << 8) | (self._BC.l)
-    @BC.setter
-    def BC(self: Self, value: int) -> None:
-        self._BC.h = value >> 8
-        self._BC.l = value & 0xFF
+    __slots__ = ('r', 'r_prime', 'SP', 'PC', 'IX', 'IY', 'I', 'R', 'IFF1', 'IFF2', 'IM', 'halted')
     
-    
-    
-    @property
-    def DE(self: Self) -> int:
-        return (self._DE.h << 8) | (self._DE.l)
-    @DE.setter
-    def DE(self: Self, value: int) -> None:
-        self._DE.h = value >> 8
-        self._DE.l = value & 0xFF
-    
-    
-    
-    @property
-    def H(self: Self) -> int:
-        return self._HL.h
-    @H.setter
-    def H(self: Self, value: int) -> None:
-        self._HL.h = value
-    
-    
-    
-    @property
-    def HL(self: Self) -> int:
-        return (self._HL.h << 8) | (self._HL.l)
-    @HL.setter
-    def HL(self: Self, value: int) -> None:
-        self._HL.h = value >> 8
-        self._HL.l = value & 0xFF
-    
-    
-    
-    @property
-    def L(self: Self) -> int:
-        return self._HL.l
-    @L.setter
-    def L(self: Self, value: int) -> None:
-        self._HL.l = value
-    
-    
-    
-    @property
-    def PC(self: Self) -> int:
-        return (self._PC.h << 8) | (self._PC.l)
-    @PC.setter
-    def PC(self: Self, value: int) -> None:
-        self._PC.h = value >> 8
-        self._PC.l = value & 0xFF
+    def __init__(self: Self):
+        self.r: List[int] = [0x00] * 8
+        ## B', C', D', E', H', L', F', A', see EX AF, AF' and EXX.
+        self.r_prime: List[int] = [0x00] * 8
+        self.SP = 0x0000
+        self.PC = 0x0000
+        self.IX = 0x0000
+        self.IY = 0x0000
+        self.I = 0x00
+        self.R = 0x00
+        
+        ## Interrupt flip-flops and mode.
+        self.IFF1 = 0
+        self.IFF2 = 0
+        self.IM = 0
+        self.halted = False
+    
+    
+    
+    A  = _byte('A')
+    B  = _byte('B')
+    C  = _byte('C')
+    D  = _byte('D')
+    E  = _byte('E')
+    F  = _byte('F')
+    H  = _byte('H')
+    L  = _byte('L')
+    
+    AF = _word('A', 'F')
+    BC = _word('B', 'C')
+    DE = _word('D', 'E')
+    HL = _word('H', 'L')
     
     
     
     def set_r_n(self: Self, r: int, n: int) -> None:
-        match r:
-            case 0b000:
-                self.B = n
-            case 0b001:
-                self.C = n
-            case 0b010:
-                self.D = n
-            case 0b011:
-                self.E = n
-            case 0b100:
-                self.H = n
-            case 0b101:
-                self.L = n
-            
-            case 0b111:
-                self.A = n
-            case _:
-                raise ValueError(f'register value {r:#05b} is not a known register.')
-    
-    def get_reg_dd(self: Self, dd: int) -> RegPair:
-        if dd == 0b00:
-            return self._BC
-        if dd == 0b00:
-            return self._DE
-        if dd == 0b10:
-            return self._HL
-        if dd == 0b11:
-            return self._SP
-        raise ValueError
+        if r == F:
+            raise ValueError(f'register value {r:#05b} is not a known register.')
+        if n < 0 or n > 0xFF:
+            raise ValueError(f'value not a byte, value={n}')
+        self.r[r] = n
+    
+    def get_reg_dd(self: Self, dd: int) -> int:
+        match dd:
+            case 0b00:
+                return self.BC
+            case 0b01:
+                return self.DE
+            case 0b10:
+                return self.HL
+            case 0b11:
+                return self.SP
+        raise ValueError(f'register pair value {dd:#04b} is not a known register pair.')
     
     def set_reg_dd(self: Self, dd: int, value: int) -> None:
-        if dd == 0b00:
-            self.BC = value; return
-        if dd == 0b01:
-            self.DE = value; return
-        if dd == 0b10:
-            self.HL = value; return
-        if dd == 0b11:
-            self.SP = value; return
-        raise ValueError
+        match dd:
+            case 0b00:
+                self.BC = value
+            case 0b01:
+                self.DE = value
+            case 0b10:
+                self.HL = value
+            case 0b11:
+                if value < 0 or value > 0xFFFF:
+                    raise ValueError(f'value not a word, value={value}')
+                self.SP = value
+            case _:
+                raise ValueError(f'register pair value {dd:#04b} is not a known register pair.')
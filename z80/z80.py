@@ -1,17 +1,80 @@
+import collections
+import heapq
+import itertools
 import logging
-from   typing import Self, Dict, List, Type
+from   typing import Self, Callable, Dict, List, Optional, Tuple, Type
+from   z80.flags import FLAGS
+import z80.handlers
 import z80.instruction
 import z80.instructions
+import z80.io
 import z80.ram
 
 
 
+## Raised by the handler of an idle loop head, see Z80._idle(). run(cycles)
+## runs the loop from cycles on, and returns the cycles it got to.
+class IdleLoop(Exception):
+    def __init__(self: Self, run: Callable[[int], int]) -> None:
+        self.run = run
+
+## Raised by EI while the interrupt line is active, see 
+## Z80.enable_interrupts().
+class EnableInterrupts(Exception):
+    pass
+
+
+
 class Z80:
-    def __init__(self: Self):
+    ## With lazy_flags, the handlers leave the flags of ALU operations to be 
+    ## looked up when F is read (see z80.flags). That is no faster to speak
+    ## of, so it is off by default. With threaded, run_cycles()
+    ## keeps the handler of the instruction at every address it ran, see 
+    ## predecode(). With fuse, some sequences of instructions run as one 
+    ## handler (see FUSIONS in z80.instruction), with fusion_stats, how often
+    ## each one ran is counted in fusion_stats. With skip_idle, waiting for 
+    ## the next event in HALT or a polling loop is skipped. fuse and skip_idle
+    ## imply threaded.
+    def __init__(self: Self, lazy_flags: bool=False, threaded: bool=False, fuse: bool=False, fusion_stats: bool=False, skip_idle: bool=False):
+        self.lazy_flags = lazy_flags
+        self.threaded = threaded or fuse or skip_idle
+        self.fuse = fuse
+        self.fusion_stats: Optional[collections.Counter] = collections.Counter() if fusion_stats else None
+        self.skip_idle = skip_idle
+        
+        ## T-states run, and the events to come (see schedule()).
+        self.cycles = 0
+        self._events: List[Tuple[int, int, Callable[[], None]]] = []
+        self._event_order = itertools.count()
+        ## Where the slice _run_until() is running ends, see end_slice().
+        self._deadline = 0
+        
+        ## The INT line, with the byte put on the data bus when it is 
+        ## accepted (IM 0 and IM 2), and whether an NMI is waiting. See
+        ## interrupt() and nmi().
+        self.int_line = False
+        self.int_data = 0xFF
+        self.nmi_pending = False
+        
         self._ram = z80.ram.RAM(size=128 * 1024)
+        ## The devices on the I/O ports.
+        self.io = z80.io.IOBus()
         self._opcode2instruction: Dict[int, z80.instruction.Instruction] = {}
         self.registers = z80.registers.Registers()
         
+        ## How instructions are rendered by render(). Without a style, every
+        ## instruction uses the style of its own instruction set.
+        self.style: Optional[z80.instruction.Style] = None
+        ## Names of addresses, shown for jump and call destinations.
+        self.symbols: Dict[int, str] = {}
+        ## Routines run natively instead of the code at their address, see
+        ## trap().
+        self.traps: Dict[int, Callable[['Z80'], int]] = {}
+        ## Decoded instructions by their bytes, see decode_instruction().
+        self._interned: Dict[Tuple[int, ...], z80.instruction.Instruction] = {}
+        ## What ram.code was decoded with, see _code().
+        self._code_key: Optional[Tuple] = None
+        
         self.load_instruction_set('z80.instructions')
     
     def load_instruction_set(self: Self, instruction_set: str, overwrite=False) -> None:
@@ -27,6 +90,7 @@ class Z80:
                 logging.error(error)
                 raise ValueError(error)
             self._opcode2instruction[opcode] = instruction_class
+        self._interned.clear()
     
     def override_instruction(self: Self, instruction_class: z80.instruction.Instruction) -> None:
         self.add_instruction(instruction_class, overwrite=True)
@@ -62,35 +126,448 @@ class Z80:
                 self._opcode |= self._ram[self.registers.PC + 3]
                 logging.debug(f'Fetched opcode at PC=0x{self.PC:04X}: 0x{self._opcode:06X}')
     
+    ## Instructions are shared: the same bytes decode to the same object, 
+    ## wherever they are.
     def decode_instruction(self: Self) -> z80.instruction.Instruction:
+        PC = self.registers.PC
         try:
-            instruction = self._opcode2instruction[self._opcode](
+            instruction_class = self._opcode2instruction[self._opcode]
+        except KeyError:
+            logging.exception(f'Unknown opcode 0x{self._opcode:02X}.')
+            instruction = z80.instruction.Illegal(
                 ram=self._ram,
-                registers=self.registers,
+                PC=PC,
                 opcode=self._opcode,
             )
             return instruction
+        
+        key = tuple(self._ram[PC:PC + instruction_class.size])
+        try:
+            return self._interned[key]
         except KeyError:
-            logging.exception(f'Unknown opcode 0x{self._opcode:02X}.')
-            instruction = z80.instruction.Illegal(
+            instruction = instruction_class(
                 ram=self._ram,
-                registers=self.registers,
+                PC=PC,
                 opcode=self._opcode,
             )
+            self._interned[key] = instruction
             return instruction
-        return None
+    
+    ## The text of instruction, at address PC.
+    def render(self: Self, instruction: z80.instruction.Instruction, PC: int) -> str:
+        return (self.style or instruction.style).render(instruction, PC, self.symbols, self.registers)
     
     def execute_opcode(self: Self) -> z80.instruction.Instruction:
         instruction = self.decode_instruction()
-        logging.debug('\t\t\t\t\t' + str(instruction))
-        if instruction is None:
-            self.registers.PC += 1
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug('\t\t\t\t\t' + self.render(instruction, self.PC))
+        registers = self.registers
+        registers.PC = (registers.PC + instruction.size) & 0xFFFF
+        registers.R = (registers.R & 0x80) | ((registers.R + 1) & 0x7F)
+        ## The execute() methods work on actual flags.
+        if self.lazy_flags:
+            registers.r[z80.registers.F] = FLAGS[registers.r[z80.registers.F]]
+        try:
+            self.cycles += instruction.execute(self)
+        except EnableInterrupts:
+            self.cycles += 4
+        return instruction
+    
+    ## Run count instructions through the generated handlers, one function
+    ## per opcode (see z80.handlers). No Instruction objects are made, so the
+    ## instruction sets loaded do not matter here.
+    ## Interrupts are accepted before the first instruction, and after the
+    ## one following an EI.
+    def run(self: Self, count: int) -> None:
+        handlers = z80.handlers.LAZY_BASE if self.lazy_flags else z80.handlers.BASE
+        ram = self._ram
+        registers = self.registers
+        registers.r[z80.registers.F] = FLAGS[registers.r[z80.registers.F]]
+        self.accept_interrupt()
+        cycles = self.cycles
+        done = 0
+        while done < count:
+            try:
+                for done in range(done, count):
+                    PC = registers.PC
+                    registers.R = (registers.R & 0x80) | ((registers.R + 1) & 0x7F)
+                    cycles += handlers[ram[PC]](self, PC)
+                done = count
+            except EnableInterrupts:
+                cycles += 4
+                done += 1
+                if done < count:
+                    cycles += self._step(handlers)
+                    done += 1
+                self.cycles = cycles
+                self.accept_interrupt()
+                cycles = self.cycles
+        self.cycles = cycles
+    
+    ## Runs the instruction at PC, the one after an EI.
+    def _step(self: Self, handlers: List) -> int:
+        registers = self.registers
+        PC = registers.PC
+        registers.R = (registers.R & 0x80) | ((registers.R + 1) & 0x7F)
+        try:
+            return handlers[self._ram[PC]](self, PC)
+        except EnableInterrupts:
+            return 4
+    
+    ## Events
+    ##
+    ## Callbacks to be called once cycles reaches the time (in T-states) they
+    ## are scheduled at, e.g. by the video chip at the end of a frame. They
+    ## are called between instructions, see run_cycles().
+    def schedule(self: Self, at: int, callback: Callable[[], None]) -> None:
+        heapq.heappush(self._events, (at, next(self._event_order), callback))
+    
+    ## Run for cycles T-states, calling the events that come due. Runs up to 
+    ## an instruction longer.
+    ##
+    ## Interrupts are only looked at between the slices run up to the next
+    ## event (where devices raise them), not per instruction. A slice ends 
+    ## early when an interrupt becomes acceptable in it, see end_slice().
+    def run_cycles(self: Self, cycles: int) -> None:
+        end = self.cycles + cycles
+        events = self._events
+        self.accept_interrupt()
+        while self.cycles < end:
+            deadline = min(end, events[0][0]) if events else end
+            self.cycles = self._run_until(deadline)
+            while events and events[0][0] <= self.cycles:
+                at, order, callback = heapq.heappop(events)
+                callback()
+            self.accept_interrupt()
+    
+    ## The run loop of run_cycles(), returns cycles once it reaches deadline,
+    ## or after the instruction that called end_slice().
+    def _run_until(self: Self, deadline: int) -> int:
+        self._deadline = deadline
+        handlers = z80.handlers.LAZY_BASE if self.lazy_flags else z80.handlers.BASE
+        ram = self._ram
+        registers = self.registers
+        registers.r[z80.registers.F] = FLAGS[registers.r[z80.registers.F]]
+        cycles = self.cycles
+        code = self._code(handlers) if self.threaded else None
+        while True:
+            try:
+                if code is None:
+                    while cycles < self._deadline:
+                        PC = registers.PC
+                        registers.R = (registers.R & 0x80) | ((registers.R + 1) & 0x7F)
+                        cycles += handlers[ram[PC]](self, PC)
+                    return cycles
+                while cycles < self._deadline:
+                    PC = registers.PC
+                    registers.R = (registers.R & 0x80) | ((registers.R + 1) & 0x7F)
+                    handler = code[PC]
+                    if handler is None:
+                        handler = code[PC] = self.decode_handler(handlers, PC)
+                    cycles += handler(self, PC)
+                return cycles
+            except EnableInterrupts:
+                ## Back to run_cycles() after the next instruction, to accept
+                ## the interrupt.
+                return cycles + 4 + self._step(handlers)
+            except IdleLoop as idle:
+                cycles = idle.run(cycles)
+    
+    ## Interrupts
+    ##
+    ## The INT line is level triggered: a device raises it with interrupt(),
+    ## and it stays active until the device lowers it with clear_interrupt(),
+    ## typically when the CPU reads its status. An NMI is accepted once.
+    def interrupt(self: Self, data: int=0xFF) -> None:
+        self.int_line = True
+        self.int_data = data
+        if self.registers.IFF1:
+            self.end_slice()
+    
+    def clear_interrupt(self: Self) -> None:
+        self.int_line = False
+    
+    def nmi(self: Self) -> None:
+        self.nmi_pending = True
+        self.end_slice()
+    
+    ## Ends the slice run_cycles() is in after the current instruction, for
+    ## an interrupt raised by a device in it, or enabled by RETN or RETI.
+    def end_slice(self: Self) -> None:
+        self._deadline = 0
+    
+    ## Called by EI with the INT line active. The interrupt is accepted after 
+    ## the instruction following EI. The run loops do not check for that,
+    ## they catch the exception.
+    def enable_interrupts(self: Self) -> None:
+        raise EnableInterrupts()
+    
+    ## Accept an NMI, or the INT line if interrupts are enabled. Leaves a 
+    ## HALT, pushes PC and jumps to the routine: 0x66 for an NMI, for INT by 
+    ## the mode:
+    ##
+    ##   IM 0: the instruction on the data bus, only RST p is supported
+    ##   IM 1: RST 38h
+    ##   IM 2: the address in the table at I << 8 | data
+    def accept_interrupt(self: Self) -> None:
+        registers = self.registers
+        if self.nmi_pending:
+            self.nmi_pending = False
+            registers.IFF1 = 0
+            address = 0x0066
+            cycles = 11
+        elif self.int_line and registers.IFF1:
+            registers.IFF1 = registers.IFF2 = 0
+            match registers.IM:
+                case 0:
+                    if self.int_data & 0xC7 != 0xC7:
+                        raise NotImplementedError(f'IM 0 interrupt with 0x{self.int_data:02X} on the bus, only RST p is supported.')
+                    address = self.int_data & 0x38
+                    cycles = 13
+                case 1:
+                    address = 0x0038
+                    cycles = 13
+                case 2:
+                    address = self._ram.get_word((registers.I << 8) | (self.int_data & 0xFE))
+                    cycles = 19
         else:
-            self.registers.PC += instruction.size
-        if hasattr(instruction, 'execute'):
-            instruction.execute()
+            return
+        
+        if registers.halted:
+            registers.halted = False
+            registers.PC = (registers.PC + 1) & 0xFFFF
+        registers.R = (registers.R & 0x80) | ((registers.R + 1) & 0x7F)
+        registers.SP = (registers.SP - 1) & 0xFFFF
+        self._ram[registers.SP] = registers.PC >> 8
+        registers.SP = (registers.SP - 1) & 0xFFFF
+        self._ram[registers.SP] = registers.PC & 0xFF
+        registers.PC = address
+        self.cycles += cycles
+    
+    ## Threaded code
+    ##
+    ## ram.code holds the handler of the instruction at every address (None if
+    ## not decoded yet), with the prefixes already followed, so run_cycles()
+    ## calls it without fetching the opcode. Writes to ram drop the handlers 
+    ## of the instructions they touch (see RAM.invalidate()), the operands are
+    ## read by the handlers themselves. Note that writes to ram._ram bypass 
+    ## this, call ram.invalidate() for them.
+    
+    ## The handler of the instruction at PC in handlers, behind its prefixes.
+    ## With fuse, that of the sequence of instructions starting at PC, if 
+    ## there is one. With skip_idle, HALT and the heads of idle loops get a
+    ## handler that detects idling, see _idle().
+    def decode_handler(self: Self, handlers: List, PC: int) -> Callable[['Z80', int], int]:
+        ram = self._ram
+        if PC in self.traps:
+            return self._trapped(self.traps[PC])
+        if self.skip_idle:
+            body = self._idle_loop(PC)
+            if body is not None:
+                return self._idle(handlers, PC, body)
+        if self.fuse:
+            fused = z80.handlers.LAZY_FUSED if handlers is z80.handlers.LAZY_BASE else z80.handlers.FUSED
+            for follow, handler in fused.get(ram[PC], ()):
+                if all(ram[PC + offset] == opcode for offset, opcode in follow):
+                    if self.fusion_stats is not None:
+                        return self._counted(handler)
+                    return handler
+        handler = handlers[ram[PC]]
+        while handler in z80.handlers.PREFIXES:
+            table, offset = z80.handlers.PREFIXES[handler]
+            handler = table[ram[PC + offset]]
+        return handler
+    
+    def _code(self: Self, handlers: List) -> List:
+        key = (handlers, self.fuse, self.fusion_stats is not None, self.skip_idle)
+        if self._ram.code is None or self._code_key != key:
+            self._ram.code = [None] * len(self._ram._ram)
+            self._code_key = key
+        return self._ram.code
+    
+    ## A fused handler that counts how often it runs in fusion_stats.
+    def _counted(self: Self, handler: Callable[['Z80', int], int]) -> Callable[['Z80', int], int]:
+        stats = self.fusion_stats
+        name = handler.__name__
+        def counted(cpu: 'Z80', PC: int) -> int:
+            stats[name] += 1
+            return handler(cpu, PC)
+        return counted
+    
+    ## How often each fused handler ran, most frequent first.
+    def fusion_report(self: Self) -> str:
+        if not self.fusion_stats:
+            return 'No fused instructions ran.'
+        total = sum(self.fusion_stats.values())
+        lines = [ f'{"Fused handler":32} {"Runs":>10} {"%":>6}' ]
+        for name, runs in self.fusion_stats.most_common():
+            lines.append(f'{name:32} {runs:10} {100 * runs / total:6.1f}')
+        return '\n'.join(lines)
+    
+    ## Traps
+    ##
+    ## A routine run natively instead of the code at an address, e.g. a BIOS
+    ## entry point (see msx.bios): once the CPU gets there, routine(cpu) does
+    ## the work on the registers and memory and returns the T-states it
+    ## takes, and the trap returns as RET. Traps are handlers in ram.code, so
+    ## they imply threaded, and only run_cycles() takes them.
+    def trap(self: Self, address: int, routine: Callable[['Z80'], int]) -> None:
+        self.traps[address] = routine
+        self.threaded = True
+        if self._ram.code is not None:
+            self._ram.code[address] = None
+    
+    def _trapped(self: Self, routine: Callable[['Z80'], int]) -> Callable[['Z80', int], int]:
+        ram = self._ram
+        registers = self.registers
+        def trapped(cpu: 'Z80', PC: int) -> int:
+            cycles = routine(cpu)
+            registers.PC = ram.get_word(registers.SP)
+            registers.SP = (registers.SP + 2) & 0xFFFF
+            return cycles + 10
+        return trapped
+    
+    ## Idle loops
+    ##
+    ## Code waiting for an interrupt: HALT, or a loop that only reads memory 
+    ## and registers until it sees a change, e.g.
+    ##
+    ##     loop: LD A, (JIFFY)
+    ##           CP B
+    ##           JR Z, loop
+    ##
+    ## Once an iteration of such a loop leaves every register as it was (but
+    ## R), all further ones do the same until an event changes something. The
+    ## handler of the loop head raises IdleLoop for _run_until() to run the
+    ## loop: an iteration, one instruction at a time up to the deadline like
+    ## the run loop, and if that changed nothing, all the iterations that end
+    ## by the deadline at once. The rest runs as usual, so a slice ends on 
+    ## the same instruction as without skip_idle.
+    
+    ## Instructions that only change registers.
+    IDLE_SAFE = {
+        "LD r, r'", 'LD r, n', 'LD r, (HL)', 'LD r, (IX+d)', 'LD r, (IY+d)', 'LD A, (BC)', 'LD A, (DE)', 'LD A, (nn)',
+        'LD dd, nn', 'LD HL, (nn)', 'LD dd, (nn)', 'NOP',
+        'ADD A, r', 'ADD A, n', 'ADD A, (HL)', 'ADD A, (IX+d)', 'ADD A, (IY+d)',
+        'AND r', 'AND n', 'AND (HL)', 'AND (IX+d)', 'AND (IY+d)',
+        'OR r', 'OR n', 'OR (HL)', 'OR (IX+d)', 'OR (IY+d)',
+        "XOR r'", 'XOR n', 'XOR (HL)', 'XOR (IX+d)', 'XOR (IY+d)',
+        'CP r', 'CP n', 'CP (HL)', 'CP (IX+d)', 'CP (IY+d)',
+        'BIT b, r', 'BIT b, (HL)', 'BIT b, (IX+d)', 'BIT b, (IY+d)',
+    }
+    IDLE_BRANCHES = { 'JR e', 'JP nn', 'JR C, e', 'JR NC, e', 'JR Z, e', 'JR NZ, e', 'JP cc, nn' }
+    ## Longest loop looked for.
+    IDLE_INSTRUCTIONS = 8
+    
+    ## The addresses of the instructions of the idle loop starting at head,
+    ## None if there is none. The loop may branch forward out of it.
+    def _idle_loop(self: Self, head: int) -> Optional[List[int]]:
+        if self._ram[head] == 0x76:
+            return [ head ]
+        body = []
+        address = head
+        for _ in range(self.IDLE_INSTRUCTIONS):
+            try:
+                instruction = self.instruction_at(address)
+            except TypeError:
+                return None
+            if instruction is None:
+                return None
+            name = instruction.name()
+            body.append(address)
+            if name in self.IDLE_SAFE:
+                address += instruction.size
+                continue
+            if name not in self.IDLE_BRANCHES:
+                return None
+            if name.startswith('JR'):
+                destination = instruction.jump_destination(address) & 0xFFFF
+            else:
+                destination = instruction._nn
+            if destination == head:
+                return body
+            if name in ('JR e', 'JP nn') or destination < address:
+                return None
+            address += instruction.size
+        return None
+    
+    ## The handler of the head of an idle loop, raises IdleLoop. Writes to
+    ## the loop only drop the head if they hit its first instruction, so the
+    ## bytes are checked again.
+    def _idle(self: Self, handlers: List, head: int, body: List[int]) -> Callable[['Z80', int], int]:
+        ram = self._ram
+        registers = self.registers
+        end = body[-1] + 4
+        original = ram._ram[head:end]
+        def state() -> Tuple:
+            return (tuple(registers.r), registers.SP, registers.IX, registers.IY, registers.I, registers.IFF1, registers.IFF2)
+        def run(cycles: int) -> int:
+            before = state()
+            R = registers.R
+            start = cycles
+            cycles += handlers[ram[head]](self, head)
+            while registers.PC in body and registers.PC != head:
+                if cycles >= self._deadline:
+                    return cycles
+                registers.R = (registers.R & 0x80) | ((registers.R + 1) & 0x7F)
+                cycles += handlers[ram[registers.PC]](self, registers.PC)
+            if registers.PC != head or state() != before:
+                return cycles
+            if ram._ram[head:end] != original:
+                ram.code[head] = None
+                return cycles
+            ## The run loop counted the fetch of the head before.
+            iteration = cycles - start
+            fetches = (registers.R - R + 1) & 0x7F
+            iterations = max(self._deadline - cycles, 0) // iteration
+            registers.R = (registers.R & 0x80) | ((registers.R + iterations * fetches) & 0x7F)
+            return cycles + iterations * iteration
+        def idle(cpu: 'Z80', PC: int) -> int:
+            raise IdleLoop(run)
+        return idle
+    
+    ## The instruction at address, without running anything. None for an
+    ## unknown opcode, which is not logged as decode_instruction() does.
+    def instruction_at(self: Self, address: int) -> Optional[z80.instruction.Instruction]:
+        PC = self.registers.PC
+        self.registers.PC = address
+        try:
+            self.fetch_opcode()
+            if self._opcode not in self._opcode2instruction:
+                return None
+            return self.decode_instruction()
+        finally:
+            self.registers.PC = PC
+    
+    ## Decodes the instructions in [start, end) ahead of run(), e.g. for ROM.
+    ## Every address is decoded, as if code could start there.
+    def predecode(self: Self, start: int, end: int) -> None:
+        handlers = z80.handlers.LAZY_BASE if self.lazy_flags else z80.handlers.BASE
+        code = self._code(handlers)
+        for address in range(start, end):
+            try:
+                code[address] = self.decode_handler(handlers, address)
+            except TypeError:
+                ## Bytes not loaded (None).
+                pass
+    
+    ## Like execute_opcode(), but only what the instruction traces is done
+    ## (see Instruction.trace()). For disassemblers, that walk the code
+    ## without running it.
+    def trace_opcode(self: Self) -> z80.instruction.Instruction:
+        instruction = self.decode_instruction()
+        self.registers.PC += instruction.size
+        instruction.trace(self)
         return instruction
     
+    ## I/O ports, see z80.io.IOBus. The instructions go to the handlers in 
+    ## io directly.
+    def port_in(self: Self, port: int) -> int:
+        return self.io.readers[port & 0xFF](port & 0xFF)
+    
+    def port_out(self: Self, port: int, value: int) -> None:
+        self.io.writers[port & 0xFF](port & 0xFF, value)
+    
     
     
     ## Convenience
@@ -120,3 +597,196 @@ class Z80:
     #@ram.setter
     def set_ram(self: Self, bytes: bytes, offset: int) -> None:
         self._ram[offset:len(bytes)] = bytes
+
+
+
+## Checks of the run loops: python3 -m z80.z80 [runs] [instructions]
+if __name__ == '__main__':
+    import functools
+    import logging
+    import random
+    import sys
+    import time
+    import z80
+    
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    steps = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    
+    ## Idle loop detection on unknown opcodes: no idle loop, nothing logged.
+    logged = []
+    class Collect(logging.Handler):
+        def emit(self: Self, record: logging.LogRecord) -> None:
+            logged.append(record)
+    logging.getLogger().addHandler(Collect(logging.ERROR))
+    cpu = z80.Z80(skip_idle=True)
+    cpu.ram._ram[:] = bytes(len(cpu.ram._ram))
+    cpu.ram._ram[0x4000:0x4004] = bytes([ 0x7E, 0xED, 0x00, 0x76 ])
+    cpu.PC = 0x4000
+    if cpu._idle_loop(0x4000) is not None:
+        sys.exit('An unknown opcode was taken for an idle loop.')
+    cpu.ram._ram[0x4000:0x8000] = bytes(range(0x100)) * 0x40
+    cpu.predecode(0x4000, 0x8000)
+    if logged:
+        sys.exit(f'Idle loop detection logged {len(logged)} errors.')
+    print('Idle loop detection: unknown opcodes are not idle loops.')
+    
+    ## R counts M1 fetches: two for a prefixed opcode.
+    for options in ({}, { 'threaded': True }, { 'lazy_flags': True, 'fuse': True }):
+        cpu = z80.Z80(**options)
+        cpu.ram._ram[0x4000:0x4004] = bytes([ 0xED, 0x5F, 0xDD, 0x23 ])
+        cpu.PC = 0x4000
+        cpu.registers.R = 0x7F
+        cpu.run_cycles(9)
+        if cpu.registers.A != 0x01:
+            sys.exit(f'LD A, R with {options} gives 0x{cpu.registers.A:02X} for R = 0x7F before.')
+        cpu.run_cycles(10)
+        if cpu.registers.R != 0x03:
+            sys.exit(f'INC IX with {options} leaves R = 0x{cpu.registers.R:02X}, not 0x03.')
+    print('R: two fetches per prefixed opcode.')
+    
+    ## INIR repeats once per dispatch, so an interrupt gets in between.
+    for options in ({}, { 'threaded': True }, { 'lazy_flags': True, 'fuse': True, 'skip_idle': True }):
+        cpu = z80.Z80(**options)
+        cpu.ram._ram[0x4000:0x4002] = bytes([ 0xED, 0xB2 ])
+        cpu.ram._ram[0x0038] = 0x76
+        cpu.PC = 0x4000
+        cpu.registers.SP = 0xF000
+        cpu.registers.HL = 0x8000
+        cpu.registers.BC = 0x1098
+        cpu.registers.IM = 1
+        cpu.registers.IFF1 = cpu.registers.IFF2 = 1
+        cpu.io.register(0x98, read=lambda port: 0x55)
+        cpu.schedule(50, cpu.interrupt)
+        cpu.run_cycles(100)
+        if cpu.ram.get_word(0xEFFE) != 0x4000 or not 0 < cpu.registers.B < 0x10:
+            sys.exit(f'INIR with {options} was not interrupted: B = {cpu.registers.B}.')
+    print('Block I/O: interrupts are accepted between the repeats.')
+    
+    ## Interrupts become acceptable in the middle of a slice: raised by a 
+    ## device (OUT), enabled by RETN, and after an EI at the end of the run.
+    def device(port: int, value: int) -> None:
+        cpu.interrupt()
+    for name, program, iff in (
+        ('OUT', [ 0x3E, 0x01, 0xD3, 0x99, 0x00, 0x00, 0x00 ], 1),
+        ('RETN', [ 0xED, 0x45 ], 0),
+        ('EI', [ 0xFB, 0x00, 0x00 ], 0),
+    ):
+        for options in ({}, { 'threaded': True }, { 'lazy_flags': True, 'fuse': True, 'skip_idle': True }):
+            cpu = z80.Z80(**options)
+            cpu.ram._ram[0x4000:0x4000 + len(program)] = bytes(program)
+            cpu.ram._ram[0x0038] = 0x76
+            cpu.ram._ram[0xEFFE:0xF000] = bytes([ 0x00, 0x50 ])
+            cpu.io.register(0x99, write=device)
+            cpu.PC = 0x4000
+            cpu.registers.SP = 0xEFFE
+            cpu.registers.IM = 1
+            cpu.registers.IFF1 = iff
+            cpu.registers.IFF2 = 1
+            if name != 'OUT':
+                cpu.interrupt()
+            cpu.schedule(10000, lambda: None)
+            cpu.run_cycles(5 if name == 'EI' else 1000)
+            if cpu.PC not in (0x0038, 0x0039):
+                sys.exit(f'{name} with {options}: the interrupt was not accepted, PC = 0x{cpu.PC:04X}.')
+    print('Interrupts: accepted in the slice they become acceptable in.')
+    
+    ## Skipped idle loops end where the plain run loop does: a polling loop
+    ## on a byte that events change, and a HALT left by interrupts that the
+    ## handler acknowledges on port 99h.
+    program = [ 0xED, 0x56, 0xFB, 0x06, 0x00,	## IM 1; EI; LD B, 0
+        0x3A, 0x00, 0xC0, 0xB8, 0x28, 0xFA,	## loop: LD A, (C000h); CP B; JR Z, loop
+        0x47, 0x76, 0x18, 0xF6 ]	## LD B, A; HALT; JR loop
+    def machine(**options) -> 'z80.Z80':
+        cpu = z80.Z80(**options)
+        cpu.ram._ram[:] = bytes(len(cpu.ram._ram))
+        cpu.ram._ram[0x4000:0x4000 + len(program)] = bytes(program)
+        cpu.ram._ram[0x0038:0x003C] = bytes([ 0xDB, 0x99, 0xFB, 0xC9 ])	## IN A, (99h); EI; RET
+        def acknowledge(port: int) -> int:
+            cpu.clear_interrupt()
+            return 0x00
+        cpu.io.register(0x99, read=acknowledge)
+        cpu.PC = 0x4000
+        cpu.registers.SP = 0xF000
+        rnd = random.Random(1)
+        at = 0
+        for event in range(200):
+            at += rnd.randrange(50, 3000)
+            if event % 3:
+                cpu.schedule(at, functools.partial(cpu.ram.__setitem__, 0xC000, event & 0xFF))
+            else:
+                cpu.schedule(at, cpu.interrupt)
+        return cpu
+    for options in ({ 'skip_idle': True }, { 'lazy_flags': True, 'fuse': True, 'skip_idle': True }):
+        plain, idle = machine(), machine(**options)
+        rnd = random.Random(2)
+        for _ in range(500):
+            slice_cycles = rnd.randrange(1, 1000)
+            plain.run_cycles(slice_cycles)
+            idle.run_cycles(slice_cycles)
+            if (plain.cycles, plain.registers.PC, plain.registers.R) != (idle.cycles, idle.registers.PC, idle.registers.R):
+                sys.exit(f'Idle loops with {options} end at {idle.cycles} (PC 0x{idle.registers.PC:04X}), not {plain.cycles} (PC 0x{plain.registers.PC:04X}).')
+    print('Idle loops: skipping them ends the slices where the plain run loop does.')
+    
+    ## Threaded code and fused handlers against the plain run loop, on random
+    ## code (self modifying included) with the fused sequences mixed in. The
+    ## plain CPU runs up to the cycles of the other one after every handler
+    ## it ran, a fused one included, and the states must match there.
+    def state(cpu: 'z80.Z80') -> tuple:
+        regs = cpu.registers
+        r_prime = list(regs.r_prime)
+        r_prime[z80.registers.F] = FLAGS[r_prime[z80.registers.F]]
+        return (regs.B, regs.C, regs.D, regs.E, regs.H, regs.L, regs.F, regs.A, tuple(r_prime),
+            regs.SP, regs.PC, regs.IX, regs.IY, regs.I, regs.R, regs.IFF1, regs.IFF2, regs.IM, regs.halted, cpu.cycles)
+    
+    ## One handler, False for an unknown opcode, which is skipped.
+    def step(cpu: 'z80.Z80') -> bool:
+        try:
+            cpu.run_cycles(1)
+        except NotImplementedError:
+            cpu.registers.PC = (cpu.registers.PC + 1) & 0xFFFF
+            return False
+        return True
+    
+    sequences = [ bytes([ first ]) + bytes(opcode for offset, opcode in offsets) for first, candidates in z80.handlers.FUSED.items() for offsets, handler in candidates ]
+    for options in ({ 'threaded': True }, { 'fuse': True }, { 'fuse': True, 'lazy_flags': True }):
+        plain, other = z80.Z80(), z80.Z80(**options)
+        for run in range(runs):
+            rnd = random.Random(run)
+            image = bytearray(rnd.randbytes(0x10000))
+            for address in range(0, 0x10000, 8):
+                sequence = rnd.choice(sequences)
+                image[address:address + len(sequence)] = sequence
+            r = list(rnd.randbytes(8))
+            for cpu in (plain, other):
+                cpu.ram._ram[:] = image * 2
+                if cpu.ram.code is not None:
+                    cpu.ram.code[:] = [ None ] * len(cpu.ram.code)
+                cpu.registers.r[:] = r
+                cpu.registers.SP = 0xF000
+                cpu.registers.PC = rnd.randrange(0x10000) if cpu is plain else plain.registers.PC
+                cpu.cycles = 0
+            for instruction in range(steps):
+                if not step(other):
+                    step(plain)
+                while plain.cycles < other.cycles:
+                    step(plain)
+                if state(plain) != state(other):
+                    sys.exit(f'{options}, run {run}, handler {instruction}: {state(plain)} != {state(other)}')
+                if other.registers.halted:
+                    for cpu in (plain, other):
+                        cpu.registers.halted = False
+                        cpu.registers.PC = (cpu.registers.PC + 1) & 0xFFFF
+            if plain.ram._ram != other.ram._ram:
+                sys.exit(f'{options}, run {run}: memory differs.')
+        print(f'{options}: {runs} runs of {steps} handlers match the plain run loop.')
+    
+    ## A VRAM copy loop: LD A, (HL); INC HL; OUT (98h), A; DEC B; JR NZ, 
+    ## 5 instructions in 40 T-states.
+    loop = bytes([ 0x7E, 0x23, 0xD3, 0x98, 0x05, 0x20, 0xF9, 0x18, 0xF7 ])
+    for options in ({}, { 'threaded': True }, { 'fuse': True }):
+        cpu = z80.Z80(**options)
+        cpu.ram._ram[0x4000:0x4000 + len(loop)] = loop
+        cpu.PC = 0x4000
+        start = time.perf_counter()
+        cpu.run_cycles(8 * 400000)
+        print(f'{options}: {cpu.cycles / 8 / (time.perf_counter() - start) / 1e6:.2f} MIPS')